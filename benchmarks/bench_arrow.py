@@ -0,0 +1,48 @@
+# benchmarks/bench_arrow.py
+
+import argparse
+
+import numpy as np
+import pyarrow as pa
+
+from common import best_time, parse_sizes, synthetic_ohlcv
+
+import indicators
+
+
+def round_trip(func, batch):
+    # Convert the batch to pandas, compute, and convert the result back to Arrow.
+    result = func(batch.to_pandas())
+    if hasattr(result, 'columns'):
+        return pa.RecordBatch.from_pandas(result, preserve_index=False)
+    return pa.Array.from_pandas(result)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare Arrow input passed directly to the indicator functions "
+                                                 "with a round trip through pandas.")
+    parser.add_argument('--rows', type=parse_sizes, default=parse_sizes('1k,100k,1M'), help="Comma separated sizes.")
+    parser.add_argument('--indicators', default='calculate_sma,calculate_rsi,calculate_atr,calculate_macd',
+                        help="Comma separated exported functions.")
+    args = parser.parse_args()
+
+    print(f"{'indicator':>26} {'rows':>12} {'pandas (s)':>11} {'arrow (s)':>10} {'speedup':>8}")
+    for rows in args.rows:
+        batch = pa.RecordBatch.from_pandas(synthetic_ohlcv(rows), preserve_index=False)
+        for name in args.indicators.split(','):
+            func = getattr(indicators, name)
+            expected, actual = round_trip(func, batch), func(batch)
+            if isinstance(expected, pa.RecordBatch):
+                expected, actual = expected.to_pandas().to_numpy(), actual.to_pandas().to_numpy()
+            else:
+                expected, actual = expected.to_numpy(zero_copy_only=False), actual.to_numpy(zero_copy_only=False)
+            if not np.array_equal(expected, actual, equal_nan=True):
+                raise AssertionError(f"{name} differs between Arrow and pandas input.")
+
+            pandas_time = best_time(round_trip, func, batch)
+            arrow_time = best_time(func, batch)
+            print(f"{name:>26} {rows:>12,} {pandas_time:11.5f} {arrow_time:10.5f} {pandas_time / arrow_time:7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,152 @@
+# benchmarks/bench_backtest.py
+
+import argparse
+import time
+from collections.abc import Mapping
+
+import numpy as np
+
+from common import parse_sizes, peak_memory, synthetic_ohlcv
+
+from indicators import calculate_donchian_channels, calculate_keltner_channels, calculate_parabolic_sar
+from indicators.backtest import backtest, hold, parameter_grid
+from indicators.signals import BandBreakout
+
+
+def donchian_breakout(data, period):
+    # Long above the previous bar's upper channel, short below its lower channel (the current bar's
+    # channel contains the close, so it can never be broken).
+    channels = calculate_donchian_channels(data, period=period)
+    breakout = BandBreakout('Close', 'Upper', 'Lower')
+    return hold(breakout.sides({'Close': data['Close'], 'Upper': channels['Upper Channel'].shift(),
+                                'Lower': channels['Lower Channel'].shift()}))
+
+
+def keltner_touch(data, multiplier):
+    # Long after the low touches the lower channel, flat after the high touches the upper channel.
+    channels = calculate_keltner_channels(data, multiplier=multiplier)
+    sides = np.where(data['Low'] <= channels['Lower Channel'], 1, np.where(data['High'] >= channels['Upper Channel'],
+                                                                           -1, 0))
+    return hold(sides, long_only=True)
+
+
+def sar_flip(data, step):
+    # Long above the Parabolic SAR, short below it.
+    return np.sign(data['Close'] - calculate_parabolic_sar(data, step=step))
+
+
+STRATEGIES = {
+    'donchian': (donchian_breakout, lambda count: {'period': list(range(10, 10 + count))}),
+    'keltner': (keltner_touch, lambda count: {'multiplier': list(np.linspace(1.0, 3.0, count))}),
+    'sar': (sar_flip, lambda count: {'step': list(np.linspace(0.01, 0.05, count))}),
+}
+
+
+class Universe(Mapping):
+    """
+    Synthetic symbols generated on access, so only the block being backtested is ever in memory.
+    """
+
+    def __init__(self, symbols: int, rows: int):
+        self.symbols = [f'SYM{i}' for i in range(symbols)]
+        self.rows = rows
+        self.seconds = 0.0
+
+    def __getitem__(self, symbol):
+        start = time.perf_counter()
+        frame = synthetic_ohlcv(self.rows, seed=int(symbol[3:]))
+        self.seconds += time.perf_counter() - start
+        return frame
+
+    def __iter__(self):
+        return iter(self.symbols)
+
+    def __len__(self):
+        return len(self.symbols)
+
+
+def event_loop(close: np.ndarray, positions: np.ndarray, fee: float) -> tuple:
+    # What the separate backtester did: walk the bars of one symbol in Python.
+    pnl = fees = turnover = peak = drawdown = 0.0
+    trades = 0
+    previous = 0.0
+    for row in range(len(close)):
+        position = 0.0 if positions[row] != positions[row] else float(positions[row])
+        if row and close[row - 1] == close[row - 1] and close[row] == close[row]:
+            pnl += previous * (close[row] / close[row - 1] - 1.0)
+        change = abs(position - previous)
+        if change:
+            turnover += change
+            trades += 1
+            fees += fee * change
+            pnl -= fee * change
+        peak = max(peak, pnl)
+        drawdown = max(drawdown, peak - pnl)
+        previous = position
+    return pnl, fees, turnover, trades, drawdown
+
+
+def check_parity(strategy, grid, fee: float) -> float:
+    """
+    Check the vectorized backtest against the event loop and return the event loop's bars per second.
+    """
+    universe = Universe(5, 5_000)
+    results = backtest(universe, strategy, grid, fee=fee, max_cells=10_000)
+    seconds = 0.0
+    for symbol in universe:
+        frame = universe[symbol]
+        for params in parameter_grid(grid):
+            positions = np.asarray(strategy(frame, **params), dtype=np.float64)
+            start = time.perf_counter()
+            expected = event_loop(frame['Close'].to_numpy(), positions, fee)
+            seconds += time.perf_counter() - start
+            actual = results.loc[tuple(params.values()) + (symbol,)].to_numpy()
+            if not np.allclose(actual, expected, rtol=1e-9, atol=1e-12):
+                raise AssertionError(f"The vectorized backtest differs from the event loop for {symbol} {params}.")
+    return len(universe) * universe.rows * len(parameter_grid(grid)) / seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time vectorized backtests over many symbols and parameter sets, "
+                                                 "and project the time of a full parameter grid.")
+    parser.add_argument('--strategy', default='donchian', choices=sorted(STRATEGIES))
+    parser.add_argument('--symbols', type=int, default=500, help="Symbols in the universe.")
+    parser.add_argument('--rows', type=parse_sizes, default=parse_sizes('100k'), help="Bars per symbol.")
+    parser.add_argument('--params', type=int, default=4, help="Parameter sets actually run (at least 2).")
+    parser.add_argument('--target', type=int, default=1_000, help="Parameter sets of the projected grid.")
+    parser.add_argument('--workers', type=int, default=1, help="Worker processes.")
+    parser.add_argument('--fee', type=float, default=0.0005, help="Cost per unit traded.")
+    args = parser.parse_args()
+    if args.params < 2:
+        parser.error("--params must be at least 2.")
+    strategy, grid = STRATEGIES[args.strategy]
+    rows = args.rows[0]
+
+    loop_speed = check_parity(strategy, grid(2), args.fee)
+
+    def run(count: int) -> float:
+        # Generating the synthetic bars is not part of the backtest (real runs read memory-mapped files).
+        universe = Universe(args.symbols, rows)
+        start = time.perf_counter()
+        backtest(universe, strategy, grid(count), fee=args.fee, workers=args.workers)
+        return time.perf_counter() - start - universe.seconds
+
+    # Assembling each block of symbols is paid once, whatever the number of parameter sets: separate it
+    # from the cost per set with a run of a single set.
+    single = run(1)
+    timing = {}
+    peak = peak_memory(lambda: timing.update(seconds=run(args.params)))
+    per_set = (timing['seconds'] - single) / (args.params - 1)
+    fixed = max(single - per_set, 0.0)
+    projected = fixed + per_set * args.target
+
+    print(f"{args.strategy}: {args.symbols:,} symbols x {rows:,} bars, {args.params} parameter sets, "
+          f"{args.workers} worker(s)")
+    print(f"{'backtest (s)':>13} {'blocks (s)':>11} {'per set (s)':>12} {'Mbars/s':>9} {'event loop Mbars/s':>19} "
+          f"{'peak (MiB)':>11} {f'{args.target:,} sets (min)':>17}")
+    print(f"{timing['seconds']:13.1f} {fixed:11.1f} {per_set:12.2f} {args.symbols * rows / per_set / 1e6:9.1f} "
+          f"{loop_speed / 1e6:19.2f} {peak / 2 ** 20:11.0f} {projected / 60:17.1f}")
+
+
+if __name__ == '__main__':
+    main()
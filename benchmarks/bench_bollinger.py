@@ -0,0 +1,60 @@
+# benchmarks/bench_bollinger.py
+
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from common import best_time, parse_sizes, synthetic_ohlcv
+
+from indicators.rolling import rolling_mean_std
+
+
+def two_passes(close, period):
+    series = pd.Series(close, copy=False)
+    return series.rolling(window=period).mean().to_numpy(), series.rolling(window=period).std().to_numpy()
+
+
+def worst_error(std, close, period, samples, rng):
+    # Largest relative error over sampled windows, against a two-pass reference in extended precision.
+    rows = rng.integers(period - 1, len(close), samples)
+    windows = close[rows[:, None] + np.arange(1 - period, 1)].astype(np.longdouble)
+    exact = np.asarray(windows.std(axis=1, ddof=1), dtype=np.float64)
+    valid = exact > 0
+    return np.max(np.abs(std[rows[valid]] / exact[valid] - 1))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the single-pass rolling mean/std with two pandas rolling "
+                                                 "passes, in speed and in accuracy at a high price level.")
+    parser.add_argument('--rows', type=parse_sizes, default=parse_sizes('100k,1M,10M'), help="Comma separated sizes.")
+    parser.add_argument('--periods', default='20,200', help="Comma separated window lengths.")
+    parser.add_argument('--price', type=float, default=30_000.0, help="Starting price of the synthetic series.")
+    parser.add_argument('--samples', type=int, default=20_000, help="Windows checked against the exact reference.")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"{'rows':>12} {'period':>7} {'pandas (s)':>11} {'engine (s)':>11} {'speedup':>8} "
+          f"{'pandas error':>13} {'engine error':>13}")
+    for rows in args.rows:
+        close = synthetic_ohlcv(rows, start_price=args.price)['Close'].to_numpy()
+        for period in (int(period) for period in args.periods.split(',')):
+            expected_mean, expected_std = two_passes(close, period)
+            mean, std = rolling_mean_std(close, period)
+            # pandas' running sums drift over long series, so the deviations are checked against the
+            # exact reference instead.
+            np.testing.assert_allclose(mean, expected_mean, rtol=1e-12)
+            np.testing.assert_array_equal(np.isnan(std), np.isnan(expected_std))
+            pandas_error = worst_error(expected_std, close, period, args.samples, rng)
+            engine_error = worst_error(std, close, period, args.samples, rng)
+            if engine_error > 1e-9:
+                raise AssertionError(f"rolling_mean_std is off by {engine_error:.2e} for period {period}.")
+
+            pandas_time = best_time(two_passes, close, period)
+            engine_time = best_time(rolling_mean_std, close, period)
+            print(f"{rows:>12,} {period:>7} {pandas_time:11.4f} {engine_time:11.4f} "
+                  f"{pandas_time / engine_time:7.1f}x {pandas_error:13.2e} {engine_error:13.2e}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+# benchmarks/bench_cci.py
+
+import argparse
+
+import numpy as np
+
+from common import best_time, parse_sizes, synthetic_ohlcv
+
+from indicators.cci import calculate_cci
+from indicators.rolling import rolling_mad
+
+
+def naive_rolling_mad(values: np.ndarray, period: int) -> np.ndarray:
+    """
+    Reference mean absolute deviation computed window by window.
+    """
+    result = np.full(len(values), np.nan)
+    for end in range(period, len(values) + 1):
+        window = values[end - period:end]
+        result[end - 1] = np.mean(np.abs(window - window.mean()))
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the rolling mean absolute deviation used by the CCI.")
+    parser.add_argument('--sizes', default='10k,100k,1M', help="Comma separated row counts.")
+    parser.add_argument('--period', type=int, default=20)
+    parser.add_argument('--naive-max-rows', type=int, default=100_000,
+                        help="Only run the window-by-window reference up to this many rows.")
+    args = parser.parse_args()
+
+    print(f"{'rows':>12} {'naive (s)':>12} {'rolling_mad (s)':>16} {'cci (s)':>12} {'speedup':>10}")
+    for rows in parse_sizes(args.sizes):
+        data = synthetic_ohlcv(rows)
+        tp = ((data['High'] + data['Low'] + data['Close']) / 3).to_numpy()
+
+        mad_time = best_time(rolling_mad, tp, args.period)
+        cci_time = best_time(calculate_cci, data, period=args.period)
+
+        if rows <= args.naive_max_rows:
+            naive_time = best_time(naive_rolling_mad, tp, args.period, repeat=1)
+            expected = naive_rolling_mad(tp, args.period)
+            np.testing.assert_allclose(rolling_mad(tp, args.period), expected, rtol=1e-10, equal_nan=True)
+            naive, speedup = f"{naive_time:12.4f}", f"{naive_time / mad_time:9.0f}x"
+        else:
+            naive, speedup = f"{'-':>12}", f"{'-':>10}"
+
+        print(f"{rows:>12,} {naive} {mad_time:16.4f} {cci_time:12.4f} {speedup}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+# benchmarks/bench_chunked.py
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from common import parse_sizes, synthetic_ohlcv
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs process_file in a fresh interpreter and prints its peak resident memory in KiB and the seconds taken.
+# VmHWM (Linux) starts over with the new program, unlike ru_maxrss, which keeps the parent's peak across exec.
+RUN = """
+import sys
+from indicators.runner import process_file
+summary = process_file(sys.argv[1], sys.argv[2], sys.argv[3].split(','), chunk_size=int(sys.argv[4]) or None,
+                       out_of_core=sys.argv[4] != '0')
+with open('/proc/self/status') as status:
+    peak = next(line.split()[1] for line in status if line.startswith('VmHWM:'))
+print(peak, summary['seconds'])
+"""
+
+
+def run(file_path: str, output_dir: str, specs: str, block_rows: int):
+    output = subprocess.run([sys.executable, '-c', RUN, file_path, output_dir, specs, str(block_rows)], cwd=ROOT,
+                            capture_output=True, text=True, check=True).stdout.split()
+    return int(output[0]) / 1024, float(output[1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the peak memory of in-memory and out-of-core runs over "
+                                                 "CSV files of growing length.")
+    parser.add_argument('--rows', type=parse_sizes, default=parse_sizes('500k,2M'), help="Comma separated sizes.")
+    parser.add_argument('--block', type=parse_sizes, default=parse_sizes('100k'), help="Rows per out-of-core block.")
+    parser.add_argument('--indicators', default='sma,rsi,macd,atr,bollinger_bands,obv,parabolic_sar',
+                        help="Comma separated indicator names.")
+    args = parser.parse_args()
+    block_rows = args.block[0]
+
+    print(f"{'rows':>12} {'in-memory (MiB)':>16} {'(s)':>7} {'out-of-core (MiB)':>18} {'(s)':>7}")
+    with tempfile.TemporaryDirectory() as directory:
+        for rows in args.rows:
+            file_path = os.path.join(directory, 'SYNTH.csv')
+            synthetic_ohlcv(rows).to_csv(file_path, index=False)
+            outputs = [os.path.join(directory, 'memory'), os.path.join(directory, 'blocks')]
+            for output in outputs:
+                os.makedirs(output, exist_ok=True)
+
+            memory, memory_time = run(file_path, outputs[0], args.indicators, 0)
+            blocks, blocks_time = run(file_path, outputs[1], args.indicators, block_rows)
+
+            expected, actual = (pd.read_csv(os.path.join(output, 'SYNTH.csv')) for output in outputs)
+            if list(expected.columns) != list(actual.columns):
+                raise AssertionError("The out-of-core run wrote different columns.")
+            # Rolling windows restart their running sums at each block, so values agree up to rounding.
+            np.testing.assert_allclose(actual.to_numpy(), expected.to_numpy(), rtol=1e-9, atol=1e-9)
+
+            print(f"{rows:>12,} {memory:16.0f} {memory_time:7.2f} {blocks:18.0f} {blocks_time:7.2f}")
+
+
+if __name__ == '__main__':
+    main()
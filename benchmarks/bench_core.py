@@ -0,0 +1,51 @@
+# benchmarks/bench_core.py
+
+import argparse
+
+import numpy as np
+
+from common import best_time, parse_sizes, peak_memory, synthetic_ohlcv
+
+import indicators
+from indicators.panel import to_panel
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the array kernels with the DataFrame adapters, "
+                                                 "in float64 and float32.")
+    parser.add_argument('--sizes', default='1k,100k', help="Comma separated row counts for the single-symbol runs.")
+    parser.add_argument('--symbols', type=int, default=500, help="Number of symbols in the panel run.")
+    parser.add_argument('--rows', type=int, default=2_000, help="Bars per symbol in the panel run.")
+    parser.add_argument('--indicator', default='rsi', help="Indicator name, e.g. 'rsi' or 'bollinger_bands'.")
+    args = parser.parse_args()
+
+    adapter = getattr(indicators, f'calculate_{args.indicator}')
+    kernel = getattr(indicators, f'{args.indicator}_array')
+
+    print(f"{args.indicator}: adapter (DataFrame in and out) against kernel (arrays in and out)")
+    print(f"{'rows':>12} {'adapter (s)':>12} {'kernel (s)':>12} {'overhead':>10}")
+    for rows in parse_sizes(args.sizes):
+        data = synthetic_ohlcv(rows)
+        close = data['Close'].to_numpy()
+        if args.indicator in ('sma', 'ema', 'rsi', 'cmo', 'macd', 'bollinger_bands'):
+            arrays = (close,)
+        else:
+            arrays = tuple(data[column].to_numpy() for column in ('High', 'Low', 'Close'))
+
+        adapter_time = best_time(adapter, data, repeat=20)
+        kernel_time = best_time(kernel, *arrays, repeat=20)
+        print(f"{rows:>12,} {adapter_time:12.6f} {kernel_time:12.6f} {adapter_time / kernel_time - 1:9.0%}")
+
+    panel = to_panel({f'SYM{i}': synthetic_ohlcv(args.rows, seed=i) for i in range(args.symbols)})
+    print(f"\n{args.symbols:,} symbols x {args.rows:,} bars")
+    print(f"{'dtype':>10} {'time (s)':>10} {'peak MB':>10} {'result MB':>10}")
+    for dtype in (np.float64, np.float32):
+        data = panel.astype(dtype)
+        elapsed = best_time(adapter, data, dtype=dtype)
+        peak = peak_memory(adapter, data, dtype=dtype)
+        result = adapter(data, dtype=dtype).memory_usage(index=False).sum()
+        print(f"{np.dtype(dtype).name:>10} {elapsed:10.4f} {peak / 2 ** 20:10.1f} {result / 2 ** 20:10.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+# benchmarks/bench_extrema.py
+
+import argparse
+
+import numpy as np
+
+from common import best_time, parse_sizes, synthetic_ohlcv
+
+from indicators.extrema import rolling_extrema
+from indicators.panel import to_panel
+from indicators.rolling import rolling_max, rolling_min
+
+
+def separate(high, low, period):
+    return rolling_max(high, period), rolling_min(low, period)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the rolling extrema engine with separate pandas "
+                                                 "rolling max/min calls.")
+    parser.add_argument('--rows', type=parse_sizes, default=parse_sizes('1M'), help="Bars of the single-symbol run.")
+    parser.add_argument('--symbols', type=int, default=500, help="Number of symbols in the panel run.")
+    parser.add_argument('--bars', type=int, default=2_000, help="Bars per symbol in the panel run.")
+    parser.add_argument('--periods', default='14,50,200', help="Comma separated window lengths.")
+    args = parser.parse_args()
+
+    cases = [(f'{rows:,} x 1', synthetic_ohlcv(rows)) for rows in args.rows]
+    panel = to_panel({f'SYM{i}': synthetic_ohlcv(args.bars, seed=i) for i in range(args.symbols)})
+    cases.append((f'{args.bars:,} x {args.symbols:,}', panel))
+
+    print(f"{'shape':>16} {'period':>7} {'pandas (s)':>11} {'engine (s)':>11} {'+ rows (s)':>11} {'speedup':>8}")
+    for label, data in cases:
+        high, low = data['High'].to_numpy(), data['Low'].to_numpy()
+        for period in (int(period) for period in args.periods.split(',')):
+            expected = separate(high, low, period)
+            for actual, wanted in zip(rolling_extrema(high, low, period), expected):
+                np.testing.assert_array_equal(actual, wanted)
+
+            pandas_time = best_time(separate, high, low, period)
+            engine_time = best_time(rolling_extrema, high, low, period)
+            positions_time = best_time(rolling_extrema, high, low, period, positions=True)
+            print(f"{label:>16} {period:>7} {pandas_time:11.4f} {engine_time:11.4f} {positions_time:11.4f} "
+                  f"{pandas_time / engine_time:7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
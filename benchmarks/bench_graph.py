@@ -0,0 +1,72 @@
+# benchmarks/bench_graph.py
+
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from common import best_time, parse_sizes, peak_memory, synthetic_ohlcv
+
+import indicators
+from indicators.graph import parse_spec, compute_indicators
+
+# A 40-indicator feature set with heavy overlap in periods, similar to a typical model input.
+FEATURE_SET = (
+    [('sma', {'period': p}) for p in (5, 10, 20, 50, 100, 200)]
+    + [('ema', {'period': p}) for p in (9, 12, 20, 26, 50, 100)]
+    + [('rsi', {'period': p}) for p in (7, 14, 21)]
+    + [('cmo', {'period': p}) for p in (7, 14, 21)]
+    + [('macd', {}), ('macd', {'fast_period': 5, 'slow_period': 35, 'signal_period': 5})]
+    + [('bollinger_bands', {'period': p}) for p in (10, 20, 50)]
+    + [('atr', {'period': p}) for p in (7, 14, 21)]
+    + [('keltner_channels', {}), ('keltner_channels', {'ema_period': 50, 'atr_period': 21})]
+    + [('stochastic_oscillator', {'period': p}) for p in (14, 21)]
+    + [('williams_r', {'period': p}) for p in (14, 21)]
+    + [('donchian_channels', {'period': p}) for p in (20, 50)]
+    + ['adl', 'obv', ('cmf', {'period': 20}), ('cci', {'period': 14}), ('cci', {'period': 20}),
+       'parabolic_sar']
+)
+
+
+def independent_calls(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Compute the feature set with one calculate_* call per indicator, the way example1.py does.
+    """
+    outputs = {}
+    for spec in FEATURE_SET:
+        name, params, label = parse_spec(spec)
+        result = getattr(indicators, f'calculate_{name}')(data.copy(), **params)
+        if isinstance(result, pd.DataFrame):
+            for column in result.columns:
+                outputs[f'{label} {column}'] = result[column]
+        else:
+            outputs[label] = result
+    return pd.DataFrame(outputs, index=data.index)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare compute_indicators with independent calculate_* calls.")
+    parser.add_argument('--sizes', default='10k,100k,1M', help="Comma separated row counts.")
+    args = parser.parse_args()
+
+    print(f"{len(FEATURE_SET)} indicators per run")
+    print(f"{'rows':>12} {'independent (s)':>16} {'graph (s)':>12} {'independent MB':>15} {'graph MB':>10}")
+    for rows in parse_sizes(args.sizes):
+        data = synthetic_ohlcv(rows)
+
+        expected = independent_calls(data)
+        actual = compute_indicators(data, FEATURE_SET)
+        if list(expected.columns) != list(actual.columns) or not np.array_equal(
+                expected.to_numpy(), actual.to_numpy(), equal_nan=True):
+            raise AssertionError(f"compute_indicators differs from independent calls at {rows} rows.")
+
+        independent_time = best_time(independent_calls, data)
+        graph_time = best_time(compute_indicators, data, FEATURE_SET)
+        independent_peak = peak_memory(independent_calls, data) / 2 ** 20
+        graph_peak = peak_memory(compute_indicators, data, FEATURE_SET) / 2 ** 20
+
+        print(f"{rows:>12,} {independent_time:16.4f} {graph_time:12.4f} {independent_peak:15.1f} {graph_peak:10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# benchmarks/bench_import.py
+
+import argparse
+import inspect
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pandas as pd
+
+from common import synthetic_ohlcv
+
+import indicators
+from indicators.graph import INDICATORS
+from indicators.registry import REGISTRY, load, warmup
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# What a cold-start job runs, timed inside a fresh interpreter.
+SCENARIOS = {
+    'import indicators': "import indicators",
+    # The floor for anything that computes: the kernels run on NumPy and pandas.
+    'import pandas': "import pandas",
+    'list the registry': "from indicators.registry import REGISTRY; sorted(REGISTRY)",
+    'one indicator': "from indicators import calculate_rsi",
+    # Touching every export reproduces the former eager imports of the package.
+    'every indicator': "import indicators; [getattr(indicators, name) for name in indicators.__all__]",
+}
+
+
+def check_registry():
+    # The registry is written by hand, so compare it with the implementations it describes.
+    data = synthetic_ohlcv(300)
+    for name, info in REGISTRY.items():
+        func = load(name)
+        assert func is getattr(indicators, info.function) and load(name, kernel=True).__name__ == info.kernel
+        params = {key: parameter.default for key, parameter in inspect.signature(func).parameters.items()
+                  if key not in ('data', 'dtype')}
+        assert params == info.params, name
+        assert set(info.columns) == INDICATORS[name]()[0], name
+
+        result = func(data)
+        assert info.outputs == (tuple(result.columns) if isinstance(result, pd.DataFrame) else ()), name
+        for changes in ({}, *({key: 5} for key in params if key.endswith('period')),
+                        {'smoothing': 'wilder'} if 'smoothing' in params else {}):
+            values = np.asarray(func(data, **changes), dtype=np.float64).reshape(len(data), -1)
+            leading = int(np.argmin(np.isnan(values).any(axis=1)))
+            assert leading == warmup(name, **changes), (name, changes, leading)
+
+
+def import_time(statement: str, repeat: int) -> float:
+    code = f"import time; start = time.perf_counter(); {statement}; print(time.perf_counter() - start)"
+    times = [float(subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True,
+                                  check=True).stdout) for _ in range(repeat)]
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time cold imports of the package in fresh interpreters.")
+    parser.add_argument('--repeat', type=int, default=10, help="Interpreters started per scenario; the best is kept.")
+    args = parser.parse_args()
+
+    check_registry()
+    modules = subprocess.run([sys.executable, '-c', "import sys, indicators; print('pandas' in sys.modules)"],
+                             cwd=ROOT, capture_output=True, text=True, check=True).stdout.strip()
+    if modules != 'False':
+        raise AssertionError("'import indicators' should not import pandas.")
+
+    print(f"{'scenario':>20} {'time (ms)':>10}")
+    for label, statement in SCENARIOS.items():
+        print(f"{label:>20} {import_time(statement, args.repeat) * 1e3:10.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+# benchmarks/bench_incremental.py
+
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from common import best_time, parse_sizes, synthetic_ohlcv
+
+import indicators
+from indicators.graph import INDICATORS
+from indicators.incremental import calculate_with_state, extend
+
+
+def check_parity(data: pd.DataFrame, split: int):
+    """
+    Check that extending a result matches a full recompute for every indicator.
+    """
+    for name in sorted(INDICATORS):
+        result, state = calculate_with_state(name, data.iloc[:split])
+        new_rows, _ = extend(result, state, data.iloc[split:])
+        expected = getattr(indicators, f'calculate_{name}')(data)
+        actual = pd.concat([result, new_rows])
+        if not np.allclose(expected.to_numpy(), actual.to_numpy(), rtol=1e-12, atol=1e-9, equal_nan=True):
+            raise AssertionError(f"Extended {name} differs from the full recompute.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare appending new bars with recomputing the full history.")
+    parser.add_argument('--history', default='100k,1M,10M', help="Comma separated history lengths.")
+    parser.add_argument('--new-bars', type=int, default=1_440, help="Number of appended bars.")
+    parser.add_argument('--indicators', default='rsi,macd,keltner_channels,obv,parabolic_sar',
+                        help="Comma separated indicator names.")
+    args = parser.parse_args()
+
+    check_parity(synthetic_ohlcv(2_000), 1_500)
+
+    print(f"Appending {args.new_bars:,} bars")
+    print(f"{'indicator':>20} {'history':>12} {'recompute (s)':>14} {'extend (s)':>12} {'speedup':>10}")
+    for rows in parse_sizes(args.history):
+        data = synthetic_ohlcv(rows + args.new_bars)
+        history, new_bars = data.iloc[:rows], data.iloc[rows:]
+        for name in args.indicators.split(','):
+            func = getattr(indicators, f'calculate_{name}')
+            result, state = calculate_with_state(name, history)
+
+            recompute_time = best_time(func, data)
+            extend_time = best_time(extend, result, state, new_bars)
+            print(f"{name:>20} {rows:>12,} {recompute_time:14.4f} {extend_time:12.5f} "
+                  f"{recompute_time / extend_time:9.0f}x")
+
+
+if __name__ == '__main__':
+    main()
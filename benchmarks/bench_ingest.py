@@ -0,0 +1,57 @@
+# benchmarks/bench_ingest.py
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+import pandas as pd
+
+from common import best_time, parse_sizes, synthetic_ohlcv
+
+from indicators.ingest import PriceCache
+
+
+def parse(file_path: str) -> pd.DataFrame:
+    # What a run without the cache does: parse the CSV, including the text dates.
+    data = pd.read_csv(file_path)
+    data['Date'] = pd.to_datetime(data['Date'])
+    return data
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare parsing price CSV files with reloading them from the "
+                                                 "memory-mapped binary cache.")
+    parser.add_argument('--rows', type=parse_sizes, default=parse_sizes('100k,1M'), help="Comma separated sizes.")
+    args = parser.parse_args()
+
+    print(f"{'rows':>12} {'parse (s)':>10} {'ingest (s)':>11} {'reload (ms)':>12} {'speedup':>9}")
+    directory = tempfile.mkdtemp()
+    try:
+        for rows in args.rows:
+            data = synthetic_ohlcv(rows)
+            data.insert(0, 'Date', pd.date_range('2020-01-01', periods=rows, freq='min').strftime('%Y-%m-%d %H:%M:%S'))
+            file_path = os.path.join(directory, f'SYNTH{rows}.csv')
+            data.to_csv(file_path, index=False)
+
+            cache = PriceCache(os.path.join(directory, 'cache'))
+            start = time.perf_counter()
+            cache.ingest(file_path)
+            ingest_time = time.perf_counter() - start
+
+            # pandas may parse the dates at a coarser resolution; the cache stores nanoseconds.
+            expected = parse(file_path).astype({'Date': 'datetime64[ns]'})
+            if not expected.equals(cache.load(file_path)):
+                raise AssertionError("The cached prices differ from the parsed CSV file.")
+
+            parse_time = best_time(parse, file_path)
+            reload_time = best_time(cache.load, file_path, repeat=10)
+            print(f"{rows:>12,} {parse_time:10.3f} {ingest_time:11.3f} {reload_time * 1e3:12.2f} "
+                  f"{parse_time / reload_time:8.0f}x")
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    main()
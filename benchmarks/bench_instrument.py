@@ -0,0 +1,60 @@
+# benchmarks/bench_instrument.py
+
+import argparse
+import timeit
+
+from common import best_time, parse_sizes, synthetic_ohlcv
+
+import indicators
+from indicators.instrument import (MetricsRegistry, SpanRecorder, disable_instrumentation, enable_instrumentation,
+                                   instrument)
+
+
+def calls(name: str, data, number: int):
+    # Look the function up through the package on every call, as instrumented callers do.
+    for _ in range(number):
+        getattr(indicators, name)(data)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the per-call overhead of the instrumentation hooks.")
+    parser.add_argument('--sizes', default='100,10k,1M', help="Comma separated row counts.")
+    parser.add_argument('--indicator', default='calculate_rsi', help="Exported function to call.")
+    parser.add_argument('--calls', type=int, default=200, help="Calls per measurement.")
+    parser.add_argument('--repeat', type=int, default=10, help="Measurements per setting; the best is kept.")
+    args = parser.parse_args()
+
+    # The fixed cost of the wrapper itself, measured on a function that does nothing.
+    def noop(data):
+        return None
+
+    wrappers = {
+        'plain': noop,
+        'metrics': instrument(noop, MetricsRegistry()),
+        'metrics + spans': instrument(noop, MetricsRegistry(), SpanRecorder()),
+    }
+    for label, func in wrappers.items():
+        seconds = min(timeit.repeat(lambda: func(None), number=100_000, repeat=5)) / 100_000
+        print(f"{label:>16}: {seconds * 1e6:6.2f} us per call")
+
+    print(f"\n{args.indicator}: time per call in microseconds")
+    print(f"{'rows':>12} {'baseline':>10} {'disabled':>10} {'metrics':>10} {'+ spans':>10}")
+    for rows in parse_sizes(args.sizes):
+        data = synthetic_ohlcv(rows)
+        number = max(1, min(args.calls, 10_000_000 // rows))
+
+        def per_call():
+            return best_time(calls, args.indicator, data, number, repeat=args.repeat) / number * 1e6
+
+        baseline = per_call()
+        enable_instrumentation()
+        metrics = per_call()
+        enable_instrumentation(on_span=SpanRecorder())
+        spans = per_call()
+        disable_instrumentation()
+        disabled = per_call()
+        print(f"{rows:>12,} {baseline:10.1f} {disabled:10.1f} {metrics:10.1f} {spans:10.1f}")
+
+
+if __name__ == '__main__':
+    main()
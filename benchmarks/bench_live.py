@@ -0,0 +1,55 @@
+# benchmarks/bench_live.py
+
+import argparse
+import asyncio
+import time
+
+import numpy as np
+
+from common import synthetic_ohlcv
+
+from indicators.live import LivePipeline, fake_feed
+
+SPECS = ['sma', 'ema', 'rsi', 'macd', 'bollinger_bands', 'atr', 'stochastic_oscillator', 'obv', 'parabolic_sar']
+
+
+async def replay(symbols: int, history: int, bars: int, maxsize: int, overflow: str):
+    data = {f'SYM{i}': synthetic_ohlcv(history + bars, seed=i) for i in range(symbols)}
+    pipeline = LivePipeline(SPECS, history={symbol: frame.iloc[:history] for symbol, frame in data.items()})
+    for symbol, frame in data.items():
+        pipeline.add_feed(symbol, fake_feed(frame.iloc[history:]))
+    subscription = pipeline.subscribe(maxsize=maxsize, overflow=overflow)
+
+    delivered = []
+
+    async def consume():
+        async for update in subscription:
+            delivered.append(time.perf_counter() - update.received)
+
+    start = time.perf_counter()
+    await asyncio.gather(pipeline.run(), consume())
+    return pipeline, subscription, np.array(delivered), time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay synthetic bars through the live indicator pipeline.")
+    parser.add_argument('--symbols', type=int, default=50, help="Number of concurrent feeds.")
+    parser.add_argument('--history', type=int, default=1_000, help="Bars per symbol used to seed the indicators.")
+    parser.add_argument('--bars', type=int, default=1_000, help="Live bars per symbol.")
+    parser.add_argument('--maxsize', type=int, default=1_000, help="Subscriber queue size.")
+    parser.add_argument('--overflow', default='block', choices=('block', 'drop_oldest'))
+    args = parser.parse_args()
+
+    pipeline, subscription, delivered, elapsed = asyncio.run(
+        replay(args.symbols, args.history, args.bars, args.maxsize, args.overflow))
+
+    updates = pipeline.latency.count
+    print(f"{len(SPECS)} indicators, {args.symbols:,} symbols, {updates:,} bars in {elapsed:.2f}s "
+          f"({updates / elapsed:,.0f} bars/s), {subscription.dropped:,} updates dropped")
+    print(f"{'percentile':>10} {'update (us)':>12} {'delivered (us)':>15}")
+    for percent, value in pipeline.latency.percentiles().items():
+        print(f"{percent:>10} {value * 1e6:12.1f} {np.percentile(delivered, percent) * 1e6:15.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+# benchmarks/bench_obv.py
+
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from common import best_time, parse_sizes, synthetic_ohlcv
+
+from indicators.obv import calculate_obv, obv_array
+
+
+def legacy_obv(data: pd.DataFrame) -> pd.Series:
+    """
+    The original row-by-row OBV implementation, kept as the reference for parity and timing.
+    """
+    obv = pd.Series([None] * len(data))
+    obv.iloc[0] = 0
+
+    for i in range(1, len(data)):
+        if data['Close'].iloc[i] > data['Close'].iloc[i - 1]:
+            obv.iloc[i] = obv.iloc[i - 1] + data['Volume'].iloc[i]
+        elif data['Close'].iloc[i] < data['Close'].iloc[i - 1]:
+            obv.iloc[i] = obv.iloc[i - 1] - data['Volume'].iloc[i]
+        else:
+            obv.iloc[i] = obv.iloc[i - 1]
+
+    return obv
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the vectorized OBV against the legacy loop.")
+    parser.add_argument('--sizes', default='10k,1M,10M', help="Comma separated row counts.")
+    parser.add_argument('--legacy-max-rows', type=int, default=10_000,
+                        help="Only time the legacy loop up to this many rows (it is O(n) Python calls).")
+    args = parser.parse_args()
+
+    print(f"{'rows':>12} {'legacy (s)':>12} {'series (s)':>12} {'array (s)':>12} {'speedup':>10}")
+    for rows in parse_sizes(args.sizes):
+        data = synthetic_ohlcv(rows)
+        close = data['Close'].to_numpy()
+        volume = data['Volume'].to_numpy()
+
+        series_time = best_time(calculate_obv, data)
+        array_time = best_time(obv_array, close, volume)
+
+        if rows <= args.legacy_max_rows:
+            legacy_time = best_time(legacy_obv, data, repeat=1)
+            expected = legacy_obv(data).to_numpy(dtype=np.float64)
+            if not np.array_equal(expected, calculate_obv(data).to_numpy(), equal_nan=True):
+                raise AssertionError(f"Vectorized OBV differs from the legacy loop at {rows} rows.")
+            legacy, speedup = f"{legacy_time:12.4f}", f"{legacy_time / series_time:9.0f}x"
+        else:
+            legacy, speedup = f"{'-':>12}", f"{'-':>10}"
+
+        print(f"{rows:>12,} {legacy} {series_time:12.4f} {array_time:12.4f} {speedup}")
+
+
+if __name__ == "__main__":
+    main()
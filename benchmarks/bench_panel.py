@@ -0,0 +1,62 @@
+# benchmarks/bench_panel.py
+
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from common import best_time, parse_sizes, synthetic_ohlcv
+
+import indicators
+from indicators.panel import to_panel
+
+INDICATORS = [
+    'calculate_sma', 'calculate_ema', 'calculate_rsi', 'calculate_macd', 'calculate_bollinger_bands',
+    'calculate_atr', 'calculate_stochastic_oscillator', 'calculate_williams_r', 'calculate_adl',
+    'calculate_obv', 'calculate_cci', 'calculate_cmf', 'calculate_keltner_channels',
+    'calculate_donchian_channels', 'calculate_cmo', 'calculate_parabolic_sar'
+]
+
+
+def check_parity(frames: dict, panel: pd.DataFrame):
+    """
+    Check that every indicator computed on the panel matches the per-symbol calls.
+    """
+    for name in INDICATORS:
+        func = getattr(indicators, name)
+        wide = func(panel)
+        for symbol, frame in frames.items():
+            expected = func(frame)
+            if isinstance(expected, pd.DataFrame):
+                actual = wide.xs(symbol, axis=1, level=1)[expected.columns]
+            else:
+                actual = wide[symbol]
+            if not np.allclose(expected.to_numpy(), actual.to_numpy(), rtol=1e-12, atol=1e-12, equal_nan=True):
+                raise AssertionError(f"{name} on the panel differs from the per-symbol call for {symbol}.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare per-symbol loops with one pass over a panel.")
+    parser.add_argument('--symbols', default='100,1000,5000', help="Comma separated symbol counts.")
+    parser.add_argument('--rows', type=int, default=1_000, help="Bars per symbol.")
+    parser.add_argument('--indicator', default='calculate_rsi', choices=INDICATORS)
+    args = parser.parse_args()
+
+    func = getattr(indicators, args.indicator)
+    frames = {f'SYM{i}': synthetic_ohlcv(50, seed=i) for i in range(3)}
+    check_parity(frames, to_panel(frames))
+
+    print(f"{args.indicator} on {args.rows:,} bars per symbol")
+    print(f"{'symbols':>10} {'looped (s)':>12} {'panel (s)':>12} {'speedup':>10}")
+    for count in parse_sizes(args.symbols):
+        frames = {f'SYM{i}': synthetic_ohlcv(args.rows, seed=i) for i in range(count)}
+        panel = to_panel(frames)
+
+        looped_time = best_time(lambda: {symbol: func(frame) for symbol, frame in frames.items()}, repeat=1)
+        panel_time = best_time(func, panel)
+
+        print(f"{count:>10,} {looped_time:12.4f} {panel_time:12.4f} {looped_time / panel_time:9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
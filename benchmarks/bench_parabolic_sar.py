@@ -0,0 +1,80 @@
+# benchmarks/bench_parabolic_sar.py
+
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from common import best_time, parse_sizes, synthetic_ohlcv
+
+from indicators._numba import NUMBA_AVAILABLE
+from indicators.parabolic_sar import calculate_parabolic_sar, parabolic_sar_array
+
+
+def legacy_parabolic_sar(data: pd.DataFrame, step: float = 0.02, max_step: float = 0.2) -> pd.Series:
+    """
+    The original label-indexed Parabolic SAR loop, kept as the reference for parity and timing.
+    """
+    sar = pd.Series([None] * len(data))
+    long_position = True
+    acceleration = step
+    extreme_point = data['Low'][0]
+    sar[0] = data['High'][0]
+
+    for i in range(1, len(data)):
+        if long_position:
+            sar[i] = sar[i - 1] + acceleration * (extreme_point - sar[i - 1])
+            if data['Low'][i] < sar[i]:
+                long_position = False
+                sar[i] = extreme_point
+                extreme_point = data['Low'][i]
+                acceleration = step
+        else:
+            sar[i] = sar[i - 1] + acceleration * (extreme_point - sar[i - 1])
+            if data['High'][i] > sar[i]:
+                long_position = True
+                sar[i] = extreme_point
+                extreme_point = data['High'][i]
+                acceleration = step
+        if long_position and data['High'][i] > extreme_point:
+            extreme_point = data['High'][i]
+            acceleration = min(acceleration + step, max_step)
+        elif not long_position and data['Low'][i] < extreme_point:
+            extreme_point = data['Low'][i]
+            acceleration = min(acceleration + step, max_step)
+
+    return sar
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the array-backed Parabolic SAR kernel.")
+    parser.add_argument('--sizes', default='1k,100k,1M', help="Comma separated row counts.")
+    parser.add_argument('--legacy-max-rows', type=int, default=10_000,
+                        help="Only time the legacy loop up to this many rows.")
+    args = parser.parse_args()
+
+    print(f"Numba backend: {'enabled' if NUMBA_AVAILABLE else 'not installed (pure Python kernel)'}")
+    print(f"{'rows':>12} {'legacy (s)':>12} {'series (s)':>12} {'array (s)':>12} {'speedup':>10}")
+    for rows in parse_sizes(args.sizes):
+        data = synthetic_ohlcv(rows)
+        high = data['High'].to_numpy()
+        low = data['Low'].to_numpy()
+        parabolic_sar_array(high[:10], low[:10])  # Trigger compilation outside the timed region.
+
+        series_time = best_time(calculate_parabolic_sar, data)
+        array_time = best_time(parabolic_sar_array, high, low)
+
+        if rows <= args.legacy_max_rows:
+            legacy_time = best_time(legacy_parabolic_sar, data, repeat=1)
+            expected = legacy_parabolic_sar(data).to_numpy(dtype=np.float64)
+            if not np.array_equal(expected, calculate_parabolic_sar(data).to_numpy(), equal_nan=True):
+                raise AssertionError(f"Parabolic SAR kernel differs from the legacy loop at {rows} rows.")
+            legacy, speedup = f"{legacy_time:12.4f}", f"{legacy_time / series_time:9.0f}x"
+        else:
+            legacy, speedup = f"{'-':>12}", f"{'-':>10}"
+
+        print(f"{rows:>12,} {legacy} {series_time:12.4f} {array_time:12.4f} {speedup}")
+
+
+if __name__ == "__main__":
+    main()
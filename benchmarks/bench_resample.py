@@ -0,0 +1,65 @@
+# benchmarks/bench_resample.py
+
+import argparse
+
+import pandas as pd
+
+from common import best_time, parse_sizes, synthetic_ohlcv
+
+from indicators.graph import compute_indicators
+from indicators.resample import compute_multi_timeframe, resample_many
+
+SPECS = ['rsi', 'macd', 'atr', 'bollinger_bands']
+RULES = ['5min', '1h', '1D']
+AGGREGATIONS = {'Open': 'first', 'High': 'max', 'Low': 'min', 'Close': 'last', 'Volume': 'sum'}
+
+
+def minute_bars(rows: int) -> pd.DataFrame:
+    data = synthetic_ohlcv(rows)
+    data.index = pd.date_range('2020-01-01', periods=rows, freq='1min', name='Date')
+    return data
+
+
+def separate_passes(data: pd.DataFrame):
+    """
+    One aggregate-compute-align pass per timeframe, each starting again from the base bars.
+    """
+    results = {'base': compute_indicators(data, SPECS)}
+    for rule in RULES:
+        bars = data.resample(rule).agg(AGGREGATIONS).dropna(subset=['Close'])
+        values = compute_indicators(bars, SPECS)
+        # Show each bar from its last minute on, so no row sees a bar before it closes.
+        closes = values.index + pd.Timedelta(rule) - pd.Timedelta('1min')
+        results[rule] = values.set_axis(closes).reindex(data.index, method='ffill')
+    return pd.concat(results, axis=1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare per-timeframe passes with the multi-timeframe stage.")
+    parser.add_argument('--rows', type=parse_sizes, default=parse_sizes('100k,1M,10M'),
+                        help="Comma separated numbers of 1-minute bars, e.g. 100k,1M.")
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{len(SPECS)} indicators on 1min + {', '.join(RULES)}")
+    print(f"{'rows':>12} {'aggregate (s)':>14} {'cascade (s)':>12} {'separate (s)':>13} {'multi-tf (s)':>13}")
+    for rows in args.rows:
+        data = minute_bars(rows)
+
+        cascaded = resample_many(data, RULES)
+        for rule in RULES:
+            expected = data.resample(rule).agg(AGGREGATIONS).dropna(subset=['Close'])
+            pd.testing.assert_frame_equal(cascaded[rule], expected, check_freq=False, check_names=False)
+        pd.testing.assert_frame_equal(compute_multi_timeframe(data, SPECS, RULES), separate_passes(data),
+                                      check_names=False, rtol=1e-9)
+
+        aggregate = best_time(lambda: {rule: data.resample(rule).agg(AGGREGATIONS) for rule in RULES},
+                              repeat=args.repeat)
+        cascade = best_time(resample_many, data, RULES, repeat=args.repeat)
+        separate = best_time(separate_passes, data, repeat=args.repeat)
+        multi = best_time(compute_multi_timeframe, data, SPECS, RULES, repeat=args.repeat)
+        print(f"{rows:>12,} {aggregate:14.3f} {cascade:12.3f} {separate:13.3f} {multi:13.3f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+# benchmarks/bench_signals.py
+
+import argparse
+import time
+
+from common import best_time, parse_sizes, synthetic_ohlcv
+
+from indicators import calculate_bollinger_bands, calculate_macd, calculate_rsi, calculate_stochastic_oscillator
+from indicators.panel import to_panel
+from indicators.signals import BandBreakout, Crossover, Hysteresis, Threshold, evaluate
+
+SIGNALS = {
+    'macd_cross': Crossover('MACD Line', 'Signal Line'),
+    'stochastic_cross': Crossover('%K', '%D'),
+    'oversold': Threshold('RSI', 30, side='below'),
+    'breakout': BandBreakout('Close', 'Upper Band', 'Lower Band'),
+    'trend': Hysteresis('%K', enter=80, exit=50),
+}
+
+
+def outputs(data) -> dict:
+    macd = calculate_macd(data)
+    bands = calculate_bollinger_bands(data)
+    stochastic = calculate_stochastic_oscillator(data)
+    return {
+        'MACD Line': macd['MACD Line'], 'Signal Line': macd['Signal Line'],
+        'Close': data['Close'], 'Upper Band': bands['Upper Band'], 'Lower Band': bands['Lower Band'],
+        'RSI': calculate_rsi(data), '%K': stochastic['%K'], '%D': stochastic['%D']
+    }
+
+
+def looped(columns: dict) -> dict:
+    # What strategies did before: walk the rows of every symbol in Python, keeping the previous values.
+    events = {name: [] for name in SIGNALS}
+    macd, signal = columns['MACD Line'].T.tolist(), columns['Signal Line'].T.tolist()
+    k, d = columns['%K'].T.tolist(), columns['%D'].T.tolist()
+    rsi, close = columns['RSI'].T.tolist(), columns['Close'].T.tolist()
+    upper, lower = columns['Upper Band'].T.tolist(), columns['Lower Band'].T.tolist()
+    for symbol in range(len(macd)):
+        trend = False
+        for row in range(len(macd[symbol])):
+            if k[symbol][row] >= 80 and not trend:
+                trend = True
+                events['trend'].append((row, symbol, 1))
+            elif k[symbol][row] <= 50 and trend:
+                trend = False
+                events['trend'].append((row, symbol, -1))
+            if row == 0:
+                continue
+            if macd[symbol][row] > signal[symbol][row] and macd[symbol][row - 1] <= signal[symbol][row - 1]:
+                events['macd_cross'].append((row, symbol, 1))
+            if k[symbol][row] > d[symbol][row] and k[symbol][row - 1] <= d[symbol][row - 1]:
+                events['stochastic_cross'].append((row, symbol, 1))
+            if rsi[symbol][row] < 30 and rsi[symbol][row - 1] >= 30:
+                events['oversold'].append((row, symbol, 1))
+            elif rsi[symbol][row] >= 30 and rsi[symbol][row - 1] < 30:
+                events['oversold'].append((row, symbol, -1))
+            if close[symbol][row] > upper[symbol][row] and close[symbol][row - 1] <= upper[symbol][row - 1]:
+                events['breakout'].append((row, symbol, 1))
+            elif close[symbol][row] < lower[symbol][row] and close[symbol][row - 1] >= lower[symbol][row - 1]:
+                events['breakout'].append((row, symbol, -1))
+    return events
+
+
+def streamed(columns: dict) -> float:
+    """
+    Feed the rows to one stream per signal, all symbols at once, and return the seconds per row.
+    """
+    streams = {name: signal.stream() for name, signal in SIGNALS.items()}
+    rows = len(next(iter(columns.values())))
+    start = time.perf_counter()
+    for row in range(rows):
+        bar = {name: values[row] for name, values in columns.items()}
+        for stream in streams.values():
+            stream.update(bar)
+    return (time.perf_counter() - start) / rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare row-by-row Python signal detection with the vectorized "
+                                                 "signal engine over panels of growing width.")
+    parser.add_argument('--symbols', type=parse_sizes, default=parse_sizes('100,1000,5000'),
+                        help="Comma separated symbol counts.")
+    parser.add_argument('--rows', type=int, default=1_000, help="Bars per symbol.")
+    args = parser.parse_args()
+
+    print(f"{len(SIGNALS)} signals on {args.rows:,} bars per symbol")
+    print(f"{'symbols':>10} {'looped (s)':>11} {'vectorized (s)':>15} {'speedup':>8} {'stream (ms/bar)':>16} "
+          f"{'events':>9} {'events (KiB)':>13} {'boolean (KiB)':>14}")
+    for count in args.symbols:
+        panel = to_panel({f'SYM{i}': synthetic_ohlcv(args.rows, seed=i) for i in range(count)})
+        data = outputs(panel)
+        columns = {name: values.to_numpy() for name, values in data.items()}
+
+        events = evaluate(SIGNALS, data)
+        expected = looped(columns)
+        for name, found in events.items():
+            if list(zip(found.rows.tolist(), found.columns.tolist(), found.sides.tolist())) != sorted(expected[name]):
+                raise AssertionError(f"The vectorized '{name}' events differ from the row loop.")
+
+        looped_time = best_time(looped, columns, repeat=1)
+        vectorized_time = best_time(evaluate, SIGNALS, data)
+        stream_time = streamed(columns)
+        total = sum(len(found.rows) for found in events.values())
+        size = sum(array.nbytes for found in events.values() for array in found)
+        print(f"{count:>10,} {looped_time:11.3f} {vectorized_time:15.4f} {looped_time / vectorized_time:7.0f}x "
+              f"{stream_time * 1e3:16.3f} {total:>9,} {size / 1024:13.0f} "
+              f"{len(SIGNALS) * args.rows * count / 1024:14.0f}")
+
+
+if __name__ == '__main__':
+    main()
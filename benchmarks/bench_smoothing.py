@@ -0,0 +1,49 @@
+# benchmarks/bench_smoothing.py
+
+import argparse
+
+import numpy as np
+
+from common import best_time, parse_sizes, synthetic_ohlcv
+
+import indicators
+from indicators.panel import to_panel
+from indicators.rolling import smoothed_mean
+
+FUNCTIONS = {'rsi': indicators.calculate_rsi, 'atr': indicators.calculate_atr}
+
+
+def wilder_loop(values, period):
+    # Wilder's textbook recursion, to check the filter against.
+    result = np.full(len(values), np.nan)
+    result[period - 1] = values[:period].mean()
+    for i in range(period, len(values)):
+        result[i] = (result[i - 1] * (period - 1) + values[i]) / period
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time the RSI and ATR with simple, Wilder and exponential smoothing.")
+    parser.add_argument('--rows', type=parse_sizes, default=parse_sizes('100k,1M,10M'), help="Comma separated sizes.")
+    parser.add_argument('--symbols', type=int, default=500, help="Number of symbols in the panel run.")
+    parser.add_argument('--bars', type=int, default=2_000, help="Bars per symbol in the panel run.")
+    parser.add_argument('--period', type=int, default=14)
+    args = parser.parse_args()
+
+    values = synthetic_ohlcv(2_000)['Close'].to_numpy()
+    np.testing.assert_allclose(smoothed_mean(values, args.period, 'wilder'), wilder_loop(values, args.period),
+                               rtol=1e-12)
+
+    cases = [(f'{rows:,} x 1', synthetic_ohlcv(rows)) for rows in args.rows]
+    panel = to_panel({f'SYM{i}': synthetic_ohlcv(args.bars, seed=i) for i in range(args.symbols)})
+    cases.append((f'{args.bars:,} x {args.symbols:,}', panel))
+
+    print(f"{'indicator':>10} {'shape':>16} {'sma (s)':>10} {'wilder (s)':>11} {'ema (s)':>10}")
+    for label, data in cases:
+        for name, func in FUNCTIONS.items():
+            seconds = [best_time(func, data, args.period, smoothing) for smoothing in ('sma', 'wilder', 'ema')]
+            print(f"{name:>10} {label:>16} {seconds[0]:10.4f} {seconds[1]:11.4f} {seconds[2]:10.4f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+# benchmarks/bench_store.py
+
+import argparse
+import tempfile
+
+import numpy as np
+
+from common import best_time, parse_sizes, synthetic_ohlcv
+
+from indicators import calculate_macd
+from indicators.store import ResultStore
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare recomputing the MACD with reading it from the result store.")
+    parser.add_argument('--symbols', type=int, default=200, help="Number of stored symbols.")
+    parser.add_argument('--rows', default='100k', help="Bars per symbol.")
+    args = parser.parse_args()
+
+    rows = parse_sizes(args.rows)[0]
+    frames = {f'SYM{i}': synthetic_ohlcv(rows, seed=i) for i in range(args.symbols)}
+
+    with tempfile.TemporaryDirectory() as root:
+        store = ResultStore(root)
+        write_time = best_time(lambda: [store.write(symbol, 'macd', calculate_macd(frame))
+                                        for symbol, frame in frames.items()], repeat=1)
+
+        for symbol, frame in list(frames.items())[:3]:
+            if not np.array_equal(calculate_macd(frame).to_numpy(), store.read(symbol, 'macd').to_numpy(),
+                                  equal_nan=True):
+                raise AssertionError(f"Stored MACD differs from the computed one for {symbol}.")
+
+        compute_time = best_time(lambda: [calculate_macd(frame) for frame in frames.values()])
+        read_time = best_time(lambda: [store.read(symbol, 'macd') for symbol in frames])
+        column_time = best_time(lambda: store.read_many(list(frames), 'macd', column='Signal Line'))
+
+    print(f"MACD for {args.symbols:,} symbols x {rows:,} bars")
+    print(f"{'compute + write (s)':>24} {write_time:10.4f}")
+    print(f"{'recompute (s)':>24} {compute_time:10.4f}")
+    print(f"{'mmap read (s)':>24} {read_time:10.4f} {compute_time / read_time:9.1f}x")
+    print(f"{'one column, wide (s)':>24} {column_time:10.4f}")
+
+
+if __name__ == '__main__':
+    main()
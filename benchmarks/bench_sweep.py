@@ -0,0 +1,55 @@
+# benchmarks/bench_sweep.py
+
+import argparse
+
+import numpy as np
+
+from common import best_time, parse_sizes, synthetic_ohlcv
+
+import indicators
+from indicators import sweep
+
+SWEEPS = {
+    'sma': (sweep.sweep_sma, indicators.calculate_sma),
+    'ema': (sweep.sweep_ema, indicators.calculate_ema),
+    'rsi': (sweep.sweep_rsi, indicators.calculate_rsi),
+    'bollinger_bands': (sweep.sweep_bollinger_bands, indicators.calculate_bollinger_bands),
+}
+
+
+def looped(func, data, periods):
+    return {period: func(data, period=period) for period in periods}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare period sweeps with one calculate_* call per period.")
+    parser.add_argument('--rows', default='1M', help="Comma separated row counts.")
+    parser.add_argument('--min-period', type=int, default=2)
+    parser.add_argument('--max-period', type=int, default=200)
+    parser.add_argument('--indicators', default='sma,ema,rsi', help=f"Any of: {', '.join(SWEEPS)}.")
+    args = parser.parse_args()
+
+    periods = range(args.min_period, args.max_period + 1)
+    print(f"Sweeping periods {args.min_period}-{args.max_period} ({len(periods)} values)")
+    print(f"{'indicator':>16} {'rows':>12} {'looped (s)':>12} {'sweep (s)':>12} {'speedup':>10}")
+    for rows in parse_sizes(args.rows):
+        data = synthetic_ohlcv(rows)
+        for name in args.indicators.split(','):
+            sweep_func, func = SWEEPS[name]
+
+            # Spot-check a few periods against the per-period function before timing.
+            result = sweep_func(data, periods)
+            for period in (periods[0], periods[len(periods) // 2], periods[-1]):
+                expected = func(data, period=period)
+                actual = result.xs(period, axis=1, level='period') if result.columns.nlevels > 1 else result[period]
+                if not np.allclose(expected.to_numpy(), actual.to_numpy(), rtol=1e-9, atol=1e-9, equal_nan=True):
+                    raise AssertionError(f"sweep_{name} differs from calculate_{name} for period {period}.")
+            del result
+
+            looped_time = best_time(looped, func, data, periods, repeat=1)
+            sweep_time = best_time(sweep_func, data, periods, repeat=1)
+            print(f"{name:>16} {rows:>12,} {looped_time:12.3f} {sweep_time:12.3f} {looped_time / sweep_time:9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
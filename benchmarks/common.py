@@ -0,0 +1,81 @@
+# benchmarks/common.py
+
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+# Allow the benchmarks to be run straight from a checkout (python benchmarks/bench_obv.py).
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def synthetic_ohlcv(rows: int, seed: int = 42, start_price: float = 100.0) -> pd.DataFrame:
+    """
+    Generate a synthetic OHLCV DataFrame following a geometric random walk.
+
+    :param rows: The number of bars to generate.
+    :param seed: Seed for the random number generator, so runs are reproducible.
+    :param start_price: The first closing price.
+    :return: A Pandas DataFrame with 'Open', 'High', 'Low', 'Close' and 'Volume' columns.
+    """
+    rng = np.random.default_rng(seed)
+    close = start_price * np.exp(np.cumsum(rng.normal(0.0, 0.001, rows)))
+    open_ = np.empty(rows)
+    open_[0] = start_price
+    open_[1:] = close[:-1]
+    spread = np.abs(rng.normal(0.0, 0.0015, rows)) * close
+    high = np.maximum(open_, close) + spread
+    low = np.minimum(open_, close) - spread
+    # Round the volume so flat bars (equal closes) and integer volumes both occur.
+    volume = np.round(rng.lognormal(8.0, 1.0, rows))
+
+    return pd.DataFrame({
+        'Open': open_,
+        'High': high,
+        'Low': low,
+        'Close': np.round(close, 2),
+        'Volume': volume
+    })
+
+
+def best_time(func, *args, repeat: int = 3, **kwargs) -> float:
+    """
+    Return the best wall-clock time in seconds over ``repeat`` calls of ``func``.
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def peak_memory(func, *args, **kwargs) -> int:
+    """
+    Return the peak memory in bytes allocated through Python and NumPy during one call of ``func``.
+    """
+    tracemalloc.start()
+    try:
+        func(*args, **kwargs)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def parse_sizes(value: str) -> list:
+    """
+    Parse a comma separated list of row counts such as '10k,1M,10M'.
+    """
+    multipliers = {'k': 1_000, 'm': 1_000_000}
+    sizes = []
+    for item in value.split(','):
+        item = item.strip().lower()
+        if item[-1] in multipliers:
+            sizes.append(int(float(item[:-1]) * multipliers[item[-1]]))
+        else:
+            sizes.append(int(item))
+    return sizes
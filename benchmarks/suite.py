@@ -0,0 +1,183 @@
+# benchmarks/suite.py
+
+"""
+Benchmark every function exported by the ``indicators`` package and check for regressions.
+
+Each function is timed on synthetic OHLCV data for every combination of size, layout (a single
+symbol or a panel of symbols) and dtype, and reports its throughput in rows per second and its peak
+memory. Results can be saved as a baseline; later runs are compared against it and the script exits
+with status 1 when a function got slower (or used more memory) than the allowed thresholds::
+
+    python benchmarks/suite.py --sizes 1k,100k --save            # record the baseline
+    python benchmarks/suite.py --sizes 1k,100k --threshold 0.2   # fail on a 20% slowdown
+
+The calculate_* functions and compute_indicators run on DataFrames, the *_array kernels on NumPy
+arrays. Baselines are specific to a machine, so record them on the machine that runs the comparison.
+"""
+
+import argparse
+import fnmatch
+import inspect
+import json
+import os
+import platform
+import sys
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from common import parse_sizes, peak_memory, synthetic_ohlcv
+
+import indicators
+from indicators.graph import INDICATORS
+from indicators.panel import to_panel
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+# Kernels whose recursion runs on one symbol at a time; the adapters loop over panel columns.
+ONE_DIMENSIONAL = {'parabolic_sar_array'}
+
+ARRAY_ARGUMENTS = ('high', 'low', 'close', 'volume')
+
+
+def make_data(rows: int, layout: str, symbols: int, dtype) -> pd.DataFrame:
+    """
+    Build ``rows`` bars of synthetic data: one symbol, or a panel of ``symbols`` sharing the rows.
+    """
+    if layout == 'single':
+        data = synthetic_ohlcv(rows)
+    else:
+        per_symbol = max(rows // symbols, 1)
+        data = to_panel({f'SYM{i}': synthetic_ohlcv(per_symbol, seed=i) for i in range(symbols)})
+    return data.astype(dtype)
+
+
+def call_for(name: str, data: pd.DataFrame, dtype):
+    """
+    Return ``(func, args, kwargs)`` calling the exported function ``name`` on ``data``, or None when
+    the function does not take this layout.
+    """
+    func = getattr(indicators, name)
+    if name == 'compute_indicators':
+        return func, (data, list(INDICATORS)), {}
+    if name.startswith('calculate_'):
+        return func, (data,), {'dtype': dtype}
+
+    if isinstance(data.columns, pd.MultiIndex) and name in ONE_DIMENSIONAL:
+        return None
+    fields = [parameter for parameter in inspect.signature(func).parameters if parameter in ARRAY_ARGUMENTS]
+    arrays = tuple(data[field.capitalize()].to_numpy() for field in fields)
+    return func, arrays, {'dtype': dtype}
+
+
+def seconds_per_call(func, args, kwargs, repeat: int) -> float:
+    """
+    Return the best time of one call, looping short calls until each measurement takes 0.2 seconds.
+    """
+    timer = timeit.Timer(lambda: func(*args, **kwargs))
+    number, elapsed = timer.autorange()
+    times = [elapsed] + timer.repeat(repeat - 1, number) if repeat > 1 else [elapsed]
+    return min(times) / number
+
+
+def environment() -> dict:
+    return {
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'system': platform.system(),
+    }
+
+
+def load_baseline(path: str) -> dict:
+    if not os.path.isfile(path):
+        return {'environment': None, 'results': {}}
+    with open(path) as file:
+        return json.load(file)
+
+
+def compare(result: dict, baseline: dict, threshold: float, memory_threshold: float) -> tuple:
+    """
+    Return ``(change, regressed)``: the relative throughput change against the baseline and whether
+    it exceeds one of the thresholds. ``change`` is None without a baseline entry.
+    """
+    if baseline is None:
+        return None, False
+    change = result['rows_per_sec'] / baseline['rows_per_sec'] - 1
+    regressed = change < -threshold
+    if memory_threshold is not None and baseline['peak_bytes']:
+        regressed |= result['peak_bytes'] > baseline['peak_bytes'] * (1 + memory_threshold)
+    return change, regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark every exported indicator function against a baseline.")
+    parser.add_argument('--sizes', default='1k,100k,10M', help="Comma separated row counts, e.g. 1k,100k,10M.")
+    parser.add_argument('--layouts', default='single,panel', help="Comma separated layouts: single, panel.")
+    parser.add_argument('--symbols', type=int, default=100, help="Number of symbols sharing the rows of a panel.")
+    parser.add_argument('--dtypes', default='float64', help="Comma separated dtypes, e.g. float64,float32.")
+    parser.add_argument('--only', default='*',
+                        help="Comma separated name patterns of the functions to run, e.g. 'calculate_*,*rsi*'.")
+    parser.add_argument('--repeat', type=int, default=3, help="Measurements per function; the best is kept.")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help="Path of the baseline JSON file.")
+    parser.add_argument('--save', action='store_true', help="Write the results to the baseline file.")
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help="Fail when throughput drops by more than this fraction of the baseline.")
+    parser.add_argument('--memory-threshold', type=float, default=None,
+                        help="Also fail when peak memory grows by more than this fraction of the baseline.")
+    args = parser.parse_args()
+
+    patterns = args.only.split(',')
+    names = [name for name in indicators.__all__ if any(fnmatch.fnmatch(name, pattern) for pattern in patterns)]
+    baseline = load_baseline(args.baseline)
+    if baseline['environment'] not in (None, environment()):
+        print(f"Warning: the baseline was recorded in a different environment: {baseline['environment']}")
+
+    results = {}
+    regressions = []
+    print(f"{'function':<32} {'layout':>7} {'dtype':>8} {'rows':>12} {'rows/s':>14} {'peak MB':>9} {'change':>8}")
+    for rows in parse_sizes(args.sizes):
+        for layout in args.layouts.split(','):
+            for dtype in (np.dtype(name) for name in args.dtypes.split(',')):
+                data = make_data(rows, layout, args.symbols, dtype)
+                cells = data['Close'].size
+                for name in names:
+                    call = call_for(name, data, dtype)
+                    if call is None:
+                        continue
+                    func, call_args, kwargs = call
+                    seconds = seconds_per_call(func, call_args, kwargs, args.repeat)
+                    result = {
+                        'rows_per_sec': cells / seconds,
+                        'peak_bytes': peak_memory(func, *call_args, **kwargs)
+                    }
+                    key = f'{name} {layout} {dtype.name} {rows}'
+                    results[key] = result
+
+                    change, regressed = compare(result, baseline['results'].get(key),
+                                                args.threshold, args.memory_threshold)
+                    if regressed:
+                        regressions.append(key)
+                    shown = '' if change is None else f'{change:+.0%}'
+                    print(f"{name:<32} {layout:>7} {dtype.name:>8} {cells:>12,} {result['rows_per_sec']:>14,.0f} "
+                          f"{result['peak_bytes'] / 2 ** 20:9.1f} {shown:>8}{'  REGRESSION' if regressed else ''}")
+
+    if args.save:
+        baseline['environment'] = environment()
+        baseline['results'].update(results)
+        with open(args.baseline, 'w') as file:
+            json.dump(baseline, file, indent=2, sort_keys=True)
+        print(f"Saved {len(results)} results to {args.baseline}")
+
+    if regressions:
+        print(f"{len(regressions)} regression(s) beyond the thresholds:")
+        for key in regressions:
+            print(f"  {key}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -3,6 +3,8 @@
 import os
 import pandas as pd
 
+from indicators.ingest import PRICE_COLUMNS, PriceCache, price_columns
+
 # Import individual indicators
 from indicators.adl import calculate_adl
 from indicators.atr import calculate_atr
@@ -24,6 +26,9 @@ from indicators.williams_r import calculate_williams_r
 # Define the path to the price history folder
 PRICE_HISTORY_FOLDER = "price_history"
 
+# Parsed copies of the CSV files; later runs memory-map them instead of parsing the CSV again
+PRICE_CACHE_FOLDER = os.path.join(PRICE_HISTORY_FOLDER, ".cache")
+
 # Variable to point to the specific price history file (update this variable with the filename to use)
 price_file = "BNBUSDT.csv"  # Replace with your desired file
 
@@ -40,7 +45,7 @@ def load_price_data(filename):
     - Volume
 
     :param filename: The name of the CSV file to load.
-    :return: A Pandas DataFrame with the required columns.
+    :return: A Pandas DataFrame with the required columns, 'Date' parsed to timestamps.
     """
     # Construct the full path to the CSV file
     file_path = os.path.join(PRICE_HISTORY_FOLDER, filename)
@@ -49,9 +54,11 @@ def load_price_data(filename):
     if not os.path.isfile(file_path):
         raise FileNotFoundError(f"File {filename} not found in {PRICE_HISTORY_FOLDER} folder.")
 
-    # Load the CSV file into a DataFrame
+    # Load the CSV file into a DataFrame (parsed once, then memory-mapped from the cache)
     try:
-        df = pd.read_csv(file_path, usecols=['Date', 'Open', 'High', 'Low', 'Close', 'Volume'])
+        # Fail on a file missing any of the six columns, 'Date' included
+        price_columns(file_path, required=PRICE_COLUMNS)
+        df = PriceCache(PRICE_CACHE_FOLDER).load(file_path)
         return df
     except Exception as e:
         raise ValueError(f"Error loading file {filename}: {e}")
@@ -1,7 +1,8 @@
 # main.py
 
 import os
-import pandas as pd
+
+from indicators.ingest import PRICE_COLUMNS, PriceCache, price_columns
 from indicators.sma import calculate_sma
 from indicators.rsi import calculate_rsi
 from indicators.ema import calculate_ema
@@ -12,6 +13,9 @@ from indicators.atr import calculate_atr
 # Define the path to the price history folder
 PRICE_HISTORY_FOLDER = "price_history"
 
+# Parsed copies of the CSV files; later runs memory-map them instead of parsing the CSV again
+PRICE_CACHE_FOLDER = os.path.join(PRICE_HISTORY_FOLDER, ".cache")
+
 # Variable to point to the specific price history file (update this variable with the filename to use)
 price_file = "BNBUSDT.csv"  # Replace with your desired file
 
@@ -32,7 +36,8 @@ def load_price_data(filename):
     Any columns beyond the 6th will be ignored during extraction.
 
     :param filename: The name of the CSV file to load.
-    :return: A Pandas DataFrame with the first 6 columns (Date, Open, High, Low, Close, Volume).
+    :return: A Pandas DataFrame with the first 6 columns (Date, Open, High, Low, Close, Volume), 'Date'
+        parsed to timestamps.
     """
     # Construct the full path to the CSV file
     file_path = os.path.join(PRICE_HISTORY_FOLDER, filename)
@@ -41,10 +46,12 @@ def load_price_data(filename):
     if not os.path.isfile(file_path):
         raise FileNotFoundError(f"File {filename} not found in {PRICE_HISTORY_FOLDER} folder.")
 
-    # Load the CSV file into a DataFrame
+    # Load the CSV file into a DataFrame (parsed once, then memory-mapped from the cache)
     try:
-        # Load only the first 6 columns from the CSV file (headers will be auto-detected)
-        df = pd.read_csv(file_path, usecols=['Date', 'Open', 'High', 'Low', 'Close', 'Volume'])
+        # Fail on a file missing any of the six columns, 'Date' included
+        price_columns(file_path, required=PRICE_COLUMNS)
+        # Only the Date, Open, High, Low, Close and Volume columns are kept
+        df = PriceCache(PRICE_CACHE_FOLDER).load(file_path)
         return df
     except Exception as e:
         raise ValueError(f"Error loading file {filename}: {e}")
@@ -1,38 +1,74 @@
 # indicators/__init__.py
 
-from .adl import calculate_adl
-from .atr import calculate_atr
-from .bollinger_bands import calculate_bollinger_bands
-from .cci import calculate_cci
-from .cmf import calculate_cmf
-from .cmo import calculate_cmo
-from .donchian import calculate_donchian_channels
-from .ema import calculate_ema
-from .keltner import calculate_keltner_channels
-from .macd import calculate_macd
-from .obv import calculate_obv
-from .parabolic_sar import calculate_parabolic_sar
-from .rsi import calculate_rsi
-from .sma import calculate_sma
-from .stochastic import calculate_stochastic_oscillator
-from .williams_r import calculate_williams_r
-
-
-__all__ = [
-    'calculate_adl',
-    'calculate_atr',
-    'calculate_bollinger_bands',
-    'calculate_cci',
-    'calculate_cmf',
-    'calculate_cmo',
-    'calculate_donchian_channels',
-    'calculate_ema',
-    'calculate_keltner_channels',
-    'calculate_macd',
-    'calculate_obv',
-    'calculate_parabolic_sar',
-    'calculate_rsi',
-    'calculate_sma',
-    'calculate_stochastic_oscillator',
-    'calculate_williams_r'
-]
+"""
+Technical indicators for OHLCV price data.
+
+The exported functions are imported lazily: ``import indicators`` loads no indicator module (nor
+NumPy or pandas), and the first access to a name such as ``indicators.calculate_rsi`` imports just
+the module defining it. :mod:`indicators.registry` describes every indicator without importing it.
+"""
+
+import importlib
+
+# Exported name -> module defining it.
+_EXPORTS = {
+    'calculate_adl': 'adl',
+    'calculate_atr': 'atr',
+    'calculate_bollinger_bands': 'bollinger_bands',
+    'calculate_cci': 'cci',
+    'calculate_cmf': 'cmf',
+    'calculate_cmo': 'cmo',
+    'calculate_donchian_channels': 'donchian',
+    'calculate_ema': 'ema',
+    'calculate_keltner_channels': 'keltner',
+    'calculate_macd': 'macd',
+    'calculate_obv': 'obv',
+    'calculate_parabolic_sar': 'parabolic_sar',
+    'calculate_rsi': 'rsi',
+    'calculate_sma': 'sma',
+    'calculate_stochastic_oscillator': 'stochastic',
+    'calculate_williams_r': 'williams_r',
+    'compute_indicators': 'graph',
+    'adl_array': 'adl',
+    'atr_array': 'atr',
+    'bollinger_bands_array': 'bollinger_bands',
+    'cci_array': 'cci',
+    'cmf_array': 'cmf',
+    'cmo_array': 'cmo',
+    'donchian_channels_array': 'donchian',
+    'ema_array': 'ema',
+    'keltner_channels_array': 'keltner',
+    'macd_array': 'macd',
+    'money_flow_multiplier_array': 'adl',
+    'obv_array': 'obv',
+    'parabolic_sar_array': 'parabolic_sar',
+    'rsi_array': 'rsi',
+    'sma_array': 'sma',
+    'stochastic_oscillator_array': 'stochastic',
+    'true_range_array': 'atr',
+    'williams_r_array': 'williams_r',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(f'.{_EXPORTS[name]}', __name__), name)
+        # Cache the function, so later lookups no longer go through this hook.
+        globals()[name] = value
+        return value
+
+    # Submodules (indicators.panel, indicators.store, ...) are loaded on first access as well.
+    try:
+        if name.startswith('__'):
+            raise ModuleNotFoundError(name=f'{__name__}.{name}')
+        return importlib.import_module(f'.{name}', __name__)
+    except ModuleNotFoundError as error:
+        if error.name != f'{__name__}.{name}':
+            raise
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
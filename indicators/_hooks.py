@@ -0,0 +1,69 @@
+# indicators/_hooks.py
+
+"""
+Wrappers installed over the functions exported by the package.
+
+:mod:`indicators.cache` and :mod:`indicators.instrument` both replace the exported functions in the
+package namespace. They register their wrapper here rather than setting the names themselves, so
+either can be enabled and disabled in any order without undoing the other: every exported name is
+rebuilt from its original function through the wrappers still installed, in installation order.
+The size of a result, which both account for, is measured by :func:`nbytes`.
+"""
+
+import sys
+
+import numpy as np
+import pandas as pd
+
+# Owner -> wrapper factory taking (func, name), innermost first.
+_wrappers = {}
+# Exported name -> original function, while any wrapper is installed.
+_originals = {}
+
+
+def install(owner: str, wrap):
+    """
+    Install (or reinstall as the outermost) the wrapper of ``owner`` over every exported function.
+
+    :param owner: Key identifying the wrapper, e.g. 'cache'.
+    :param wrap: Callable taking ``(func, name)`` and returning the wrapped function.
+    """
+    _wrappers.pop(owner, None)
+    _wrappers[owner] = wrap
+    _apply()
+
+
+def uninstall(owner: str):
+    """
+    Remove the wrapper of ``owner``, keeping the others installed.
+    """
+    if _wrappers.pop(owner, None) is not None:
+        _apply()
+
+
+def _apply():
+    package = sys.modules[__package__]
+    if not _originals:
+        _originals.update((name, getattr(package, name)) for name in package.__all__)
+    for name, func in _originals.items():
+        for wrap in _wrappers.values():
+            func = wrap(func, name)
+        setattr(package, name, func)
+    if not _wrappers:
+        _originals.clear()
+
+
+def nbytes(value) -> int:
+    """
+    Return the memory held by an indicator result: a DataFrame, Series, array, Arrow object or tuple of them.
+    """
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return int(np.sum(value.memory_usage(deep=False)))
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, tuple):
+        return sum(nbytes(item) for item in value)
+    if hasattr(value, 'nbytes'):
+        # Arrow tables, batches and arrays.
+        return value.nbytes
+    return sys.getsizeof(value)
@@ -0,0 +1,24 @@
+# indicators/_numba.py
+
+"""
+Optional Numba backend.
+
+Kernels decorated with :func:`jit` are compiled with ``numba.njit`` when Numba is installed and
+run as plain Python otherwise, so Numba never becomes a hard dependency of the package.
+"""
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - depends on the environment
+    njit = None
+
+NUMBA_AVAILABLE = njit is not None
+
+
+def jit(func):
+    """
+    Compile ``func`` with Numba in nopython mode when available, otherwise return it unchanged.
+    """
+    if njit is None:
+        return func
+    return njit(cache=True, nogil=True)(func)
@@ -1,19 +1,75 @@
 # indicators/adl.py
 
+import numpy as np
 import pandas as pd
 
+from .panel import field_major, field_arrays, fields, like
 
-def calculate_adl(data: pd.DataFrame) -> pd.Series:
+
+def money_flow_multiplier_array(high, low, close, dtype=np.float64) -> np.ndarray:
+    """
+    Calculate the money flow multiplier (close location value) on plain NumPy arrays.
+
+    :param high: An array-like of high prices, one row per bar (2-D for one column per symbol).
+    :param low: An array-like of low prices with the same shape as ``high``.
+    :param close: An array-like of closing prices with the same shape as ``high``.
+    :param dtype: The floating-point dtype of the computation and result, e.g. np.float32 to halve memory.
+    :return: A NumPy array with values between -1 (close at the low) and 1 (close at the high).
+    """
+    high = np.asarray(high, dtype=dtype)
+    low = np.asarray(low, dtype=dtype)
+    close = np.asarray(close, dtype=dtype)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return ((close - low) - (high - close)) / (high - low)
+
+
+def adl_array(high, low, close, volume, dtype=np.float64) -> np.ndarray:
+    """
+    Calculate the Accumulation/Distribution Line (ADL) on plain NumPy arrays.
+
+    Bars with a missing money flow volume are NaN and leave the running total unchanged, as in
+    ``Series.cumsum()``.
+
+    :param high: An array-like of high prices, one row per bar (2-D for one column per symbol).
+    :param low: An array-like of low prices with the same shape as ``high``.
+    :param close: An array-like of closing prices with the same shape as ``high``.
+    :param volume: An array-like of volumes with the same shape as ``high``.
+    :param dtype: The floating-point dtype of the computation and result, e.g. np.float32 to halve memory.
+    :return: A NumPy array with the ADL values.
+    """
+    clv = money_flow_multiplier_array(high, low, close, dtype)
+    money_flow_volume = clv * np.asarray(volume, dtype=dtype)
+
+    missing = np.isnan(money_flow_volume)
+    adl = np.cumsum(np.where(missing, 0, money_flow_volume), axis=0)
+    adl[missing] = np.nan
+
+    return adl
+
+
+def calculate_money_flow_multiplier(data: pd.DataFrame, dtype=np.float64) -> pd.Series:
+    """
+    Calculate the money flow multiplier (close location value) shared by the ADL and the CMF.
+
+    :param data: A Pandas DataFrame containing 'High', 'Low', and 'Close' columns.
+    :param dtype: The floating-point dtype of the computation and result, e.g. np.float32 to halve memory.
+    :return: A Pandas Series with values between -1 (close at the low) and 1 (close at the high).
+    """
+    template, arrays = field_arrays(field_major(data), ('High', 'Low', 'Close'), dtype)
+    return like(money_flow_multiplier_array(*arrays, dtype=dtype), template)
+
+
+def calculate_adl(data: pd.DataFrame, dtype=np.float64) -> pd.Series:
     """
     Calculate the Accumulation/Distribution Line (ADL) for the given data.
 
     :param data: A Pandas DataFrame containing 'High', 'Low', 'Close', and 'Volume' columns.
+    :param dtype: The floating-point dtype of the computation and result, e.g. np.float32 to halve memory.
     :return: A Pandas Series representing the ADL values.
     """
-    if not {'High', 'Low', 'Close', 'Volume'}.issubset(data.columns):
+    data = field_major(data)
+    if not {'High', 'Low', 'Close', 'Volume'}.issubset(fields(data)):
         raise ValueError("DataFrame must contain 'High', 'Low', 'Close', and 'Volume' columns.")
 
-    clv = ((data['Close'] - data['Low']) - (data['High'] - data['Close'])) / (data['High'] - data['Low'])
-    adl = (clv * data['Volume']).cumsum()
-
-    return adl
+    template, arrays = field_arrays(data, ('High', 'Low', 'Close', 'Volume'), dtype)
+    return like(adl_array(*arrays, dtype=dtype), template)
@@ -1,29 +1,80 @@
 # indicators/atr.py
 
+import numpy as np
 import pandas as pd
 
+from .panel import field_major, field_arrays, fields, like
+from .rolling import shift, smoothed_mean
 
-def calculate_atr(data: pd.DataFrame, period: int = 14):
+
+def true_range_array(high, low, close, dtype=np.float64) -> np.ndarray:
     """
-    Calculate the Average True Range (ATR) for the given data.
+    Calculate the True Range on plain NumPy arrays.
 
-    :param data: A Pandas DataFrame containing 'High', 'Low', and 'Close' columns.
+    :param high: An array-like of high prices, one row per bar (2-D for one column per symbol).
+    :param low: An array-like of low prices with the same shape as ``high``.
+    :param close: An array-like of closing prices with the same shape as ``high``.
+    :param dtype: The floating-point dtype of the computation and result, e.g. np.float32 to halve memory.
+    :return: A NumPy array with the greatest of High-Low, |High-previous Close| and |Low-previous Close|.
+    """
+    high = np.asarray(high, dtype=dtype)
+    low = np.asarray(low, dtype=dtype)
+    previous_close = shift(close, dtype)
+
+    high_low = high - low
+    high_close = np.abs(high - previous_close)
+    low_close = np.abs(low - previous_close)
+
+    # np.fmax skips NaN like a row-wise max, so the first bar's true range is its high-low range.
+    return np.fmax(np.fmax(high_low, high_close), low_close)
+
+
+def atr_array(high, low, close, period: int = 14, smoothing: str = 'sma', dtype=np.float64) -> np.ndarray:
+    """
+    Calculate the Average True Range (ATR) on plain NumPy arrays.
+
+    :param high: An array-like of high prices, one row per bar (2-D for one column per symbol).
+    :param low: An array-like of low prices with the same shape as ``high``.
+    :param close: An array-like of closing prices with the same shape as ``high``.
     :param period: The number of periods for calculating the ATR.
-    :return: A Pandas Series representing the ATR values.
+    :param smoothing: How true ranges are averaged: 'sma' (rolling mean), 'wilder' (Wilder's original
+        ATR, seeded with the mean of the first ``period`` true ranges) or 'ema'.
+    :param dtype: The floating-point dtype of the computation and result, e.g. np.float32 to halve memory.
+    :return: A NumPy array with the ATR values.
     """
-    if not {'High', 'Low', 'Close'}.issubset(data.columns):
+    return smoothed_mean(true_range_array(high, low, close, dtype), period, smoothing, dtype)
+
+
+def calculate_true_range(data: pd.DataFrame, dtype=np.float64) -> pd.Series:
+    """
+    Calculate the True Range for the given data.
+
+    :param data: A Pandas DataFrame containing 'High', 'Low', and 'Close' columns.
+    :param dtype: The floating-point dtype of the computation and result, e.g. np.float32 to halve memory.
+    :return: A Pandas Series with the greatest of High-Low, |High-previous Close| and |Low-previous Close|.
+    """
+    data = field_major(data)
+    if not {'High', 'Low', 'Close'}.issubset(fields(data)):
         raise ValueError("DataFrame must contain 'High', 'Low', and 'Close' columns.")
 
-    high_low = data['High'] - data['Low']
-    high_close = (data['High'] - data['Close'].shift()).abs()
-    low_close = (data['Low'] - data['Close'].shift()).abs()
+    template, arrays = field_arrays(data, ('High', 'Low', 'Close'), dtype)
+    return like(true_range_array(*arrays, dtype=dtype), template)
+
 
-    true_range = pd.DataFrame({
-        'High-Low': high_low,
-        'High-Close': high_close,
-        'Low-Close': low_close
-    }).max(axis=1)
+def calculate_atr(data: pd.DataFrame, period: int = 14, smoothing: str = 'sma', dtype=np.float64):
+    """
+    Calculate the Average True Range (ATR) for the given data.
 
-    atr = true_range.rolling(window=period).mean()
+    :param data: A Pandas DataFrame containing 'High', 'Low', and 'Close' columns.
+    :param period: The number of periods for calculating the ATR.
+    :param smoothing: How true ranges are averaged: 'sma' (rolling mean), 'wilder' (Wilder's original
+        ATR) or 'ema'.
+    :param dtype: The floating-point dtype of the computation and result, e.g. np.float32 to halve memory.
+    :return: A Pandas Series representing the ATR values.
+    """
+    data = field_major(data)
+    if not {'High', 'Low', 'Close'}.issubset(fields(data)):
+        raise ValueError("DataFrame must contain 'High', 'Low', and 'Close' columns.")
 
-    return atr
+    template, arrays = field_arrays(data, ('High', 'Low', 'Close'), dtype)
+    return like(atr_array(*arrays, period, smoothing, dtype), template)
@@ -0,0 +1,333 @@
+# indicators/backtest.py
+
+"""
+Vectorized backtests of positions derived from indicator outputs.
+
+A position array holds, for every bar, the exposure taken at that bar's close: 1 for long, -1 for
+short, 0 for flat, or any fraction in between. It earns the next bar's close-to-close return, so a
+position computed from indicator values up to a bar never trades on that bar's own move. Changing
+the position costs ``fee`` times the traded amount (e.g. 0.001 for 10 basis points), charged on the
+bar of the change. PnL and drawdown are in units of the traded capital and are not compounded.
+
+:func:`backtest_array` reduces one price array and one position array (2-D for one column per symbol)
+to the PnL, fees, turnover, number of trades and maximum drawdown of every column with array
+operations only. :func:`backtest` runs a strategy over many symbols and parameter sets::
+
+    def sar_flip(data, step):
+        sar = calculate_parabolic_sar(data, step=step)
+        return np.sign(data['Close'] - sar)
+
+    results = backtest(panel, sar_flip, {'step': [0.01, 0.02, 0.03]}, fee=0.0005)
+
+It splits the symbols into blocks of at most ``max_cells`` bars, computes each block's returns once and
+calls the strategy for every parameter set on that block, keeping only the metrics: memory is bounded
+by the block size, not by the number of parameter sets. Per-symbol DataFrames (e.g. memory-mapped
+by :class:`indicators.ingest.PriceCache`) are assembled into a panel one block at a time, so the full
+panel never has to fit in memory.
+
+:func:`hold` turns event sides, such as those of :meth:`indicators.signals.Signal.sides`, into the
+positions held between events.
+"""
+
+import itertools
+from collections import deque, namedtuple
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from ._numba import NUMBA_AVAILABLE, jit
+from .panel import field_major, is_panel, to_panel
+
+# Metrics of every column of a backtest, as arrays (or floats for a single column): the net PnL, the
+# fees paid, the turnover (sum of absolute position changes), the number of position changes and the
+# maximum drawdown of the cumulative net PnL from its running peak (starting at 0).
+BacktestResult = namedtuple('BacktestResult', ['pnl', 'fees', 'turnover', 'trades', 'max_drawdown'])
+
+METRICS = ('PnL', 'Fees', 'Turnover', 'Trades', 'Max Drawdown')
+
+
+def returns_array(close, dtype=np.float64) -> np.ndarray:
+    """
+    Calculate the close-to-close return of every bar, with 0 for the first bar and around missing prices.
+    """
+    close = np.asarray(close, dtype=dtype)
+    returns = np.zeros(close.shape, dtype=dtype, order='F')
+    with np.errstate(divide='ignore', invalid='ignore'):
+        np.divide(close[1:], close[:-1], out=returns[1:])
+    returns[1:] -= 1
+    returns[~np.isfinite(returns)] = 0
+    return returns
+
+
+def _positions(positions, shape: tuple, dtype) -> np.ndarray:
+    """
+    Return positions as an array of the given shape, with NaN (e.g. during an indicator's warm-up) as flat.
+    """
+    positions = np.asarray(positions)
+    if positions.dtype.kind not in 'iub':
+        positions = positions.astype(dtype, copy=False)
+        if np.isnan(positions).any():
+            positions = np.nan_to_num(positions, nan=0.0)
+    if positions.shape != shape:
+        positions = np.broadcast_to(positions, shape)
+    return positions
+
+
+def _net(returns: np.ndarray, positions: np.ndarray, dtype, buffers=None):
+    """
+    Return the per-bar gross PnL and the absolute position changes, written to ``buffers`` if given.
+    """
+    # Column-major buffers: the cumulative sums and running peaks run along the rows, one symbol at a time.
+    if buffers is None:
+        buffers = (np.empty(returns.shape, dtype=dtype, order='F'), np.empty(returns.shape, dtype=dtype, order='F'))
+    gross, changes = buffers
+    gross[:1] = 0
+    np.multiply(positions[:-1], returns[1:], out=gross[1:])
+
+    np.abs(positions[:1], out=changes[:1])
+    np.subtract(positions[1:], positions[:-1], out=changes[1:], dtype=dtype)
+    np.abs(changes[1:], out=changes[1:])
+    return gross, changes
+
+
+@jit
+def _metrics_kernel(returns, positions, fee, out):
+    """
+    Fill ``out[:, j]`` with the PnL, fees, turnover, trades and maximum drawdown of column ``j`` in one pass.
+    """
+    for j in range(returns.shape[1]):
+        previous = 0.0
+        pnl = 0.0
+        turnover = 0.0
+        trades = 0
+        peak = 0.0
+        drawdown = 0.0
+        for i in range(returns.shape[0]):
+            position = positions[i, j]
+            pnl += previous * returns[i, j]
+            change = abs(position - previous)
+            if change != 0:
+                turnover += change
+                trades += 1
+                pnl -= fee * change
+            if pnl > peak:
+                peak = pnl
+            elif peak - pnl > drawdown:
+                drawdown = peak - pnl
+            previous = position
+        out[0, j] = pnl
+        out[1, j] = turnover * fee
+        out[2, j] = turnover
+        out[3, j] = trades
+        out[4, j] = drawdown
+
+
+def pnl_array(close, positions, fee: float = 0.0, dtype=np.float64) -> np.ndarray:
+    """
+    Calculate the net PnL of every bar, for plotting equity curves (``pnl.cumsum(axis=0)``).
+
+    :param close: Array of closing prices, 1-D or 2-D (one column per symbol).
+    :param positions: Array of positions taken at each close, shaped like ``close`` (or broadcastable to it).
+    :param fee: The cost per unit of position traded.
+    :param dtype: The dtype of the computation.
+    :return: A NumPy array shaped like ``close``.
+    """
+    returns = returns_array(close, dtype)
+    net, changes = _net(returns, _positions(positions, returns.shape, dtype), dtype)
+    changes *= fee
+    net -= changes
+    return net
+
+
+def _metrics(returns: np.ndarray, positions, fee: float, dtype, buffers=None) -> BacktestResult:
+    positions = _positions(positions, returns.shape, dtype)
+    if not len(returns):
+        zeros = np.zeros(returns.shape[1:])
+        return BacktestResult(zeros, zeros, zeros, zeros.astype(np.int64), zeros)
+
+    if NUMBA_AVAILABLE:
+        columns = returns.reshape(len(returns), -1)
+        out = np.empty((len(METRICS), columns.shape[1]))
+        _metrics_kernel(columns, positions.reshape(columns.shape), fee, out)
+        out = out.reshape((len(METRICS),) + returns.shape[1:])
+        return BacktestResult(out[0], out[1], out[2], out[3].astype(np.int64), out[4])
+
+    net, changes = _net(returns, positions, dtype, buffers)
+    turnover = changes.sum(axis=0)
+    trades = np.count_nonzero(changes, axis=0)
+    if fee:
+        changes *= fee
+        net -= changes
+
+    # Cumulative PnL, then its drop from the running peak (which starts at 0), reusing both buffers.
+    equity = np.cumsum(net, axis=0, out=net)
+    peak = np.maximum.accumulate(equity, axis=0, out=changes)
+    np.maximum(peak, 0, out=peak)
+    drawdown = np.subtract(peak, equity, out=peak).max(axis=0)
+    # Copy the last row: the buffers are reused by the next parameter set.
+    return BacktestResult(equity[-1].copy(), turnover * fee, turnover, trades, drawdown)
+
+
+def backtest_array(close, positions, fee: float = 0.0, dtype=np.float64) -> BacktestResult:
+    """
+    Calculate the PnL, fees, turnover, trades and maximum drawdown of positions in one or more symbols.
+
+    :param close: Array of closing prices, 1-D or 2-D (one column per symbol or per strategy).
+    :param positions: Array of positions taken at each close, shaped like ``close`` (or broadcastable to it).
+        NaN positions (e.g. during an indicator's warm-up) are flat.
+    :param fee: The cost per unit of position traded, e.g. 0.001 for 10 basis points.
+    :param dtype: The dtype of the computation.
+    :return: A :data:`BacktestResult` with one value per column.
+    """
+    return _metrics(returns_array(close, dtype), positions, fee, dtype)
+
+
+def hold(sides, long_only: bool = False) -> np.ndarray:
+    """
+    Turn event sides into positions: +1 from a +1 event and -1 from a -1 event until the next event.
+
+    :param sides: Array of sides, 1-D or 2-D (0 where nothing happens), e.g. from ``Signal.sides(data)``.
+    :param long_only: If True, -1 events close the position (0) instead of opening a short.
+    :return: An int8 NumPy array shaped like ``sides``, flat before the first event.
+    """
+    sides = np.asarray(sides)
+    # Forward-fill the latest event with a running maximum of 4 * (row + 1) + side + 2, whose two lowest
+    # bits give side + 2; 2 before the first event gives a flat position.
+    rows = np.arange(1, len(sides) + 1, dtype=np.int32 if 4 * len(sides) < 2 ** 31 else np.int64)
+    latest = np.where(sides != 0, 4 * rows.reshape((-1,) + (1,) * (sides.ndim - 1)) + np.sign(sides) + 2, 2)
+    np.maximum.accumulate(latest, axis=0, out=latest)
+    positions = ((latest & 3) - 2).astype(np.int8)
+    if long_only:
+        np.maximum(positions, 0, out=positions)
+    return positions
+
+
+def parameter_grid(grid) -> list:
+    """
+    Return the parameter sets of a grid.
+
+    :param grid: A mapping of parameter name to the values to try (every combination is used), a list of
+        parameter dicts, or None for a single run without parameters.
+    :return: A list of parameter dicts.
+    """
+    if grid is None:
+        return [{}]
+    if isinstance(grid, Mapping):
+        names = list(grid)
+        grid = [dict(zip(names, values)) for values in itertools.product(*grid.values())]
+    else:
+        grid = [dict(params) for params in grid]
+    if not grid:
+        raise ValueError("'grid' must contain at least one parameter set.")
+    if any(params.keys() != grid[0].keys() for params in grid):
+        raise ValueError("Every parameter set must have the same parameters.")
+    return grid
+
+
+def _blocks(data, price: str, max_cells: int):
+    """
+    Yield ``(symbols, block)`` pairs covering all symbols in blocks of at most ``max_cells`` bars.
+    """
+    if isinstance(data, Mapping):
+        symbols = list(data)
+        # Sized on the first symbol, so lazily loaded frames are only read one block at a time.
+        size = max(1, max_cells // max(len(data[symbols[0]]), 1)) if symbols else 1
+        for start in range(0, len(symbols), size):
+            block = to_panel({symbol: data[symbol] for symbol in symbols[start:start + size]})
+            if price not in block.columns.get_level_values(0):
+                raise ValueError(f"DataFrame must contain a '{price}' column.")
+            yield list(block[price].columns), block
+        return
+
+    data = field_major(data)
+    if price not in data.columns.get_level_values(0):
+        raise ValueError(f"DataFrame must contain a '{price}' column.")
+    symbols = list(data[price].columns)
+    size = max(1, max_cells // max(len(data), 1))
+    for start in range(0, len(symbols), size):
+        chunk = symbols[start:start + size]
+        yield chunk, data.loc[:, data.columns.get_level_values(1).isin(chunk)]
+
+
+def _index(params: list, names: list, symbols=None) -> pd.Index:
+    """
+    Return the index of the results: the parameter values, then the symbol (if any) of every row.
+    """
+    if symbols is None:
+        labels = [tuple(values.values()) for values in params]
+    else:
+        labels = [tuple(values.values()) + (symbol,) for values in params for symbol in symbols]
+        names = names + ['Symbol']
+    if not names:
+        return pd.RangeIndex(len(labels))
+    if len(names) == 1:
+        return pd.Index([label[0] for label in labels], name=names[0])
+    return pd.MultiIndex.from_tuples(labels, names=names)
+
+
+def _frame(values: np.ndarray, index: pd.Index) -> pd.DataFrame:
+    return pd.DataFrame(values, index=index, columns=list(METRICS)).astype({'Trades': np.int64})
+
+
+def _run_block(block, strategy, params: list, fee: float, price: str, dtype) -> np.ndarray:
+    """
+    Return the (parameter set, metric, symbol) array of the metrics of one block of symbols.
+    """
+    returns = returns_array(block[price].to_numpy(dtype=dtype), dtype)
+    # The returns and the work buffers are shared by all parameter sets of the block.
+    buffers = (np.empty(returns.shape, dtype=dtype, order='F'), np.empty(returns.shape, dtype=dtype, order='F'))
+    return np.array([_metrics(returns, strategy(block, **values), fee, dtype, buffers) for values in params],
+                    dtype=np.float64)
+
+
+def backtest(data, strategy, grid=None, fee: float = 0.0, price: str = 'Close', max_cells: int = 2 ** 22,
+             workers: int = 1, dtype=np.float64) -> pd.DataFrame:
+    """
+    Backtest a strategy over many symbols and parameter sets.
+
+    :param data: A single-symbol DataFrame, a panel, or a mapping of symbol to DataFrame.
+    :param strategy: A function ``strategy(data, **params)`` returning the positions for a DataFrame or
+        panel (a Series, a wide DataFrame or an array), computed from the bars up to each row.
+    :param grid: The parameter sets, as accepted by :func:`parameter_grid`.
+    :param fee: The cost per unit of position traded, e.g. 0.001 for 10 basis points.
+    :param price: The column whose returns the positions earn.
+    :param max_cells: The maximum number of bars (rows times symbols) per block of symbols.
+    :param workers: Number of worker processes, each backtesting one block of symbols at a time; 1 runs
+        in-process. ``strategy`` must then be picklable (e.g. defined at module level).
+    :param dtype: The dtype of the PnL computation.
+    :return: A Pandas DataFrame with 'PnL', 'Fees', 'Turnover', 'Trades' and 'Max Drawdown' columns and
+        one row per parameter set (and symbol, for panels and mappings), indexed by the parameter values.
+    """
+    params = parameter_grid(grid)
+    names = list(params[0])
+
+    if not isinstance(data, Mapping) and not is_panel(field_major(data)):
+        if price not in data.columns:
+            raise ValueError(f"DataFrame must contain a '{price}' column.")
+        returns = returns_array(data[price].to_numpy(dtype=dtype), dtype)
+        rows = [_metrics(returns, strategy(data, **values), fee, dtype) for values in params]
+        return _frame(np.array(rows, dtype=np.float64).reshape(len(params), len(METRICS)), _index(params, names))
+
+    symbols = []
+    results = []
+    if workers == 1:
+        for chunk, block in _blocks(data, price, max_cells):
+            results.append(_run_block(block, strategy, params, fee, price, dtype))
+            symbols.extend(chunk)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # At most one pending block per worker, so memory stays bounded by the block size.
+            pending = deque()
+            for chunk, block in _blocks(data, price, max_cells):
+                if len(pending) == workers:
+                    results.append(pending.popleft().result())
+                pending.append(executor.submit(_run_block, block, strategy, params, fee, price, dtype))
+                symbols.extend(chunk)
+            results.extend(future.result() for future in pending)
+
+    if not results:
+        raise ValueError("The data must contain at least one symbol.")
+    values = np.concatenate(results, axis=2).transpose(0, 2, 1).reshape(-1, len(METRICS))
+    return _frame(values, _index(params, names, symbols))
@@ -1,28 +1,65 @@
 # indicators/bollinger_bands.py
 
+import numpy as np
 import pandas as pd
 
+from .panel import combine, field_major, fields, like
+from .rolling import rolling_mean_std
 
-def calculate_bollinger_bands(data: pd.DataFrame, period: int = 20, num_std_dev: int = 2):
+
+def bollinger_bands_array(close, period: int = 20, num_std_dev: int = 2, ddof: int = 1, extended: bool = False,
+                          dtype=np.float64):
+    """
+    Calculate the Bollinger Bands on plain NumPy arrays.
+
+    The middle band and the standard deviation come from one pass of
+    :func:`indicators.rolling.rolling_mean_std`, which stays accurate over long series at high price levels.
+
+    :param close: An array-like of closing prices, one row per bar (2-D for one column per symbol).
+    :param period: The number of periods for calculating the moving average.
+    :param num_std_dev: Number of standard deviations to calculate the upper and lower bands.
+    :param ddof: Delta degrees of freedom of the standard deviation; 1 for the sample (default), 0 for the population.
+    :param extended: Also return %B and the bandwidth.
+    :param dtype: The floating-point dtype of the computation and results, e.g. np.float32 to halve memory.
+    :return: A tuple ``(middle_band, upper_band, lower_band)`` of NumPy arrays, followed by
+        ``(percent_b, bandwidth)`` with ``extended=True``.
+    """
+    close = np.asarray(close, dtype=dtype)
+    sma, std = rolling_mean_std(close, period, ddof, dtype)
+
+    upper_band = sma + (std * num_std_dev)
+    lower_band = sma - (std * num_std_dev)
+    if not extended:
+        return sma, upper_band, lower_band
+
+    width = upper_band - lower_band
+    with np.errstate(divide='ignore', invalid='ignore'):
+        percent_b = (close - lower_band) / width
+        bandwidth = width / sma
+
+    return sma, upper_band, lower_band, percent_b, bandwidth
+
+
+def calculate_bollinger_bands(data: pd.DataFrame, period: int = 20, num_std_dev: int = 2, ddof: int = 1,
+                              extended: bool = False, dtype=np.float64):
     """
     Calculate the Bollinger Bands for the given data.
 
     :param data: A Pandas DataFrame containing at least the 'Close' price column.
     :param period: The number of periods for calculating the moving average.
     :param num_std_dev: Number of standard deviations to calculate the upper and lower bands.
+    :param ddof: Delta degrees of freedom of the standard deviation; 1 for the sample (default), 0 for the population.
+    :param extended: Also return the '%B' (position of the close within the bands) and 'Bandwidth'
+        (band width relative to the middle band) columns.
+    :param dtype: The floating-point dtype of the computation and results, e.g. np.float32 to halve memory.
     :return: A Pandas DataFrame with columns for the middle band, upper band, and lower band.
     """
-    if 'Close' not in data.columns:
+    data = field_major(data)
+    if 'Close' not in fields(data):
         raise ValueError("DataFrame must contain a 'Close' column.")
 
-    sma = data['Close'].rolling(window=period).mean()
-    rolling_std = data['Close'].rolling(window=period).std()
-
-    upper_band = sma + (rolling_std * num_std_dev)
-    lower_band = sma - (rolling_std * num_std_dev)
+    close = data['Close']
+    bands = bollinger_bands_array(close.to_numpy(dtype=dtype), period, num_std_dev, ddof, extended, dtype=dtype)
+    names = ('Middle Band', 'Upper Band', 'Lower Band', '%B', 'Bandwidth')
 
-    return pd.DataFrame({
-        'Middle Band': sma,
-        'Upper Band': upper_band,
-        'Lower Band': lower_band
-    })
+    return combine({name: like(band, close) for name, band in zip(names, bands)})
@@ -0,0 +1,285 @@
+# indicators/cache.py
+
+"""
+Opt-in memoization of indicator results.
+
+Results are keyed on a SHA-256 hash of the input columns the function actually reads (plus the
+index) and its bound parameters, so two calls on equal data hit the same entry even when the
+DataFrames are different objects, and adding an unrelated column does not invalidate anything.
+SHA-256 is hardware accelerated on current CPUs and hashes faster than BLAKE2 or MD5 there.
+Entries live in an in-memory LRU bounded by bytes; with a ``directory`` they are also written to
+disk and survive the process.
+
+Wrap a single function::
+
+    cache = IndicatorCache(max_bytes=512 * 2 ** 20)
+    macd = cache.wrap(calculate_macd)
+
+or cache every function exported by the package::
+
+    cache = enable_cache(directory='.indicator_cache')
+    indicators.calculate_macd(data)   # computed
+    indicators.calculate_macd(data)   # served from the cache
+    disable_cache()
+
+Cached values are returned as copies, so callers may modify them freely.
+"""
+
+import functools
+import hashlib
+import inspect
+import os
+import pickle
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from . import _hooks
+from .graph import INDICATORS, parse_spec
+from .columnar import is_columnar
+from .panel import field_major, fields
+
+DEFAULT_MAX_BYTES = 256 * 2 ** 20
+
+
+def _used_columns(name: str, arguments: dict):
+    """
+    Return the input columns read by the exported function ``name``, or None if unknown (all columns).
+    """
+    if name == 'compute_indicators':
+        columns = set()
+        for spec in arguments['specs']:
+            columns |= INDICATORS[parse_spec(spec)[0]]()[0]
+        return columns
+    indicator = name[len('calculate_'):]
+    if name.startswith('calculate_') and indicator in INDICATORS:
+        return INDICATORS[indicator]()[0]
+    return None
+
+
+def _update_array(digest, values: np.ndarray):
+    values = np.asarray(values)
+    if values.dtype == object:
+        digest.update(pd.util.hash_array(values.ravel()).tobytes())
+    else:
+        digest.update(np.ascontiguousarray(values).view(np.uint8).data)
+    digest.update(repr((values.dtype.str, values.shape)).encode())
+
+
+def _update_index(digest, index: pd.Index):
+    if isinstance(index, pd.RangeIndex):
+        digest.update(repr((index.start, index.stop, index.step)).encode())
+    else:
+        _update_array(digest, index.to_numpy())
+
+
+def _update(digest, value, columns=None):
+    """
+    Feed ``value`` into ``digest``; DataFrames contribute only ``columns`` when given.
+    """
+    if isinstance(value, pd.DataFrame):
+        data = field_major(value)
+        names = [column for column in fields(data) if columns is None or column in columns]
+        digest.update(b'frame')
+        _update_index(digest, data.index)
+        for column in names:
+            selected = data[column]
+            digest.update(repr(column).encode())
+            if isinstance(selected, pd.DataFrame):
+                digest.update(repr(list(selected.columns)).encode())
+            _update_array(digest, selected.to_numpy())
+    elif is_columnar(value):
+        data = field_major(value)
+        digest.update(b'columns')
+        for column in data.columns:
+            if columns is None or column in columns:
+                digest.update(repr(column).encode())
+                _update_array(digest, data[column].to_numpy(dtype=None))
+    elif isinstance(value, pd.Series):
+        digest.update(b'series')
+        _update_index(digest, value.index)
+        _update_array(digest, value.to_numpy())
+    elif isinstance(value, np.ndarray):
+        digest.update(b'array')
+        _update_array(digest, value)
+    else:
+        digest.update(repr(value).encode())
+
+
+def _copy(value):
+    if isinstance(value, (pd.DataFrame, pd.Series, np.ndarray)):
+        return value.copy()
+    if isinstance(value, tuple):
+        return tuple(_copy(item) for item in value)
+    return value
+
+
+class IndicatorCache:
+    """
+    Content-addressed LRU cache for indicator results.
+
+    :param max_bytes: Memory budget of the in-memory tier; least recently used entries are evicted
+        beyond it. Results larger than the budget are not kept in memory.
+    :param directory: Optional directory for the on-disk tier. Every computed result is written there
+        and looked up on an in-memory miss.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES, directory: str = None):
+        if max_bytes < 0:
+            raise ValueError("'max_bytes' must not be negative.")
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    @property
+    def stats(self) -> dict:
+        """
+        Counters of the cache: hits (memory and disk), disk hits, misses, evictions, entries and bytes.
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'bytes': self._bytes
+            }
+
+    def key(self, func, *args, **kwargs) -> str:
+        """
+        Return the cache key of ``func(*args, **kwargs)``.
+        """
+        bound = inspect.signature(func).bind(*args, **kwargs)
+        bound.apply_defaults()
+        name = func.__name__
+        columns = _used_columns(name, bound.arguments)
+
+        digest = hashlib.sha256()
+        digest.update(f'{func.__module__}.{func.__qualname__}'.encode())
+        for argument, value in bound.arguments.items():
+            digest.update(argument.encode())
+            _update(digest, value, columns)
+        return digest.hexdigest()
+
+    def get(self, key: str, default=None):
+        """
+        Return the cached value for ``key`` from memory or disk, or ``default``.
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return _copy(self._entries[key][0])
+
+        path = self._path(key)
+        if path is not None and os.path.isfile(path):
+            with open(path, 'rb') as file:
+                value = pickle.load(file)
+            self._insert(key, value)
+            with self._lock:
+                self.hits += 1
+                self.disk_hits += 1
+            return _copy(value)
+
+        with self._lock:
+            self.misses += 1
+        return default
+
+    def put(self, key: str, value):
+        """
+        Store ``value`` under ``key`` in memory and, if configured, on disk.
+        """
+        stored = _copy(value)
+        self._insert(key, stored)
+
+        path = self._path(key)
+        if path is not None:
+            temporary = f'{path}.{os.getpid()}.tmp'
+            with open(temporary, 'wb') as file:
+                pickle.dump(stored, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary, path)
+
+    def wrap(self, func):
+        """
+        Return a memoized version of ``func``.
+        """
+        @functools.wraps(func)
+        def cached(*args, **kwargs):
+            key = self.key(func, *args, **kwargs)
+            missing = object()
+            value = self.get(key, missing)
+            if value is missing:
+                value = func(*args, **kwargs)
+                self.put(key, value)
+            return value
+
+        cached.cache = self
+        return cached
+
+    def clear(self, disk: bool = False):
+        """
+        Drop all in-memory entries (and the on-disk tier with ``disk=True``) and reset the counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = self.disk_hits = self.misses = self.evictions = 0
+        if disk and self.directory is not None:
+            for name in os.listdir(self.directory):
+                if name.endswith('.pkl'):
+                    os.remove(os.path.join(self.directory, name))
+
+    def _path(self, key: str):
+        if self.directory is None:
+            return None
+        return os.path.join(self.directory, key + '.pkl')
+
+    def _insert(self, key: str, value):
+        size = _hooks.nbytes(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._bytes -= self._entries.pop(key)[1]
+            self._entries[key] = (value, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._bytes -= evicted
+                self.evictions += 1
+
+
+def enable_cache(max_bytes: int = DEFAULT_MAX_BYTES, directory: str = None) -> IndicatorCache:
+    """
+    Memoize every function exported by the ``indicators`` package with one shared cache.
+
+    The functions are replaced in the package namespace, so the cache applies to calls made through
+    ``indicators.calculate_*`` (and to names imported after this call). It wraps whatever is already
+    installed, such as :func:`indicators.instrument.enable_instrumentation`, and either can be
+    disabled first.
+
+    :param max_bytes: Memory budget of the cache in bytes.
+    :param directory: Optional directory for the on-disk tier.
+    :return: The installed :class:`IndicatorCache`, e.g. to read its ``stats``.
+    """
+    cache = IndicatorCache(max_bytes, directory)
+    _hooks.install('cache', lambda func, name: cache.wrap(func))
+    return cache
+
+
+def disable_cache():
+    """
+    Remove the cache installed by :func:`enable_cache`, keeping any other wrapper.
+    """
+    _hooks.uninstall('cache')
@@ -1,23 +1,47 @@
 # indicators/cci.py
 
+import numpy as np
 import pandas as pd
 
+from .panel import field_major, field_arrays, fields, like
+from .rolling import rolling_mad, rolling_mean
 
-def calculate_cci(data: pd.DataFrame, period: int = 20) -> pd.Series:
+
+def cci_array(high, low, close, period: int = 20, dtype=np.float64) -> np.ndarray:
+    """
+    Calculate the Commodity Channel Index (CCI) on plain NumPy arrays.
+
+    :param high: An array-like of high prices, one row per bar (2-D for one column per symbol).
+    :param low: An array-like of low prices with the same shape as ``high``.
+    :param close: An array-like of closing prices with the same shape as ``high``.
+    :param period: The number of periods for calculating the CCI.
+    :param dtype: The floating-point dtype of the computation and result, e.g. np.float32 to halve memory.
+    :return: A NumPy array with the CCI values.
+    """
+    high = np.asarray(high, dtype=dtype)
+    low = np.asarray(low, dtype=dtype)
+    close = np.asarray(close, dtype=dtype)
+
+    tp = (high + low + close) / 3  # Typical Price
+    sma = rolling_mean(tp, period, dtype)
+    mean_dev = rolling_mad(tp, period, dtype)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return (tp - sma) / (0.015 * mean_dev)
+
+
+def calculate_cci(data: pd.DataFrame, period: int = 20, dtype=np.float64) -> pd.Series:
     """
     Calculate the Commodity Channel Index (CCI) for the given data.
 
     :param data: A Pandas DataFrame containing 'High', 'Low', and 'Close' columns.
     :param period: The number of periods for calculating the CCI.
+    :param dtype: The floating-point dtype of the computation and result, e.g. np.float32 to halve memory.
     :return: A Pandas Series representing the CCI values.
     """
-    if not {'High', 'Low', 'Close'}.issubset(data.columns):
+    data = field_major(data)
+    if not {'High', 'Low', 'Close'}.issubset(fields(data)):
         raise ValueError("DataFrame must contain 'High', 'Low', and 'Close' columns.")
 
-    tp = (data['High'] + data['Low'] + data['Close']) / 3  # Typical Price
-    sma = tp.rolling(window=period).mean()
-    mean_dev = tp.rolling(window=period).apply(lambda x: pd.Series(x).mad())
-
-    cci = (tp - sma) / (0.015 * mean_dev)
-
-    return cci
+    template, arrays = field_arrays(data, ('High', 'Low', 'Close'), dtype)
+    return like(cci_array(*arrays, period, dtype), template)
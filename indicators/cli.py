@@ -0,0 +1,71 @@
+# indicators/cli.py
+
+"""
+Command-line interface: ``python -m indicators <command>``.
+"""
+
+import argparse
+import sys
+import time
+
+from .registry import REGISTRY, warmup
+
+
+def _run(args) -> int:
+    # Imported here, so 'list' runs without loading pandas or the indicator modules.
+    from .runner import parse_indicator, run_directory
+
+    specs = [parse_indicator(text) for text in args.indicator] if args.indicator else None
+    memory_limit = args.memory_limit * 2 ** 20 if args.memory_limit else None
+
+    start = time.perf_counter()
+    results, failures = run_directory(args.input_dir, args.output_dir, specs=specs, workers=args.workers,
+                                      chunk_size=args.chunk_size, memory_limit=memory_limit,
+                                      pattern=args.pattern, output_format=args.format,
+                                      out_of_core=args.out_of_core, cache_dir=args.cache_dir)
+    elapsed = time.perf_counter() - start
+
+    rows = sum(result['rows'] for result in results)
+    print(f"Processed {len(results)} files ({rows:,} rows) in {elapsed:.2f}s.")
+    for file_path, error in failures:
+        print(f"Error: {file_path}: {error}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+def _list(args) -> int:
+    for name, info in sorted(REGISTRY.items()):
+        params = ', '.join(f'{key}={value!r}' for key, value in info.params.items())
+        print(f"{name:<22} columns: {', '.join(info.columns):<27} warm-up: {warmup(name):>3}  params: {params}")
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m indicators', description="Technical indicator tools.")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run = commands.add_parser('run', help="Compute indicators for every price file in a directory.")
+    run.add_argument('input_dir', help="Directory containing OHLCV CSV files.")
+    run.add_argument('output_dir', help="Directory receiving one result file per input file.")
+    run.add_argument('-i', '--indicator', action='append',
+                     help="Indicator spec such as 'rsi', 'macd:fast_period=5,slow_period=35' or "
+                          "'rsi:smoothing=wilder' (numbers, true/false or text values). "
+                          "Repeat for several indicators; defaults to all indicators.")
+    run.add_argument('-w', '--workers', type=int, default=None,
+                     help="Number of worker processes (default: number of CPUs).")
+    run.add_argument('--chunk-size', type=int, default=None, help="Rows per CSV parsing chunk.")
+    run.add_argument('--memory-limit', type=int, default=None, help="Memory cap per worker process in MB.")
+    run.add_argument('--pattern', default='.csv', help="File name suffix of the input files (default: .csv).")
+    run.add_argument('--format', choices=('csv', 'arrow'), default='csv',
+                     help="Output format: one CSV per input file, or an Arrow result store (default: csv).")
+    run.add_argument('--out-of-core', action='store_true',
+                     help="Compute and write each file --chunk-size rows at a time (default 1,000,000), "
+                          "for files larger than memory.")
+    run.add_argument('--cache-dir', default=None,
+                     help="Directory of parsed price files: each CSV is parsed once and memory-mapped on later runs.")
+    run.set_defaults(handler=_run)
+
+    listing = commands.add_parser('list', help="List the available indicators, their inputs and parameters.")
+    listing.set_defaults(handler=_list)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
@@ -1,22 +1,45 @@
 # indicators/cmf.py
 
+import numpy as np
 import pandas as pd
 
+from .adl import money_flow_multiplier_array
+from .panel import field_major, field_arrays, fields, like
+from .rolling import rolling_sum
 
-def calculate_cmf(data: pd.DataFrame, period: int = 20) -> pd.Series:
+
+def cmf_array(high, low, close, volume, period: int = 20, dtype=np.float64) -> np.ndarray:
+    """
+    Calculate the Chaikin Money Flow (CMF) on plain NumPy arrays.
+
+    :param high: An array-like of high prices, one row per bar (2-D for one column per symbol).
+    :param low: An array-like of low prices with the same shape as ``high``.
+    :param close: An array-like of closing prices with the same shape as ``high``.
+    :param volume: An array-like of volumes with the same shape as ``high``.
+    :param period: The number of periods for calculating the CMF.
+    :param dtype: The floating-point dtype of the computation and result, e.g. np.float32 to halve memory.
+    :return: A NumPy array with the CMF values.
+    """
+    volume = np.asarray(volume, dtype=dtype)
+    money_flow_multiplier = money_flow_multiplier_array(high, low, close, dtype)
+    money_flow_volume = money_flow_multiplier * volume
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return rolling_sum(money_flow_volume, period, dtype) / rolling_sum(volume, period, dtype)
+
+
+def calculate_cmf(data: pd.DataFrame, period: int = 20, dtype=np.float64) -> pd.Series:
     """
     Calculate the Chaikin Money Flow (CMF) for the given data.
 
     :param data: A Pandas DataFrame containing 'High', 'Low', 'Close', and 'Volume' columns.
     :param period: The number of periods for calculating the CMF.
+    :param dtype: The floating-point dtype of the computation and result, e.g. np.float32 to halve memory.
     :return: A Pandas Series representing the CMF values.
     """
-    if not {'High', 'Low', 'Close', 'Volume'}.issubset(data.columns):
+    data = field_major(data)
+    if not {'High', 'Low', 'Close', 'Volume'}.issubset(fields(data)):
         raise ValueError("DataFrame must contain 'High', 'Low', 'Close', and 'Volume' columns.")
 
-    money_flow_multiplier = ((data['Close'] - data['Low']) - (data['High'] - data['Close'])) / (
-                data['High'] - data['Low'])
-    money_flow_volume = money_flow_multiplier * data['Volume']
-    cmf = money_flow_volume.rolling(window=period).sum() / data['Volume'].rolling(window=period).sum()
-
-    return cmf
+    template, arrays = field_arrays(data, ('High', 'Low', 'Close', 'Volume'), dtype)
+    return like(cmf_array(*arrays, period, dtype), template)
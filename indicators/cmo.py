@@ -1,23 +1,45 @@
 # indicators/cmo.py
 
+import numpy as np
 import pandas as pd
 
+from .panel import field_major, fields, like
+from .rolling import rolling_sum, shift
 
-def calculate_cmo(data: pd.DataFrame, period: int = 14) -> pd.Series:
+
+def cmo_array(close, period: int = 14, dtype=np.float64) -> np.ndarray:
+    """
+    Calculate the Chande Momentum Oscillator (CMO) on plain NumPy arrays.
+
+    :param close: An array-like of closing prices, one row per bar (2-D for one column per symbol).
+    :param period: The number of periods for calculating the CMO.
+    :param dtype: The floating-point dtype of the computation and result, e.g. np.float32 to halve memory.
+    :return: A NumPy array with the CMO values.
+    """
+    close = np.asarray(close, dtype=dtype)
+    delta = close - shift(close, dtype)
+    gain = np.where(delta > 0, delta, 0)
+    loss = -np.where(delta < 0, delta, 0)
+
+    up = rolling_sum(gain, period, dtype)
+    down = rolling_sum(loss, period, dtype)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return 100 * (up - down) / (up + down)
+
+
+def calculate_cmo(data: pd.DataFrame, period: int = 14, dtype=np.float64) -> pd.Series:
     """
     Calculate the Chande Momentum Oscillator (CMO) for the given data.
 
     :param data: A Pandas DataFrame containing at least the 'Close' column.
     :param period: The number of periods for calculating the CMO.
+    :param dtype: The floating-point dtype of the computation and result, e.g. np.float32 to halve memory.
     :return: A Pandas Series representing the CMO values.
     """
-    if 'Close' not in data.columns:
+    data = field_major(data)
+    if 'Close' not in fields(data):
         raise ValueError("DataFrame must contain a 'Close' column.")
 
-    delta = data['Close'].diff(1)
-    up = delta.where(delta > 0, 0).rolling(window=period).sum()
-    down = -delta.where(delta < 0, 0).rolling(window=period).sum()
-
-    cmo = 100 * (up - down) / (up + down)
-
-    return cmo
+    close = data['Close']
+    return like(cmo_array(close.to_numpy(dtype=dtype), period, dtype), close)
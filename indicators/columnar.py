@@ -0,0 +1,104 @@
+# indicators/columnar.py
+
+"""
+Zero-copy input from Apache Arrow and NumPy structured arrays.
+
+Every calculate_* function also accepts a ``pyarrow.Table``, a ``pyarrow.RecordBatch`` or a NumPy
+structured array with the usual OHLCV fields. The fields are read as NumPy views over the Arrow
+buffers (or over the structured array's memory), without building a DataFrame, and results come back
+in the format of the input:
+
+* a Table gives a ChunkedArray for single-output indicators and a Table for multi-output ones;
+* a RecordBatch gives an Array, or a RecordBatch;
+* a structured array gives a float array, or a structured array with one field per output.
+
+Arrow results share their buffers with the computed NumPy arrays, so warm-up rows hold NaN rather
+than nulls. Columns with nulls, several chunks or another dtype than the one requested are copied
+once into a float array. Arrow input requires ``pyarrow``.
+"""
+
+import numpy as np
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover - depends on the environment
+    pa = None
+
+
+def is_columnar(data) -> bool:
+    """
+    Return True if ``data`` is an Arrow Table or RecordBatch or a NumPy structured array.
+    """
+    if isinstance(data, np.ndarray):
+        return data.dtype.names is not None
+    return pa is not None and isinstance(data, (pa.Table, pa.RecordBatch))
+
+
+class Column:
+    """
+    One field of a :class:`Columns` source, read and wrapped like a pandas Series.
+    """
+
+    def __init__(self, data, name: str):
+        self.data = data
+        self.name = name
+
+    def __len__(self):
+        return len(self.data)
+
+    def to_numpy(self, dtype=np.float64) -> np.ndarray:
+        """
+        Return the values as a NumPy array, a read-only view when the buffer already has ``dtype``.
+        """
+        if isinstance(self.data, np.ndarray):
+            return np.asarray(self.data[self.name], dtype=dtype)
+
+        column = self.data.column(self.name)
+        if isinstance(column, pa.ChunkedArray):
+            column = column.chunk(0) if column.num_chunks == 1 else column.combine_chunks()
+        # Nulls become NaN; without nulls a primitive column is viewed without copying.
+        return np.asarray(column.to_numpy(zero_copy_only=False), dtype=dtype)
+
+    def wrap(self, values: np.ndarray):
+        """
+        Wrap a result computed from this column in the format of the source, without copying it.
+        """
+        if isinstance(self.data, np.ndarray):
+            return values
+        array = pa.array(values)
+        return pa.chunked_array([array]) if isinstance(self.data, pa.Table) else array
+
+
+class Columns:
+    """
+    Read-only view of an Arrow Table or RecordBatch or a NumPy structured array, indexed by field
+    name like a DataFrame (``data['Close']``).
+    """
+
+    def __init__(self, data):
+        self.data = data
+        self.columns = list(data.dtype.names) if isinstance(data, np.ndarray) else list(data.schema.names)
+
+    def __len__(self):
+        return len(self.data)
+
+    def __getitem__(self, name: str) -> Column:
+        if name not in self.columns:
+            raise KeyError(name)
+        return Column(self.data, name)
+
+
+def combine_columns(outputs: dict):
+    """
+    Combine named results wrapped by :meth:`Column.wrap` into a Table, a RecordBatch or a structured array.
+    """
+    names = list(outputs)
+    values = list(outputs.values())
+    if isinstance(values[0], np.ndarray):
+        result = np.empty(len(values[0]), dtype=[(name, value.dtype) for name, value in outputs.items()])
+        for name, value in outputs.items():
+            result[name] = value
+        return result
+    if isinstance(values[0], pa.ChunkedArray):
+        return pa.Table.from_arrays(values, names=names)
+    return pa.RecordBatch.from_arrays(values, names=names)
@@ -1,25 +1,46 @@
 # indicators/donchian.py
 
+import numpy as np
 import pandas as pd
 
+from .extrema import rolling_extrema
+from .panel import combine, field_major, field_arrays, fields, like
 
-def calculate_donchian_channels(data: pd.DataFrame, period: int = 20) -> pd.DataFrame:
+
+def donchian_channels_array(high, low, period: int = 20, dtype=np.float64):
+    """
+    Calculate Donchian Channels on plain NumPy arrays.
+
+    :param high: An array-like of high prices, one row per bar (2-D for one column per symbol).
+    :param low: An array-like of low prices with the same shape as ``high``.
+    :param period: The number of periods for calculating the channels.
+    :param dtype: The floating-point dtype of the computation and results, e.g. np.float32 to halve memory.
+    :return: A tuple ``(upper_channel, middle_channel, lower_channel)`` of NumPy arrays.
+    """
+    upper_channel, lower_channel = rolling_extrema(high, low, period, dtype=dtype)
+    middle_channel = (upper_channel + lower_channel) / 2
+
+    return upper_channel, middle_channel, lower_channel
+
+
+def calculate_donchian_channels(data: pd.DataFrame, period: int = 20, dtype=np.float64) -> pd.DataFrame:
     """
     Calculate Donchian Channels for the given data.
 
     :param data: A Pandas DataFrame containing 'High' and 'Low' columns.
     :param period: The number of periods for calculating the channels.
+    :param dtype: The floating-point dtype of the computation and results, e.g. np.float32 to halve memory.
     :return: A Pandas DataFrame with columns for upper, lower, and middle channels.
     """
-    if not {'High', 'Low'}.issubset(data.columns):
+    data = field_major(data)
+    if not {'High', 'Low'}.issubset(fields(data)):
         raise ValueError("DataFrame must contain 'High' and 'Low' columns.")
 
-    upper_channel = data['High'].rolling(window=period).max()
-    lower_channel = data['Low'].rolling(window=period).min()
-    middle_channel = (upper_channel + lower_channel) / 2
+    template, arrays = field_arrays(data, ('High', 'Low'), dtype)
+    upper_channel, middle_channel, lower_channel = donchian_channels_array(*arrays, period, dtype)
 
-    return pd.DataFrame({
-        'Upper Channel': upper_channel,
-        'Middle Channel': middle_channel,
-        'Lower Channel': lower_channel
+    return combine({
+        'Upper Channel': like(upper_channel, template),
+        'Middle Channel': like(middle_channel, template),
+        'Lower Channel': like(lower_channel, template)
     })
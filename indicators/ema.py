@@ -1,20 +1,37 @@
 # indicators/ema.py
 
+import numpy as np
 import pandas as pd
 
+from .panel import field_major, fields, like
+from .rolling import ewm_mean
 
-def calculate_ema(data: pd.DataFrame, period: int = 20) -> pd.Series:
+
+def ema_array(close, period: int = 20, dtype=np.float64) -> np.ndarray:
+    """
+    Calculate the Exponential Moving Average (EMA) on plain NumPy arrays.
+
+    :param close: An array-like of closing prices, one row per bar (2-D for one column per symbol).
+    :param period: The number of periods for calculating the EMA.
+    :param dtype: The floating-point dtype of the result, e.g. np.float32 to halve memory.
+    :return: A NumPy array with the EMA values.
+    """
+    return ewm_mean(np.asarray(close, dtype=dtype), period, dtype)
+
+
+def calculate_ema(data: pd.DataFrame, period: int = 20, dtype=np.float64) -> pd.Series:
     """
     Calculate the Exponential Moving Average (EMA) for the given data.
 
     :param data: A Pandas DataFrame containing at least the 'Close' price column.
     :param period: The number of periods for calculating the EMA.
+    :param dtype: The floating-point dtype of the result, e.g. np.float32 to halve memory.
     :return: A Pandas Series representing the EMA values.
     """
-    if 'Close' not in data.columns:
+    data = field_major(data)
+    if 'Close' not in fields(data):
         raise ValueError("DataFrame must contain a 'Close' column.")
 
     # Calculate the Exponential Moving Average
-    ema = data['Close'].ewm(span=period, adjust=False).mean()
-
-    return ema
+    close = data['Close']
+    return like(ema_array(close.to_numpy(dtype=dtype), period, dtype), close)
@@ -0,0 +1,238 @@
+# indicators/extrema.py
+
+"""
+Rolling-window extrema engine shared by the Donchian Channels, the Stochastic Oscillator and the
+Williams %R.
+
+:func:`rolling_extrema` computes the rolling maximum of one array and the rolling minimum of another
+(the highs and the lows) in a single pass, optionally with the row of each extreme for Aroon-style
+indicators. With Numba it runs one monotonic deque per column, O(n) regardless of the period; without
+it, the van Herk/Gil-Werman algorithm computes the same result with whole-array NumPy operations at
+about three comparisons per value, also independent of the period.
+
+Windows that are not full yet or that contain NaN yield NaN, with position -1, like
+``rolling(period).max()``. When the extreme occurs several times in a window the most recent
+occurrence is reported.
+
+:class:`RollingExtrema` is the streaming counterpart, updated one bar at a time.
+"""
+
+from collections import deque
+
+import numpy as np
+
+from ._numba import NUMBA_AVAILABLE, jit
+
+
+@jit
+def _extrema_kernel(high, low, period, upper, lower, upper_at, lower_at):
+    """
+    Fill the rolling maximum of ``high`` and minimum of ``low`` (2-D, one column per symbol) and their rows.
+
+    Each column keeps two monotonic deques of row numbers in ring buffers of ``period`` slots.
+    """
+    rows, columns = high.shape
+    high_queue = np.empty(period, dtype=np.int64)
+    low_queue = np.empty(period, dtype=np.int64)
+    for j in range(columns):
+        high_start = high_count = low_start = low_count = 0
+        high_nan = low_nan = -period
+        for i in range(rows):
+            # Drop the rows that left the window, then the candidates the new value dominates.
+            if high_count and high_queue[high_start] <= i - period:
+                high_start = (high_start + 1) % period
+                high_count -= 1
+            if low_count and low_queue[low_start] <= i - period:
+                low_start = (low_start + 1) % period
+                low_count -= 1
+
+            value = high[i, j]
+            if value != value:
+                high_nan = i
+            else:
+                while high_count and high[high_queue[(high_start + high_count - 1) % period], j] <= value:
+                    high_count -= 1
+                high_queue[(high_start + high_count) % period] = i
+                high_count += 1
+
+            value = low[i, j]
+            if value != value:
+                low_nan = i
+            else:
+                while low_count and low[low_queue[(low_start + low_count - 1) % period], j] >= value:
+                    low_count -= 1
+                low_queue[(low_start + low_count) % period] = i
+                low_count += 1
+
+            if i < period - 1 or high_nan > i - period:
+                upper[i, j] = np.nan
+                upper_at[i, j] = -1
+            else:
+                upper_at[i, j] = high_queue[high_start]
+                upper[i, j] = high[high_queue[high_start], j]
+            if i < period - 1 or low_nan > i - period:
+                lower[i, j] = np.nan
+                lower_at[i, j] = -1
+            else:
+                lower_at[i, j] = low_queue[low_start]
+                lower[i, j] = low[low_queue[low_start], j]
+
+
+def _van_herk(values: np.ndarray, period: int, out: np.ndarray, maximum: bool, positions: bool):
+    """
+    Write the rolling maximum (or minimum) of 2-D ``values`` into ``out`` and return the rows of the
+    extremes, or None without ``positions``.
+
+    The rows are split into blocks of ``period``. Every window spans the end of one block and the
+    start of the next, so its extreme is that of a suffix extreme and a prefix extreme within blocks.
+    """
+    extreme, beyond = (np.fmax, np.greater_equal) if maximum else (np.fmin, np.less_equal)
+    rows, columns = values.shape
+    blocks = -(-rows // period)
+    if rows % period:
+        padded = np.full((blocks * period, columns), np.nan, dtype=values.dtype)
+        padded[:rows] = values
+    else:
+        padded = values
+    grouped = padded.reshape(blocks, period, columns)
+    prefix = extreme.accumulate(grouped, axis=1).reshape(-1, columns)
+    suffix = extreme.accumulate(grouped[:, ::-1], axis=1)[:, ::-1].reshape(-1, columns)
+
+    starts = suffix[:rows - period + 1]
+    ends = prefix[period - 1:rows]
+    out[:period - 1] = np.nan
+    extreme(starts, ends, out=out[period - 1:])
+
+    # fmax and fmin skip NaN, so windows containing NaN are blanked afterwards.
+    missing = np.isnan(values)
+    incomplete = None
+    if missing.any():
+        counts = np.zeros((rows + 1, columns), dtype=np.int64)
+        np.cumsum(missing, axis=0, out=counts[1:])
+        incomplete = counts[period:] - counts[:rows - period + 1] > 0
+        out[period - 1:][incomplete] = np.nan
+    if not positions:
+        return None
+
+    # The latest row reaching the prefix extreme, and the latest row reaching the suffix extreme,
+    # which is the nearest following row strictly beyond everything after it in its block.
+    row = np.arange(blocks * period).reshape(blocks, period, 1)
+    prefix_at = np.maximum.accumulate(np.where(grouped == prefix.reshape(grouped.shape), row, -1), axis=1)
+    following = np.full(grouped.shape, np.nan, dtype=values.dtype)
+    following[:, :-1] = suffix.reshape(grouped.shape)[:, 1:]
+    record = ~np.isnan(grouped) & ~beyond(following, grouped)
+    unset = blocks * period
+    suffix_at = np.minimum.accumulate(np.where(record, row, unset)[:, ::-1], axis=1)[:, ::-1]
+
+    prefix_at = prefix_at.reshape(-1, columns)[period - 1:rows]
+    suffix_at = suffix_at.reshape(-1, columns)[:rows - period + 1]
+    at = np.full((rows, columns), -1, dtype=np.int64)
+    at[period - 1:] = np.where(beyond(ends, starts) | np.isnan(starts), prefix_at, suffix_at)
+    if incomplete is not None:
+        at[period - 1:][incomplete] = -1
+    return at
+
+
+def rolling_extrema(high, low, period: int, positions: bool = False, dtype=np.float64):
+    """
+    Calculate the rolling maximum of ``high`` and the rolling minimum of ``low`` in one pass.
+
+    :param high: An array-like rolled along the first axis for the maximum (2-D for one column per symbol).
+    :param low: An array-like with the same shape as ``high``, rolled for the minimum.
+    :param period: The number of rows in each window.
+    :param positions: Also return the row (counted from 0) of each extreme, -1 where the value is NaN.
+    :param dtype: The floating-point dtype of the computation and results.
+    :return: A tuple ``(high_max, low_min)`` of NumPy arrays, or ``(high_max, low_min, high_max_at,
+        low_min_at)`` with ``positions=True``.
+    """
+    if period < 1:
+        raise ValueError("'period' must be a positive integer.")
+
+    high = np.asarray(high, dtype=dtype)
+    low = np.asarray(low, dtype=dtype)
+    if high.shape != low.shape:
+        raise ValueError("'high' and 'low' must have the same shape.")
+
+    shape = high.shape
+    high_2d = high[:, None] if high.ndim == 1 else high
+    low_2d = low[:, None] if low.ndim == 1 else low
+    upper = np.empty(high_2d.shape, dtype=dtype)
+    lower = np.empty(low_2d.shape, dtype=dtype)
+    rows = len(high_2d)
+
+    if rows < period:
+        upper.fill(np.nan)
+        lower.fill(np.nan)
+        upper_at = np.full(upper.shape, -1, dtype=np.int64) if positions else None
+        lower_at = np.full(lower.shape, -1, dtype=np.int64) if positions else None
+    elif NUMBA_AVAILABLE:
+        upper_at = np.empty(upper.shape, dtype=np.int64)
+        lower_at = np.empty(lower.shape, dtype=np.int64)
+        _extrema_kernel(high_2d, low_2d, period, upper, lower, upper_at, lower_at)
+    else:
+        upper_at = _van_herk(high_2d, period, upper, True, positions)
+        lower_at = _van_herk(low_2d, period, lower, False, positions)
+
+    results = (upper.reshape(shape), lower.reshape(shape))
+    if positions:
+        results += (upper_at.reshape(shape), lower_at.reshape(shape))
+    return results
+
+
+class RollingExtrema:
+    """
+    Streaming rolling maximum of the highs and minimum of the lows, using monotonic deques.
+
+    :param period: The number of values in each window.
+    """
+
+    def __init__(self, period: int):
+        if period < 1:
+            raise ValueError("'period' must be a positive integer.")
+        self.period = period
+        self.count = 0
+        self._high = deque()
+        self._low = deque()
+        self._high_nan = self._low_nan = -period
+        self.high_max_at = self.low_min_at = -1
+
+    def push(self, high: float, low: float) -> tuple:
+        """
+        Add one bar and return ``(high_max, low_min)`` over the last ``period`` bars (NaN while the
+        window is not full or contains NaN). The rows of the extremes are kept in ``high_max_at``
+        and ``low_min_at``.
+        """
+        i = self.count
+        self.count += 1
+        oldest = i - self.period
+
+        candidates = self._high
+        if candidates and candidates[0][0] <= oldest:
+            candidates.popleft()
+        if high != high:
+            self._high_nan = i
+        else:
+            while candidates and candidates[-1][1] <= high:
+                candidates.pop()
+            candidates.append((i, high))
+
+        candidates = self._low
+        if candidates and candidates[0][0] <= oldest:
+            candidates.popleft()
+        if low != low:
+            self._low_nan = i
+        else:
+            while candidates and candidates[-1][1] >= low:
+                candidates.pop()
+            candidates.append((i, low))
+
+        full = self.count >= self.period
+        if full and self._high_nan <= oldest:
+            self.high_max_at, high_max = self._high[0]
+        else:
+            self.high_max_at, high_max = -1, float('nan')
+        if full and self._low_nan <= oldest:
+            self.low_min_at, low_min = self._low[0]
+        else:
+            self.low_min_at, low_min = -1, float('nan')
+        return high_max, low_min
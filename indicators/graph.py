@@ -0,0 +1,370 @@
+# indicators/graph.py
+
+"""
+Batch computation of many indicators in one pass.
+
+Indicators are described by the intermediates they need (true range, close-to-close delta,
+money flow multiplier, rolling extremes, close EMAs, ...). :func:`compute_indicators` builds the
+dependency graph of those intermediates for all requested indicators, computes each one exactly
+once and releases it as soon as its last consumer has been evaluated.
+"""
+
+import inspect
+from collections import Counter
+
+import pandas as pd
+
+from .adl import calculate_money_flow_multiplier
+from .atr import calculate_true_range
+from .obv import calculate_obv
+from .panel import combine, field_major, fields, like
+from .parabolic_sar import calculate_parabolic_sar
+from .rolling import SMOOTHING, rolling_mad, rolling_mean_std, smoothed_mean
+
+
+def _rolling_mad(series: pd.Series, period: int) -> pd.Series:
+    return like(rolling_mad(series.to_numpy(), period), series)
+
+
+def _rolling_mean_std(series: pd.Series, period: int, ddof: int) -> tuple:
+    return tuple(like(values, series) for values in rolling_mean_std(series.to_numpy(), period, ddof))
+
+
+def _smoothed_mean(series: pd.Series, period: int, smoothing: str) -> pd.Series:
+    return like(smoothed_mean(series.to_numpy(), period, smoothing), series)
+
+
+# Rolling node kinds: (source, period, *options) -> Series, or a (mean, std) tuple of Series for
+# 'rolling_mean_std'.
+_ROLLING = {
+    'rolling_mean': lambda series, period: series.rolling(window=period).mean(),
+    'rolling_sum': lambda series, period: series.rolling(window=period).sum(),
+    'rolling_std': lambda series, period: series.rolling(window=period).std(),
+    'rolling_max': lambda series, period: series.rolling(window=period).max(),
+    'rolling_min': lambda series, period: series.rolling(window=period).min(),
+    'rolling_mad': _rolling_mad,
+    'rolling_mean_std': _rolling_mean_std,
+    'smoothed_mean': _smoothed_mean,
+}
+
+
+def _node(key: tuple):
+    """
+    Return ``(dependencies, function)`` for an intermediate node.
+
+    The function is called with the input DataFrame followed by the values of the dependencies.
+    """
+    kind = key[0]
+    if kind == 'delta':
+        return (), lambda data: data['Close'].diff(1)
+    if kind == 'gain' and len(key) > 1:
+        # ('gain', 'keep_missing') keeps the first bar's undefined change NaN, as the recursive RSI needs.
+        return (('delta',),), lambda data, delta: delta.clip(lower=0)
+    if kind == 'loss' and len(key) > 1:
+        return (('delta',),), lambda data, delta: (-delta).clip(lower=0)
+    if kind == 'gain':
+        return (('delta',),), lambda data, delta: delta.where(delta > 0, 0)
+    if kind == 'loss':
+        return (('delta',),), lambda data, delta: -delta.where(delta < 0, 0)
+    if kind == 'true_range':
+        return (), calculate_true_range
+    if kind == 'typical_price':
+        return (), lambda data: (data['High'] + data['Low'] + data['Close']) / 3
+    if kind == 'money_flow_multiplier':
+        return (), calculate_money_flow_multiplier
+    if kind == 'money_flow_volume':
+        return (('money_flow_multiplier',),), lambda data, multiplier: multiplier * data['Volume']
+    if kind == 'ema':
+        span = key[1]
+        return (), lambda data: data['Close'].ewm(span=span, adjust=False).mean()
+    if kind in _ROLLING:
+        _, source, period, *options = key
+        rolling = _ROLLING[kind]
+        if isinstance(source, str):
+            return (), lambda data: rolling(data[source], period, *options)
+        return (source,), lambda data, value: rolling(value, period, *options)
+    raise KeyError(f"Unknown intermediate {key!r}.")
+
+
+# Indicator definitions. Each returns (required columns, dependencies, combine function); the
+# combine function receives the DataFrame and the dependency values and returns a Series or a
+# dict of named output Series. The arithmetic mirrors the calculate_* functions exactly.
+
+def _sma(period: int = 20):
+    return {'Close'}, [('rolling_mean', 'Close', period)], lambda data, sma: sma
+
+
+def _ema(period: int = 20):
+    return {'Close'}, [('ema', period)], lambda data, ema: ema
+
+
+def _average(source: tuple, period: int, smoothing: str) -> tuple:
+    # The 'sma' node is shared with the indicators averaging the same source with a rolling mean.
+    if smoothing == 'sma':
+        return 'rolling_mean', source, period
+    if smoothing not in SMOOTHING:
+        raise ValueError(f"'smoothing' must be one of {', '.join(repr(name) for name in SMOOTHING)}.")
+    return 'smoothed_mean', source, period, smoothing
+
+
+def _rsi(period: int = 14, *, smoothing: str = 'sma'):
+    def combine(data, avg_gain, avg_loss):
+        rs = avg_gain / avg_loss
+        return 100 - (100 / (1 + rs))
+
+    if smoothing == 'sma':
+        gain, loss = ('gain',), ('loss',)
+    else:
+        gain, loss = ('gain', 'keep_missing'), ('loss', 'keep_missing')
+    return {'Close'}, [_average(gain, period, smoothing), _average(loss, period, smoothing)], combine
+
+
+def _macd(fast_period: int = 12, slow_period: int = 26, signal_period: int = 9):
+    def combine(data, fast_ema, slow_ema):
+        macd_line = fast_ema - slow_ema
+        signal_line = macd_line.ewm(span=signal_period, adjust=False).mean()
+        return {
+            'MACD Line': macd_line,
+            'Signal Line': signal_line,
+            'MACD Histogram': macd_line - signal_line
+        }
+
+    return {'Close'}, [('ema', fast_period), ('ema', slow_period)], combine
+
+
+def _bollinger_bands(period: int = 20, num_std_dev: int = 2, *, ddof: int = 1, extended: bool = False):
+    def combine(data, stats):
+        sma, rolling_std = stats
+        bands = {
+            'Middle Band': sma,
+            'Upper Band': sma + (rolling_std * num_std_dev),
+            'Lower Band': sma - (rolling_std * num_std_dev)
+        }
+        if extended:
+            width = bands['Upper Band'] - bands['Lower Band']
+            bands['%B'] = (data['Close'] - bands['Lower Band']) / width
+            bands['Bandwidth'] = width / sma
+        return bands
+
+    return {'Close'}, [('rolling_mean_std', 'Close', period, ddof)], combine
+
+
+def _atr(period: int = 14, *, smoothing: str = 'sma'):
+    return {'High', 'Low', 'Close'}, [_average(('true_range',), period, smoothing)], lambda data, atr: atr
+
+
+def _stochastic_oscillator(period: int = 14):
+    def combine(data, low_min, high_max):
+        percent_k = 100 * ((data['Close'] - low_min) / (high_max - low_min))
+        return {
+            '%K': percent_k,
+            '%D': percent_k.rolling(window=3).mean()
+        }
+
+    return {'High', 'Low', 'Close'}, [('rolling_min', 'Low', period), ('rolling_max', 'High', period)], combine
+
+
+def _williams_r(period: int = 14):
+    def combine(data, high_max, low_min):
+        return -100 * (high_max - data['Close']) / (high_max - low_min)
+
+    return {'High', 'Low', 'Close'}, [('rolling_max', 'High', period), ('rolling_min', 'Low', period)], combine
+
+
+def _adl():
+    return {'High', 'Low', 'Close', 'Volume'}, [('money_flow_volume',)], lambda data, volume: volume.cumsum()
+
+
+def _parabolic_sar(step: float = 0.02, max_step: float = 0.2):
+    return {'High', 'Low'}, [], lambda data: calculate_parabolic_sar(data, step, max_step)
+
+
+def _cci(period: int = 20):
+    def combine(data, tp, sma, mean_dev):
+        return (tp - sma) / (0.015 * mean_dev)
+
+    tp = ('typical_price',)
+    return {'High', 'Low', 'Close'}, [tp, ('rolling_mean', tp, period), ('rolling_mad', tp, period)], combine
+
+
+def _cmf(period: int = 20):
+    def combine(data, flow, volume):
+        return flow / volume
+
+    return ({'High', 'Low', 'Close', 'Volume'},
+            [('rolling_sum', ('money_flow_volume',), period), ('rolling_sum', 'Volume', period)], combine)
+
+
+def _keltner_channels(ema_period: int = 20, atr_period: int = 14, multiplier: int = 2):
+    def combine(data, ema, atr):
+        return {
+            'Middle Channel': ema,
+            'Upper Channel': ema + (atr * multiplier),
+            'Lower Channel': ema - (atr * multiplier)
+        }
+
+    return {'High', 'Low', 'Close'}, [('ema', ema_period), ('rolling_mean', ('true_range',), atr_period)], combine
+
+
+def _obv():
+    return {'Close', 'Volume'}, [], calculate_obv
+
+
+def _donchian_channels(period: int = 20):
+    def combine(data, upper, lower):
+        return {
+            'Upper Channel': upper,
+            'Middle Channel': (upper + lower) / 2,
+            'Lower Channel': lower
+        }
+
+    return {'High', 'Low'}, [('rolling_max', 'High', period), ('rolling_min', 'Low', period)], combine
+
+
+def _cmo(period: int = 14):
+    def combine(data, up, down):
+        return 100 * (up - down) / (up + down)
+
+    return {'Close'}, [('rolling_sum', ('gain',), period), ('rolling_sum', ('loss',), period)], combine
+
+
+# Indicator names follow the calculate_<name> functions they mirror.
+INDICATORS = {
+    'adl': _adl,
+    'atr': _atr,
+    'bollinger_bands': _bollinger_bands,
+    'cci': _cci,
+    'cmf': _cmf,
+    'cmo': _cmo,
+    'donchian_channels': _donchian_channels,
+    'ema': _ema,
+    'keltner_channels': _keltner_channels,
+    'macd': _macd,
+    'obv': _obv,
+    'parabolic_sar': _parabolic_sar,
+    'rsi': _rsi,
+    'sma': _sma,
+    'stochastic_oscillator': _stochastic_oscillator,
+    'williams_r': _williams_r,
+}
+
+
+def parse_spec(spec):
+    """
+    Normalize a spec to ``(name, params, label)``.
+
+    A spec is an indicator name ('rsi'), a ``(name, params)`` tuple (('rsi', {'period': 21})) or a dict
+    with a 'name' key, the parameters and an optional 'label' ({'name': 'rsi', 'period': 21}). Options
+    such as ``smoothing`` appear in the label as key=value, e.g. 'RSI_14_smoothing=wilder'.
+    """
+    label = None
+    if isinstance(spec, str):
+        name, params = spec, {}
+    elif isinstance(spec, dict):
+        params = dict(spec)
+        name = params.pop('name')
+        label = params.pop('label', None)
+    else:
+        name, params = spec
+        params = dict(params)
+
+    if name not in INDICATORS:
+        raise ValueError(f"Unknown indicator '{name}'. Available indicators: {', '.join(sorted(INDICATORS))}.")
+
+    signature = inspect.signature(INDICATORS[name])
+    parameters = signature.parameters
+    unknown = sorted(set(params).difference(parameters))
+    if unknown:
+        raise ValueError(f"Unknown parameter '{unknown[0]}' for indicator '{name}'.")
+    for key, value in params.items():
+        # Catches numbers given as text (e.g. 'sma:period=abc' on the command line) and the reverse.
+        if isinstance(value, str) != isinstance(parameters[key].default, str):
+            raise ValueError(f"Invalid value {value!r} for parameter '{key}' of indicator '{name}'.")
+    bound = signature.bind(**params)
+    bound.apply_defaults()
+    # Keyword-only options (such as the RSI smoothing) are only kept when they differ from their default,
+    # so the default variants keep their labels ('RSI_14') and store paths ('rsi/period=14').
+    options = {key for key, parameter in parameters.items() if parameter.kind == inspect.Parameter.KEYWORD_ONLY}
+    arguments = {key: value for key, value in bound.arguments.items()
+                 if key not in options or value != parameters[key].default}
+    if label is None:
+        label = '_'.join([name.upper()] + [f'{key}={value}' if key in options else str(value)
+                                           for key, value in arguments.items()])
+
+    return name, arguments, label
+
+
+def compute_indicators(data: pd.DataFrame, specs) -> pd.DataFrame:
+    """
+    Calculate several indicators at once, sharing the intermediates they have in common.
+
+    Single-output indicators produce one column named after their label (e.g. 'RSI_14'); multi-output
+    indicators produce one column per output, prefixed with the label (e.g. 'MACD_12_26_9 Signal Line').
+    For a multi-symbol panel every output becomes a (column, symbol) pair.
+
+    :param data: A Pandas DataFrame (or panel) containing the columns required by the requested indicators.
+    :param specs: An iterable of indicator specs: a name such as 'rsi', a ``(name, params)`` tuple, or a
+        dict with a 'name' key, the parameters and an optional 'label'.
+    :return: A Pandas DataFrame with all requested outputs, aligned to the index of ``data``.
+    """
+    plan = []
+    required = set()
+    for spec in specs:
+        name, params, label = parse_spec(spec)
+        columns, dependencies, finish = INDICATORS[name](**params)
+        if any(label == planned[0] for planned in plan):
+            raise ValueError(f"Duplicate indicator label '{label}'.")
+        required |= columns
+        plan.append((label, dependencies, finish))
+
+    data = field_major(data)
+    missing = sorted(required.difference(fields(data)))
+    if len(missing) == 1:
+        raise ValueError(f"DataFrame must contain a '{missing[0]}' column.")
+    if missing:
+        raise ValueError(f"DataFrame must contain {', '.join(repr(column) for column in missing)} columns.")
+
+    # Build the graph: every node is evaluated once and dropped after its last consumer has run.
+    definitions = {}
+    consumers = Counter()
+
+    def visit(key):
+        consumers[key] += 1
+        if key not in definitions:
+            definitions[key] = _node(key)
+            for dependency in definitions[key][0]:
+                visit(dependency)
+
+    for _, dependencies, _ in plan:
+        for key in dependencies:
+            visit(key)
+
+    values = {}
+
+    def release(key):
+        consumers[key] -= 1
+        if consumers[key] == 0:
+            del values[key]
+
+    def evaluate(key):
+        if key not in values:
+            dependencies, func = definitions[key]
+            values[key] = func(data, *[evaluate(dependency) for dependency in dependencies])
+            for dependency in dependencies:
+                release(dependency)
+        return values[key]
+
+    outputs = {}
+    for label, dependencies, finish in plan:
+        result = finish(data, *[evaluate(key) for key in dependencies])
+        for key in dependencies:
+            release(key)
+        if isinstance(result, dict):
+            for output, series in result.items():
+                outputs[f'{label} {output}'] = series
+        else:
+            outputs[label] = result
+
+    if not outputs:
+        return pd.DataFrame(index=data.index)
+    return combine(outputs)
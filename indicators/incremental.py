@@ -0,0 +1,270 @@
+# indicators/incremental.py
+
+"""
+Incremental append: extend an indicator result with new bars without recomputing the history.
+
+:func:`calculate_with_state` runs an indicator over the history and also returns an
+:class:`IndicatorState` holding just what the next bars depend on:
+
+* the last input rows covering one window, for rolling indicators (SMA, RSI, Bollinger Bands, ...);
+* the last EMA value and the number of trailing missing closes, for the EMA, MACD and Keltner Channels;
+* the running total for the ADL and the OBV (plus the last close for the OBV);
+* the SAR, trend, acceleration factor and extreme point for the Parabolic SAR.
+
+:func:`extend` then computes only the rows of the new bars, at a cost proportional to their number::
+
+    result, state = calculate_with_state('macd', history)
+    new_rows, state = extend(result, state, todays_bars)
+
+The recursive indicators (EMA, MACD, ADL, OBV, Parabolic SAR) match a full recompute exactly; rolling
+windows match up to floating-point rounding, as pandas' running window sums depend on where they start.
+The Wilder and EMA smoothing of the RSI and the ATR are recursive over the whole history and cannot be
+extended from a window of bars, so only their default 'sma' smoothing is supported here.
+States are plain Python objects and can be pickled between runs.
+"""
+
+import numpy as np
+import pandas as pd
+
+from .adl import calculate_money_flow_multiplier
+from .atr import calculate_atr
+from .bollinger_bands import calculate_bollinger_bands
+from .cci import calculate_cci
+from .cmf import calculate_cmf
+from .cmo import calculate_cmo
+from .donchian import calculate_donchian_channels
+from .graph import INDICATORS, parse_spec
+from .obv import obv_array
+from .panel import combine, field_major, fields, like
+from .parabolic_sar import parabolic_sar_array
+from .rsi import calculate_rsi
+from .sma import calculate_sma
+from .stochastic import calculate_stochastic_oscillator
+from .williams_r import calculate_williams_r
+
+
+class IndicatorState:
+    """
+    What an indicator needs to continue after the last processed bar.
+
+    :ivar indicator: The indicator name, e.g. 'macd'.
+    :ivar params: The indicator parameters, completed with their defaults.
+    :ivar tail: The last input rows needed by rolling windows, or None for purely recursive indicators.
+    :ivar seeds: Recursive values (EMA seeds, running totals, SAR state) keyed by name.
+    :ivar last_index: The index label of the last processed bar, or None before the first bar.
+    """
+
+    def __init__(self, indicator: str, params: dict):
+        if params.get('smoothing', 'sma') != 'sma':
+            raise ValueError(f"'{indicator}' with smoothing '{params['smoothing']}' cannot be extended from a window "
+                             f"of bars; only smoothing='sma' is supported incrementally.")
+        self.indicator = indicator
+        self.params = params
+        self.tail = None
+        self.seeds = {}
+        self.last_index = None
+
+    def __repr__(self):
+        rows = 0 if self.tail is None else len(self.tail)
+        return f"IndicatorState({self.indicator!r}, {self.params!r}, tail_rows={rows}, last_index={self.last_index!r})"
+
+
+def _new_rows(result, count: int):
+    return result.iloc[len(result) - count:]
+
+
+def _ewm(values, span: int, seed):
+    """
+    Continue ``values.ewm(span=span, adjust=False).mean()`` from ``seed = (last value, trailing gap)``.
+
+    Prepending the last EMA value followed by as many missing values as the history ended with puts
+    pandas' recursion in exactly the state it had after the last bar.
+    """
+    array = values.to_numpy(dtype=np.float64)
+    if seed is None:
+        prefix = np.empty((0,) + array.shape[1:])
+        previous_gap = np.zeros(array.shape[1:], dtype=np.int64)
+    else:
+        last, previous_gap = seed
+        width = int(np.max(previous_gap)) + 1
+        prefix = np.full((width,) + array.shape[1:], np.nan)
+        # Leading missing values do not affect the recursion, so each column's seed is right-padded
+        # with exactly its own gap.
+        if array.ndim == 1:
+            prefix[width - 1 - previous_gap] = last
+        else:
+            prefix[width - 1 - previous_gap, np.arange(array.shape[1])] = last
+
+    combined = np.concatenate([prefix, array])
+    frame = pd.Series(combined) if array.ndim == 1 else pd.DataFrame(combined)
+    ema = frame.ewm(span=span, adjust=False).mean().to_numpy()[len(prefix):]
+
+    missing = np.isnan(array)
+    gap = np.cumprod(missing[::-1], axis=0).sum(axis=0)
+    gap = np.where(gap == len(array), previous_gap + gap, gap)
+    last = ema[-1] if len(array) else seed[0] if seed is not None else np.full(array.shape[1:], np.nan)
+    return like(ema, values), (last, gap)
+
+
+def _windowed(func):
+    """
+    Extend a rolling indicator by computing it over the stored tail followed by the new bars.
+    """
+    def extend_windowed(bars, tail, seeds, **params):
+        data = bars if tail is None else pd.concat([tail, bars])
+        return _new_rows(func(data, **params), len(bars))
+
+    return extend_windowed
+
+
+def _extend_ema(bars, tail, seeds, period):
+    ema, seeds['ema'] = _ewm(bars['Close'], period, seeds.get('ema'))
+    return ema
+
+
+def _extend_macd(bars, tail, seeds, fast_period, slow_period, signal_period):
+    fast_ema, seeds['fast'] = _ewm(bars['Close'], fast_period, seeds.get('fast'))
+    slow_ema, seeds['slow'] = _ewm(bars['Close'], slow_period, seeds.get('slow'))
+
+    macd_line = fast_ema - slow_ema
+    signal_line, seeds['signal'] = _ewm(macd_line, signal_period, seeds.get('signal'))
+
+    return combine({
+        'MACD Line': macd_line,
+        'Signal Line': signal_line,
+        'MACD Histogram': macd_line - signal_line
+    })
+
+
+def _extend_keltner_channels(bars, tail, seeds, ema_period, atr_period, multiplier):
+    ema, seeds['ema'] = _ewm(bars['Close'], ema_period, seeds.get('ema'))
+    data = bars if tail is None else pd.concat([tail, bars])
+    atr = _new_rows(calculate_atr(data, atr_period), len(bars))
+
+    return combine({
+        'Middle Channel': ema,
+        'Upper Channel': ema + (atr * multiplier),
+        'Lower Channel': ema - (atr * multiplier)
+    })
+
+
+def _extend_adl(bars, tail, seeds):
+    flow = calculate_money_flow_multiplier(bars) * bars['Volume']
+    values = flow.to_numpy(dtype=np.float64)
+    total = seeds.get('total', np.zeros(values.shape[1:]))
+
+    # Continue the running total sequentially from the previous one, as cumsum would have.
+    combined = np.concatenate([np.reshape(total, (1,) + values.shape[1:]), values])
+    frame = pd.Series(combined) if values.ndim == 1 else pd.DataFrame(combined)
+    adl = frame.cumsum()
+    seeds['total'] = adl.ffill().to_numpy()[-1]
+
+    return like(adl.to_numpy()[1:], flow)
+
+
+def _extend_obv(bars, tail, seeds):
+    close = bars['Close'].to_numpy(dtype=np.float64)
+    volume = bars['Volume'].to_numpy(dtype=np.float64)
+    if len(close) == 0:
+        return like(np.empty(close.shape), bars['Close'])
+
+    if 'close' not in seeds:
+        obv = obv_array(close, volume)
+    else:
+        delta = np.diff(np.concatenate([seeds['close'][None], close]), axis=0)
+        signed = np.where(delta > 0, volume, np.where(delta < 0, -volume, 0.0))
+        obv = np.cumsum(np.concatenate([seeds['total'][None], signed]), axis=0)[1:]
+
+    seeds['close'] = close[-1]
+    seeds['total'] = obv[-1]
+    return like(obv, bars['Close'])
+
+
+def _extend_parabolic_sar(bars, tail, seeds, step, max_step):
+    high = bars['High'].to_numpy(dtype=np.float64)
+    low = bars['Low'].to_numpy(dtype=np.float64)
+    if high.ndim == 1:
+        state = seeds.setdefault('sar', np.zeros(4))
+        sar, _, _ = parabolic_sar_array(high, low, step, max_step, state=state)
+    else:
+        states = seeds.setdefault('sar', np.zeros((high.shape[1], 4)))
+        sar = np.empty(high.shape)
+        for j in range(high.shape[1]):
+            # The SAR recursion is sequential in time, so a panel runs the kernel once per symbol.
+            sar[:, j] = parabolic_sar_array(high[:, j], low[:, j], step, max_step, state=states[j])[0]
+    return like(sar, bars['High'])
+
+
+# Indicator name -> (extend function, number of trailing input rows the rolling part depends on).
+_EXTENSIONS = {
+    'adl': (_extend_adl, lambda: 0),
+    'atr': (_windowed(calculate_atr), lambda period: period),
+    'bollinger_bands': (_windowed(calculate_bollinger_bands), lambda period, num_std_dev, **options: period),
+    'cci': (_windowed(calculate_cci), lambda period: period),
+    'cmf': (_windowed(calculate_cmf), lambda period: period),
+    'cmo': (_windowed(calculate_cmo), lambda period: period),
+    'donchian_channels': (_windowed(calculate_donchian_channels), lambda period: period),
+    'ema': (_extend_ema, lambda period: 0),
+    'keltner_channels': (_extend_keltner_channels, lambda ema_period, atr_period, multiplier: atr_period),
+    'macd': (_extend_macd, lambda fast_period, slow_period, signal_period: 0),
+    'obv': (_extend_obv, lambda: 0),
+    'parabolic_sar': (_extend_parabolic_sar, lambda step, max_step: 0),
+    'rsi': (_windowed(calculate_rsi), lambda period: period),
+    'sma': (_windowed(calculate_sma), lambda period: period),
+    # %D averages the last three %K values, each of which spans one window.
+    'stochastic_oscillator': (_windowed(calculate_stochastic_oscillator), lambda period: period + 2),
+    'williams_r': (_windowed(calculate_williams_r), lambda period: period),
+}
+
+
+def calculate_with_state(indicator: str, data: pd.DataFrame, **params):
+    """
+    Calculate an indicator over the full history and return the state needed to extend it.
+
+    :param indicator: The indicator name, as used by :func:`indicators.graph.compute_indicators` (e.g. 'rsi').
+    :param data: A Pandas DataFrame (or panel) containing the columns required by the indicator.
+    :param params: The indicator parameters; omitted parameters take their defaults.
+    :return: A tuple ``(result, state)``: the same result as the calculate_* function and an
+        :class:`IndicatorState` to pass to :func:`extend`.
+    """
+    name, params, _ = parse_spec((indicator, params))
+    return extend(None, IndicatorState(name, params), data)
+
+
+def extend(previous_result, previous_state: IndicatorState, new_bars: pd.DataFrame):
+    """
+    Compute an indicator for new bars, continuing from the state of the previous run.
+
+    :param previous_result: The result the state belongs to (the rows computed so far), used to check
+        that the state is current; may be None.
+    :param previous_state: The :class:`IndicatorState` returned with ``previous_result``.
+    :param new_bars: A Pandas DataFrame (or panel) with the bars following the last processed bar.
+    :return: A tuple ``(new_rows, state)``: the indicator values for the new bars only, and the state
+        to pass to the next call. ``previous_state`` is left unchanged.
+    """
+    state = previous_state
+    if previous_result is not None and len(previous_result) and previous_result.index[-1] != state.last_index:
+        raise ValueError("'previous_state' does not belong to 'previous_result': their last bars differ.")
+
+    new_bars = field_major(new_bars)
+    columns = INDICATORS[state.indicator]()[0]
+    missing = sorted(columns.difference(fields(new_bars)))
+    if len(missing) == 1:
+        raise ValueError(f"DataFrame must contain a '{missing[0]}' column.")
+    if missing:
+        raise ValueError(f"DataFrame must contain {', '.join(repr(column) for column in missing)} columns.")
+
+    func, lookback = _EXTENSIONS[state.indicator]
+    rows = lookback(**state.params)
+    bars = new_bars[sorted(columns)]
+
+    following = IndicatorState(state.indicator, state.params)
+    following.seeds = {key: np.copy(value) if isinstance(value, np.ndarray) else value
+                       for key, value in state.seeds.items()}
+    result = func(bars, state.tail, following.seeds, **state.params)
+
+    if rows:
+        tail = bars if state.tail is None else pd.concat([state.tail, bars])
+        following.tail = tail.iloc[max(len(tail) - rows, 0):]
+    following.last_index = new_bars.index[-1] if len(new_bars) else state.last_index
+    return result, following
@@ -0,0 +1,193 @@
+# indicators/ingest.py
+
+"""
+Binary cache of parsed price CSV files.
+
+Parsing a CSV file, and its text dates in particular, often costs more than the indicators computed
+from it. :class:`PriceCache` converts each file once into a directory of typed NumPy ``.npy`` files,
+one per column, with the 'Date' column parsed to ``datetime64[ns]`` (epoch nanoseconds)::
+
+    <root>/<file name>-<path hash>/Date.npy, Open.npy, ..., Volume.npy, meta.json
+
+Later loads memory-map those files, so reopening even a 10M-row history takes milliseconds and the
+DataFrame columns are views over the mapped pages: the calculate_* functions read them without
+copying. ``meta.json`` records the source's size, modification time and content hash; a source whose
+size or modification time has changed is hashed again and re-parsed only if its content differs.
+"""
+
+import hashlib
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+PRICE_COLUMNS = ['Date', 'Open', 'High', 'Low', 'Close', 'Volume']
+
+# Bump when the layout changes, so existing caches are rebuilt rather than misread.
+CACHE_VERSION = 1
+META_FILE = 'meta.json'
+
+
+def price_columns(file_path: str, required=('Open', 'High', 'Low', 'Close', 'Volume')):
+    """
+    Return the price columns present in a CSV file and the float64 dtypes of the numeric ones.
+
+    :param file_path: Path to the CSV file.
+    :param required: Columns the file must contain. 'Date' is optional by default, as it is only
+        carried along with the results.
+    :return: A ``(columns, dtypes)`` tuple to pass to ``pd.read_csv`` as ``usecols`` and ``dtype``.
+    :raises ValueError: If a required column is missing.
+    """
+    header = pd.read_csv(file_path, nrows=0).columns
+    missing = [column for column in required if column not in header]
+    if missing:
+        raise ValueError(f"'{file_path}' is missing the price columns: {', '.join(missing)}.")
+    columns = [column for column in PRICE_COLUMNS if column in header]
+    return columns, {column: 'float64' for column in columns if column != 'Date'}
+
+
+def file_hash(file_path: str, block_size: int = 1 << 20) -> str:
+    """
+    Return the BLAKE2b hex digest of a file's content, read in blocks of ``block_size`` bytes.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, 'rb') as file:
+        for block in iter(lambda: file.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class PriceCache:
+    """
+    Directory of parsed, memory-mappable copies of price CSV files.
+
+    :param root: The root directory of the cache; created on first write.
+    :param verify: 'stat' to trust a cache entry while the source's size and modification time are
+        unchanged, or 'hash' to also compare the content hash on every load.
+    """
+
+    def __init__(self, root: str, verify: str = 'stat'):
+        if verify not in ('stat', 'hash'):
+            raise ValueError("'verify' must be 'stat' or 'hash'.")
+        self.root = root
+        self.verify = verify
+
+    def path(self, file_path: str) -> str:
+        """
+        Return the cache directory of a source file.
+        """
+        source = os.path.abspath(file_path)
+        key = hashlib.blake2b(source.encode(), digest_size=8).hexdigest()
+        return os.path.join(self.root, f'{os.path.basename(source)}-{key}')
+
+    def _meta(self, file_path: str):
+        """
+        Return the metadata of a source's cache entry, or None when the entry is missing or stale.
+        """
+        meta_path = os.path.join(self.path(file_path), META_FILE)
+        try:
+            with open(meta_path) as file:
+                meta = json.load(file)
+        except (OSError, ValueError):
+            return None
+        if meta.get('version') != CACHE_VERSION:
+            return None
+
+        stat = os.stat(file_path)
+        if stat.st_size != meta['size']:
+            return None
+        if stat.st_mtime_ns == meta['mtime_ns'] and self.verify == 'stat':
+            return meta
+        if file_hash(file_path) != meta['hash']:
+            return None
+        if stat.st_mtime_ns != meta['mtime_ns']:
+            # Touched or copied without changing: keep the entry and remember the new time.
+            meta['mtime_ns'] = stat.st_mtime_ns
+            self._write_meta(file_path, meta)
+        return meta
+
+    def _write_meta(self, file_path: str, meta: dict):
+        meta_path = os.path.join(self.path(file_path), META_FILE)
+        with open(meta_path + '.tmp', 'w') as file:
+            json.dump(meta, file)
+        os.replace(meta_path + '.tmp', meta_path)
+
+    def ingest(self, file_path: str) -> dict:
+        """
+        Parse a CSV file and write its cache entry, replacing any previous one.
+
+        :param file_path: Path to the CSV file with the usual OHLCV columns.
+        :return: The metadata of the new entry.
+        """
+        stat = os.stat(file_path)
+        digest = file_hash(file_path)
+        columns, dtypes = price_columns(file_path)
+        data = pd.read_csv(file_path, usecols=columns, dtype=dtypes)
+
+        directory = self.path(file_path)
+        os.makedirs(directory, exist_ok=True)
+        # Remove the metadata first, so an interrupted rewrite leaves an entry that reads as stale.
+        if os.path.exists(os.path.join(directory, META_FILE)):
+            os.remove(os.path.join(directory, META_FILE))
+
+        timezone = None
+        for column in columns:
+            values = data[column]
+            if column == 'Date':
+                try:
+                    values = pd.to_datetime(values)
+                except ValueError:
+                    # Offsets that change within the file (e.g. daylight saving time) give UTC timestamps.
+                    values = pd.to_datetime(values, utc=True)
+                if values.dt.tz is not None:
+                    timezone = str(values.dt.tz)
+                    values = values.dt.tz_convert('UTC').dt.tz_localize(None)
+                values = values.to_numpy(dtype='datetime64[ns]')
+            else:
+                values = values.to_numpy(dtype=np.float64)
+            column_path = os.path.join(directory, column + '.npy')
+            with open(column_path + '.tmp', 'wb') as file:
+                np.save(file, values)
+            os.replace(column_path + '.tmp', column_path)
+
+        meta = {
+            'version': CACHE_VERSION,
+            'source': os.path.abspath(file_path),
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'hash': digest,
+            'rows': len(data),
+            'columns': columns,
+            'timezone': timezone
+        }
+        self._write_meta(file_path, meta)
+        return meta
+
+    def arrays(self, file_path: str) -> dict:
+        """
+        Return the columns of a price file as read-only memory-mapped NumPy arrays, ingesting it if needed.
+
+        :param file_path: Path to the CSV file.
+        :return: A dict of column name to array; 'Date' holds ``datetime64[ns]`` values in UTC.
+        """
+        return self._columns(file_path, self._meta(file_path) or self.ingest(file_path))
+
+    def _columns(self, file_path: str, meta: dict) -> dict:
+        directory = self.path(file_path)
+        return {column: np.load(os.path.join(directory, column + '.npy'), mmap_mode='r')
+                for column in meta['columns']}
+
+    def load(self, file_path: str) -> pd.DataFrame:
+        """
+        Load a price file as a DataFrame backed by its memory-mapped cache entry, ingesting it if needed.
+
+        :param file_path: Path to the CSV file.
+        :return: A Pandas DataFrame with the price columns found in the file; 'Date' is parsed to
+            timestamps (in the file's time zone, if it had one).
+        """
+        meta = self._meta(file_path) or self.ingest(file_path)
+        data = pd.DataFrame(self._columns(file_path, meta), copy=False)
+        if meta['timezone'] is not None:
+            data['Date'] = data['Date'].dt.tz_localize('UTC').dt.tz_convert(meta['timezone'])
+        return data
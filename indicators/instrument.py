@@ -0,0 +1,247 @@
+# indicators/instrument.py
+
+"""
+Opt-in instrumentation of the indicator functions.
+
+:func:`enable_instrumentation` wraps every function exported by the package so each call records
+its wall time, the number of input rows and the bytes of its result in a :class:`MetricsRegistry`,
+and optionally hands a :class:`Span` to a trace callback::
+
+    registry = enable_instrumentation(on_span=SpanRecorder())
+    indicators.calculate_rsi(data)
+    print(registry.snapshot()['calculate_rsi'])
+    registry.write_prometheus('/var/lib/node_exporter/indicators.prom')
+    disable_instrumentation()
+
+Instrumentation replaces the functions in the package namespace and :func:`disable_instrumentation`
+removes its wrappers again, so while it is disabled calls cost exactly what they did before.
+"""
+
+import functools
+import os
+import threading
+import time
+from collections import deque, namedtuple
+
+from . import _hooks
+
+# Upper bounds in seconds of the duration histogram buckets.
+DEFAULT_BUCKETS = (1e-5, 1e-4, 1e-3, 1e-2, 0.1, 1.0, 10.0)
+
+# One instrumented call: the function name, its start as a Unix timestamp, its duration in seconds,
+# the number of input rows, the bytes of the result, the calling thread and the exception type name
+# if the call raised (None otherwise).
+Span = namedtuple('Span', ['function', 'start', 'duration', 'rows', 'output_bytes', 'thread', 'error'])
+
+
+def _rows(args) -> int:
+    """
+    Return the number of rows of the first argument (a DataFrame, Series or array), or 0.
+    """
+    if not args:
+        return 0
+    try:
+        return len(args[0])
+    except TypeError:
+        return 0
+
+
+class _FunctionMetrics:
+    __slots__ = ('calls', 'errors', 'seconds', 'max_seconds', 'rows', 'output_bytes', 'buckets')
+
+    def __init__(self, buckets: int):
+        self.calls = 0
+        self.errors = 0
+        self.seconds = 0.0
+        self.max_seconds = 0.0
+        self.rows = 0
+        self.output_bytes = 0
+        self.buckets = [0] * buckets
+
+
+class MetricsRegistry:
+    """
+    Thread-safe per-function call metrics.
+
+    :param buckets: Upper bounds in seconds of the duration histogram exported to Prometheus.
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def record(self, function: str, seconds: float, rows: int = 0, output_bytes: int = 0, error: bool = False):
+        """
+        Add one call of ``function`` to the metrics.
+        """
+        with self._lock:
+            metrics = self._metrics.get(function)
+            if metrics is None:
+                metrics = self._metrics[function] = _FunctionMetrics(len(self.buckets))
+            metrics.calls += 1
+            metrics.errors += error
+            metrics.seconds += seconds
+            metrics.max_seconds = max(metrics.max_seconds, seconds)
+            metrics.rows += rows
+            metrics.output_bytes += output_bytes
+            for position, bound in enumerate(self.buckets):
+                if seconds <= bound:
+                    metrics.buckets[position] += 1
+                    break
+
+    def snapshot(self) -> dict:
+        """
+        Return the metrics per function, e.g. ``{'calculate_rsi': {'calls': 3, 'seconds': 0.012, ...}}``,
+        sorted by total time, most expensive first.
+        """
+        with self._lock:
+            items = [(function, {
+                'calls': metrics.calls,
+                'errors': metrics.errors,
+                'seconds': metrics.seconds,
+                'mean_seconds': metrics.seconds / metrics.calls,
+                'max_seconds': metrics.max_seconds,
+                'rows': metrics.rows,
+                'rows_per_second': metrics.rows / metrics.seconds if metrics.seconds else float('nan'),
+                'output_bytes': metrics.output_bytes,
+            }) for function, metrics in self._metrics.items()]
+        return dict(sorted(items, key=lambda item: -item[1]['seconds']))
+
+    def reset(self):
+        """
+        Drop all recorded metrics.
+        """
+        with self._lock:
+            self._metrics.clear()
+
+    def to_prometheus(self, prefix: str = 'indicator') -> str:
+        """
+        Render the metrics in the Prometheus text exposition format.
+
+        :param prefix: The prefix of the metric names, e.g. 'indicator' for 'indicator_calls_total'.
+        :return: The exposition text, ending with a newline.
+        """
+        with self._lock:
+            metrics = sorted((function, (m.calls, m.errors, m.seconds, m.rows, m.output_bytes, list(m.buckets)))
+                             for function, m in self._metrics.items())
+
+        lines = []
+        counters = (
+            ('calls_total', 'Calls of each indicator function.', 0),
+            ('errors_total', 'Calls that raised an exception.', 1),
+            ('rows_total', 'Input rows processed.', 3),
+            ('output_bytes_total', 'Bytes of the returned results.', 4),
+        )
+        for name, description, position in counters:
+            lines.append(f'# HELP {prefix}_{name} {description}')
+            lines.append(f'# TYPE {prefix}_{name} counter')
+            for function, values in metrics:
+                lines.append(f'{prefix}_{name}{{function="{function}"}} {values[position]}')
+
+        name = f'{prefix}_duration_seconds'
+        lines.append(f'# HELP {name} Wall time of each call.')
+        lines.append(f'# TYPE {name} histogram')
+        for function, (calls, _, seconds, _, _, buckets) in metrics:
+            cumulative = 0
+            for bound, count in zip(self.buckets, buckets):
+                cumulative += count
+                lines.append(f'{name}_bucket{{function="{function}",le="{bound:g}"}} {cumulative}')
+            lines.append(f'{name}_bucket{{function="{function}",le="+Inf"}} {calls}')
+            lines.append(f'{name}_sum{{function="{function}"}} {seconds!r}')
+            lines.append(f'{name}_count{{function="{function}"}} {calls}')
+        return '\n'.join(lines) + '\n'
+
+    def write_prometheus(self, path: str, prefix: str = 'indicator'):
+        """
+        Atomically write the Prometheus text to ``path``, e.g. for the node exporter textfile collector.
+        """
+        temporary = f'{path}.{os.getpid()}.tmp'
+        with open(temporary, 'w') as file:
+            file.write(self.to_prometheus(prefix))
+        os.replace(temporary, path)
+
+
+class SpanRecorder:
+    """
+    Trace callback keeping the most recent spans.
+
+    :param size: The number of most recent spans kept.
+    """
+
+    def __init__(self, size: int = 100_000):
+        self.spans = deque(maxlen=size)
+
+    def __call__(self, span: Span):
+        self.spans.append(span)
+
+    def chrome_trace(self) -> list:
+        """
+        Return the spans as Chrome trace events, to save as JSON and open in Perfetto or chrome://tracing.
+        """
+        return [{
+            'name': span.function,
+            'ph': 'X',
+            'ts': span.start * 1e6,
+            'dur': span.duration * 1e6,
+            'pid': os.getpid(),
+            'tid': span.thread,
+            'args': {'rows': span.rows, 'output_bytes': span.output_bytes, 'error': span.error},
+        } for span in self.spans]
+
+
+def instrument(func, registry: MetricsRegistry, on_span=None, name: str = None):
+    """
+    Return a version of ``func`` that records every call in ``registry``.
+
+    :param func: The function to wrap.
+    :param registry: The :class:`MetricsRegistry` receiving the metrics.
+    :param on_span: Optional callable receiving a :class:`Span` per call.
+    :param name: The name the calls are recorded under; defaults to ``func.__name__``.
+    """
+    name = name or func.__name__
+
+    @functools.wraps(func)
+    def instrumented(*args, **kwargs):
+        start = time.perf_counter()
+        result, error = None, None
+        try:
+            result = func(*args, **kwargs)
+            return result
+        except BaseException as exception:
+            error = type(exception).__name__
+            raise
+        finally:
+            seconds = time.perf_counter() - start
+            rows = _rows(args)
+            output_bytes = 0 if result is None else _hooks.nbytes(result)
+            registry.record(name, seconds, rows, output_bytes, error is not None)
+            if on_span is not None:
+                on_span(Span(name, time.time() - seconds, seconds, rows, output_bytes, threading.get_ident(), error))
+
+    instrumented.registry = registry
+    return instrumented
+
+
+def enable_instrumentation(registry: MetricsRegistry = None, on_span=None) -> MetricsRegistry:
+    """
+    Instrument every function exported by the ``indicators`` package.
+
+    The functions are replaced in the package namespace, so the instrumentation applies to calls made
+    through ``indicators.calculate_*`` (and to names imported after this call). It wraps whatever is
+    already installed, such as :func:`indicators.cache.enable_cache`, and either can be disabled first.
+
+    :param registry: The registry to record into; a new one when None.
+    :param on_span: Optional callable receiving a :class:`Span` per call, e.g. a :class:`SpanRecorder`.
+    :return: The registry in use.
+    """
+    registry = registry if registry is not None else MetricsRegistry()
+    _hooks.install('instrumentation', lambda func, name: instrument(func, registry, on_span, name))
+    return registry
+
+
+def disable_instrumentation():
+    """
+    Remove the instrumentation installed by :func:`enable_instrumentation`, keeping any other wrapper.
+    """
+    _hooks.uninstall('instrumentation')
@@ -1,10 +1,41 @@
 # indicators/keltner.py
 
+import numpy as np
 import pandas as pd
 
+from .atr import atr_array
+from .panel import combine, field_major, field_arrays, fields, like
+from .rolling import ewm_mean
+
+
+def keltner_channels_array(high, low, close, ema_period: int = 20, atr_period: int = 14, multiplier: int = 2,
+                           dtype=np.float64):
+    """
+    Calculate Keltner Channels on plain NumPy arrays.
+
+    :param high: An array-like of high prices, one row per bar (2-D for one column per symbol).
+    :param low: An array-like of low prices with the same shape as ``high``.
+    :param close: An array-like of closing prices with the same shape as ``high``.
+    :param ema_period: The number of periods for the EMA.
+    :param atr_period: The number of periods for the ATR.
+    :param multiplier: The ATR multiplier for the upper and lower channels.
+    :param dtype: The floating-point dtype of the computation and results, e.g. np.float32 to halve memory.
+    :return: A tuple ``(middle_channel, upper_channel, lower_channel)`` of NumPy arrays.
+    """
+    # EMA of the close price
+    ema = ewm_mean(np.asarray(close, dtype=dtype), ema_period, dtype)
+
+    # ATR calculation
+    atr = atr_array(high, low, close, atr_period, dtype=dtype)
+
+    upper_channel = ema + (atr * multiplier)
+    lower_channel = ema - (atr * multiplier)
+
+    return ema, upper_channel, lower_channel
+
 
 def calculate_keltner_channels(data: pd.DataFrame, ema_period: int = 20, atr_period: int = 14,
-                               multiplier: int = 2) -> pd.DataFrame:
+                               multiplier: int = 2, dtype=np.float64) -> pd.DataFrame:
     """
     Calculate Keltner Channels for the given data.
 
@@ -12,14 +43,19 @@ def calculate_keltner_channels(data: pd.DataFrame, ema_period: int = 20, atr_per
     :param ema_period: The number of periods for the EMA.
     :param atr_period: The number of periods for the ATR.
     :param multiplier: The ATR multiplier for the upper and lower channels.
+    :param dtype: The floating-point dtype of the computation and results, e.g. np.float32 to halve memory.
     :return: A Pandas DataFrame with columns for middle, upper, and lower channels.
     """
-    if not {'High', 'Low', 'Close'}.issubset(data.columns):
+    data = field_major(data)
+    if not {'High', 'Low', 'Close'}.issubset(fields(data)):
         raise ValueError("DataFrame must contain 'High', 'Low', and 'Close' columns.")
 
-    # EMA of the close price
-    ema = data['Close'].ewm(span=ema_period, adjust=False).mean()
+    template, arrays = field_arrays(data, ('High', 'Low', 'Close'), dtype)
+    middle_channel, upper_channel, lower_channel = keltner_channels_array(*arrays, ema_period, atr_period,
+                                                                          multiplier, dtype)
 
-    # ATR calculation
-    high_low = data['High'] - data['Low']
-    high_close = (data['High'] - data['Close'].shift()).abs()
+    return combine({
+        'Middle Channel': like(middle_channel, template),
+        'Upper Channel': like(upper_channel, template),
+        'Lower Channel': like(lower_channel, template)
+    })
@@ -0,0 +1,231 @@
+# indicators/live.py
+
+"""
+Asyncio pipeline updating indicators from live bar feeds.
+
+A :class:`LivePipeline` consumes one async iterator of bars per symbol, updates the streaming
+indicators of :mod:`indicators.streaming` for every bar and publishes the new values to its
+subscribers. Each subscriber reads from its own bounded ``asyncio.Queue``; when a queue is full the
+pipeline either waits for the subscriber (``overflow='block'``, which slows down the feeds) or drops
+the oldest pending update (``overflow='drop_oldest'``). The time from receiving a bar to handing its
+update to every subscriber is recorded for latency percentiles::
+
+    pipeline = LivePipeline(['rsi', ('macd', {'fast_period': 5})], history={'BNBUSDT': history})
+    pipeline.add_feed('BNBUSDT', exchange_candles('BNBUSDT'))
+    subscription = pipeline.subscribe()
+
+    async def consume():
+        async for update in subscription:
+            print(update.symbol, update.values['RSI_14'])
+
+    await asyncio.gather(pipeline.run(), consume())
+    print(pipeline.latency.percentiles())
+
+:func:`fake_feed` replays a DataFrame as an async feed, for tests and benchmarks.
+"""
+
+import asyncio
+import time
+from collections import deque, namedtuple
+
+import numpy as np
+import pandas as pd
+
+from .graph import parse_spec
+from .streaming import STREAMS
+
+# One published update: the symbol, the bar that triggered it, the indicator values keyed like the
+# columns of compute_indicators ('RSI_14', 'MACD_12_26_9 Signal Line', ...) and the time.perf_counter()
+# reading when the bar was received, so subscribers can measure their end-to-end latency.
+Update = namedtuple('Update', ['symbol', 'bar', 'values', 'received'])
+
+_END = object()
+
+
+class LatencyRecorder:
+    """
+    Keeps the most recent latency samples and reports their percentiles.
+
+    :param size: The number of most recent samples kept.
+    """
+
+    def __init__(self, size: int = 100_000):
+        self.samples = deque(maxlen=size)
+        self.count = 0
+
+    def record(self, seconds: float):
+        self.samples.append(seconds)
+        self.count += 1
+
+    def percentiles(self, percents=(50, 90, 99, 99.9)) -> dict:
+        """
+        Return the latency percentiles in seconds, e.g. ``{50: 1.2e-05, 99: 4.1e-05, ...}``.
+        """
+        if not self.samples:
+            return {percent: float('nan') for percent in percents}
+        values = np.percentile(np.fromiter(self.samples, dtype=np.float64), percents)
+        return dict(zip(percents, values.tolist()))
+
+
+class Subscription:
+    """
+    Async iterator over the updates published to one subscriber.
+
+    Created by :meth:`LivePipeline.subscribe`; iteration ends when the pipeline has finished. The end
+    marker never waits for the subscriber: if the queue is full when the pipeline stops, the oldest
+    pending update is dropped to make room for it.
+    """
+
+    def __init__(self, symbols, maxsize: int, overflow: str):
+        self.symbols = None if symbols is None else set(symbols)
+        self.queue = asyncio.Queue(maxsize)
+        self.overflow = overflow
+        self.dropped = 0
+        self.closed = False
+
+    def wants(self, symbol: str) -> bool:
+        return not self.closed and (self.symbols is None or symbol in self.symbols)
+
+    def _replace_oldest(self, item):
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(item)
+
+    async def put(self, item):
+        if self.overflow == 'drop_oldest':
+            self._replace_oldest(item)
+        else:
+            await self.queue.put(item)
+
+    def end(self):
+        """
+        Queue the end marker without waiting, even when the subscriber has stopped reading.
+        """
+        if not self.closed:
+            self._replace_oldest(_END)
+
+    def close(self):
+        """
+        Stop receiving updates; the pipeline no longer waits for this subscriber.
+        """
+        self.closed = True
+        while not self.queue.empty():
+            self.queue.get_nowait()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> Update:
+        item = await self.queue.get()
+        if item is _END:
+            raise StopAsyncIteration
+        return item
+
+
+class LivePipeline:
+    """
+    Updates streaming indicators per bar for many symbols and fans the values out to subscribers.
+
+    :param specs: Indicator specs, as accepted by :func:`indicators.graph.compute_indicators`.
+    :param history: Optional mapping of symbol to a historical DataFrame used to seed the indicators.
+    :param latency_samples: The number of most recent latency samples kept.
+    """
+
+    def __init__(self, specs, history: dict = None, latency_samples: int = 100_000):
+        self.specs = [parse_spec(spec) for spec in specs]
+        self.history = history or {}
+        self.feeds = {}
+        self.streams = {}
+        self.subscriptions = []
+        self.latency = LatencyRecorder(latency_samples)
+
+    def _streams(self, symbol: str) -> list:
+        if symbol not in self.streams:
+            streams = []
+            for name, params, label in self.specs:
+                stream = STREAMS[name](**params)
+                if symbol in self.history:
+                    stream.seed(self.history[symbol])
+                streams.append((label, stream))
+            self.streams[symbol] = streams
+        return self.streams[symbol]
+
+    def add_feed(self, symbol: str, bars):
+        """
+        Register the async iterator of bars (mappings with the OHLCV columns) for a symbol.
+        """
+        if symbol in self.feeds:
+            raise ValueError(f"A feed is already registered for '{symbol}'.")
+        self._streams(symbol)
+        self.feeds[symbol] = bars
+
+    def subscribe(self, symbols=None, maxsize: int = 1_000, overflow: str = 'block') -> Subscription:
+        """
+        Create a subscriber queue.
+
+        :param symbols: The symbols to receive updates for, or None for all symbols.
+        :param maxsize: The number of pending updates the queue holds.
+        :param overflow: 'block' to make the pipeline wait when the queue is full (backpressure),
+            or 'drop_oldest' to discard the oldest pending update instead.
+        :return: A :class:`Subscription` to iterate with ``async for``.
+        """
+        if overflow not in ('block', 'drop_oldest'):
+            raise ValueError("'overflow' must be 'block' or 'drop_oldest'.")
+        if maxsize < 1:
+            raise ValueError("'maxsize' must be a positive integer.")
+        subscription = Subscription(symbols, maxsize, overflow)
+        self.subscriptions.append(subscription)
+        return subscription
+
+    def update(self, symbol: str, bar) -> dict:
+        """
+        Feed one bar of ``symbol`` to its indicators and return the new values.
+        """
+        values = {}
+        for label, stream in self._streams(symbol):
+            value = stream.update(bar)
+            if isinstance(value, dict):
+                for output, output_value in value.items():
+                    values[f'{label} {output}'] = output_value
+            else:
+                values[label] = value
+        return values
+
+    async def _publish(self, update: Update):
+        for subscription in self.subscriptions:
+            if subscription.wants(update.symbol):
+                await subscription.put(update)
+
+    async def _consume(self, symbol: str, bars):
+        async for bar in bars:
+            start = time.perf_counter()
+            await self._publish(Update(symbol, bar, self.update(symbol, bar), start))
+            self.latency.record(time.perf_counter() - start)
+
+    async def run(self):
+        """
+        Consume every registered feed until all are exhausted, then end the subscriptions.
+
+        The subscriptions are also ended when a feed fails or the run is cancelled; ending them never
+        waits, so a subscriber that has stopped reading cannot hold up the shutdown.
+        """
+        try:
+            await asyncio.gather(*[self._consume(symbol, bars) for symbol, bars in self.feeds.items()])
+        finally:
+            for subscription in self.subscriptions:
+                subscription.end()
+
+
+async def fake_feed(data: pd.DataFrame, interval: float = 0.0):
+    """
+    Replay the rows of a DataFrame as an async feed of bars.
+
+    :param data: A Pandas DataFrame of OHLCV bars, one row per bar.
+    :param interval: Seconds to wait between bars; 0 still yields to the event loop after every bar.
+    :return: An async iterator of dicts keyed by column name.
+    """
+    columns = list(data.columns)
+    for row in data.itertuples(index=False, name=None):
+        yield dict(zip(columns, row))
+        await asyncio.sleep(interval)
@@ -1,9 +1,36 @@
 # indicators/macd.py
 
+import numpy as np
 import pandas as pd
 
+from .panel import combine, field_major, fields, like
+from .rolling import ewm_mean
 
-def calculate_macd(data: pd.DataFrame, fast_period: int = 12, slow_period: int = 26, signal_period: int = 9):
+
+def macd_array(close, fast_period: int = 12, slow_period: int = 26, signal_period: int = 9, dtype=np.float64):
+    """
+    Calculate the MACD (Moving Average Convergence Divergence) on plain NumPy arrays.
+
+    :param close: An array-like of closing prices, one row per bar (2-D for one column per symbol).
+    :param fast_period: The number of periods for the fast EMA.
+    :param slow_period: The number of periods for the slow EMA.
+    :param signal_period: The number of periods for the signal line EMA.
+    :param dtype: The floating-point dtype of the computation and results, e.g. np.float32 to halve memory.
+    :return: A tuple ``(macd_line, signal_line, macd_histogram)`` of NumPy arrays.
+    """
+    close = np.asarray(close, dtype=dtype)
+    fast_ema = ewm_mean(close, fast_period, dtype)
+    slow_ema = ewm_mean(close, slow_period, dtype)
+
+    macd_line = fast_ema - slow_ema
+    signal_line = ewm_mean(macd_line, signal_period, dtype)
+    macd_histogram = macd_line - signal_line
+
+    return macd_line, signal_line, macd_histogram
+
+
+def calculate_macd(data: pd.DataFrame, fast_period: int = 12, slow_period: int = 26, signal_period: int = 9,
+                   dtype=np.float64):
     """
     Calculate the MACD (Moving Average Convergence Divergence) for the given data.
 
@@ -11,20 +38,19 @@ def calculate_macd(data: pd.DataFrame, fast_period: int = 12, slow_period: int =
     :param fast_period: The number of periods for the fast EMA.
     :param slow_period: The number of periods for the slow EMA.
     :param signal_period: The number of periods for the signal line EMA.
+    :param dtype: The floating-point dtype of the computation and results, e.g. np.float32 to halve memory.
     :return: A Pandas DataFrame with columns for MACD line, signal line, and MACD histogram.
     """
-    if 'Close' not in data.columns:
+    data = field_major(data)
+    if 'Close' not in fields(data):
         raise ValueError("DataFrame must contain a 'Close' column.")
 
-    fast_ema = data['Close'].ewm(span=fast_period, adjust=False).mean()
-    slow_ema = data['Close'].ewm(span=slow_period, adjust=False).mean()
-
-    macd_line = fast_ema - slow_ema
-    signal_line = macd_line.ewm(span=signal_period, adjust=False).mean()
-    macd_histogram = macd_line - signal_line
+    close = data['Close']
+    macd_line, signal_line, macd_histogram = macd_array(close.to_numpy(dtype=dtype), fast_period, slow_period,
+                                                        signal_period, dtype)
 
-    return pd.DataFrame({
-        'MACD Line': macd_line,
-        'Signal Line': signal_line,
-        'MACD Histogram': macd_histogram
+    return combine({
+        'MACD Line': like(macd_line, close),
+        'Signal Line': like(signal_line, close),
+        'MACD Histogram': like(macd_histogram, close)
     })
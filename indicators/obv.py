@@ -1,27 +1,50 @@
 # indicators/obv.py
 
+import numpy as np
 import pandas as pd
 
+from .panel import field_major, field_arrays, fields, like
 
-def calculate_obv(data: pd.DataFrame) -> pd.Series:
+
+def obv_array(close, volume, dtype=np.float64) -> np.ndarray:
+    """
+    Calculate the On-Balance Volume (OBV) on plain NumPy arrays.
+
+    Each bar adds its volume when the close rises, subtracts it when the close falls and
+    carries the previous total otherwise. The first bar starts at zero.
+
+    :param close: An array-like of closing prices, one row per bar (2-D for one column per symbol).
+    :param volume: An array-like of volumes with the same shape as ``close``.
+    :param dtype: The floating-point dtype of the computation and result, e.g. np.float32 to halve memory.
+    :return: A NumPy array with the OBV values.
+    """
+    close = np.asarray(close, dtype=dtype)
+    volume = np.asarray(volume, dtype=dtype)
+    if close.shape != volume.shape:
+        raise ValueError("'close' and 'volume' must have the same shape.")
+
+    obv = np.zeros(close.shape, dtype=dtype)
+    if len(close) < 2:
+        return obv
+
+    delta = np.diff(close, axis=0)
+    obv[1:] = np.where(delta > 0, volume[1:], np.where(delta < 0, -volume[1:], 0))
+
+    # np.cumsum accumulates sequentially, matching the bar-by-bar running total exactly.
+    return np.cumsum(obv, axis=0, out=obv)
+
+
+def calculate_obv(data: pd.DataFrame, dtype=np.float64) -> pd.Series:
     """
     Calculate the On-Balance Volume (OBV) for the given data.
 
     :param data: A Pandas DataFrame containing 'Close' and 'Volume' columns.
+    :param dtype: The floating-point dtype of the computation and result, e.g. np.float32 to halve memory.
     :return: A Pandas Series representing the OBV values.
     """
-    if not {'Close', 'Volume'}.issubset(data.columns):
+    data = field_major(data)
+    if not {'Close', 'Volume'}.issubset(fields(data)):
         raise ValueError("DataFrame must contain 'Close' and 'Volume' columns.")
 
-    obv = pd.Series([None] * len(data))
-    obv.iloc[0] = 0  # Start OBV at zero
-
-    for i in range(1, len(data)):
-        if data['Close'].iloc[i] > data['Close'].iloc[i - 1]:
-            obv.iloc[i] = obv.iloc[i - 1] + data['Volume'].iloc[i]
-        elif data['Close'].iloc[i] < data['Close'].iloc[i - 1]:
-            obv.iloc[i] = obv.iloc[i - 1] - data['Volume'].iloc[i]
-        else:
-            obv.iloc[i] = obv.iloc[i - 1]
-
-    return obv
+    template, arrays = field_arrays(data, ('Close', 'Volume'), dtype)
+    return like(obv_array(*arrays, dtype=dtype), template)
@@ -0,0 +1,121 @@
+# indicators/panel.py
+
+"""
+Support for multi-symbol panels.
+
+A panel is a DataFrame whose columns are a two-level MultiIndex of (field, symbol) or
+(symbol, field), e.g. ('Close', 'BTCUSDT'). Every calculate_* function accepts a panel and computes
+all symbols in one vectorized pass along the rows: ``data['Close']`` then selects a wide DataFrame
+(one column per symbol) instead of a Series, and pandas applies the same rolling, EWM and
+arithmetic operations column-wise.
+
+Single-output indicators return a DataFrame with one column per symbol; multi-output indicators
+return a DataFrame with (output, symbol) columns, e.g. ('Upper Band', 'BTCUSDT').
+
+The helpers below also pass Arrow and NumPy structured array inputs through to
+:mod:`indicators.columnar`, so the calculate_* functions accept those without converting them.
+"""
+
+import numpy as np
+import pandas as pd
+
+from .columnar import Column, Columns, combine_columns, is_columnar
+
+FIELDS = ('Date', 'Open', 'High', 'Low', 'Close', 'Volume')
+
+
+def is_panel(data: pd.DataFrame) -> bool:
+    """
+    Return True if ``data`` has two-level (field, symbol) or (symbol, field) columns.
+    """
+    return isinstance(data.columns, pd.MultiIndex) and data.columns.nlevels == 2
+
+
+def field_major(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Return ``data`` with the field on the first column level, so ``data['Close']`` selects all symbols.
+
+    Plain single-symbol DataFrames are returned unchanged; Arrow and structured array inputs are
+    wrapped in a :class:`indicators.columnar.Columns` view.
+    """
+    if is_columnar(data):
+        return Columns(data)
+    if not is_panel(data):
+        return data
+
+    if data.columns.get_level_values(0).isin(FIELDS).any():
+        return data
+    if data.columns.get_level_values(1).isin(FIELDS).any():
+        return data.swaplevel(0, 1, axis=1).sort_index(axis=1)
+    return data
+
+
+def fields(data: pd.DataFrame) -> pd.Index:
+    """
+    Return the field names available in ``data``: its columns, or the first level of a field-major panel.
+    """
+    if isinstance(data, Columns):
+        return pd.Index(data.columns)
+    if is_panel(data):
+        return data.columns.get_level_values(0).unique()
+    return data.columns
+
+
+def like(values: np.ndarray, template):
+    """
+    Wrap an array computed from ``template`` (a Series or a wide DataFrame) into the same pandas type.
+
+    The array is not copied, so it must not be shared with anything else.
+    """
+    if isinstance(template, Column):
+        return template.wrap(values)
+    if isinstance(template, pd.DataFrame):
+        return pd.DataFrame(values, index=template.index, columns=template.columns, copy=False)
+    return pd.Series(values, index=template.index, copy=False)
+
+
+def field_arrays(data: pd.DataFrame, names, dtype=np.float64):
+    """
+    Return the given fields of a DataFrame (or field-major panel) as NumPy arrays.
+
+    Panel fields are aligned on the symbols of the first field, so the arrays can be combined
+    element-wise.
+
+    :param data: A single-symbol DataFrame or a field-major panel.
+    :param names: The field names, e.g. ('High', 'Low', 'Close').
+    :param dtype: The dtype of the returned arrays.
+    :return: A tuple ``(template, arrays)``: the first field (a Series or a wide DataFrame) to wrap
+        results with :func:`like`, and one array per field.
+    """
+    template = data[names[0]]
+    arrays = []
+    for name in names:
+        values = data[name]
+        if isinstance(values, pd.DataFrame) and not values.columns.equals(template.columns):
+            values = values.reindex(columns=template.columns)
+        arrays.append(values.to_numpy(dtype=dtype))
+    return template, arrays
+
+
+def combine(outputs: dict) -> pd.DataFrame:
+    """
+    Combine named indicator outputs into one DataFrame.
+
+    Series become plain columns; wide DataFrames from panels become (output, symbol) columns.
+    Results wrapped from Arrow or structured array inputs are combined in the same format.
+    """
+    if not isinstance(next(iter(outputs.values())), (pd.Series, pd.DataFrame)):
+        return combine_columns(outputs)
+    return pd.concat(outputs, axis=1)
+
+
+def to_panel(frames: dict) -> pd.DataFrame:
+    """
+    Build a field-major panel from per-symbol DataFrames.
+
+    :param frames: A mapping of symbol to a DataFrame with the usual OHLCV columns.
+    :return: A DataFrame with (field, symbol) columns, aligned on the union of the indexes.
+    """
+    panel = pd.concat(frames, axis=1)
+    # copy() consolidates the per-symbol blocks into one 2-D block, so each operation is a single pass.
+    return panel.swaplevel(0, 1, axis=1).sort_index(axis=1).copy()
@@ -1,46 +1,134 @@
 # indicators/parabolic_sar.py
 
+import numpy as np
 import pandas as pd
 
+from ._numba import NUMBA_AVAILABLE, jit
+from .panel import field_major, field_arrays, fields, like
 
-def calculate_parabolic_sar(data: pd.DataFrame, step: float = 0.02, max_step: float = 0.2) -> pd.Series:
+
+@jit
+def _parabolic_sar_kernel(high, low, step, max_step, state, sar, trend, af):
     """
-    Calculate the Parabolic SAR for the given data.
+    Fill ``sar``, ``trend`` and ``af`` in place. Works on NumPy arrays (compiled) or lists (pure Python).
 
-    :param data: A Pandas DataFrame containing 'High' and 'Low' columns.
-    :param step: The step increment for the SAR.
-    :param max_step: The maximum value for the step increment.
-    :return: A Pandas Series representing the Parabolic SAR values.
+    ``state`` holds ``[sar, trend, af, extreme point]`` after the previous bar (a trend of 0 starts a
+    new series at the first bar) and is updated to the state after the last bar.
     """
-    if not {'High', 'Low'}.issubset(data.columns):
-        raise ValueError("DataFrame must contain 'High' and 'Low' columns.")
+    start = 0
+    if state[1] == 0:
+        if len(high) == 0:
+            return
+        state[0] = high[0]
+        state[1] = 1
+        state[2] = step
+        state[3] = low[0]
+        sar[0] = high[0]
+        trend[0] = 1
+        af[0] = step
+        start = 1
 
-    sar = pd.Series([None] * len(data))
-    long_position = True
-    acceleration = step
-    extreme_point = data['Low'][0]
-    sar[0] = data['High'][0]
+    previous = state[0]
+    long_position = state[1] > 0
+    acceleration = state[2]
+    extreme_point = state[3]
 
-    for i in range(1, len(data)):
+    for i in range(start, len(high)):
+        sar_i = previous + acceleration * (extreme_point - previous)
         if long_position:
-            sar[i] = sar[i - 1] + acceleration * (extreme_point - sar[i - 1])
-            if data['Low'][i] < sar[i]:
+            if low[i] < sar_i:
                 long_position = False
-                sar[i] = extreme_point
-                extreme_point = data['Low'][i]
+                sar_i = extreme_point
+                extreme_point = low[i]
                 acceleration = step
         else:
-            sar[i] = sar[i - 1] + acceleration * (extreme_point - sar[i - 1])
-            if data['High'][i] > sar[i]:
+            if high[i] > sar_i:
                 long_position = True
-                sar[i] = extreme_point
-                extreme_point = data['High'][i]
+                sar_i = extreme_point
+                extreme_point = high[i]
                 acceleration = step
-        if long_position and data['High'][i] > extreme_point:
-            extreme_point = data['High'][i]
+        if long_position and high[i] > extreme_point:
+            extreme_point = high[i]
             acceleration = min(acceleration + step, max_step)
-        elif not long_position and data['Low'][i] < extreme_point:
-            extreme_point = data['Low'][i]
+        elif not long_position and low[i] < extreme_point:
+            extreme_point = low[i]
             acceleration = min(acceleration + step, max_step)
 
-    return sar
+        sar[i] = sar_i
+        trend[i] = 1 if long_position else -1
+        af[i] = acceleration
+        previous = sar_i
+
+    state[0] = previous
+    state[1] = 1 if long_position else -1
+    state[2] = acceleration
+    state[3] = extreme_point
+
+
+def parabolic_sar_array(high, low, step: float = 0.02, max_step: float = 0.2, state=None, dtype=np.float64):
+    """
+    Calculate the Parabolic SAR on plain NumPy arrays.
+
+    :param high: A 1-D array-like of high prices.
+    :param low: A 1-D array-like of low prices, the same length as ``high``.
+    :param step: The step increment for the SAR.
+    :param max_step: The maximum value for the step increment.
+    :param state: Optional float64 array ``[sar, trend, af, extreme point]`` to continue a previous run
+        from; it is updated in place to the state after the last bar. ``np.zeros(4)`` starts a new series.
+    :param dtype: The floating-point dtype of the SAR and acceleration factor arrays.
+    :return: A tuple ``(sar, trend, af)`` of NumPy arrays: the SAR values, the int8 trend direction
+        (1 for long, -1 for short) and the acceleration factor after each bar.
+    """
+    high = np.ascontiguousarray(high, dtype=dtype)
+    low = np.ascontiguousarray(low, dtype=dtype)
+    if high.ndim != 1 or high.shape != low.shape:
+        raise ValueError("'high' and 'low' must be 1-D arrays of the same length.")
+    if state is None:
+        state = np.zeros(4, dtype=np.float64)
+    elif not isinstance(state, np.ndarray) or state.shape != (4,) or state.dtype != np.float64:
+        raise ValueError("'state' must be a float64 NumPy array of length 4.")
+
+    n = len(high)
+    if n == 0:
+        return np.empty(0, dtype=dtype), np.empty(0, dtype=np.int8), np.empty(0, dtype=dtype)
+
+    if NUMBA_AVAILABLE:
+        sar = np.empty(n, dtype=dtype)
+        trend = np.empty(n, dtype=np.int8)
+        af = np.empty(n, dtype=dtype)
+        _parabolic_sar_kernel(high, low, float(step), float(max_step), state, sar, trend, af)
+        return sar, trend, af
+
+    # Without Numba, iterate over Python floats: indexing lists is far cheaper than NumPy scalars.
+    sar, trend, af = [0.0] * n, [0] * n, [0.0] * n
+    values = state.tolist()
+    _parabolic_sar_kernel(high.tolist(), low.tolist(), float(step), float(max_step), values, sar, trend, af)
+    state[:] = values
+    return np.array(sar, dtype=dtype), np.array(trend, dtype=np.int8), np.array(af, dtype=dtype)
+
+
+def calculate_parabolic_sar(data: pd.DataFrame, step: float = 0.02, max_step: float = 0.2,
+                            dtype=np.float64) -> pd.Series:
+    """
+    Calculate the Parabolic SAR for the given data.
+
+    :param data: A Pandas DataFrame containing 'High' and 'Low' columns.
+    :param step: The step increment for the SAR.
+    :param max_step: The maximum value for the step increment.
+    :param dtype: The floating-point dtype of the result, e.g. np.float32 to halve memory.
+    :return: A Pandas Series representing the Parabolic SAR values.
+    """
+    data = field_major(data)
+    if not {'High', 'Low'}.issubset(fields(data)):
+        raise ValueError("DataFrame must contain 'High' and 'Low' columns.")
+
+    template, (high, low) = field_arrays(data, ('High', 'Low'), dtype)
+    if high.ndim == 2:
+        # The SAR recursion is sequential in time, so a panel runs the kernel once per symbol.
+        sar = np.empty(high.shape, dtype=dtype)
+        for j in range(high.shape[1]):
+            sar[:, j] = parabolic_sar_array(high[:, j], low[:, j], step, max_step, dtype=dtype)[0]
+    else:
+        sar, _, _ = parabolic_sar_array(high, low, step, max_step, dtype=dtype)
+
+    return like(sar, template)
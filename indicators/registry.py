@@ -0,0 +1,110 @@
+# indicators/registry.py
+
+"""
+Static description of every indicator, available without importing its implementation.
+
+:data:`REGISTRY` maps each indicator name (as used by :func:`indicators.graph.compute_indicators`)
+to an :class:`IndicatorInfo` with the module and function names, the required input columns, the
+parameters and their defaults (accepted by both the calculate_* function and compute_indicators),
+the output columns and the warm-up length. This module imports neither NumPy nor pandas, so tools
+can list and validate indicators at almost no cost and only import the one they actually run::
+
+    from indicators.registry import REGISTRY, load, warmup
+
+    info = REGISTRY['rsi']            # info.columns == ('Close',), info.params == {'period': 14, ...}
+    rows = warmup('rsi', period=21)   # 20 leading NaN rows
+    rsi = load('rsi')(data, period=21)
+"""
+
+import importlib
+from collections import namedtuple
+
+# name: the indicator name; module: the module under ``indicators``; function and kernel: the names of
+# the calculate_* function and of its array kernel; columns: the required input columns; params: the
+# parameters (other than ``data`` and ``dtype``) and their defaults; outputs: the output columns of a
+# multi-output indicator with default parameters, or () for one that returns a Series; warmup: a
+# function of the parameters returning the number of leading rows that are NaN in some output.
+IndicatorInfo = namedtuple('IndicatorInfo', ['name', 'module', 'function', 'kernel', 'columns', 'params',
+                                             'outputs', 'warmup'])
+
+
+def _rsi_warmup(period, smoothing):
+    # Wilder and EMA smoothing seed from the first ``period`` changes, the rolling mean from the first
+    # ``period`` closes.
+    return period - 1 if smoothing == 'sma' else period
+
+
+REGISTRY = {info.name: info for info in [
+    IndicatorInfo('adl', 'adl', 'calculate_adl', 'adl_array', ('High', 'Low', 'Close', 'Volume'), {}, (),
+                  lambda: 0),
+    IndicatorInfo('atr', 'atr', 'calculate_atr', 'atr_array', ('High', 'Low', 'Close'),
+                  {'period': 14, 'smoothing': 'sma'}, (), lambda period, smoothing: period - 1),
+    IndicatorInfo('bollinger_bands', 'bollinger_bands', 'calculate_bollinger_bands', 'bollinger_bands_array',
+                  ('Close',), {'period': 20, 'num_std_dev': 2, 'ddof': 1, 'extended': False},
+                  ('Middle Band', 'Upper Band', 'Lower Band'),
+                  lambda period, num_std_dev, ddof, extended: period - 1),
+    IndicatorInfo('cci', 'cci', 'calculate_cci', 'cci_array', ('High', 'Low', 'Close'), {'period': 20}, (),
+                  lambda period: period - 1),
+    IndicatorInfo('cmf', 'cmf', 'calculate_cmf', 'cmf_array', ('High', 'Low', 'Close', 'Volume'), {'period': 20},
+                  (), lambda period: period - 1),
+    IndicatorInfo('cmo', 'cmo', 'calculate_cmo', 'cmo_array', ('Close',), {'period': 14}, (),
+                  lambda period: period - 1),
+    IndicatorInfo('donchian_channels', 'donchian', 'calculate_donchian_channels', 'donchian_channels_array',
+                  ('High', 'Low'), {'period': 20}, ('Upper Channel', 'Middle Channel', 'Lower Channel'),
+                  lambda period: period - 1),
+    IndicatorInfo('ema', 'ema', 'calculate_ema', 'ema_array', ('Close',), {'period': 20}, (), lambda period: 0),
+    IndicatorInfo('keltner_channels', 'keltner', 'calculate_keltner_channels', 'keltner_channels_array',
+                  ('High', 'Low', 'Close'), {'ema_period': 20, 'atr_period': 14, 'multiplier': 2},
+                  ('Middle Channel', 'Upper Channel', 'Lower Channel'),
+                  lambda ema_period, atr_period, multiplier: atr_period - 1),
+    IndicatorInfo('macd', 'macd', 'calculate_macd', 'macd_array', ('Close',),
+                  {'fast_period': 12, 'slow_period': 26, 'signal_period': 9},
+                  ('MACD Line', 'Signal Line', 'MACD Histogram'), lambda fast_period, slow_period, signal_period: 0),
+    IndicatorInfo('obv', 'obv', 'calculate_obv', 'obv_array', ('Close', 'Volume'), {}, (), lambda: 0),
+    IndicatorInfo('parabolic_sar', 'parabolic_sar', 'calculate_parabolic_sar', 'parabolic_sar_array',
+                  ('High', 'Low'), {'step': 0.02, 'max_step': 0.2}, (), lambda step, max_step: 0),
+    IndicatorInfo('rsi', 'rsi', 'calculate_rsi', 'rsi_array', ('Close',), {'period': 14, 'smoothing': 'sma'}, (),
+                  _rsi_warmup),
+    IndicatorInfo('sma', 'sma', 'calculate_sma', 'sma_array', ('Close',), {'period': 20}, (),
+                  lambda period: period - 1),
+    # %D averages the last three %K values.
+    IndicatorInfo('stochastic_oscillator', 'stochastic', 'calculate_stochastic_oscillator',
+                  'stochastic_oscillator_array', ('High', 'Low', 'Close'), {'period': 14}, ('%K', '%D'),
+                  lambda period: period + 1),
+    IndicatorInfo('williams_r', 'williams_r', 'calculate_williams_r', 'williams_r_array', ('High', 'Low', 'Close'),
+                  {'period': 14}, (), lambda period: period - 1),
+]}
+
+
+def _info(name: str) -> IndicatorInfo:
+    if name not in REGISTRY:
+        raise ValueError(f"Unknown indicator '{name}'. Available indicators: {', '.join(sorted(REGISTRY))}.")
+    return REGISTRY[name]
+
+
+def warmup(name: str, **params) -> int:
+    """
+    Return the number of leading rows an indicator leaves NaN (in at least one output).
+
+    :param name: The indicator name, e.g. 'rsi'.
+    :param params: The indicator parameters; omitted parameters take their defaults.
+    :return: The warm-up length in rows.
+    """
+    info = _info(name)
+    unknown = sorted(set(params).difference(info.params))
+    if unknown:
+        raise ValueError(f"Unknown parameter '{unknown[0]}' for indicator '{name}'.")
+    return info.warmup(**{**info.params, **params})
+
+
+def load(name: str, kernel: bool = False):
+    """
+    Import an indicator's module and return its calculate_* function (or its array kernel).
+
+    :param name: The indicator name, e.g. 'rsi'.
+    :param kernel: Return the array kernel (e.g. ``rsi_array``) instead of the calculate_* function.
+    :return: The function.
+    """
+    info = _info(name)
+    module = importlib.import_module(f'{__package__}.{info.module}')
+    return getattr(module, info.kernel if kernel else info.function)
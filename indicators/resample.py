@@ -0,0 +1,290 @@
+# indicators/resample.py
+
+"""
+OHLCV aggregation to higher timeframes and multi-timeframe indicators.
+
+Bars are grouped into fixed-length bins counted from the Unix epoch on the local wall clock (so '1h'
+bins start on the hour and '1D' bins at midnight in the data's time zone) and aggregated as first
+Open, highest High, lowest Low, last Close and summed Volume. Missing values are skipped and bins
+without bars are omitted. Bar timestamps are the bar open times, taken from a DatetimeIndex or a
+'Date' column.
+
+:func:`resample_many` derives several timeframes in one cascade (5m from 1m, 1h from 5m, ...),
+:func:`compute_multi_timeframe` computes an indicator set on every timeframe and aligns the results
+back to the base bars without look-ahead, and :class:`BarAggregator` rolls live bars up into the
+partially formed higher-timeframe bar.
+"""
+
+import numpy as np
+import pandas as pd
+
+from .graph import compute_indicators
+from .panel import is_panel
+
+_AGGREGATIONS = {'Open': 'first', 'High': 'max', 'Low': 'min', 'Close': 'last', 'Volume': 'sum'}
+
+
+def _step(rule) -> int:
+    """
+    Return the length of a fixed-length rule such as '5min', '1h' or '1D' in nanoseconds.
+    """
+    try:
+        step = pd.Timedelta(rule)
+    except ValueError:
+        raise ValueError(f"Unsupported rule '{rule}': only fixed-length rules such as '5min', '1h' or '1D' are supported.")
+    if step <= pd.Timedelta(0):
+        raise ValueError(f"Rule '{rule}' must have a positive length.")
+    return step.value
+
+
+def _timestamps(data: pd.DataFrame) -> pd.DatetimeIndex:
+    if is_panel(data):
+        raise ValueError("Resampling takes a single-symbol DataFrame.")
+    if isinstance(data.index, pd.DatetimeIndex):
+        timestamps = data.index
+    elif 'Date' in data.columns:
+        timestamps = pd.DatetimeIndex(pd.to_datetime(data['Date']))
+    else:
+        raise ValueError("DataFrame must have a DatetimeIndex or a 'Date' column.")
+    if not timestamps.is_monotonic_increasing:
+        raise ValueError("Bar timestamps must be sorted in increasing order.")
+    return timestamps
+
+
+def _wall_times(timestamps: pd.DatetimeIndex, lengths) -> tuple:
+    """
+    Return the bar times as integer ticks on the local wall clock, the lengths (in nanoseconds)
+    converted to ticks, and the tick unit.
+
+    Ticks keep the resolution of the index, so no conversion is needed, unless a length is not a
+    whole number of ticks.
+    """
+    if timestamps.tz is not None:
+        timestamps = timestamps.tz_localize(None)
+    tick = pd.Timedelta(1, unit=timestamps.unit).value
+    if any(length % tick for length in lengths):
+        timestamps, tick = timestamps.as_unit('ns'), 1
+    return timestamps.asi8, [length // tick for length in lengths], timestamps.unit
+
+
+def _starts(bins: np.ndarray) -> np.ndarray:
+    """
+    Return the positions where a sorted array of bin numbers changes value, starting with 0.
+    """
+    if not len(bins):
+        return np.empty(0, dtype=np.intp)
+    return np.flatnonzero(np.concatenate([[True], bins[1:] != bins[:-1]]))
+
+
+def _reduce(values: np.ndarray, how: str, starts: np.ndarray) -> np.ndarray:
+    """
+    Aggregate the consecutive segments of ``values`` beginning at ``starts``, skipping missing values.
+    """
+    if not len(starts):
+        return values[:0]
+    valid = ~np.isnan(values) if values.dtype.kind == 'f' else None
+    if how == 'max':
+        return np.fmax.reduceat(values, starts)
+    if how == 'min':
+        return np.fmin.reduceat(values, starts)
+    if how == 'sum':
+        return np.add.reduceat(values if valid is None else np.where(valid, values, 0), starts)
+
+    if how == 'first':
+        if valid is None:
+            return values[starts]
+        chosen = np.minimum.reduceat(np.where(valid, np.arange(len(values)), len(values)), starts)
+        found = chosen < len(values)
+    else:
+        if valid is None:
+            return values[np.append(starts[1:], len(values)) - 1]
+        chosen = np.maximum.reduceat(np.where(valid, np.arange(len(values)), -1), starts)
+        found = chosen >= 0
+    return np.where(found, values[np.clip(chosen, 0, len(values) - 1)], np.nan)
+
+
+def _aggregate(bars, times: np.ndarray, step: int) -> tuple:
+    """
+    Aggregate sorted bars (a DataFrame or a dict of arrays) with wall-clock ``times`` into bins of ``step`` ticks.
+
+    :return: A tuple ``(columns, opens)``: the aggregated columns and the bin open times in ticks.
+    """
+    bins = times // step
+    starts = _starts(bins)
+    columns = {
+        column: _reduce(np.asarray(bars[column]), how, starts)
+        for column, how in _AGGREGATIONS.items() if column in bars
+    }
+    return columns, bins[starts] * step
+
+
+def resample_ohlcv(data: pd.DataFrame, rule) -> pd.DataFrame:
+    """
+    Aggregate OHLCV bars to a higher timeframe.
+
+    :param data: A Pandas DataFrame with OHLCV columns and a DatetimeIndex or a 'Date' column.
+    :param rule: A fixed-length rule such as '5min', '1h' or '1D'.
+    :return: A Pandas DataFrame indexed by the bin open time, with the OHLCV columns found in ``data``.
+    """
+    return resample_many(data, [rule])[rule]
+
+
+def resample_many(data: pd.DataFrame, rules) -> dict:
+    """
+    Aggregate OHLCV bars to several timeframes in one cascade.
+
+    Each timeframe is aggregated from the coarsest timeframe already computed that divides it (for
+    example 1h from 5m rather than from the base bars), so the longer timeframes cost little.
+
+    :param data: A Pandas DataFrame with OHLCV columns and a DatetimeIndex or a 'Date' column.
+    :param rules: An iterable of fixed-length rules such as ['5min', '1h', '1D'].
+    :return: A dict mapping each rule to its aggregated DataFrame.
+    """
+    timestamps = _timestamps(data)
+    rules = list(dict.fromkeys(rules))
+    times, steps, unit = _wall_times(timestamps, [_step(rule) for rule in rules])
+
+    aggregated = []
+    results = {}
+    for step, rule in sorted(zip(steps, rules)):
+        source, source_times = data, times
+        for finer_step, finer_columns, finer_times in reversed(aggregated):
+            if step % finer_step == 0:
+                source, source_times = finer_columns, finer_times
+                break
+        columns, opens = _aggregate(source, source_times, step)
+        aggregated.append((step, columns, opens))
+
+        # Label each bin with its open time, in the time zone and unit of the input.
+        index = pd.DatetimeIndex(opens.view(f'datetime64[{unit}]'), name='Date')
+        if timestamps.tz is not None:
+            index = index.tz_localize(timestamps.tz, ambiguous=True, nonexistent='shift_forward')
+        results[rule] = pd.DataFrame(columns, index=index.as_unit(timestamps.unit), copy=False)
+
+    return {rule: results[rule] for rule in rules}
+
+
+def _available_rows(times: np.ndarray, step: int, base_interval: int) -> np.ndarray:
+    """
+    Return, per bin, the first base row at which the bin is complete.
+
+    A bin is complete at its last base bar if that bar closes at or after the end of the bin, and
+    otherwise (a gap or a truncated bin) only at the first bar of the next bin.
+    """
+    bins = times // step
+    last = np.append(_starts(bins)[1:], len(bins)) - 1
+    closes_bin = times[last] + base_interval >= (bins[last] + 1) * step
+    return np.where(closes_bin, last, last + 1)
+
+
+def compute_multi_timeframe(data: pd.DataFrame, specs, rules, base_interval=None) -> pd.DataFrame:
+    """
+    Compute an indicator set on the base bars and on several higher timeframes, aligned to the base bars.
+
+    Higher-timeframe values only become visible on the base bar at which their bin is complete, and
+    stay until the next bin completes, so no row sees data from its future.
+
+    :param data: A Pandas DataFrame with OHLCV columns and a DatetimeIndex or a 'Date' column.
+    :param specs: Indicator specs, as accepted by :func:`indicators.graph.compute_indicators`.
+    :param rules: An iterable of fixed-length rules such as ['5min', '1h', '1D'].
+    :param base_interval: The length of one base bar (a rule or a Timedelta); inferred from the smallest
+        gap between timestamps when None.
+    :return: A Pandas DataFrame indexed like ``data`` with (timeframe, column) columns, where the
+        timeframe is 'base' or one of the rules, e.g. ('1h', 'RSI_14').
+    """
+    rules = list(dict.fromkeys(rules))
+    lengths = [_step(rule) for rule in rules]
+    if base_interval is not None:
+        lengths.append(_step(base_interval))
+    times, steps, _ = _wall_times(_timestamps(data), lengths)
+
+    if base_interval is not None:
+        base_interval = steps.pop()
+    else:
+        gaps = np.diff(times)
+        gaps = gaps[gaps > 0]
+        if not len(gaps):
+            raise ValueError("Cannot infer 'base_interval' from fewer than two distinct timestamps.")
+        base_interval = int(gaps.min())
+
+    base = compute_indicators(data, specs)
+    columns = {('base', column): base[column].to_numpy() for column in base.columns}
+    for step, (rule, bars) in zip(steps, resample_many(data, rules).items()):
+        values = compute_indicators(bars, specs)
+        available = _available_rows(times, step, base_interval)
+
+        # Row i shows the latest bin completed at or before row i; -1 (no bin yet) picks the NaN pad.
+        source = np.full(len(times) + 1, -1)
+        source[available] = np.arange(len(available))
+        source = np.maximum.accumulate(source)[:len(times)]
+        for column in values.columns:
+            columns[(rule, column)] = np.append(values[column].to_numpy(dtype=np.float64), np.nan)[source]
+
+    result = pd.DataFrame(columns, index=data.index, copy=False)
+    result.columns.names = ['timeframe', None]
+    return result
+
+
+class BarAggregator:
+    """
+    Rolls live bars up into a higher timeframe, keeping the partially formed bar.
+
+    :param rule: A fixed-length rule such as '5min', '1h' or '1D'.
+    """
+
+    def __init__(self, rule):
+        self.rule = rule
+        self.step = _step(rule)
+        self.partial = None
+        self._bin = None
+
+    def update(self, timestamp, bar):
+        """
+        Add one base bar.
+
+        :param timestamp: The bar open time (anything accepted by ``pd.Timestamp``).
+        :param bar: A mapping with the OHLCV values of the bar.
+        :return: A tuple ``(completed, partial)``: the bar completed by this update (a dict with a
+            'Date' key) or None, and a copy of the current partially formed bar.
+        """
+        time = pd.Timestamp(timestamp)
+        current = time.tz_localize(None).as_unit('ns').value // self.step
+        completed = None
+        if self._bin is not None and current != self._bin:
+            if current < self._bin:
+                raise ValueError("Bar timestamps must be sorted in increasing order.")
+            completed, self.partial = self.partial, None
+        self._bin = current
+
+        if self.partial is None:
+            opens = pd.Timestamp(current * self.step)
+            if time.tz is not None:
+                opens = opens.tz_localize(time.tz, ambiguous=True, nonexistent='shift_forward')
+            self.partial = {'Date': opens}
+        partial = self.partial
+        for column, how in _AGGREGATIONS.items():
+            if column not in bar:
+                continue
+            value = float(bar[column])
+            if value != value:
+                continue
+            previous = partial.get(column)
+            if previous is None:
+                partial[column] = value
+            elif how == 'max':
+                partial[column] = max(previous, value)
+            elif how == 'min':
+                partial[column] = min(previous, value)
+            elif how == 'last':
+                partial[column] = value
+            elif how == 'sum':
+                partial[column] = previous + value
+
+        return completed, dict(partial)
+
+    def flush(self):
+        """
+        Return the partially formed bar as completed (e.g. at the end of a session) and reset.
+        """
+        completed, self.partial, self._bin = self.partial, None, None
+        return completed
@@ -0,0 +1,625 @@
+# indicators/rolling.py
+
+"""
+Rolling-window primitives shared by the indicator modules.
+
+All functions take NumPy array-likes, roll along the first axis (one row per bar, one column per
+symbol for 2-D input) and return arrays of the same shape, with NaN for the warm-up rows where the
+window is not yet full. Results are float64 unless another ``dtype`` is requested.
+
+Rolling sums, means, standard deviations, extremes and EWMs run pandas' compiled window routines on
+a zero-copy view of the array, so they match the pandas methods exactly. :func:`rolling_mean_std`
+computes the mean and standard deviation together and stays accurate where pandas' running sums
+drift (long series at high price levels); :class:`RollingMeanStd` is its streaming counterpart.
+"""
+
+import math
+from collections import deque
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from ._numba import NUMBA_AVAILABLE, jit
+
+# Number of windows materialized at once; bounds the temporary memory to chunk * period values.
+_CHUNK_SIZE = 65_536
+
+
+def _pandas(values: np.ndarray):
+    """
+    View an array as a Series (1-D) or a DataFrame (2-D) without copying it.
+    """
+    if values.ndim == 1:
+        return pd.Series(values, copy=False)
+    return pd.DataFrame(values, copy=False)
+
+
+def _missing_infinities(values: np.ndarray) -> np.ndarray:
+    """
+    Return ``values`` with infinities replaced by NaN (copying only when there are any), so windows
+    holding one are NaN like in pandas rolling windows, instead of poisoning the centered sums.
+    """
+    infinite = np.isinf(values)
+    if infinite.any():
+        return np.where(infinite, np.nan, values)
+    return values
+
+
+def shift(values, dtype=np.float64) -> np.ndarray:
+    """
+    Return the previous row of every row, with NaN for the first row (like ``Series.shift()``).
+    """
+    values = np.asarray(values, dtype=dtype)
+    result = np.empty_like(values)
+    if len(values):
+        result[0] = np.nan
+        result[1:] = values[:-1]
+    return result
+
+
+def rolling_mean(values, period: int, dtype=np.float64) -> np.ndarray:
+    """
+    Calculate the rolling mean over ``period`` rows (like ``rolling(period).mean()``).
+    """
+    return _pandas(np.asarray(values)).rolling(window=period).mean().to_numpy(dtype=dtype)
+
+
+def rolling_sum(values, period: int, dtype=np.float64) -> np.ndarray:
+    """
+    Calculate the rolling sum over ``period`` rows (like ``rolling(period).sum()``).
+    """
+    return _pandas(np.asarray(values)).rolling(window=period).sum().to_numpy(dtype=dtype)
+
+
+def rolling_std(values, period: int, dtype=np.float64) -> np.ndarray:
+    """
+    Calculate the rolling sample standard deviation over ``period`` rows (like ``rolling(period).std()``).
+    """
+    return _pandas(np.asarray(values)).rolling(window=period).std().to_numpy(dtype=dtype)
+
+
+def rolling_max(values, period: int, dtype=np.float64) -> np.ndarray:
+    """
+    Calculate the rolling maximum over ``period`` rows (like ``rolling(period).max()``).
+    """
+    return _pandas(np.asarray(values)).rolling(window=period).max().to_numpy(dtype=dtype)
+
+
+def rolling_min(values, period: int, dtype=np.float64) -> np.ndarray:
+    """
+    Calculate the rolling minimum over ``period`` rows (like ``rolling(period).min()``).
+    """
+    return _pandas(np.asarray(values)).rolling(window=period).min().to_numpy(dtype=dtype)
+
+
+def ewm_mean(values, span: int, dtype=np.float64) -> np.ndarray:
+    """
+    Calculate the exponentially weighted mean for ``span`` (like ``ewm(span=span, adjust=False).mean()``).
+    """
+    return _pandas(np.asarray(values)).ewm(span=span, adjust=False).mean().to_numpy(dtype=dtype)
+
+
+def rolling_mad(values, period: int, dtype=np.float64) -> np.ndarray:
+    """
+    Calculate the rolling mean absolute deviation around the window mean.
+
+    Windows are strided views over the input, processed in chunks so memory stays bounded
+    regardless of the series length. A window containing NaN yields NaN.
+
+    :param values: An array-like of values, rolled along the first axis.
+    :param period: The number of values in each window.
+    :param dtype: The floating-point dtype of the computation and result.
+    :return: A NumPy array with the mean absolute deviation of each window.
+    """
+    if period < 1:
+        raise ValueError("'period' must be a positive integer.")
+
+    values = np.asarray(values, dtype=dtype)
+    result = np.full(values.shape, np.nan, dtype=dtype)
+    if len(values) < period:
+        return result
+
+    windows = sliding_window_view(values, period, axis=0)
+    for start in range(0, len(windows), _CHUNK_SIZE):
+        block = windows[start:start + _CHUNK_SIZE]
+        mean = block.mean(axis=-1, keepdims=True)
+        offset = start + period - 1
+        result[offset:offset + len(block)] = np.abs(block - mean).mean(axis=-1)
+
+    return result
+
+
+# Smoothing methods of smoothed_mean -> the weight of each new value in the recursive average (None
+# for a simple moving average).
+SMOOTHING = {
+    'sma': None,
+    'wilder': lambda period: 1.0 / period,
+    'ema': lambda period: 2.0 / (period + 1.0),
+}
+
+
+def _ewm_weight(alpha: float) -> float:
+    """
+    Return the weight pandas' EWM actually applies for ``alpha``: it converts alpha to a center of mass
+    and back, which can change the last bit.
+    """
+    return 1.0 / (1.0 + (1.0 - alpha) / alpha)
+
+
+@jit
+def _recursive_kernel(values, period, alpha, out):
+    """
+    Fill ``out`` with the recursive mean of each column of ``values``, skipping NaN values.
+
+    The first output is the mean of the first ``period`` values; each later value moves the mean by
+    ``alpha`` of its distance, with the arithmetic of ``ewm(alpha=alpha, adjust=False, ignore_na=True)``.
+    """
+    rows, columns = values.shape
+    decay = 1.0 - alpha
+    for j in range(columns):
+        count = 0
+        mean = 0.0
+        for i in range(rows):
+            value = values[i, j]
+            if value != value:
+                out[i, j] = np.nan
+                continue
+            if count < period:
+                count += 1
+                mean += value
+                if count < period:
+                    out[i, j] = np.nan
+                    continue
+                mean /= period
+            elif mean != value:
+                mean = (decay * mean + alpha * value) / (decay + alpha)
+            out[i, j] = mean
+
+
+def _recursive_pandas(values: np.ndarray, period: int, alpha: float) -> np.ndarray:
+    """
+    Compute the recursive mean of :func:`_recursive_kernel` with pandas' exponentially weighted mean.
+
+    The EWM starts from the row completing each column's first ``period`` values, replaced by their mean.
+    The kernel gives identical results when it is passed the weight of :func:`_ewm_weight`.
+    """
+    present = ~np.isnan(values)
+    # The seeds lie near the top unless a column starts with a long gap, so only the leading rows are
+    # scanned, growing the scan until every column is seeded.
+    head = min(len(values), 2 * period)
+    while True:
+        counts = np.cumsum(present[:head], axis=0)
+        if head == len(values) or (counts[-1] >= period).all():
+            break
+        head = min(len(values), 4 * head)
+
+    start = values.copy()
+    leading = start[:head]
+    seeds = present[:head] & (counts == period)
+    means = np.cumsum(np.where(present[:head], leading, 0.0), axis=0)[seeds] / period
+    leading[counts < period] = np.nan
+    leading[seeds] = means
+    result = _pandas(start).ewm(alpha=alpha, adjust=False, ignore_na=True).mean().to_numpy()
+    return np.where(present, result, np.nan)
+
+
+def smoothed_mean(values, period: int, smoothing: str = 'sma', dtype=np.float64) -> np.ndarray:
+    """
+    Calculate a moving average of ``values`` with the given smoothing method.
+
+    'sma' is the simple rolling mean. 'wilder' (Wilder's smoothing, also known as RMA or SMMA) and
+    'ema' are recursive filters with weights 1 / period and 2 / (period + 1): seeded with the mean
+    of the first ``period`` values, then ``mean += alpha * (value - mean)`` at every row, in one pass
+    without intermediate arrays when Numba is available. The recursive filters skip NaN values (the
+    output is NaN on those rows and the average resumes on the next value).
+
+    :param values: An array-like of values, along the first axis (2-D for one column per symbol).
+    :param period: The number of values in the window (for 'sma') or of the seed average.
+    :param smoothing: One of 'sma', 'wilder' or 'ema'.
+    :param dtype: The floating-point dtype of the result.
+    :return: A NumPy array with the moving average.
+    """
+    if smoothing not in SMOOTHING:
+        raise ValueError(f"'smoothing' must be one of {', '.join(repr(name) for name in SMOOTHING)}.")
+    if SMOOTHING[smoothing] is None:
+        return rolling_mean(values, period, dtype)
+    if period < 1:
+        raise ValueError("'period' must be a positive integer.")
+
+    alpha = SMOOTHING[smoothing](period)
+    values = np.asarray(values, dtype=np.float64)
+    shape = values.shape
+    values_2d = values[:, None] if values.ndim == 1 else values
+    if NUMBA_AVAILABLE:
+        result = np.empty(values_2d.shape)
+        _recursive_kernel(values_2d, period, _ewm_weight(alpha), result)
+    else:
+        result = _recursive_pandas(values_2d, period, alpha)
+    return result.reshape(shape).astype(dtype, copy=False)
+
+
+# Rows per block of WindowSums. Prefix sums restart at every block, so rounding error grows with the
+# block length rather than with the length of the series.
+_BLOCK_SIZE = 4_096
+
+
+class WindowSums:
+    """
+    Block-anchored prefix sums answering rolling-window sums for every period up to ``max_period``.
+
+    The series is split into blocks; each block stores the prefix sums of its values, centered on
+    the block mean, starting ``max_period - 1`` rows before the block. Any window of at
+    most ``max_period`` rows is then the difference of two prefix values within one block, so each
+    additional period costs O(n) arithmetic. Windows that are not full yet or contain NaN or an
+    infinity yield NaN.
+
+    :param values: A 1-D array-like of values.
+    :param max_period: The longest window that will be queried.
+    """
+
+    def __init__(self, values, max_period: int, block_size: int = _BLOCK_SIZE):
+        if max_period < 1:
+            raise ValueError("'max_period' must be a positive integer.")
+
+        values = _missing_infinities(np.asarray(values, dtype=np.float64))
+        if values.ndim != 1:
+            raise ValueError("'values' must be a 1-D array.")
+
+        self.length = len(values)
+        self.max_period = max_period
+        self.block_size = block_size
+        blocks = max(1, -(-self.length // block_size))
+
+        # Leading NaN padding makes the first max_period - 1 rows incomplete windows automatically.
+        padded = np.full(max_period - 1 + blocks * block_size, np.nan)
+        padded[max_period - 1:max_period - 1 + self.length] = values
+        segments = sliding_window_view(padded, block_size + max_period - 1)[::block_size]
+
+        missing = np.isnan(segments)
+        with np.errstate(invalid='ignore'):
+            counts = (~missing[:, max_period - 1:]).sum(axis=1)
+            totals = np.where(missing[:, max_period - 1:], 0.0, segments[:, max_period - 1:]).sum(axis=1)
+            self.center = np.where(counts > 0, totals / np.maximum(counts, 1), 0.0)
+
+        self._prefix = self._cumulative(np.where(missing, 0.0, segments - self.center[:, None]))
+        # Only the leading padding is missing when the values have no NaN; skip the per-window counts then.
+        self._prefix_missing = self._cumulative(missing.astype(np.int32)) if np.isnan(values).any() else None
+
+        # Windows made of one repeated value (e.g. runs of zero gains) are returned exactly rather than
+        # as a difference of prefix sums, and sums of non-negative values are never negative.
+        rows = np.arange(self.length)
+        changed = np.ones(self.length, dtype=bool)
+        changed[1:] = values[1:] != values[:-1]
+        self._run_length = rows - np.maximum.accumulate(np.where(changed, rows, 0)) + 1
+        self._values = values
+        self._non_negative = not (values < 0).any()
+
+    @staticmethod
+    def _cumulative(values: np.ndarray) -> np.ndarray:
+        prefix = np.zeros((values.shape[0], values.shape[1] + 1), dtype=values.dtype)
+        np.cumsum(values, axis=1, out=prefix[:, 1:])
+        return prefix
+
+    def _window(self, prefix: np.ndarray, period: int) -> np.ndarray:
+        if not 1 <= period <= self.max_period:
+            raise ValueError(f"'period' must be between 1 and {self.max_period}.")
+        end = self.max_period
+        return prefix[:, end:end + self.block_size] - prefix[:, end - period:end - period + self.block_size]
+
+    def _finish(self, result: np.ndarray, period: int, scale: float) -> np.ndarray:
+        if self._prefix_missing is not None:
+            result[self._window(self._prefix_missing, period) > 0] = np.nan
+        result = result.reshape(-1)[:self.length]
+        result[:period - 1] = np.nan
+        constant = self._run_length >= period
+        result[constant] = self._values[constant] * scale
+        if self._non_negative:
+            np.maximum(result, 0.0, out=result)
+        return result
+
+    def sum(self, period: int) -> np.ndarray:
+        """
+        Return the rolling sum over ``period`` rows.
+        """
+        result = self._window(self._prefix, period) + period * self.center[:, None]
+        return self._finish(result, period, period)
+
+    def mean(self, period: int) -> np.ndarray:
+        """
+        Return the rolling mean over ``period`` rows.
+        """
+        result = self._window(self._prefix, period) / period + self.center[:, None]
+        return self._finish(result, period, 1.0)
+
+
+# Periods per block of rolling_mean_std, with a minimum number of rows. Each block is centered on a
+# local price, so the deviations entering the running sums stay on the scale of the nearby moves.
+_CENTER_PERIODS = 8
+_CENTER_ROWS = 32
+# Target number of values per chunk of the NumPy mean/std fallback, sized so a chunk and its
+# temporaries stay in the CPU cache.
+_CHUNK_VALUES = 1 << 14
+# Windows whose centered sum of squares exceeds this multiple of their squared deviations from the
+# window mean (very narrow windows far from the center) lose too many digits to the subtraction and
+# are recomputed exactly from their values.
+_CANCELLATION_LIMIT = 1e4
+
+
+@jit
+def _mean_std_kernel(values, period, ddof, block, limit, mean, std):
+    """
+    Fill the rolling mean and standard deviation of each column of ``values`` with running sums of
+    deviations from a center.
+
+    At the start of every ``block`` rows the center moves to the current value and the sums are
+    recomputed from the window, so rounding errors cannot accumulate over long series. Windows
+    losing digits to cancellation (see ``_CANCELLATION_LIMIT``) are recomputed with two passes.
+    """
+    rows, columns = values.shape
+    for j in range(columns):
+        center = 0.0
+        first = second = 0.0
+        missing = run = 0
+        for i in range(rows):
+            value = values[i, j]
+            recenter = i % block == 0 and value == value
+            if i >= period:
+                old = values[i - period, j]
+                if old != old:
+                    missing -= 1
+                elif not recenter:
+                    deviation = old - center
+                    first -= deviation
+                    second -= deviation * deviation
+            if recenter:
+                center = value
+                first = second = 0.0
+                for k in range(max(i - period + 1, 0), i):
+                    if values[k, j] == values[k, j]:
+                        deviation = values[k, j] - center
+                        first += deviation
+                        second += deviation * deviation
+
+            if value != value:
+                missing += 1
+                run = 0
+            else:
+                deviation = value - center
+                first += deviation
+                second += deviation * deviation
+                run = run + 1 if i > 0 and values[i - 1, j] == value else 1
+
+            if i < period - 1 or missing:
+                mean[i, j] = np.nan
+                std[i, j] = np.nan
+            elif run >= period:
+                mean[i, j] = value
+                std[i, j] = 0.0 if period > ddof else np.nan
+            elif period <= ddof:
+                mean[i, j] = center + first / period
+                std[i, j] = np.nan
+            else:
+                shift = first / period
+                squares = second - first * shift
+                if second > limit * squares:
+                    total = 0.0
+                    for k in range(i - period + 1, i + 1):
+                        total += values[k, j]
+                    window_mean = total / period
+                    squares = 0.0
+                    for k in range(i - period + 1, i + 1):
+                        squares += (values[k, j] - window_mean) ** 2
+                mean[i, j] = center + shift
+                std[i, j] = np.sqrt(max(squares, 0.0) / (period - ddof))
+
+
+def _mean_std_blocks(values, period: int, ddof: int, block: int, mean: np.ndarray, std: np.ndarray):
+    """
+    Fill the rolling mean and standard deviation of each column of ``values`` with block-centered prefix sums.
+
+    Each block of ``block`` rows is centered on its own mean, and its window sums are differences of
+    prefix sums over the block and the ``period - 1`` rows before it.
+    """
+    rows, columns = values.shape
+    length = block + period - 1
+    blocks = -(-rows // block)
+    padded = np.empty((period - 1 + blocks * block, columns))
+    padded[:period - 1] = np.nan
+    padded[period - 1:period - 1 + rows] = values
+    # The rows past the end only complete the last block; repeating the last row keeps its center finite.
+    padded[period - 1 + rows:] = values[-1]
+    segments = sliding_window_view(padded, length, axis=0)[::block]
+    has_gaps = np.isnan(values).any()
+    lost = []
+
+    per_chunk = max(1, _CHUNK_VALUES // (length * columns))
+    for first_block in range(0, blocks, per_chunk):
+        # (blocks, rows, columns) copy of the segments of this chunk.
+        chunk = segments[first_block:first_block + per_chunk].transpose(0, 2, 1).copy()
+        own = chunk[:, period - 1:]
+        if has_gaps:
+            center = np.nanmean(own, axis=1, keepdims=True)
+            center[np.isnan(center)] = 0.0
+        else:
+            center = own.mean(axis=1, keepdims=True)
+        chunk -= center
+        if has_gaps:
+            gaps = np.isnan(chunk)
+            chunk[gaps] = 0.0
+        elif first_block == 0:
+            chunk[0, :period - 1] = 0.0
+
+        sums = np.zeros((len(chunk), length + 1, columns))
+        np.cumsum(chunk, axis=1, out=sums[:, 1:])
+        window_sum = sums[:, period:] - sums[:, :-period]
+        np.multiply(chunk, chunk, out=chunk)
+        np.cumsum(chunk, axis=1, out=sums[:, 1:])
+        window_squares = sums[:, period:] - sums[:, :-period]
+
+        window_sum /= period
+        # The rounding error of a window is relative to the prefix sum it is taken from.
+        centered = sums[:, period:] * (1.0 / _CANCELLATION_LIMIT)
+        window_squares -= window_sum * window_sum * period
+        window_sum += center
+        begin = first_block * block
+        if period > ddof:
+            inexact = centered > window_squares
+            if inexact.any():
+                block_at, row_at, column_at = np.nonzero(inexact)
+                lost.append((begin + block_at * block + row_at, column_at))
+            np.maximum(window_squares, 0.0, out=window_squares)
+            window_squares /= period - ddof
+            np.sqrt(window_squares, out=window_squares)
+        else:
+            window_squares.fill(np.nan)
+        if has_gaps:
+            np.cumsum(gaps, axis=1, out=sums[:, 1:])
+            incomplete = sums[:, period:] - sums[:, :-period] > 0
+            window_sum[incomplete] = np.nan
+            window_squares[incomplete] = np.nan
+
+        end = min(begin + len(chunk) * block, rows)
+        mean[begin:end] = window_sum.reshape(-1, columns)[:end - begin]
+        std[begin:end] = window_squares.reshape(-1, columns)[:end - begin]
+
+    # Windows losing digits to cancellation are recomputed with two passes over their values.
+    if lost:
+        row_at = np.concatenate([row_at for row_at, _ in lost])
+        column_at = np.concatenate([column_at for _, column_at in lost])
+        keep = (row_at >= period - 1) & (row_at < rows)
+        row_at, column_at = row_at[keep], column_at[keep]
+        for start in range(0, len(row_at), _CHUNK_SIZE):
+            at, columns_at = row_at[start:start + _CHUNK_SIZE], column_at[start:start + _CHUNK_SIZE]
+            windows = values[at[:, None] + np.arange(1 - period, 1), columns_at[:, None]]
+            deviations = windows - windows.mean(axis=1, keepdims=True)
+            std[at, columns_at] = np.sqrt((deviations * deviations).sum(axis=1) / (period - ddof))
+
+    # Windows holding one repeated value have that value as their mean and exactly zero deviation.
+    same = values[1:] == values[:-1]
+    if period > 1 and same.any():
+        repeats = np.zeros((rows, columns), dtype=np.int64)
+        np.cumsum(~same, axis=0, out=repeats[1:])
+        # Rows where the value at the start of the window starts the same run as the current value.
+        constant = np.zeros((rows, columns), dtype=bool)
+        constant[period - 1:] = repeats[period - 1:] == repeats[:rows - period + 1]
+        constant &= ~np.isnan(values)
+        mean[constant] = values[constant]
+        std[constant] = 0.0 if period > ddof else np.nan
+    mean[:period - 1] = np.nan
+    std[:period - 1] = np.nan
+
+
+def rolling_mean_std(values, period: int, ddof: int = 1, dtype=np.float64) -> tuple:
+    """
+    Calculate the rolling mean and standard deviation over ``period`` rows in one pass.
+
+    The running sums are taken over deviations from a center that follows the series block by
+    block, rather than over raw values and squares, so the result stays accurate for long series
+    with a high price level (e.g. crypto pairs in the tens of thousands), where the textbook sums
+    lose most of their digits. Windows containing NaN yield NaN, and windows of one repeated value
+    have a deviation of exactly 0.
+
+    :param values: An array-like of values, rolled along the first axis (2-D for one column per symbol).
+    :param period: The number of values in each window.
+    :param ddof: Delta degrees of freedom; 1 for the sample standard deviation (as pandas), 0 for the population.
+    :param dtype: The floating-point dtype of the results; the computation always runs in float64.
+    :return: A tuple ``(mean, std)`` of NumPy arrays.
+    """
+    if period < 1:
+        raise ValueError("'period' must be a positive integer.")
+    if ddof < 0:
+        raise ValueError("'ddof' must not be negative.")
+
+    values = _missing_infinities(np.asarray(values, dtype=np.float64))
+    shape = values.shape
+    values_2d = values[:, None] if values.ndim == 1 else values
+    mean = np.empty(values_2d.shape)
+    std = np.empty(values_2d.shape)
+    block = max(_CENTER_PERIODS * period, _CENTER_ROWS)
+    if len(values_2d) < period:
+        mean.fill(np.nan)
+        std.fill(np.nan)
+    elif NUMBA_AVAILABLE:
+        _mean_std_kernel(values_2d, period, ddof, block, _CANCELLATION_LIMIT, mean, std)
+    else:
+        _mean_std_blocks(values_2d, period, ddof, block, mean, std)
+
+    return mean.reshape(shape).astype(dtype, copy=False), std.reshape(shape).astype(dtype, copy=False)
+
+
+class RollingMeanStd:
+    """
+    Streaming rolling mean and standard deviation, with the same centered running sums as
+    :func:`rolling_mean_std`.
+
+    :param period: The number of values in each window.
+    :param ddof: Delta degrees of freedom; 1 for the sample standard deviation, 0 for the population.
+    """
+
+    def __init__(self, period: int, ddof: int = 1):
+        if period < 1:
+            raise ValueError("'period' must be a positive integer.")
+        if ddof < 0:
+            raise ValueError("'ddof' must not be negative.")
+        self.period = period
+        self.ddof = ddof
+        self.block = max(_CENTER_PERIODS * period, _CENTER_ROWS)
+        self.count = 0
+        self.window = deque()
+        self.missing = 0
+        self.run = 0
+        self.center = 0.0
+        self.first = 0.0
+        self.second = 0.0
+
+    def push(self, value: float) -> tuple:
+        """
+        Add one value and return ``(mean, std)`` over the last ``period`` values (NaN while the
+        window is not full or contains NaN or an infinity).
+        """
+        if not math.isfinite(value):
+            value = float('nan')
+        recenter = self.count % self.block == 0 and value == value
+        previous = self.window[-1] if self.window else None
+        if len(self.window) == self.period:
+            old = self.window.popleft()
+            if old != old:
+                self.missing -= 1
+            elif not recenter:
+                deviation = old - self.center
+                self.first -= deviation
+                self.second -= deviation * deviation
+        if recenter:
+            self.center = value
+            self.first = self.second = 0.0
+            for old in self.window:
+                if old == old:
+                    deviation = old - self.center
+                    self.first += deviation
+                    self.second += deviation * deviation
+
+        self.count += 1
+        self.window.append(value)
+        if value != value:
+            self.missing += 1
+            self.run = 0
+        else:
+            deviation = value - self.center
+            self.first += deviation
+            self.second += deviation * deviation
+            self.run = self.run + 1 if previous == value else 1
+
+        period, ddof = self.period, self.ddof
+        if self.count < period or self.missing:
+            return float('nan'), float('nan')
+        if self.run >= period:
+            return value, 0.0 if period > ddof else float('nan')
+        shift = self.first / period
+        if period <= ddof:
+            return self.center + shift, float('nan')
+        squares = self.second - self.first * shift
+        if self.second > _CANCELLATION_LIMIT * squares:
+            window_mean = sum(self.window) / period
+            squares = sum((old - window_mean) ** 2 for old in self.window)
+        return self.center + shift, math.sqrt(max(squares, 0.0) / (period - ddof))
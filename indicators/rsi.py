@@ -1,42 +1,59 @@
+import numpy as np
 import pandas as pd
 
+from .panel import field_major, fields, like
+from .rolling import rolling_mean, shift, smoothed_mean
 
-def calculate_rsi(data: pd.DataFrame, period: int = 14) -> pd.Series:
+
+def rsi_array(close, period: int = 14, smoothing: str = 'sma', dtype=np.float64) -> np.ndarray:
     """
-    Calculate the Relative Strength Index (RSI) for the given data.
+    Calculate the Relative Strength Index (RSI) on plain NumPy arrays.
 
-    :param data: A Pandas DataFrame containing at least the 'Close' price column.
+    :param close: An array-like of closing prices, one row per bar (2-D for one column per symbol).
     :param period: The number of periods for calculating the RSI.
-    :return: A Pandas Series representing the RSI values.
+    :param smoothing: How gains and losses are averaged: 'sma' (rolling mean), 'wilder' (Wilder's
+        original RSI, seeded with the mean of the first ``period`` changes) or 'ema'.
+    :param dtype: The floating-point dtype of the computation and result, e.g. np.float32 to halve memory.
+    :return: A NumPy array with the RSI values.
     """
-    if 'Close' not in data.columns:
-        raise ValueError("DataFrame must contain a 'Close' column.")
-
-    delta = data['Close'].diff(1)
-    gain = delta.where(delta > 0, 0)
-    loss = -delta.where(delta < 0, 0)
-
-    avg_gain = gain.rolling(window=period).mean()
-    avg_loss = loss.rolling(window=period).mean()
-
-    rs = avg_gain / avg_loss
-    rsi = 100 - (100 / (1 + rs))
-
-    return rsi
-
-
-import pandas as pd
-
-
-def calculate_sma(data: pd.DataFrame, period: int = 20) -> pd.Series:
+    close = np.asarray(close, dtype=dtype)
+    delta = close - shift(close, dtype)
+    if smoothing == 'sma':
+        gain = np.where(delta > 0, delta, 0)
+        loss = -np.where(delta < 0, delta, 0)
+        avg_gain = rolling_mean(gain, period, dtype)
+        avg_loss = rolling_mean(loss, period, dtype)
+    else:
+        # Gains and losses are smoothed side by side in one pass. np.maximum keeps the first bar's
+        # change NaN, so the recursive average skips it rather than counting it as no change.
+        delta = delta[:, None] if delta.ndim == 1 else delta
+        count = delta.shape[1]
+        changes = np.empty((len(delta), 2 * count), dtype=dtype)
+        np.maximum(delta, 0, out=changes[:, :count])
+        np.maximum(-delta, 0, out=changes[:, count:])
+        averages = smoothed_mean(changes, period, smoothing, dtype)
+        avg_gain = averages[:, :count].reshape(close.shape)
+        avg_loss = averages[:, count:].reshape(close.shape)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rs = avg_gain / avg_loss
+        return 100 - (100 / (1 + rs))
+
+
+def calculate_rsi(data: pd.DataFrame, period: int = 14, smoothing: str = 'sma', dtype=np.float64) -> pd.Series:
     """
-    Calculate the Simple Moving Average (SMA) for the given data.
+    Calculate the Relative Strength Index (RSI) for the given data.
 
     :param data: A Pandas DataFrame containing at least the 'Close' price column.
-    :param period: The number of periods for calculating the moving average.
-    :return: A Pandas Series representing the SMA values.
+    :param period: The number of periods for calculating the RSI.
+    :param smoothing: How gains and losses are averaged: 'sma' (rolling mean), 'wilder' (Wilder's
+        original RSI) or 'ema'.
+    :param dtype: The floating-point dtype of the computation and result, e.g. np.float32 to halve memory.
+    :return: A Pandas Series representing the RSI values.
     """
-    if 'Close' not in data.columns:
+    data = field_major(data)
+    if 'Close' not in fields(data):
         raise ValueError("DataFrame must contain a 'Close' column.")
 
-    return data['Close'].rolling(window=period).mean()
+    close = data['Close']
+    return like(rsi_array(close.to_numpy(dtype=dtype), period, smoothing, dtype), close)
@@ -0,0 +1,292 @@
+# indicators/runner.py
+
+"""
+Parallel indicator runs over a directory of price history files.
+
+Every CSV file in the input directory is loaded (optionally in row chunks), the configured
+indicator set is computed with :func:`indicators.graph.compute_indicators` and the result is written
+to the output directory, either as CSV or into an Arrow :class:`indicators.store.ResultStore`
+keyed by the file name. Files are spread over a pool of worker processes, so a run scales with the
+number of cores.
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import ExitStack
+
+import pandas as pd
+
+from .chunked import ChunkedComputation
+from .graph import INDICATORS, compute_indicators
+from .ingest import PriceCache, price_columns
+from .store import ResultStore, split_results
+
+# Rows per block of an out-of-core run when no chunk size is given.
+DEFAULT_BLOCK_ROWS = 1_000_000
+
+
+def _parse_value(value: str):
+    """
+    Parse a command-line parameter value: an int, a float, 'true' or 'false', and otherwise the text itself.
+    """
+    value = value.strip()
+    for parse in (int, float):
+        try:
+            return parse(value)
+        except ValueError:
+            pass
+    return {'true': True, 'false': False}.get(value.lower(), value)
+
+
+def parse_indicator(text: str):
+    """
+    Parse a command-line indicator spec such as 'rsi' or 'macd:fast_period=5,slow_period=35'.
+
+    Values are parsed as numbers when possible, 'true' and 'false' as booleans, and other values are kept
+    as text, e.g. 'rsi:period=21,smoothing=wilder' or 'bollinger_bands:ddof=0,extended=true'.
+
+    :param text: The indicator name, optionally followed by ':' and comma separated key=value parameters.
+    :return: A ``(name, params)`` tuple accepted by :func:`indicators.graph.compute_indicators`.
+    """
+    name, _, arguments = text.partition(':')
+    params = {}
+    for argument in filter(None, arguments.split(',')):
+        key, separator, value = argument.partition('=')
+        if not separator:
+            raise ValueError(f"Invalid indicator parameter '{argument}' (expected key=value).")
+        params[key.strip()] = _parse_value(value)
+    return name.strip(), params
+
+
+def load_price_data(file_path: str, chunk_size: int = None, cache_dir: str = None) -> pd.DataFrame:
+    """
+    Load OHLCV price data from a CSV file.
+
+    Only the standard price columns are read and prices are parsed as float64; the file must contain the
+    'Open', 'High', 'Low', 'Close' and 'Volume' columns, and 'Date' is kept when present. With ``chunk_size``
+    the file is parsed ``chunk_size`` rows at a time, which bounds the parser's temporary memory.
+
+    :param file_path: Path to the CSV file.
+    :param chunk_size: Number of rows per parsing chunk, or None to parse the file in one go.
+    :param cache_dir: Root of a :class:`indicators.ingest.PriceCache`: the file is parsed once into it and
+        later loads memory-map the parsed columns ('Date' then holds timestamps rather than text).
+    :return: A Pandas DataFrame with the price columns found in the file.
+    :raises ValueError: If one of the required price columns is missing.
+    """
+    if cache_dir is not None:
+        return PriceCache(cache_dir).load(file_path)
+    if chunk_size is None:
+        columns, dtypes = price_columns(file_path)
+        return pd.read_csv(file_path, usecols=columns, dtype=dtypes)
+    return pd.concat(read_price_chunks(file_path, chunk_size), ignore_index=True)
+
+
+def read_price_chunks(file_path: str, chunk_size: int, cache_dir: str = None):
+    """
+    Iterate over the OHLCV price data of a CSV file in blocks of ``chunk_size`` rows.
+
+    :param file_path: Path to the CSV file.
+    :param chunk_size: Number of rows per block.
+    :param cache_dir: Root of a :class:`indicators.ingest.PriceCache` to read the blocks from (see
+        :func:`load_price_data`); only the pages of the current block are then touched.
+    :return: An iterator of Pandas DataFrames whose RangeIndex continues from block to block.
+    """
+    if cache_dir is not None:
+        data = PriceCache(cache_dir).load(file_path)
+        for start in range(0, len(data), chunk_size):
+            yield data.iloc[start:start + chunk_size]
+        return
+
+    columns, dtypes = price_columns(file_path)
+    with pd.read_csv(file_path, usecols=columns, dtype=dtypes, chunksize=chunk_size) as reader:
+        yield from reader
+
+
+def _limit_memory(memory_limit: int):
+    """
+    Cap the address space of the current (worker) process at ``memory_limit`` bytes where supported.
+    """
+    try:
+        import resource
+    except ImportError:  # pragma: no cover - not available on Windows
+        return
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    resource.setrlimit(resource.RLIMIT_AS, (memory_limit, hard))
+
+
+def _initialize_worker(memory_limit):
+    if memory_limit:
+        _limit_memory(memory_limit)
+
+
+def _csv_output_path(file_path: str, output_dir: str) -> str:
+    """
+    Return the CSV output path of an input file, refusing to overwrite the input itself.
+    """
+    output_path = os.path.join(output_dir, os.path.basename(file_path))
+    if os.path.exists(output_path) and os.path.samefile(output_path, file_path):
+        raise ValueError(f"The output file '{output_path}' would overwrite its input; use another output directory.")
+    return output_path
+
+
+def process_file(file_path: str, output_dir: str, specs: list, chunk_size: int = None,
+                 output_format: str = 'csv', out_of_core: bool = False, cache_dir: str = None) -> dict:
+    """
+    Compute the indicator set for one price file and write the result next to the other outputs.
+
+    :param file_path: Path to the input CSV file.
+    :param output_dir: Directory receiving the output file (same base name as the input), or the root
+        of the result store for the 'arrow' format.
+    :param specs: Indicator specs, as accepted by :func:`indicators.graph.compute_indicators`.
+    :param chunk_size: Number of rows per CSV parsing chunk, or None.
+    :param output_format: 'csv' for one CSV file per input, or 'arrow' to write one store entry per
+        indicator with the file name (without extension) as the symbol.
+    :param out_of_core: Compute and write the file ``chunk_size`` rows at a time (see
+        :mod:`indicators.chunked`), so memory does not grow with the length of the file.
+    :param cache_dir: Root of a :class:`indicators.ingest.PriceCache` to load the prices through, or None.
+    :return: A summary dict with the input path, output path, row count and elapsed seconds.
+    """
+    if out_of_core:
+        return _process_file_in_blocks(file_path, output_dir, specs, chunk_size or DEFAULT_BLOCK_ROWS, output_format,
+                                       cache_dir)
+
+    start = time.perf_counter()
+    data = load_price_data(file_path, chunk_size, cache_dir)
+    result = compute_indicators(data, specs)
+
+    if output_format == 'arrow':
+        if 'Date' in data.columns:
+            result.index = pd.Index(data['Date'], name='Date')
+        store = ResultStore(output_dir)
+        symbol = os.path.splitext(os.path.basename(file_path))[0]
+        for name, params, frame in split_results(result, specs):
+            store.write(symbol, name, frame, params)
+        output_path = output_dir
+    else:
+        if 'Date' in data.columns:
+            result.insert(0, 'Date', data['Date'])
+        output_path = _csv_output_path(file_path, output_dir)
+        result.to_csv(output_path, index=False)
+
+    return {
+        'input': file_path,
+        'output': output_path,
+        'rows': len(data),
+        'seconds': time.perf_counter() - start
+    }
+
+
+def _remove_if_exists(path: str):
+    if os.path.exists(path):
+        os.remove(path)
+
+
+def _process_file_in_blocks(file_path: str, output_dir: str, specs: list, block_rows: int,
+                            output_format: str, cache_dir: str) -> dict:
+    """
+    Out-of-core variant of :func:`process_file`: each block of rows is computed and appended to the output.
+    """
+    start = time.perf_counter()
+    computation = ChunkedComputation(specs)
+    symbol = os.path.splitext(os.path.basename(file_path))[0]
+    temporary_path = None
+
+    with ExitStack() as stack:
+        if output_format == 'arrow':
+            store = ResultStore(output_dir)
+            writers = None
+            output_path = output_dir
+        else:
+            output_path = _csv_output_path(file_path, output_dir)
+            # Blocks go to a temporary file, which replaces the output only once the last block is written.
+            temporary_path = output_path + '.tmp'
+            stack.callback(_remove_if_exists, temporary_path)
+            output = stack.enter_context(open(temporary_path, 'w', newline=''))
+
+        for block in read_price_chunks(file_path, block_rows, cache_dir):
+            result = computation.update(block)
+            if output_format == 'arrow':
+                if 'Date' in block.columns:
+                    result.index = pd.Index(block['Date'], name='Date')
+                frames = split_results(result, specs)
+                if writers is None:
+                    writers = [stack.enter_context(store.writer(symbol, name, params)) for name, params, _ in frames]
+                for writer, (_, _, frame) in zip(writers, frames):
+                    writer.write(frame)
+            else:
+                if 'Date' in block.columns:
+                    result.insert(0, 'Date', block['Date'])
+                result.to_csv(output, header=computation.blocks == 1, index=False)
+
+        if temporary_path is not None and computation.blocks:
+            output.close()
+            os.replace(temporary_path, output_path)
+
+    if computation.blocks == 0:
+        # An empty file has no block to take the output columns from.
+        return process_file(file_path, output_dir, specs, output_format=output_format, cache_dir=cache_dir)
+    return {
+        'input': file_path,
+        'output': output_path,
+        'rows': computation.rows,
+        'seconds': time.perf_counter() - start
+    }
+
+
+def run_directory(input_dir: str, output_dir: str, specs: list = None, workers: int = None,
+                  chunk_size: int = None, memory_limit: int = None, pattern: str = '.csv',
+                  output_format: str = 'csv', out_of_core: bool = False, cache_dir: str = None):
+    """
+    Compute indicators for every price file in a directory using a process pool.
+
+    :param input_dir: Directory containing the price CSV files.
+    :param output_dir: Directory receiving one output file per input file; created if missing.
+    :param specs: Indicator specs; defaults to every indicator with its default parameters.
+    :param workers: Number of worker processes; defaults to the number of CPUs. 1 runs in-process,
+        unless ``memory_limit`` is set (a single worker process then applies it).
+    :param chunk_size: Number of rows per CSV parsing chunk, or None to parse each file in one go.
+    :param memory_limit: Address-space cap per worker process in bytes (POSIX only), or None.
+    :param pattern: File name suffix selecting the input files.
+    :param output_format: 'csv' or 'arrow' (see :func:`process_file`).
+    :param out_of_core: Compute and write each file ``chunk_size`` rows at a time (see :func:`process_file`).
+    :param cache_dir: Root of a :class:`indicators.ingest.PriceCache`: each file is parsed once and
+        memory-mapped on later runs.
+    :return: A tuple ``(results, failures)``: summary dicts of processed files and ``(path, error)`` pairs.
+    """
+    if output_format not in ('csv', 'arrow'):
+        raise ValueError("'output_format' must be 'csv' or 'arrow'.")
+    if specs is None:
+        specs = sorted(INDICATORS)
+    files = sorted(
+        os.path.join(input_dir, name) for name in os.listdir(input_dir)
+        if name.endswith(pattern) and os.path.isfile(os.path.join(input_dir, name))
+    )
+    os.makedirs(output_dir, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+
+    results, failures = [], []
+    # The address-space cap applies to worker processes only, so a limited run always uses the pool.
+    if workers == 1 and not memory_limit:
+        for file_path in files:
+            try:
+                results.append(process_file(file_path, output_dir, specs, chunk_size, output_format, out_of_core,
+                                            cache_dir))
+            except Exception as e:
+                failures.append((file_path, e))
+        return results, failures
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_initialize_worker,
+                             initargs=(memory_limit,)) as executor:
+        futures = {
+            executor.submit(process_file, file_path, output_dir, specs, chunk_size, output_format,
+                            out_of_core, cache_dir): file_path
+            for file_path in files
+        }
+        for future in as_completed(futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                failures.append((futures[future], e))
+
+    return results, failures
@@ -0,0 +1,351 @@
+# indicators/signals.py
+
+"""
+Signals: events derived from indicator outputs, such as crossovers, threshold entries and band breakouts.
+
+A signal is declared once from the names of the columns it compares (or constants)::
+
+    signals = {
+        'macd_cross': Crossover('MACD Line', 'Signal Line'),
+        'oversold': Threshold('RSI', 30, side='below'),
+        'breakout': BandBreakout('Close', 'Upper Band', 'Lower Band'),
+        'trend': Hysteresis('%K', enter=80, exit=50),
+    }
+
+and evaluated either over whole histories or one bar at a time:
+
+- ``signal.events(data)`` (or :func:`evaluate` for several signals) compares every row with the
+  previous one using array operations. ``data`` is anything whose ``data[name]`` returns a Series,
+  a wide DataFrame with one column per symbol (as for a panel or the result of a calculate_*
+  function on a panel) or an array, e.g. a DataFrame or a dict combining prices and indicators.
+  A 5,000-symbol panel is therefore evaluated in one pass.
+- ``signal.stream()`` returns a :class:`SignalStream`, whose ``update(values)`` takes the latest
+  values (floats for one symbol, or one array element per symbol) and returns the sides of the
+  events on that bar. It keeps the previous values, and the state of a hysteresis, between updates.
+
+Events are returned as an :class:`Events` tuple of index arrays rather than boolean frames: the row
+positions, the symbol (column) positions and the side of every event, +1 for an entry or an upward
+cross and -1 for an exit or a downward cross, in row order. NaN values, e.g. during the warm-up of an
+indicator, never produce an event, and a cross is only reported once both rows are known.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+
+class Events(namedtuple('Events', ['rows', 'columns', 'sides'])):
+    """
+    The events of a signal: row positions, column (symbol) positions and sides (+1 or -1).
+
+    Single-symbol inputs have every column position at 0.
+    """
+
+    __slots__ = ()
+
+    def to_frame(self, index, columns=None) -> pd.DataFrame:
+        """
+        Return the events as a DataFrame with the row and column labels.
+
+        :param index: The index of the evaluated data, e.g. ``data.index``.
+        :param columns: The symbols of a panel; omit for a single symbol.
+        :return: A Pandas DataFrame with 'Row', 'Symbol' (panels only) and 'Side' columns.
+        """
+        frame = {'Row': np.asarray(index)[self.rows]}
+        if columns is not None:
+            frame['Symbol'] = np.asarray(columns)[self.columns]
+        frame['Side'] = self.sides
+        return pd.DataFrame(frame)
+
+
+def _events(sides: np.ndarray) -> Events:
+    """
+    Compress an array of sides (0 where nothing happens) into an :class:`Events` tuple.
+    """
+    # int32 positions halve the size of the events of all but the largest (over 2**31 rows) inputs.
+    dtype = np.int32 if max(sides.shape, default=0) < 2 ** 31 else np.int64
+    if sides.ndim == 1:
+        rows = np.flatnonzero(sides)
+        sides = sides[rows]
+        columns = np.zeros(len(rows), dtype=dtype)
+    else:
+        rows, columns = np.nonzero(sides)
+        sides = sides[rows, columns]
+    return Events(rows.astype(dtype), columns.astype(dtype), sides)
+
+
+def _sides(up: np.ndarray, down: np.ndarray = None) -> np.ndarray:
+    sides = up.astype(np.int8)
+    if down is not None:
+        sides -= down
+    return sides
+
+
+def _resolve(data, operand, cache: dict, template: list):
+    """
+    Return an operand as a float array (or a float for constants).
+
+    Column names are looked up in ``data`` once per evaluation; wide DataFrames are aligned on the
+    symbols of the first one, so the operands of a signal can come from different sources.
+    """
+    if isinstance(operand, (int, float)):
+        return float(operand)
+    if not isinstance(operand, str):
+        return np.asarray(operand, dtype=np.float64)
+    if operand in cache:
+        return cache[operand]
+
+    try:
+        values = data[operand]
+    except KeyError:
+        raise ValueError(f"Data must contain a '{operand}' column.") from None
+    if isinstance(values, pd.DataFrame):
+        if not template:
+            template.append(values.columns)
+        elif not values.columns.equals(template[0]):
+            values = values.reindex(columns=template[0])
+    if isinstance(values, (pd.Series, pd.DataFrame)):
+        values = values.to_numpy(dtype=np.float64)
+    cache[operand] = np.asarray(values, dtype=np.float64)
+    return cache[operand]
+
+
+class Signal:
+    """
+    Base class of the signals.
+
+    Subclasses list the columns (or constants) they compare in ``operands`` and implement ``_step``,
+    which returns the sides of the events on the current rows given the previous and current values.
+    Streams keep a ``memory`` between bars: the previous values, unless a subclass needs other state.
+    """
+
+    operands = ()
+
+    def _step(self, previous: list, current: list) -> np.ndarray:
+        raise NotImplementedError
+
+    def _sides(self, values: list) -> np.ndarray:
+        # Compare offset views of the rows rather than shifted copies; the first row has no previous one.
+        shape = np.broadcast_shapes(*(np.shape(value) for value in values))
+        arrays = [value for value in values if isinstance(value, np.ndarray)]
+        previous = [value[:-1] if isinstance(value, np.ndarray) else value for value in values]
+        current = [value[1:] if isinstance(value, np.ndarray) else value for value in values]
+        # Keep the layout of the operands: panel columns are column-major (one symbol after another).
+        order = 'F' if arrays[0].ndim > 1 and arrays[0].flags.f_contiguous else 'C'
+        sides = np.zeros(shape, dtype=np.int8, order=order)
+        sides[1:] = self._step(previous, current)
+        return sides
+
+    def _values(self, data, cache: dict = None, template: list = None) -> list:
+        cache = {} if cache is None else cache
+        template = [] if template is None else template
+        values = [_resolve(data, operand, cache, template) for operand in self.operands]
+        if not any(isinstance(value, np.ndarray) for value in values):
+            raise ValueError("A signal must compare at least one column.")
+        return values
+
+    def _advance(self, memory, current: list):
+        if memory is None:
+            memory = [np.full_like(value, np.nan) for value in current]
+        return current, self._step(memory, current)
+
+    def _memory(self, values: list):
+        return [value[-1] if isinstance(value, np.ndarray) and len(value) else np.asarray(value) for value in values]
+
+    def sides(self, data) -> np.ndarray:
+        """
+        Return the side of every row (0 where nothing happens), shaped like the operands.
+
+        :param data: A DataFrame, panel or mapping with the operand columns.
+        :return: An int8 NumPy array, 1-D for a single symbol and (rows, symbols) for a panel.
+        """
+        return self._sides(self._values(data))
+
+    def events(self, data) -> Events:
+        """
+        Evaluate the signal over whole histories.
+
+        :param data: A DataFrame, panel or mapping with the operand columns.
+        :return: The :class:`Events` of the signal, in row order.
+        """
+        return _events(self.sides(data))
+
+    def stream(self) -> 'SignalStream':
+        """
+        Return a :class:`SignalStream` evaluating the signal one bar at a time.
+        """
+        return SignalStream(self)
+
+
+class Crossover(Signal):
+    """
+    +1 when ``fast`` crosses above ``slow``: it is above on the current row and was not on the previous one.
+
+    :param fast: A column name, a constant or an array.
+    :param slow: A column name, a constant or an array.
+    """
+
+    def __init__(self, fast, slow):
+        self.operands = (fast, slow)
+
+    def _step(self, previous, current):
+        with np.errstate(invalid='ignore'):
+            return _sides((current[0] > current[1]) & (previous[0] <= previous[1]))
+
+
+class Crossunder(Signal):
+    """
+    -1 when ``fast`` crosses below ``slow``: it is below on the current row and was not on the previous one.
+
+    :param fast: A column name, a constant or an array.
+    :param slow: A column name, a constant or an array.
+    """
+
+    def __init__(self, fast, slow):
+        self.operands = (fast, slow)
+
+    def _step(self, previous, current):
+        with np.errstate(invalid='ignore'):
+            return -_sides((current[0] < current[1]) & (previous[0] >= previous[1]))
+
+
+class Threshold(Signal):
+    """
+    +1 when ``column`` enters the zone beyond ``level`` and -1 when it leaves it.
+
+    :param column: A column name or an array, e.g. 'RSI'.
+    :param level: The threshold, e.g. 30.
+    :param side: 'above' for the zone above the level (e.g. overbought) or 'below' for the zone below it.
+    """
+
+    def __init__(self, column, level, side: str = 'above'):
+        if side not in ('above', 'below'):
+            raise ValueError("'side' must be 'above' or 'below'.")
+        self.operands = (column, level)
+        self.side = side
+
+    def _step(self, previous, current):
+        (value, level), (last, last_level) = current, previous
+        with np.errstate(invalid='ignore'):
+            if self.side == 'above':
+                return _sides((value > level) & (last <= last_level), (value <= level) & (last > last_level))
+            return _sides((value < level) & (last >= last_level), (value >= level) & (last < last_level))
+
+
+class BandBreakout(Signal):
+    """
+    +1 when ``price`` crosses above ``upper`` and -1 when it crosses below ``lower``.
+
+    :param price: A column name or an array, e.g. 'Close'.
+    :param upper: The upper band, e.g. 'Upper Band'.
+    :param lower: The lower band, e.g. 'Lower Band', or None to report upward breakouts only.
+    """
+
+    def __init__(self, price, upper, lower=None):
+        self.operands = (price, upper) if lower is None else (price, upper, lower)
+
+    def _step(self, previous, current):
+        with np.errstate(invalid='ignore'):
+            up = (current[0] > current[1]) & (previous[0] <= previous[1])
+            if len(current) == 2:
+                return _sides(up)
+            return _sides(up, (current[0] < current[2]) & (previous[0] >= previous[2]))
+
+
+class Hysteresis(Signal):
+    """
+    A state switched on at one level and off at another, reporting +1 when it turns on and -1 when it turns off.
+
+    With ``enter`` above ``exit`` the state turns on once ``column`` reaches ``enter`` and stays on until
+    it falls to ``exit`` (e.g. ``Hysteresis('%K', enter=80, exit=50)``); with ``enter`` below ``exit`` it
+    turns on at or below ``enter`` and off at or above ``exit`` (e.g. ``Hysteresis('RSI', 30, 50)``).
+    Values in between, and NaN values, keep the current state, so noise around a single level does not
+    produce a burst of events. The state starts off.
+
+    :param column: A column name or an array.
+    :param enter: The level switching the state on.
+    :param exit: The level switching the state off.
+    """
+
+    def __init__(self, column, enter: float, exit: float):
+        if enter == exit:
+            raise ValueError("'enter' and 'exit' must differ.")
+        self.operands = (column, enter, exit)
+
+    def _switches(self, value, enter, exit):
+        with np.errstate(invalid='ignore'):
+            if self.operands[1] > self.operands[2]:
+                return value >= enter, value <= exit
+            return value <= enter, value >= exit
+
+    def _sides(self, values):
+        on, off = self._switches(*values)
+        # Forward-fill the latest switch along the rows with a running maximum of row * 2 + (1 if on else 0),
+        # so the lowest bit holds the state; -2 before the first switch (state off).
+        rows = np.arange(len(on), dtype=np.int32 if 2 * len(on) < 2 ** 31 else np.int64)
+        latest = np.where(on | off, (2 * rows + 1).reshape((-1,) + (1,) * (on.ndim - 1)) - off, -2)
+        np.maximum.accumulate(latest, axis=0, out=latest)
+        state = (latest & 1).astype(bool)
+        previous = np.zeros_like(state)
+        previous[1:] = state[:-1]
+        return _sides(state & ~previous, previous & ~state)
+
+    def _advance(self, memory, current):
+        # The memory is the state (on or off) after the previous bar.
+        previous = np.zeros(current[0].shape, dtype=bool) if memory is None else memory
+        on, off = self._switches(*current)
+        state = np.where(on, True, np.where(off, False, previous))
+        return state, _sides(state & ~previous, previous & ~state)
+
+    def _memory(self, values):
+        sides = self._sides(values)
+        return np.sum(sides, axis=0, dtype=np.int64) > 0
+
+
+def evaluate(signals: dict, data) -> dict:
+    """
+    Evaluate several signals over whole histories, reading each column from ``data`` once.
+
+    :param signals: A mapping of signal name to :class:`Signal`.
+    :param data: A DataFrame, panel or mapping with the operand columns of every signal.
+    :return: A dict of signal name to :class:`Events`.
+    """
+    cache = {}
+    template = []
+    return {name: _events(signal._sides(signal._values(data, cache, template))) for name, signal in signals.items()}
+
+
+class SignalStream:
+    """
+    Evaluates a signal one bar at a time.
+
+    :param signal: The :class:`Signal` to evaluate.
+    """
+
+    def __init__(self, signal: Signal):
+        self.signal = signal
+        self.memory = None
+
+    def update(self, values):
+        """
+        Evaluate the signal on the next bar.
+
+        :param values: A mapping with the operand columns (a dict, a row of a DataFrame, ...), holding a
+            float per column for one symbol or an array with one value per symbol.
+        :return: The side of the event on this bar (0 for none): an int for one symbol, or an int8 array
+            with one side per symbol.
+        """
+        current = [np.asarray(_resolve(values, operand, {}, []), dtype=np.float64) for operand in self.signal.operands]
+        self.memory, sides = self.signal._advance(self.memory, current)
+        return int(sides) if sides.ndim == 0 else sides
+
+    def seed(self, data) -> 'SignalStream':
+        """
+        Seed the stream with a history, so the first update can already report an event.
+
+        :param data: A DataFrame, panel or mapping with the operand columns over the history.
+        :return: The stream itself.
+        """
+        self.memory = self.signal._memory(self.signal._values(data))
+        return self
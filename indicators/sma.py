@@ -1,15 +1,34 @@
+import numpy as np
 import pandas as pd
 
+from .panel import field_major, fields, like
+from .rolling import rolling_mean
 
-def calculate_sma(data: pd.DataFrame, period: int = 20) -> pd.Series:
+
+def sma_array(close, period: int = 20, dtype=np.float64) -> np.ndarray:
+    """
+    Calculate the Simple Moving Average (SMA) on plain NumPy arrays.
+
+    :param close: An array-like of closing prices, one row per bar (2-D for one column per symbol).
+    :param period: The number of periods for calculating the moving average.
+    :param dtype: The floating-point dtype of the result, e.g. np.float32 to halve memory.
+    :return: A NumPy array with the SMA values.
+    """
+    return rolling_mean(np.asarray(close, dtype=dtype), period, dtype)
+
+
+def calculate_sma(data: pd.DataFrame, period: int = 20, dtype=np.float64) -> pd.Series:
     """
     Calculate the Simple Moving Average (SMA) for the given data.
 
     :param data: A Pandas DataFrame containing at least the 'Close' price column.
     :param period: The number of periods for calculating the moving average.
+    :param dtype: The floating-point dtype of the result, e.g. np.float32 to halve memory.
     :return: A Pandas Series representing the SMA values.
     """
-    if 'Close' not in data.columns:
+    data = field_major(data)
+    if 'Close' not in fields(data):
         raise ValueError("DataFrame must contain a 'Close' column.")
 
-    return data['Close'].rolling(window=period).mean()
+    close = data['Close']
+    return like(sma_array(close.to_numpy(dtype=dtype), period, dtype), close)
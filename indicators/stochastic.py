@@ -1,26 +1,51 @@
 # indicators/stochastic.py
 
+import numpy as np
 import pandas as pd
 
+from .extrema import rolling_extrema
+from .panel import combine, field_major, field_arrays, fields, like
+from .rolling import rolling_mean
 
-def calculate_stochastic_oscillator(data: pd.DataFrame, period: int = 14) -> pd.DataFrame:
+
+def stochastic_oscillator_array(high, low, close, period: int = 14, dtype=np.float64):
+    """
+    Calculate the Stochastic Oscillator on plain NumPy arrays.
+
+    :param high: An array-like of high prices, one row per bar (2-D for one column per symbol).
+    :param low: An array-like of low prices with the same shape as ``high``.
+    :param close: An array-like of closing prices with the same shape as ``high``.
+    :param period: The number of periods for calculating the Stochastic Oscillator.
+    :param dtype: The floating-point dtype of the computation and results, e.g. np.float32 to halve memory.
+    :return: A tuple ``(percent_k, percent_d)`` of NumPy arrays.
+    """
+    close = np.asarray(close, dtype=dtype)
+    high_max, low_min = rolling_extrema(high, low, period, dtype=dtype)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        percent_k = 100 * ((close - low_min) / (high_max - low_min))
+    percent_d = rolling_mean(percent_k, 3, dtype)  # Moving average of %K
+
+    return percent_k, percent_d
+
+
+def calculate_stochastic_oscillator(data: pd.DataFrame, period: int = 14, dtype=np.float64) -> pd.DataFrame:
     """
     Calculate the Stochastic Oscillator for the given data.
 
     :param data: A Pandas DataFrame containing 'High', 'Low', and 'Close' columns.
     :param period: The number of periods for calculating the Stochastic Oscillator.
+    :param dtype: The floating-point dtype of the computation and results, e.g. np.float32 to halve memory.
     :return: A Pandas DataFrame with columns for %K and %D lines.
     """
-    if not {'High', 'Low', 'Close'}.issubset(data.columns):
+    data = field_major(data)
+    if not {'High', 'Low', 'Close'}.issubset(fields(data)):
         raise ValueError("DataFrame must contain 'High', 'Low', and 'Close' columns.")
 
-    low_min = data['Low'].rolling(window=period).min()
-    high_max = data['High'].rolling(window=period).max()
-
-    percent_k = 100 * ((data['Close'] - low_min) / (high_max - low_min))
-    percent_d = percent_k.rolling(window=3).mean()  # Moving average of %K
+    template, arrays = field_arrays(data, ('High', 'Low', 'Close'), dtype)
+    percent_k, percent_d = stochastic_oscillator_array(*arrays, period, dtype)
 
-    return pd.DataFrame({
-        '%K': percent_k,
-        '%D': percent_d
+    return combine({
+        '%K': like(percent_k, template),
+        '%D': like(percent_d, template)
     })
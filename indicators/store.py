@@ -0,0 +1,267 @@
+# indicators/store.py
+
+"""
+Columnar on-disk store for indicator results.
+
+Results are written as uncompressed Arrow IPC (Feather v2) files laid out as
+``<root>/<indicator>/<parameters>/<symbol>.arrow``, for example
+``results/macd/fast_period=12,signal_period=9,slow_period=26/BNBUSDT.arrow``. Reads memory-map the
+file and only touch the requested columns; float columns come back as NumPy views over the mapped
+pages, so loading a stored result costs little more than opening the file.
+
+Requires ``pyarrow``.
+"""
+
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from .graph import parse_spec
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover - depends on the environment
+    pa = None
+
+INDEX_COLUMN = '__index__'
+VALUE_COLUMN = 'value'
+EXTENSION = '.arrow'
+
+
+def _require_pyarrow():
+    if pa is None:
+        raise ImportError("The result store requires pyarrow. Install it with 'pip install pyarrow'.")
+
+
+def _format_value(value) -> str:
+    # An integral float names the same parameters as the int, so both map to one directory.
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value)
+
+
+def params_key(params: dict) -> str:
+    """
+    Return the directory name used for a set of indicator parameters, e.g. 'period=14'.
+
+    Integral floats are written as integers, so ``{'period': 14.0}`` and ``{'period': 14}`` share a key.
+    """
+    if not params:
+        return 'default'
+    return ','.join(f'{key}={_format_value(params[key])}' for key in sorted(params))
+
+
+def split_results(result: pd.DataFrame, specs):
+    """
+    Split the output of :func:`indicators.graph.compute_indicators` back into one frame per indicator.
+
+    :param result: The DataFrame returned by ``compute_indicators(data, specs)``.
+    :param specs: The specs passed to ``compute_indicators``.
+    :return: A list of ``(name, params, frame)`` tuples; single-output indicators have a 'value' column,
+        multi-output indicators keep their output names ('MACD Line', ...).
+    """
+    frames = []
+    for spec in specs:
+        name, params, label = parse_spec(spec)
+        if label in result.columns:
+            frame = result[[label]].rename(columns={label: VALUE_COLUMN})
+        else:
+            prefix = label + ' '
+            columns = [column for column in result.columns if column.startswith(prefix)]
+            frame = result[columns].rename(columns=lambda column: column[len(prefix):])
+        frames.append((name, params, frame))
+    return frames
+
+
+def _to_table(frame: pd.DataFrame, metadata: dict, index_column: bool = False):
+    """
+    Convert a single-symbol result to an Arrow table, keeping NaN as NaN so floats stay zero-copy.
+
+    A RangeIndex is stored in the metadata unless ``index_column`` is set, like any other index.
+    """
+    names, arrays = [], []
+    index = frame.index
+    if isinstance(index, pd.RangeIndex) and not index_column:
+        metadata['range_index'] = [index.start, index.stop, index.step]
+    else:
+        names.append(INDEX_COLUMN)
+        arrays.append(pa.array(index.to_numpy()))
+        metadata['index_name'] = index.name
+
+    for column in frame.columns:
+        names.append(str(column))
+        arrays.append(pa.array(frame[column].to_numpy(), from_pandas=False))
+
+    schema_metadata = {b'indicators': json.dumps(metadata).encode()}
+    return pa.Table.from_arrays(arrays, names=names, metadata=schema_metadata)
+
+
+class ResultStore:
+    """
+    Directory of indicator results keyed by indicator name, parameters and symbol.
+
+    :param root: The root directory of the store; created on first write.
+    """
+
+    def __init__(self, root: str):
+        _require_pyarrow()
+        self.root = root
+
+    def path(self, symbol: str, indicator: str, params: dict = None) -> str:
+        """
+        Return the file path of a stored result. Parameters are completed with the indicator defaults.
+        """
+        name, params, _ = parse_spec((indicator, params or {}))
+        return os.path.join(self.root, name, params_key(params), symbol + EXTENSION)
+
+    def write(self, symbol: str, indicator: str, result, params: dict = None) -> str:
+        """
+        Write one indicator result for one symbol, replacing any previous version.
+
+        :param symbol: The symbol the result belongs to.
+        :param indicator: The indicator name, as used by :func:`indicators.graph.compute_indicators`.
+        :param result: The result as returned by the calculate_* function (a Series or a DataFrame).
+        :param params: The indicator parameters; omitted parameters take their defaults.
+        :return: The path of the written file.
+        """
+        frame = result.to_frame(VALUE_COLUMN) if isinstance(result, pd.Series) else result
+        name, params, _ = parse_spec((indicator, params or {}))
+        path = self.path(symbol, name, params)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        table = _to_table(frame, {'symbol': symbol, 'indicator': name, 'params': params})
+        temporary = path + '.tmp'
+        with pa.OSFile(temporary, 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(temporary, path)
+        return path
+
+    def writer(self, symbol: str, indicator: str, params: dict = None) -> 'ResultWriter':
+        """
+        Open a :class:`ResultWriter` that writes one result block by block, replacing any previous version.
+
+        :param symbol: The symbol the result belongs to.
+        :param indicator: The indicator name, as used by :func:`indicators.graph.compute_indicators`.
+        :param params: The indicator parameters; omitted parameters take their defaults.
+        :return: The writer; use it as a context manager.
+        """
+        name, params, _ = parse_spec((indicator, params or {}))
+        path = self.path(symbol, name, params)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        return ResultWriter(path, {'symbol': symbol, 'indicator': name, 'params': params})
+
+    def read(self, symbol: str, indicator: str, params: dict = None, columns: list = None) -> pd.DataFrame:
+        """
+        Load a stored result by memory-mapping its file.
+
+        :param symbol: The symbol to load.
+        :param indicator: The indicator name.
+        :param params: The indicator parameters; omitted parameters take their defaults.
+        :param columns: Output columns to load (e.g. ['Signal Line']); all columns when None.
+        :return: A Pandas DataFrame backed by the mapped file where possible.
+        """
+        path = self.path(symbol, indicator, params)
+        if not os.path.isfile(path):
+            raise FileNotFoundError(f"No stored {indicator} result for {symbol} at {path}.")
+
+        table = pa.ipc.open_file(pa.memory_map(path, 'r')).read_all()
+        metadata = json.loads(table.schema.metadata[b'indicators'])
+        names = [name for name in table.column_names if name != INDEX_COLUMN]
+        if columns is not None:
+            unknown = sorted(set(columns).difference(names))
+            if unknown:
+                raise KeyError(f"Columns not stored for {indicator}: {', '.join(unknown)}.")
+            names = list(columns)
+
+        frame = pd.DataFrame({name: _column_array(table.column(name)) for name in names}, copy=False)
+        if 'range_index' in metadata:
+            frame.index = pd.RangeIndex(*metadata['range_index'])
+        else:
+            frame.index = pd.Index(_column_array(table.column(INDEX_COLUMN)), name=metadata.get('index_name'))
+        return frame
+
+    def read_many(self, symbols, indicator: str, params: dict = None, column: str = VALUE_COLUMN) -> pd.DataFrame:
+        """
+        Load one output column for many symbols into a wide DataFrame (one column per symbol).
+
+        :param symbols: The symbols to load.
+        :param indicator: The indicator name.
+        :param params: The indicator parameters; omitted parameters take their defaults.
+        :param column: The output column to load ('value' for single-output indicators).
+        :return: A Pandas DataFrame aligned on the union of the stored indexes.
+        """
+        return pd.DataFrame({
+            symbol: self.read(symbol, indicator, params, columns=[column])[column] for symbol in symbols
+        })
+
+    def symbols(self, indicator: str, params: dict = None) -> list:
+        """
+        Return the symbols stored for an indicator and parameter set.
+        """
+        directory = os.path.dirname(self.path('_', indicator, params))
+        if not os.path.isdir(directory):
+            return []
+        return sorted(name[:-len(EXTENSION)] for name in os.listdir(directory) if name.endswith(EXTENSION))
+
+
+class ResultWriter:
+    """
+    Append the rows of one stored result block by block, e.g. from an out-of-core run.
+
+    Each :meth:`write` adds one record batch to the Arrow file, so only the current block is held in
+    memory. The file is written under a temporary name and moved into place when the writer is closed;
+    an error inside the ``with`` block leaves the previous version untouched.
+    """
+
+    def __init__(self, path: str, metadata: dict):
+        self.path = path
+        self.metadata = metadata
+        self._sink = None
+        self._writer = None
+
+    def write(self, result):
+        """
+        Append the next rows of the result (a Series or a DataFrame, as returned by the calculate_* function).
+        """
+        frame = result.to_frame(VALUE_COLUMN) if isinstance(result, pd.Series) else result
+        # Blocks do not know the final length, so the index is always stored as a column.
+        table = _to_table(frame, dict(self.metadata), index_column=True)
+        if self._writer is None:
+            self._sink = pa.OSFile(self.path + '.tmp', 'wb')
+            self._writer = pa.ipc.new_file(self._sink, table.schema)
+        self._writer.write_table(table)
+
+    def close(self, discard: bool = False):
+        """
+        Finish the file and move it into place, or delete it when ``discard`` is set.
+        """
+        if self._writer is None:
+            return
+        self._writer.close()
+        self._sink.close()
+        self._writer = self._sink = None
+        if discard:
+            os.remove(self.path + '.tmp')
+        else:
+            os.replace(self.path + '.tmp', self.path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close(discard=exc_type is not None)
+
+
+def _column_array(column) -> np.ndarray:
+    """
+    Return a chunked Arrow column as a NumPy array, without copying when it is a single null-free chunk.
+    """
+    if column.num_chunks == 1 and column.null_count == 0:
+        try:
+            return column.chunk(0).to_numpy(zero_copy_only=True)
+        except pa.ArrowInvalid:
+            pass
+    return column.to_numpy()
@@ -0,0 +1,572 @@
+# indicators/streaming.py
+
+"""
+Incremental (streaming) counterparts of the calculate_* functions.
+
+Each stream keeps just enough state to produce the latest indicator value from one new bar in
+amortized O(1): running sums for rolling means and sums, re-centered running sums for the
+Bollinger variance, monotonic deques for rolling extremes and the usual recursions for EMAs,
+ADL, OBV and the Parabolic SAR. The CCI is the exception: its mean deviation depends on every
+value in the window, so its update is O(period).
+
+Streams are seeded from a historical DataFrame and then fed one bar at a time::
+
+    stream = RSIStream.from_history(history, period=14)
+    value = stream.update({'Close': 101.5})
+
+``update`` accepts any mapping with the required columns (a dict, a row of a DataFrame, ...) and
+returns a float, or a dict keyed like the columns of the batch result for multi-output indicators.
+Values match the batch functions up to floating-point rounding.
+"""
+
+import math
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+from .extrema import RollingExtrema
+from .rolling import SMOOTHING, RollingMeanStd, _ewm_weight
+
+NAN = float('nan')
+
+
+def _require_columns(data: pd.DataFrame, columns: tuple):
+    if not set(columns).issubset(data.columns):
+        if len(columns) == 1:
+            raise ValueError(f"DataFrame must contain a '{columns[0]}' column.")
+        names = [f"'{column}'" for column in columns]
+        joined = ', '.join(names[:-1]) + (',' if len(names) > 2 else '') + f" and {names[-1]}"
+        raise ValueError(f"DataFrame must contain {joined} columns.")
+
+
+class _RollingSum:
+    """
+    Sum over the last ``period`` values, updated with Kahan-compensated adds and removes.
+
+    Like pandas rolling windows, the sum is NaN until the window is full and while it contains a NaN
+    or an infinity, and a window of identical values sums (and averages) to them exactly.
+    """
+
+    def __init__(self, period: int):
+        if period < 1:
+            raise ValueError("'period' must be a positive integer.")
+        self.period = period
+        self.window = deque()
+        self.total = 0.0
+        self.nan_count = 0
+        self.negative_count = 0
+        self.same_count = 0
+        self.previous = NAN
+        self._add_compensation = 0.0
+        self._remove_compensation = 0.0
+
+    def push(self, value: float) -> float:
+        if len(self.window) == self.period:
+            old = self.window.popleft()
+            if not math.isfinite(old):
+                self.nan_count -= 1
+            else:
+                self.negative_count -= old < 0
+                y = -old - self._remove_compensation
+                t = self.total + y
+                self._remove_compensation = t - self.total - y
+                self.total = t
+
+        self.window.append(value)
+        if not math.isfinite(value):
+            self.nan_count += 1
+        else:
+            self.negative_count += value < 0
+            self.same_count = self.same_count + 1 if value == self.previous else 1
+            self.previous = value
+            y = value - self._add_compensation
+            t = self.total + y
+            self._add_compensation = t - self.total - y
+            self.total = t
+
+        return self.sum()
+
+    def sum(self) -> float:
+        if len(self.window) < self.period or self.nan_count:
+            return NAN
+        if self.same_count >= self.period:
+            return self.previous * self.period
+        return self.total
+
+    def mean(self) -> float:
+        if len(self.window) < self.period or self.nan_count:
+            return NAN
+        if self.same_count >= self.period:
+            return self.previous
+        mean = self.total / self.period
+        # Like pandas, a mean of one-signed values never takes the other sign through rounding.
+        if (mean < 0 and not self.negative_count) or (mean > 0 and self.negative_count == self.period):
+            return 0.0
+        return mean
+
+
+class _Ewm:
+    """
+    Exponentially weighted mean with the semantics of ``Series.ewm(span=span, adjust=False).mean()``.
+    """
+
+    def __init__(self, span: float):
+        if span < 1:
+            raise ValueError("'span' must be at least 1.")
+        self.alpha = 2.0 / (span + 1.0)
+        self.value = NAN
+        self.old_weight = 1.0
+
+    def push(self, value: float) -> float:
+        if self.value == self.value:
+            self.old_weight *= 1.0 - self.alpha
+            if value == value:
+                if self.value != value:
+                    self.value = (self.old_weight * self.value + self.alpha * value) / (self.old_weight + self.alpha)
+                self.old_weight = 1.0
+        elif value == value:
+            self.value = value
+        return self.value
+
+
+class _RecursiveMean:
+    """
+    Recursive mean with the semantics of :func:`indicators.rolling.smoothed_mean` for 'wilder' and 'ema'.
+    """
+
+    def __init__(self, period: int, alpha: float):
+        if period < 1:
+            raise ValueError("'period' must be a positive integer.")
+        self.period = period
+        self.alpha = alpha
+        self.count = 0
+        self.mean = 0.0
+
+    def push(self, value: float) -> float:
+        if value != value:
+            return NAN
+        if self.count < self.period:
+            self.count += 1
+            self.mean += value
+            if self.count < self.period:
+                return NAN
+            self.mean /= self.period
+        elif self.mean != value:
+            decay = 1.0 - self.alpha
+            self.mean = (decay * self.mean + self.alpha * value) / (decay + self.alpha)
+        return self.mean
+
+
+class _Average:
+    """
+    Moving average of :func:`indicators.rolling.smoothed_mean` for any smoothing method.
+    """
+
+    def __init__(self, period: int, smoothing: str = 'sma'):
+        if smoothing not in SMOOTHING:
+            raise ValueError(f"'smoothing' must be one of {', '.join(repr(name) for name in SMOOTHING)}.")
+        weight = SMOOTHING[smoothing]
+        self._sum = _RollingSum(period) if weight is None else None
+        self._recursive = None if weight is None else _RecursiveMean(period, _ewm_weight(weight(period)))
+
+    def push(self, value: float) -> float:
+        if self._recursive is not None:
+            return self._recursive.push(value)
+        self._sum.push(value)
+        return self._sum.mean()
+
+
+def _divide(numerator: float, denominator: float) -> float:
+    """
+    Divide like NumPy does: x / 0 is a signed infinity and 0 / 0 is NaN instead of an exception.
+    """
+    if denominator == 0:
+        if numerator != numerator or numerator == 0:
+            return NAN
+        return math.copysign(math.inf, numerator) * math.copysign(1.0, denominator)
+    return numerator / denominator
+
+
+def _true_range(high: float, low: float, previous_close: float) -> float:
+    """
+    True range of one bar, skipping NaN terms like ``DataFrame.max(axis=1)``.
+    """
+    terms = [term for term in (high - low, abs(high - previous_close), abs(low - previous_close)) if term == term]
+    return max(terms) if terms else NAN
+
+
+class IndicatorStream:
+    """
+    Base class of the streaming indicators.
+
+    Subclasses declare the input ``columns`` they read from each bar and implement ``_step`` taking
+    those values in the same order.
+    """
+
+    columns = ('Close',)
+
+    def _step(self, *values):
+        raise NotImplementedError
+
+    def update(self, bar):
+        """
+        Feed one bar and return the latest indicator value.
+
+        :param bar: A mapping (dict, DataFrame row, ...) holding the required columns.
+        :return: The latest value, or a dict of values for multi-output indicators.
+        """
+        return self._step(*[float(bar[column]) for column in self.columns])
+
+    def seed(self, data: pd.DataFrame):
+        """
+        Feed every row of a historical DataFrame and return the value for the last row.
+        """
+        _require_columns(data, self.columns)
+        arrays = [data[column].to_numpy(dtype=np.float64).tolist() for column in self.columns]
+        value = None
+        for values in zip(*arrays):
+            value = self._step(*values)
+        return value
+
+    @classmethod
+    def from_history(cls, data: pd.DataFrame, **params):
+        """
+        Create a stream and seed it from a historical DataFrame.
+
+        :param data: A Pandas DataFrame with the columns required by the indicator.
+        :param params: The indicator parameters, as accepted by the matching calculate_* function.
+        :return: The seeded stream.
+        """
+        stream = cls(**params)
+        stream.seed(data)
+        return stream
+
+
+class SMAStream(IndicatorStream):
+    """Streaming counterpart of :func:`indicators.sma.calculate_sma`."""
+
+    def __init__(self, period: int = 20):
+        self._sum = _RollingSum(period)
+
+    def _step(self, close):
+        self._sum.push(close)
+        return self._sum.mean()
+
+
+class EMAStream(IndicatorStream):
+    """Streaming counterpart of :func:`indicators.ema.calculate_ema`."""
+
+    def __init__(self, period: int = 20):
+        self._ema = _Ewm(period)
+
+    def _step(self, close):
+        return self._ema.push(close)
+
+
+class _GainLoss:
+    """
+    Splits close-to-close changes into gains and losses. A change involving a missing close (such as
+    the first bar's) counts as no change, or stays NaN with ``keep_missing``.
+    """
+
+    def __init__(self, keep_missing: bool = False):
+        self.previous_close = NAN
+        self.keep_missing = keep_missing
+
+    def push(self, close: float):
+        delta = close - self.previous_close
+        self.previous_close = close
+        if self.keep_missing:
+            return (0.0 if delta < 0 else delta), (0.0 if delta > 0 else -delta)
+        return (delta if delta > 0 else 0.0), (-delta if delta < 0 else 0.0)
+
+
+class RSIStream(IndicatorStream):
+    """Streaming counterpart of :func:`indicators.rsi.calculate_rsi`."""
+
+    def __init__(self, period: int = 14, smoothing: str = 'sma'):
+        self._changes = _GainLoss(keep_missing=smoothing != 'sma')
+        self._gains = _Average(period, smoothing)
+        self._losses = _Average(period, smoothing)
+
+    def _step(self, close):
+        gain, loss = self._changes.push(close)
+        rs = _divide(self._gains.push(gain), self._losses.push(loss))
+        return 100 - (100 / (1 + rs))
+
+
+class CMOStream(IndicatorStream):
+    """Streaming counterpart of :func:`indicators.cmo.calculate_cmo`."""
+
+    def __init__(self, period: int = 14):
+        self._changes = _GainLoss()
+        self._up = _RollingSum(period)
+        self._down = _RollingSum(period)
+
+    def _step(self, close):
+        gain, loss = self._changes.push(close)
+        up = self._up.push(gain)
+        down = self._down.push(loss)
+        return _divide(100 * (up - down), up + down)
+
+
+class MACDStream(IndicatorStream):
+    """Streaming counterpart of :func:`indicators.macd.calculate_macd`."""
+
+    def __init__(self, fast_period: int = 12, slow_period: int = 26, signal_period: int = 9):
+        self._fast = _Ewm(fast_period)
+        self._slow = _Ewm(slow_period)
+        self._signal = _Ewm(signal_period)
+
+    def _step(self, close):
+        macd_line = self._fast.push(close) - self._slow.push(close)
+        signal_line = self._signal.push(macd_line)
+        return {
+            'MACD Line': macd_line,
+            'Signal Line': signal_line,
+            'MACD Histogram': macd_line - signal_line
+        }
+
+
+class BollingerBandsStream(IndicatorStream):
+    """Streaming counterpart of :func:`indicators.bollinger_bands.calculate_bollinger_bands`."""
+
+    def __init__(self, period: int = 20, num_std_dev: int = 2, ddof: int = 1, extended: bool = False):
+        self._stats = RollingMeanStd(period, ddof)
+        self.num_std_dev = num_std_dev
+        self.extended = extended
+
+    def _step(self, close):
+        mean, rolling_std = self._stats.push(close)
+        upper_band = mean + (rolling_std * self.num_std_dev)
+        lower_band = mean - (rolling_std * self.num_std_dev)
+        bands = {'Middle Band': mean, 'Upper Band': upper_band, 'Lower Band': lower_band}
+        if self.extended:
+            width = upper_band - lower_band
+            bands['%B'] = _divide(close - lower_band, width)
+            bands['Bandwidth'] = _divide(width, mean)
+        return bands
+
+
+class ATRStream(IndicatorStream):
+    """Streaming counterpart of :func:`indicators.atr.calculate_atr`."""
+
+    columns = ('High', 'Low', 'Close')
+
+    def __init__(self, period: int = 14, smoothing: str = 'sma'):
+        self._average = _Average(period, smoothing)
+        self.previous_close = NAN
+
+    def _step(self, high, low, close):
+        true_range = _true_range(high, low, self.previous_close)
+        self.previous_close = close
+        return self._average.push(true_range)
+
+
+class KeltnerChannelsStream(IndicatorStream):
+    """Streaming counterpart of :func:`indicators.keltner.calculate_keltner_channels`."""
+
+    columns = ('High', 'Low', 'Close')
+
+    def __init__(self, ema_period: int = 20, atr_period: int = 14, multiplier: int = 2):
+        self._ema = _Ewm(ema_period)
+        self._atr = ATRStream(atr_period)
+        self.multiplier = multiplier
+
+    def _step(self, high, low, close):
+        ema = self._ema.push(close)
+        atr = self._atr._step(high, low, close)
+        return {
+            'Middle Channel': ema,
+            'Upper Channel': ema + (atr * self.multiplier),
+            'Lower Channel': ema - (atr * self.multiplier)
+        }
+
+
+class StochasticOscillatorStream(IndicatorStream):
+    """Streaming counterpart of :func:`indicators.stochastic.calculate_stochastic_oscillator`."""
+
+    columns = ('High', 'Low', 'Close')
+
+    def __init__(self, period: int = 14):
+        self._extrema = RollingExtrema(period)
+        self._percent_k = _RollingSum(3)
+
+    def _step(self, high, low, close):
+        high_max, low_min = self._extrema.push(high, low)
+        percent_k = 100 * _divide(close - low_min, high_max - low_min)
+        self._percent_k.push(percent_k)
+        return {
+            '%K': percent_k,
+            '%D': self._percent_k.mean()
+        }
+
+
+class WilliamsRStream(IndicatorStream):
+    """Streaming counterpart of :func:`indicators.williams_r.calculate_williams_r`."""
+
+    columns = ('High', 'Low', 'Close')
+
+    def __init__(self, period: int = 14):
+        self._extrema = RollingExtrema(period)
+
+    def _step(self, high, low, close):
+        high_max, low_min = self._extrema.push(high, low)
+        return _divide(-100 * (high_max - close), high_max - low_min)
+
+
+class DonchianChannelsStream(IndicatorStream):
+    """Streaming counterpart of :func:`indicators.donchian.calculate_donchian_channels`."""
+
+    columns = ('High', 'Low')
+
+    def __init__(self, period: int = 20):
+        self._extrema = RollingExtrema(period)
+
+    def _step(self, high, low):
+        upper_channel, lower_channel = self._extrema.push(high, low)
+        return {
+            'Upper Channel': upper_channel,
+            'Middle Channel': (upper_channel + lower_channel) / 2,
+            'Lower Channel': lower_channel
+        }
+
+
+def _money_flow_multiplier(high: float, low: float, close: float) -> float:
+    return _divide((close - low) - (high - close), high - low)
+
+
+class ADLStream(IndicatorStream):
+    """Streaming counterpart of :func:`indicators.adl.calculate_adl`."""
+
+    columns = ('High', 'Low', 'Close', 'Volume')
+
+    def __init__(self):
+        self.total = 0.0
+
+    def _step(self, high, low, close, volume):
+        flow = _money_flow_multiplier(high, low, close) * volume
+        if flow != flow:
+            return NAN
+        self.total += flow
+        return self.total
+
+
+class CMFStream(IndicatorStream):
+    """Streaming counterpart of :func:`indicators.cmf.calculate_cmf`."""
+
+    columns = ('High', 'Low', 'Close', 'Volume')
+
+    def __init__(self, period: int = 20):
+        self._flow = _RollingSum(period)
+        self._volume = _RollingSum(period)
+
+    def _step(self, high, low, close, volume):
+        flow = self._flow.push(_money_flow_multiplier(high, low, close) * volume)
+        total_volume = self._volume.push(volume)
+        return _divide(flow, total_volume)
+
+
+class OBVStream(IndicatorStream):
+    """Streaming counterpart of :func:`indicators.obv.calculate_obv`."""
+
+    columns = ('Close', 'Volume')
+
+    def __init__(self):
+        self.total = 0.0
+        self.previous_close = NAN
+
+    def _step(self, close, volume):
+        if close > self.previous_close:
+            self.total += volume
+        elif close < self.previous_close:
+            self.total -= volume
+        self.previous_close = close
+        return self.total
+
+
+class ParabolicSARStream(IndicatorStream):
+    """Streaming counterpart of :func:`indicators.parabolic_sar.calculate_parabolic_sar`."""
+
+    columns = ('High', 'Low')
+
+    def __init__(self, step: float = 0.02, max_step: float = 0.2):
+        self.step = step
+        self.max_step = max_step
+        self.sar = None
+        self.long_position = True
+        self.acceleration = step
+        self.extreme_point = NAN
+
+    def _step(self, high, low):
+        if self.sar is None:
+            self.sar = high
+            self.extreme_point = low
+            return self.sar
+
+        sar = self.sar + self.acceleration * (self.extreme_point - self.sar)
+        if self.long_position:
+            if low < sar:
+                self.long_position = False
+                sar = self.extreme_point
+                self.extreme_point = low
+                self.acceleration = self.step
+        elif high > sar:
+            self.long_position = True
+            sar = self.extreme_point
+            self.extreme_point = high
+            self.acceleration = self.step
+        if self.long_position and high > self.extreme_point:
+            self.extreme_point = high
+            self.acceleration = min(self.acceleration + self.step, self.max_step)
+        elif not self.long_position and low < self.extreme_point:
+            self.extreme_point = low
+            self.acceleration = min(self.acceleration + self.step, self.max_step)
+
+        self.sar = sar
+        return sar
+
+
+class CCIStream(IndicatorStream):
+    """
+    Streaming counterpart of :func:`indicators.cci.calculate_cci`.
+
+    The mean deviation is recomputed over the window on every update, so updates are O(period).
+    """
+
+    columns = ('High', 'Low', 'Close')
+
+    def __init__(self, period: int = 20):
+        self._sum = _RollingSum(period)
+
+    def _step(self, high, low, close):
+        tp = (high + low + close) / 3
+        self._sum.push(tp)
+        sma = self._sum.mean()
+        if sma != sma:
+            return NAN
+        window = np.fromiter(self._sum.window, dtype=np.float64, count=self._sum.period)
+        mean_dev = np.abs(window - window.mean()).mean()
+        return _divide(tp - sma, 0.015 * mean_dev)
+
+
+# Streams keyed by the indicator names used by :mod:`indicators.graph`.
+STREAMS = {
+    'adl': ADLStream,
+    'atr': ATRStream,
+    'bollinger_bands': BollingerBandsStream,
+    'cci': CCIStream,
+    'cmf': CMFStream,
+    'cmo': CMOStream,
+    'donchian_channels': DonchianChannelsStream,
+    'ema': EMAStream,
+    'keltner_channels': KeltnerChannelsStream,
+    'macd': MACDStream,
+    'obv': OBVStream,
+    'parabolic_sar': ParabolicSARStream,
+    'rsi': RSIStream,
+    'sma': SMAStream,
+    'stochastic_oscillator': StochasticOscillatorStream,
+    'williams_r': WilliamsRStream,
+}
@@ -0,0 +1,221 @@
+# indicators/sweep.py
+
+"""
+Parameter sweeps: evaluate an indicator for many periods in one call.
+
+Rolling means and sums for all periods are read from a single :class:`indicators.rolling.WindowSums`
+structure, so each extra period costs O(n) arithmetic instead of a full pandas rolling pass. EMAs
+for all spans are computed in one pass over the data when Numba is installed.
+
+Each sweep returns a DataFrame aligned to the input index with one column per period (or per
+(output, period...) combination for multi-output indicators). Values match the calculate_*
+functions up to floating-point rounding.
+"""
+
+import itertools
+
+import numpy as np
+import pandas as pd
+
+from ._numba import NUMBA_AVAILABLE, jit
+from .panel import field_major, is_panel
+from .rolling import WindowSums, rolling_mean_std
+
+
+def _close(data: pd.DataFrame) -> pd.Series:
+    data = field_major(data)
+    if is_panel(data):
+        raise ValueError("Parameter sweeps take a single-symbol DataFrame.")
+    if 'Close' not in data.columns:
+        raise ValueError("DataFrame must contain a 'Close' column.")
+    return data['Close']
+
+
+def _periods(periods) -> list:
+    periods = list(dict.fromkeys(int(period) for period in periods))
+    if not periods or min(periods) < 1:
+        raise ValueError("'periods' must contain at least one positive integer.")
+    return periods
+
+
+def _frame(columns: list, length: int, names) -> tuple:
+    """
+    Allocate a column-major result buffer and the DataFrame viewing it.
+    """
+    values = np.empty((length, len(columns)), dtype=np.float64, order='F')
+    if isinstance(names, str):
+        labels = pd.Index(columns, name=names)
+    else:
+        labels = pd.MultiIndex.from_tuples(columns, names=names)
+    return values, labels
+
+
+@jit
+def _ewm_kernel(values, alphas, out):
+    """
+    Fill ``out[:, j]`` with the EWM of ``values`` for ``alphas[j]`` (``adjust=False`` semantics).
+    """
+    for j in range(len(alphas)):
+        alpha = alphas[j]
+        weighted = np.nan
+        old_weight = 1.0
+        for i in range(len(values)):
+            value = values[i]
+            if weighted == weighted:
+                old_weight *= 1.0 - alpha
+                if value == value:
+                    if weighted != value:
+                        weighted = (old_weight * weighted + alpha * value) / (old_weight + alpha)
+                    old_weight = 1.0
+            elif value == value:
+                weighted = value
+            out[i, j] = weighted
+
+
+def _ewm_columns(values: np.ndarray, spans: list, out: np.ndarray):
+    """
+    Write ``Series.ewm(span=span, adjust=False).mean()`` of ``values`` for every span into ``out``.
+    """
+    if NUMBA_AVAILABLE:
+        alphas = np.array([2.0 / (span + 1.0) for span in spans])
+        _ewm_kernel(values, alphas, out)
+        return
+
+    series = pd.Series(values)
+    for j, span in enumerate(spans):
+        out[:, j] = series.ewm(span=span, adjust=False).mean().to_numpy()
+
+
+def sweep_sma(data: pd.DataFrame, periods) -> pd.DataFrame:
+    """
+    Calculate the Simple Moving Average for many periods at once.
+
+    :param data: A Pandas DataFrame containing at least the 'Close' price column.
+    :param periods: An iterable of periods, e.g. ``range(2, 201)``.
+    :return: A Pandas DataFrame with one SMA column per period.
+    """
+    close = _close(data)
+    periods = _periods(periods)
+
+    sums = WindowSums(close.to_numpy(dtype=np.float64), max(periods))
+    values, columns = _frame(periods, len(close), 'period')
+    for j, period in enumerate(periods):
+        values[:, j] = sums.mean(period)
+
+    return pd.DataFrame(values, index=close.index, columns=columns, copy=False)
+
+
+def sweep_ema(data: pd.DataFrame, periods) -> pd.DataFrame:
+    """
+    Calculate the Exponential Moving Average for many periods at once.
+
+    :param data: A Pandas DataFrame containing at least the 'Close' price column.
+    :param periods: An iterable of EMA spans.
+    :return: A Pandas DataFrame with one EMA column per period.
+    """
+    close = _close(data)
+    periods = _periods(periods)
+
+    values, columns = _frame(periods, len(close), 'period')
+    _ewm_columns(close.to_numpy(dtype=np.float64), periods, values)
+
+    return pd.DataFrame(values, index=close.index, columns=columns, copy=False)
+
+
+def sweep_rsi(data: pd.DataFrame, periods) -> pd.DataFrame:
+    """
+    Calculate the Relative Strength Index for many periods at once.
+
+    :param data: A Pandas DataFrame containing at least the 'Close' price column.
+    :param periods: An iterable of periods.
+    :return: A Pandas DataFrame with one RSI column per period.
+    """
+    close = _close(data)
+    periods = _periods(periods)
+
+    delta = np.diff(close.to_numpy(dtype=np.float64), prepend=np.nan)
+    # As in calculate_rsi, the undefined first delta counts as neither a gain nor a loss.
+    gains = WindowSums(np.where(delta > 0, delta, 0.0), max(periods))
+    losses = WindowSums(np.where(delta < 0, -delta, 0.0), max(periods))
+
+    values, columns = _frame(periods, len(close), 'period')
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for j, period in enumerate(periods):
+            rs = gains.mean(period) / losses.mean(period)
+            values[:, j] = 100 - (100 / (1 + rs))
+
+    return pd.DataFrame(values, index=close.index, columns=columns, copy=False)
+
+
+def sweep_bollinger_bands(data: pd.DataFrame, periods, num_std_dev: int = 2) -> pd.DataFrame:
+    """
+    Calculate Bollinger Bands for many periods at once.
+
+    Each period takes one :func:`indicators.rolling.rolling_mean_std` pass, as in
+    :func:`indicators.bollinger_bands.calculate_bollinger_bands`, since differences of prefix sums of
+    squares are not accurate enough for narrow bands.
+
+    :param data: A Pandas DataFrame containing at least the 'Close' price column.
+    :param periods: An iterable of periods.
+    :param num_std_dev: Number of standard deviations to calculate the upper and lower bands.
+    :return: A Pandas DataFrame with (band, period) columns, e.g. ('Upper Band', 20).
+    """
+    close = _close(data)
+    periods = _periods(periods)
+
+    prices = close.to_numpy(dtype=np.float64)
+    bands = ('Middle Band', 'Upper Band', 'Lower Band')
+    values, columns = _frame(list(itertools.product(bands, periods)), len(close), ('band', 'period'))
+    count = len(periods)
+    for j, period in enumerate(periods):
+        middle, rolling_std = rolling_mean_std(prices, period)
+        values[:, j] = middle
+        values[:, count + j] = middle + (rolling_std * num_std_dev)
+        values[:, 2 * count + j] = middle - (rolling_std * num_std_dev)
+
+    return pd.DataFrame(values, index=close.index, columns=columns, copy=False)
+
+
+def sweep_macd(data: pd.DataFrame, fast_periods=(12,), slow_periods=(26,), signal_periods=(9,)) -> pd.DataFrame:
+    """
+    Calculate the MACD over a grid of fast, slow and signal periods.
+
+    Every distinct close EMA is computed once and shared by all combinations using it. Combinations
+    where the fast period is not shorter than the slow period are skipped.
+
+    :param data: A Pandas DataFrame containing at least the 'Close' price column.
+    :param fast_periods: An iterable of fast EMA periods.
+    :param slow_periods: An iterable of slow EMA periods.
+    :param signal_periods: An iterable of signal line EMA periods.
+    :return: A Pandas DataFrame with (output, fast, slow, signal) columns, e.g. ('Signal Line', 12, 26, 9).
+    """
+    close = _close(data)
+    fast_periods = _periods(fast_periods)
+    slow_periods = _periods(slow_periods)
+    signal_periods = _periods(signal_periods)
+    pairs = [(fast, slow) for fast in fast_periods for slow in slow_periods if fast < slow]
+    if not pairs:
+        raise ValueError("At least one fast period must be shorter than a slow period.")
+
+    spans = sorted({period for pair in pairs for period in pair})
+    emas = np.empty((len(close), len(spans)), dtype=np.float64, order='F')
+    _ewm_columns(close.to_numpy(dtype=np.float64), spans, emas)
+    position = {span: j for j, span in enumerate(spans)}
+
+    outputs = ('MACD Line', 'Signal Line', 'MACD Histogram')
+    combinations = [(fast, slow, signal) for fast, slow in pairs for signal in signal_periods]
+    values, columns = _frame([(output,) + combination for output in outputs for combination in combinations],
+                             len(close), ('output', 'fast', 'slow', 'signal'))
+    count = len(combinations)
+    signals = np.empty((len(close), len(signal_periods)), dtype=np.float64, order='F')
+    j = 0
+    for fast, slow in pairs:
+        macd_line = emas[:, position[fast]] - emas[:, position[slow]]
+        _ewm_columns(macd_line, signal_periods, signals)
+        for k in range(len(signal_periods)):
+            values[:, j] = macd_line
+            values[:, count + j] = signals[:, k]
+            values[:, 2 * count + j] = macd_line - signals[:, k]
+            j += 1
+
+    return pd.DataFrame(values, index=close.index, columns=columns, copy=False)
@@ -1,22 +1,42 @@
 # indicators/williams_r.py
 
+import numpy as np
 import pandas as pd
 
+from .extrema import rolling_extrema
+from .panel import field_major, field_arrays, fields, like
 
-def calculate_williams_r(data: pd.DataFrame, period: int = 14) -> pd.Series:
+
+def williams_r_array(high, low, close, period: int = 14, dtype=np.float64) -> np.ndarray:
+    """
+    Calculate the Williams %R on plain NumPy arrays.
+
+    :param high: An array-like of high prices, one row per bar (2-D for one column per symbol).
+    :param low: An array-like of low prices with the same shape as ``high``.
+    :param close: An array-like of closing prices with the same shape as ``high``.
+    :param period: The number of periods for calculating the Williams %R.
+    :param dtype: The floating-point dtype of the computation and result, e.g. np.float32 to halve memory.
+    :return: A NumPy array with the Williams %R values.
+    """
+    close = np.asarray(close, dtype=dtype)
+    high_max, low_min = rolling_extrema(high, low, period, dtype=dtype)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return -100 * (high_max - close) / (high_max - low_min)
+
+
+def calculate_williams_r(data: pd.DataFrame, period: int = 14, dtype=np.float64) -> pd.Series:
     """
     Calculate the Williams %R for the given data.
 
     :param data: A Pandas DataFrame containing 'High', 'Low', and 'Close' columns.
     :param period: The number of periods for calculating the Williams %R.
+    :param dtype: The floating-point dtype of the computation and result, e.g. np.float32 to halve memory.
     :return: A Pandas Series representing the Williams %R values.
     """
-    if not {'High', 'Low', 'Close'}.issubset(data.columns):
+    data = field_major(data)
+    if not {'High', 'Low', 'Close'}.issubset(fields(data)):
         raise ValueError("DataFrame must contain 'High', 'Low', and 'Close' columns.")
 
-    high_max = data['High'].rolling(window=period).max()
-    low_min = data['Low'].rolling(window=period).min()
-
-    williams_r = -100 * (high_max - data['Close']) / (high_max - low_min)
-
-    return williams_r
+    template, arrays = field_arrays(data, ('High', 'Low', 'Close'), dtype)
+    return like(williams_r_array(*arrays, period, dtype), template)
@@ -0,0 +1,141 @@
+# tests/test_backtest.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from indicators import backtest as backtest_module
+from indicators import calculate_parabolic_sar, calculate_sma
+from indicators.backtest import backtest, backtest_array, hold, parameter_grid, pnl_array
+from indicators.panel import to_panel
+
+FEE = 0.0005
+
+
+def ohlcv(rows: int = 800, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.01, rows)))
+    spread = np.abs(rng.normal(0.0, 0.01, rows)) * close
+    data = pd.DataFrame({
+        'High': close + spread,
+        'Low': close - spread,
+        'Close': np.round(close, 2),
+        'Volume': np.round(rng.lognormal(8.0, 1.0, rows))
+    })
+    data.iloc[rng.choice(rows, 5, replace=False), :3] = np.nan
+    return data
+
+
+def sar_flip(data, step):
+    # Long above the Parabolic SAR, short below it.
+    return np.sign(data['Close'] - calculate_parabolic_sar(data, step=step))
+
+
+def sma_fraction(data, period, scale):
+    # A fractional position, NaN during the warm-up.
+    return scale * np.tanh(data['Close'] / calculate_sma(data, period) - 1.0)
+
+
+def event_loop(close: np.ndarray, positions: np.ndarray, fee: float) -> tuple:
+    """
+    Walk the bars of one symbol in Python, as a separate event-driven backtester would.
+    """
+    pnl = fees = turnover = peak = drawdown = 0.0
+    trades = 0
+    previous = 0.0
+    for row in range(len(close)):
+        position = 0.0 if positions[row] != positions[row] else float(positions[row])
+        if row and close[row - 1] == close[row - 1] and close[row] == close[row]:
+            pnl += previous * (close[row] / close[row - 1] - 1.0)
+        change = abs(position - previous)
+        if change:
+            turnover += change
+            trades += 1
+            fees += fee * change
+            pnl -= fee * change
+        peak = max(peak, pnl)
+        drawdown = max(drawdown, peak - pnl)
+        previous = position
+    return pnl, fees, turnover, trades, drawdown
+
+
+@pytest.fixture(params=[False, True], ids=['numpy', 'kernel'])
+def backend(request, monkeypatch):
+    # The kernel runs as plain Python without Numba, so both paths can be checked here.
+    monkeypatch.setattr(backtest_module, 'NUMBA_AVAILABLE', request.param)
+
+
+@pytest.mark.filterwarnings('ignore::RuntimeWarning')
+@pytest.mark.parametrize('strategy, params', [
+    (sar_flip, {'step': 0.02}),
+    (sma_fraction, {'period': 20, 'scale': 0.5}),
+])
+def test_backtest_array_matches_event_loop(backend, strategy, params):
+    frames = [ohlcv(seed=seed) for seed in range(3)]
+    close = np.column_stack([frame['Close'].to_numpy() for frame in frames])
+    positions = np.column_stack([np.asarray(strategy(frame, **params), dtype=np.float64) for frame in frames])
+
+    result = backtest_array(close, positions, fee=FEE)
+    for column in range(close.shape[1]):
+        expected = event_loop(close[:, column], positions[:, column], FEE)
+        actual = [metric[column] for metric in result]
+        np.testing.assert_allclose(actual, expected, rtol=1e-9, atol=1e-12)
+
+    single = backtest_array(close[:, 0], positions[:, 0], fee=FEE)
+    np.testing.assert_allclose(np.array(single, dtype=np.float64), [metric[0] for metric in result], rtol=1e-12)
+
+
+def test_pnl_array_adds_up_to_the_pnl():
+    data = ohlcv()
+    positions = sar_flip(data, 0.02)
+    pnl = pnl_array(data['Close'], positions, fee=FEE)
+    assert pnl.shape == (len(data),)
+    np.testing.assert_allclose(pnl.sum(), backtest_array(data['Close'], positions, fee=FEE).pnl, rtol=1e-9)
+
+
+@pytest.mark.filterwarnings('ignore::RuntimeWarning')
+@pytest.mark.parametrize('layout', ['single', 'panel', 'mapping'])
+def test_backtest_matches_event_loop(backend, layout):
+    frames = {f'SYM{seed}': ohlcv(seed=seed) for seed in range(5)}
+    grid = {'period': [10, 30], 'scale': [1.0, 0.25]}
+    data = {'single': frames['SYM0'], 'panel': to_panel(frames), 'mapping': frames}[layout]
+    # Two symbols per block, so the blocks are joined back together.
+    results = backtest(data, sma_fraction, grid, fee=FEE, max_cells=2 * 800)
+
+    assert list(results.columns) == ['PnL', 'Fees', 'Turnover', 'Trades', 'Max Drawdown']
+    assert results['Trades'].dtype == np.int64
+    symbols = ['SYM0'] if layout == 'single' else list(frames)
+    assert len(results) == len(parameter_grid(grid)) * len(symbols)
+    for params in parameter_grid(grid):
+        for symbol in symbols:
+            frame = frames[symbol]
+            positions = np.asarray(sma_fraction(frame, **params), dtype=np.float64)
+            expected = event_loop(frame['Close'].to_numpy(), positions, FEE)
+            key = tuple(params.values()) + (() if layout == 'single' else (symbol,))
+            np.testing.assert_allclose(results.loc[key].to_numpy(dtype=np.float64), expected, rtol=1e-9,
+                                       atol=1e-12)
+
+
+@pytest.mark.filterwarnings('ignore::RuntimeWarning')
+def test_backtest_in_worker_processes_matches_in_process():
+    frames = {f'SYM{seed}': ohlcv(seed=seed) for seed in range(4)}
+    grid = {'step': [0.01, 0.03]}
+    expected = backtest(frames, sar_flip, grid, fee=FEE, max_cells=800)
+    actual = backtest(frames, sar_flip, grid, fee=FEE, max_cells=800, workers=2)
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+def test_hold_keeps_the_position_between_events():
+    sides = np.array([0, 0, 1, 0, 0, -1, 0, -1, 1, 0])
+    np.testing.assert_array_equal(hold(sides), [0, 0, 1, 1, 1, -1, -1, -1, 1, 1])
+    np.testing.assert_array_equal(hold(sides, long_only=True), [0, 0, 1, 1, 1, 0, 0, 0, 1, 1])
+    np.testing.assert_array_equal(hold(np.column_stack([sides, -sides]))[:, 1], -hold(sides))
+
+
+def test_parameter_grid():
+    assert parameter_grid(None) == [{}]
+    assert parameter_grid({'a': [1, 2], 'b': [3]}) == [{'a': 1, 'b': 3}, {'a': 2, 'b': 3}]
+    with pytest.raises(ValueError, match="'grid' must contain at least one parameter set."):
+        parameter_grid([])
+    with pytest.raises(ValueError, match='Every parameter set must have the same parameters.'):
+        parameter_grid([{'a': 1}, {'b': 2}])
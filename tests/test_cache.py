@@ -0,0 +1,156 @@
+# tests/test_cache.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import indicators
+from indicators.cache import IndicatorCache, disable_cache, enable_cache
+from indicators.instrument import disable_instrumentation, enable_instrumentation
+from indicators.panel import to_panel
+from indicators.rsi import calculate_rsi
+from indicators.sma import calculate_sma
+
+
+def ohlcv(rows: int = 300, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.01, rows)))
+    return pd.DataFrame({
+        'High': close * 1.01,
+        'Low': close * 0.99,
+        'Close': close,
+        'Volume': np.round(rng.lognormal(8.0, 1.0, rows))
+    })
+
+
+@pytest.fixture
+def restore_exports():
+    # Tests that install wrappers over the package functions remove them again, whatever happens.
+    yield
+    disable_cache()
+    disable_instrumentation()
+
+
+def test_wrapped_function_is_computed_once():
+    cache = IndicatorCache()
+    rsi = cache.wrap(calculate_rsi)
+    data = ohlcv()
+    first = rsi(data, 14)
+    second = rsi(data.copy(), period=14)
+    pd.testing.assert_series_equal(first, calculate_rsi(data))
+    pd.testing.assert_series_equal(second, first)
+    assert cache.stats['hits'] == 1 and cache.stats['misses'] == 1
+
+
+def test_cached_values_are_copies():
+    cache = IndicatorCache()
+    sma = cache.wrap(calculate_sma)
+    data = ohlcv()
+    sma(data)
+    hit = sma(data)
+    hit.iloc[:] = 0.0
+    pd.testing.assert_series_equal(sma(data), calculate_sma(data))
+
+
+def test_key_depends_only_on_what_the_function_reads():
+    cache = IndicatorCache()
+    data = ohlcv()
+    key = cache.key(calculate_sma, data)
+
+    assert cache.key(calculate_sma, data.assign(Extra=1.0)) == key
+    assert cache.key(calculate_sma, data.drop(columns='Volume')) == key
+    assert cache.key(calculate_sma, data, period=20) == key
+
+    changed = data.copy()
+    changed.loc[10, 'Close'] += 1e-9
+    assert cache.key(calculate_sma, changed) != key
+    assert cache.key(calculate_sma, data, period=21) != key
+    assert cache.key(calculate_sma, data.set_axis(data.index + 1)) != key
+    assert cache.key(calculate_rsi, data) != key
+
+
+def test_key_of_a_panel_depends_on_its_symbols():
+    cache = IndicatorCache()
+    frames = {'AAA': ohlcv(seed=1), 'BBB': ohlcv(seed=2)}
+    key = cache.key(calculate_sma, to_panel(frames))
+    assert cache.key(calculate_sma, to_panel({'AAA': frames['AAA'], 'CCC': frames['BBB']})) != key
+
+
+def test_least_recently_used_entries_are_evicted():
+    data = ohlcv()
+    size = calculate_sma(data).memory_usage(deep=False)
+    cache = IndicatorCache(max_bytes=int(2.5 * size))
+    sma = cache.wrap(calculate_sma)
+    for period in (5, 10, 5, 20):
+        sma(data, period)
+
+    assert cache.stats['entries'] == 2
+    assert cache.stats['evictions'] == 1
+    assert cache.stats['bytes'] <= cache.max_bytes
+    sma(data, 5)
+    sma(data, 10)
+    assert cache.stats['hits'] == 2 and cache.stats['misses'] == 4
+
+
+def test_results_larger_than_the_budget_are_not_kept():
+    cache = IndicatorCache(max_bytes=10)
+    sma = cache.wrap(calculate_sma)
+    sma(ohlcv())
+    assert cache.stats['entries'] == 0
+
+
+def test_disk_tier_survives_a_new_cache(tmp_path):
+    data = ohlcv()
+    IndicatorCache(directory=str(tmp_path)).wrap(calculate_rsi)(data)
+
+    cache = IndicatorCache(directory=str(tmp_path))
+    pd.testing.assert_series_equal(cache.wrap(calculate_rsi)(data), calculate_rsi(data))
+    assert cache.stats['disk_hits'] == 1
+
+    cache.clear(disk=True)
+    assert not list(tmp_path.iterdir())
+    assert cache.stats['hits'] == 0
+
+
+def test_enable_cache_memoizes_the_exported_functions(restore_exports):
+    original = indicators.calculate_macd
+    data = ohlcv()
+    cache = enable_cache()
+    indicators.calculate_macd(data)
+    indicators.compute_indicators(data, ['rsi', 'sma'])
+    indicators.compute_indicators(data.assign(Extra=1.0), ['rsi', 'sma'])
+    pd.testing.assert_frame_equal(indicators.calculate_macd(data), original(data))
+    assert cache.stats['hits'] == 2 and cache.stats['misses'] == 2
+
+    disable_cache()
+    assert indicators.calculate_macd is original
+
+
+@pytest.mark.parametrize('first_disabled', ['cache', 'instrumentation'])
+def test_cache_and_instrumentation_are_disabled_in_any_order(restore_exports, first_disabled):
+    original = indicators.calculate_sma
+    data = ohlcv()
+    cache = enable_cache()
+    registry = enable_instrumentation()
+
+    if first_disabled == 'cache':
+        disable_cache()
+        indicators.calculate_sma(data)
+        indicators.calculate_sma(data)
+        assert registry.snapshot()['calculate_sma']['calls'] == 2
+        assert cache.stats['misses'] == 0
+        disable_instrumentation()
+    else:
+        disable_instrumentation()
+        indicators.calculate_sma(data)
+        indicators.calculate_sma(data)
+        assert cache.stats['hits'] == 1
+        assert registry.snapshot() == {}
+        disable_cache()
+
+    assert indicators.calculate_sma is original
+
+
+def test_max_bytes_is_validated():
+    with pytest.raises(ValueError, match="'max_bytes' must not be negative."):
+        IndicatorCache(max_bytes=-1)
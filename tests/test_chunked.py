@@ -0,0 +1,71 @@
+# tests/test_chunked.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from indicators import compute_indicators
+from indicators.chunked import ChunkedComputation
+from indicators.graph import INDICATORS
+from indicators.panel import to_panel
+
+SPECS = sorted(INDICATORS) + [
+    ('bollinger_bands', {'ddof': 0, 'extended': True}),
+    ('macd', {'fast_period': 5, 'slow_period': 35}),
+]
+
+
+def ohlcv(rows: int = 700, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.01, rows)))
+    spread = np.abs(rng.normal(0.0, 0.01, rows)) * close
+    data = pd.DataFrame({
+        'High': close + spread,
+        'Low': close - spread,
+        'Close': np.round(close, 2),
+        'Volume': np.round(rng.lognormal(8.0, 1.0, rows))
+    })
+    data.iloc[300:320] = np.nan
+    data.iloc[rng.choice(rows, 5, replace=False), :3] = np.nan
+    return data
+
+
+def in_blocks(data: pd.DataFrame, block_rows: int) -> tuple:
+    computation = ChunkedComputation(SPECS)
+    blocks = [computation.update(data.iloc[start:start + block_rows]) for start in range(0, len(data), block_rows)]
+    return computation, pd.concat(blocks)
+
+
+def assert_matches(actual: pd.DataFrame, expected: pd.DataFrame):
+    # Rolling windows restart their running sums at each block, so values agree up to rounding.
+    assert list(actual.columns) == list(expected.columns)
+    assert actual.index.equals(expected.index)
+    np.testing.assert_allclose(actual.to_numpy(dtype=np.float64), expected.to_numpy(dtype=np.float64), rtol=1e-9,
+                               atol=1e-9, equal_nan=True)
+
+
+@pytest.mark.filterwarnings('ignore::RuntimeWarning')
+@pytest.mark.parametrize('block_rows', [25, 64, 310, 1_000])
+def test_blocks_match_in_memory_computation(block_rows):
+    data = ohlcv()
+    computation, result = in_blocks(data, block_rows)
+    assert_matches(result, compute_indicators(data, SPECS))
+    assert computation.blocks == -(-len(data) // block_rows)
+    assert computation.rows == len(data)
+
+
+@pytest.mark.filterwarnings('ignore::RuntimeWarning')
+def test_panel_blocks_match_in_memory_computation():
+    data = to_panel({'AAA': ohlcv(seed=1), 'BBB': ohlcv(seed=2)})
+    _, result = in_blocks(data, 150)
+    assert_matches(result, compute_indicators(data, SPECS))
+
+
+def test_duplicate_labels_are_rejected():
+    with pytest.raises(ValueError, match="Duplicate indicator label 'RSI_14'."):
+        ChunkedComputation(['rsi', ('rsi', {'period': 14})])
+
+
+def test_recursive_smoothing_is_rejected():
+    with pytest.raises(ValueError, match="only smoothing='sma' is supported incrementally"):
+        ChunkedComputation([('rsi', {'smoothing': 'ema'})])
@@ -0,0 +1,91 @@
+# tests/test_columnar.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from indicators.columnar import Columns
+from indicators.registry import REGISTRY, load
+
+pa = pytest.importorskip('pyarrow')
+
+
+def ohlcv(rows: int = 300, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.01, rows)))
+    spread = np.abs(rng.normal(0.0, 0.01, rows)) * close
+    return pd.DataFrame({
+        'High': close + spread,
+        'Low': close - spread,
+        'Close': np.round(close, 2),
+        'Volume': np.round(rng.lognormal(8.0, 1.0, rows))
+    })
+
+
+def structured(data: pd.DataFrame) -> np.ndarray:
+    return data.to_records(index=False)
+
+
+def to_arrays(result) -> dict:
+    """
+    Return the output columns of a result in any supported format as float arrays.
+    """
+    if isinstance(result, (pd.Series, pd.DataFrame)):
+        frame = result.to_frame('value') if isinstance(result, pd.Series) else result
+        return {column: frame[column].to_numpy(dtype=np.float64) for column in frame.columns}
+    if isinstance(result, np.ndarray):
+        if result.dtype.names is None:
+            return {'value': result}
+        return {name: result[name] for name in result.dtype.names}
+    if isinstance(result, (pa.Table, pa.RecordBatch)):
+        return {name: np.asarray(result.column(name).to_numpy(), dtype=np.float64) for name in result.column_names}
+    return {'value': np.asarray(result.to_numpy(zero_copy_only=False), dtype=np.float64)}
+
+
+FORMATS = {
+    'table': pa.Table.from_pandas,
+    'chunked_table': lambda data: pa.concat_tables([pa.Table.from_pandas(data.iloc[:100]),
+                                                    pa.Table.from_pandas(data.iloc[100:])]),
+    'record_batch': lambda data: pa.RecordBatch.from_pandas(data, preserve_index=False),
+    'structured': structured,
+}
+
+RESULT_TYPES = {
+    'table': (pa.ChunkedArray, pa.Table),
+    'chunked_table': (pa.ChunkedArray, pa.Table),
+    'record_batch': (pa.Array, pa.RecordBatch),
+    'structured': (np.ndarray, np.ndarray),
+}
+
+
+@pytest.mark.filterwarnings('ignore::RuntimeWarning')
+@pytest.mark.parametrize('format', sorted(FORMATS))
+@pytest.mark.parametrize('name', sorted(REGISTRY))
+def test_columnar_input_matches_pandas(name, format):
+    data = ohlcv()
+    expected = load(name)(data)
+    actual = load(name)(FORMATS[format](data))
+
+    single, multiple = RESULT_TYPES[format]
+    assert isinstance(actual, multiple if REGISTRY[name].outputs else single)
+    expected, actual = to_arrays(expected), to_arrays(actual)
+    assert list(actual) == list(expected)
+    for column, values in expected.items():
+        np.testing.assert_array_equal(actual[column], values, err_msg=f'{name} {column}')
+
+
+def test_arrow_nulls_are_missing_values():
+    data = ohlcv()
+    close = data['Close'].to_numpy().copy()
+    close[[10, 11]] = np.nan
+    table = pa.table({'Close': pa.array(close, from_pandas=True)})
+    assert table.column('Close').null_count == 2
+
+    expected = load('sma')(pd.DataFrame({'Close': close}), period=5)
+    np.testing.assert_array_equal(to_arrays(load('sma')(table, period=5))['value'], expected.to_numpy())
+
+
+def test_structured_array_is_read_without_copying():
+    records = structured(ohlcv())
+    close = Columns(records)['Close'].to_numpy()
+    assert np.shares_memory(close, records)
@@ -0,0 +1,89 @@
+# tests/test_extrema.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from indicators import extrema
+from indicators.extrema import RollingExtrema, rolling_extrema
+
+PERIODS = [1, 2, 7, 50]
+
+
+def bars(rows: int = 500, columns: int = 3, seed: int = 0) -> tuple:
+    """
+    Generate highs and lows with missing values and repeated extremes (prices on a coarse tick).
+    """
+    rng = np.random.default_rng(seed)
+    close = np.round(100.0 + np.cumsum(rng.normal(0.0, 0.5, (rows, columns)), axis=0), 0)
+    high = close + rng.integers(0, 3, close.shape)
+    low = close - rng.integers(0, 3, close.shape)
+    high[rng.random(high.shape) < 0.01] = np.nan
+    low[rng.random(low.shape) < 0.01] = np.nan
+    return high, low
+
+
+def naive_positions(values: np.ndarray, period: int, maximum: bool) -> np.ndarray:
+    # The row of the most recent occurrence of each window's extreme, -1 where the window is not full or has NaN.
+    at = np.full(values.shape, -1, dtype=np.int64)
+    for end in range(period, len(values) + 1):
+        for column in range(values.shape[1]):
+            window = values[end - period:end, column]
+            if not np.isnan(window).any():
+                extreme = window.max() if maximum else window.min()
+                at[end - 1, column] = end - period + np.flatnonzero(window == extreme)[-1]
+    return at
+
+
+@pytest.fixture(params=[False, True], ids=['numpy', 'kernel'])
+def backend(request, monkeypatch):
+    # The kernel runs as plain Python without Numba, so both paths can be checked here.
+    monkeypatch.setattr(extrema, 'NUMBA_AVAILABLE', request.param)
+
+
+@pytest.mark.parametrize('period', PERIODS)
+def test_rolling_extrema_match_pandas(backend, period):
+    high, low = bars()
+    upper, lower, upper_at, lower_at = rolling_extrema(high, low, period, positions=True)
+
+    np.testing.assert_array_equal(upper, pd.DataFrame(high).rolling(period).max().to_numpy())
+    np.testing.assert_array_equal(lower, pd.DataFrame(low).rolling(period).min().to_numpy())
+    np.testing.assert_array_equal(upper_at, naive_positions(high, period, True))
+    np.testing.assert_array_equal(lower_at, naive_positions(low, period, False))
+
+
+def test_rolling_extrema_of_one_column_match_a_series(backend):
+    high, low = bars(columns=1)
+    upper, lower = rolling_extrema(high[:, 0], low[:, 0], 20)
+    assert upper.shape == lower.shape == (len(high),)
+    np.testing.assert_array_equal(upper, pd.Series(high[:, 0]).rolling(20).max())
+    np.testing.assert_array_equal(lower, pd.Series(low[:, 0]).rolling(20).min())
+
+
+def test_rolling_extrema_of_short_input_are_missing(backend):
+    upper, lower, upper_at, lower_at = rolling_extrema(np.arange(3.0), np.arange(3.0), 5, positions=True)
+    assert np.isnan(upper).all() and np.isnan(lower).all()
+    assert (upper_at == -1).all() and (lower_at == -1).all()
+
+
+@pytest.mark.parametrize('period', PERIODS)
+def test_rolling_extrema_stream_matches_batch(period):
+    high, low = bars(columns=1)
+    high, low = high[:, 0], low[:, 0]
+    stream = RollingExtrema(period)
+    streamed = []
+    for values in zip(high.tolist(), low.tolist()):
+        streamed.append(stream.push(*values) + (stream.high_max_at, stream.low_min_at))
+
+    expected = rolling_extrema(high, low, period, positions=True)
+    for actual, wanted in zip(zip(*streamed), expected):
+        np.testing.assert_array_equal(np.array(actual), wanted)
+
+
+def test_rolling_extrema_validate_their_arguments():
+    with pytest.raises(ValueError, match="'period' must be a positive integer."):
+        rolling_extrema(np.arange(3.0), np.arange(3.0), 0)
+    with pytest.raises(ValueError, match="'high' and 'low' must have the same shape."):
+        rolling_extrema(np.arange(3.0), np.arange(4.0), 2)
+    with pytest.raises(ValueError, match="'period' must be a positive integer."):
+        RollingExtrema(0)
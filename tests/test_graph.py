@@ -0,0 +1,104 @@
+# tests/test_graph.py
+
+import inspect
+import re
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import indicators
+from indicators import compute_indicators
+from indicators.graph import INDICATORS, parse_spec
+from indicators.panel import to_panel
+from indicators.registry import REGISTRY, load
+from indicators.runner import parse_indicator
+
+# Options checked on top of the defaults.
+OPTIONS = [
+    ('rsi', {'smoothing': 'wilder'}),
+    ('rsi', {'period': 10, 'smoothing': 'ema'}),
+    ('atr', {'smoothing': 'wilder'}),
+    ('bollinger_bands', {'ddof': 0, 'extended': True}),
+]
+
+
+def ohlcv(rows: int = 600, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.01, rows)))
+    spread = np.abs(rng.normal(0.0, 0.01, rows)) * close
+    data = pd.DataFrame({
+        'High': close + spread,
+        'Low': close - spread,
+        'Close': close,
+        'Volume': np.round(rng.lognormal(8.0, 1.0, rows))
+    })
+    data.iloc[[50, 51, 300]] = np.nan
+    return data
+
+
+@pytest.mark.parametrize('name', sorted(REGISTRY))
+def test_registry_params_are_accepted_by_graph_and_calculate(name):
+    def defaults(func):
+        return {key: parameter.default for key, parameter in inspect.signature(func).parameters.items()
+                if key not in ('data', 'dtype')}
+
+    graph_params = defaults(INDICATORS[name])
+    calculate_params = defaults(load(name))
+    assert graph_params == REGISTRY[name].params == calculate_params
+
+
+@pytest.mark.parametrize('panel', [False, True], ids=['single', 'panel'])
+def test_compute_indicators_matches_calculate(panel):
+    data = to_panel({'A': ohlcv(seed=1), 'B': ohlcv(seed=2)}) if panel else ohlcv()
+    specs = [(name, {}) for name in sorted(INDICATORS)] + OPTIONS
+    result = compute_indicators(data, specs)
+
+    expected = {}
+    for spec in specs:
+        name, params, label = parse_spec(spec)
+        output = getattr(indicators, f'calculate_{name}')(data, **params)
+        if REGISTRY[name].outputs:
+            for column in output.columns.get_level_values(0).unique():
+                expected[f'{label} {column}'] = output[column]
+        else:
+            expected[label] = output
+
+    assert list(result.columns.get_level_values(0).unique()) == list(expected)
+    for column, values in expected.items():
+        np.testing.assert_allclose(np.asarray(result[column], dtype=np.float64),
+                                   np.asarray(values, dtype=np.float64), rtol=1e-12, equal_nan=True)
+
+
+def test_labels_of_default_variants_are_unchanged():
+    assert parse_spec('rsi') == ('rsi', {'period': 14}, 'RSI_14')
+    assert parse_spec(('bollinger_bands', {'ddof': 1})) == \
+        ('bollinger_bands', {'period': 20, 'num_std_dev': 2}, 'BOLLINGER_BANDS_20_2')
+    assert parse_spec(('rsi', {'smoothing': 'wilder'})) == \
+        ('rsi', {'period': 14, 'smoothing': 'wilder'}, 'RSI_14_smoothing=wilder')
+
+
+@pytest.mark.parametrize('spec, message', [
+    (('rsi', {'smooth': 'wilder'}), "Unknown parameter 'smooth' for indicator 'rsi'."),
+    (('sma', {'period': 'abc'}), "Invalid value 'abc' for parameter 'period' of indicator 'sma'."),
+    (('atr', {'smoothing': 'median'}), "'smoothing' must be one of"),
+])
+def test_invalid_params_raise_value_error(spec, message):
+    with pytest.raises(ValueError, match=re.escape(message)):
+        compute_indicators(ohlcv(), [spec])
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('rsi', ('rsi', {})),
+    ('macd:fast_period=5,slow_period=35', ('macd', {'fast_period': 5, 'slow_period': 35})),
+    ('parabolic_sar:step=1e-2', ('parabolic_sar', {'step': 0.01})),
+    ('rsi:period=21,smoothing=wilder', ('rsi', {'period': 21, 'smoothing': 'wilder'})),
+    ('bollinger_bands:ddof=0,extended=true', ('bollinger_bands', {'ddof': 0, 'extended': True})),
+])
+def test_parse_indicator(text, expected):
+    assert parse_indicator(text) == expected
+
+
+def test_parse_indicator_requires_key_value():
+    with pytest.raises(ValueError, match='expected key=value'):
+        parse_indicator('rsi:21')
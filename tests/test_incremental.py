@@ -0,0 +1,111 @@
+# tests/test_incremental.py
+
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from indicators.graph import INDICATORS
+from indicators.incremental import calculate_with_state, extend
+from indicators.panel import to_panel
+from indicators.registry import load
+
+# Row positions the history is split at: right after the warm-up, inside a gap of missing bars and
+# close to the end.
+SPLITS = [(30,), (205, 207), (50, 480, 499)]
+
+
+def ohlcv(rows: int = 500, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.01, rows)))
+    spread = np.abs(rng.normal(0.0, 0.01, rows)) * close
+    data = pd.DataFrame({
+        'High': close + spread,
+        'Low': close - spread,
+        'Close': np.round(close, 2),
+        'Volume': np.round(rng.lognormal(8.0, 1.0, rows))
+    })
+    data.iloc[200:210] = np.nan
+    data.iloc[rng.choice(rows, 5, replace=False), :3] = np.nan
+    return data
+
+
+def extended(name: str, data: pd.DataFrame, splits, **params) -> pd.DataFrame:
+    """
+    Compute an indicator over the first rows and extend it piece by piece over the rest.
+    """
+    bounds = list(splits) + [len(data)]
+    result, state = calculate_with_state(name, data.iloc[:bounds[0]], **params)
+    pieces = [result]
+    for start, stop in zip(bounds, bounds[1:]):
+        new_rows, state = extend(pieces[-1], state, data.iloc[start:stop])
+        pieces.append(new_rows)
+    return pd.concat(pieces)
+
+
+def assert_matches(actual, expected):
+    assert actual.index.equals(expected.index)
+    np.testing.assert_allclose(actual.to_numpy(dtype=np.float64), expected.to_numpy(dtype=np.float64), rtol=1e-12,
+                               atol=1e-9, equal_nan=True)
+
+
+@pytest.mark.filterwarnings('ignore::RuntimeWarning')
+@pytest.mark.parametrize('splits', SPLITS, ids=str)
+@pytest.mark.parametrize('name', sorted(INDICATORS))
+def test_extend_matches_full_recompute(name, splits):
+    data = ohlcv()
+    assert_matches(extended(name, data, splits), load(name)(data))
+
+
+@pytest.mark.filterwarnings('ignore::RuntimeWarning')
+@pytest.mark.parametrize('name', sorted(INDICATORS))
+def test_extend_matches_full_recompute_on_a_panel(name):
+    data = to_panel({'AAA': ohlcv(seed=1), 'BBB': ohlcv(seed=2)})
+    assert_matches(extended(name, data, (120, 300)), load(name)(data))
+
+
+@pytest.mark.parametrize('name, params', [
+    ('bollinger_bands', {'period': 5, 'ddof': 0, 'extended': True}),
+    ('macd', {'fast_period': 3, 'slow_period': 8, 'signal_period': 4}),
+    ('parabolic_sar', {'step': 0.05, 'max_step': 0.3}),
+])
+def test_extend_matches_full_recompute_with_parameters(name, params):
+    data = ohlcv()
+    assert_matches(extended(name, data, (100,), **params), load(name)(data, **params))
+
+
+def test_state_survives_pickling():
+    data = ohlcv()
+    result, state = calculate_with_state('macd', data.iloc[:300])
+    state = pickle.loads(pickle.dumps(state))
+    new_rows, _ = extend(result, state, data.iloc[300:])
+    assert_matches(pd.concat([result, new_rows]), load('macd')(data))
+
+
+def test_extend_leaves_the_previous_state_unchanged():
+    data = ohlcv()
+    result, state = calculate_with_state('obv', data.iloc[:300])
+    first, _ = extend(result, state, data.iloc[300:])
+    second, _ = extend(result, state, data.iloc[300:])
+    assert_matches(first, second)
+
+
+def test_extend_rejects_a_state_of_another_result():
+    data = ohlcv()
+    result, state = calculate_with_state('sma', data.iloc[:300])
+    newer, _ = extend(result, state, data.iloc[300:400])
+    with pytest.raises(ValueError, match="'previous_state' does not belong to 'previous_result'"):
+        extend(newer, state, data.iloc[400:])
+
+
+def test_extend_requires_the_indicator_columns():
+    result, state = calculate_with_state('atr', ohlcv().iloc[:300])
+    with pytest.raises(ValueError, match="DataFrame must contain 'High', 'Low' columns."):
+        extend(result, state, ohlcv().iloc[300:][['Close']])
+
+
+@pytest.mark.parametrize('name', ['rsi', 'atr'])
+def test_recursive_smoothing_cannot_be_extended(name):
+    with pytest.raises(ValueError, match="only smoothing='sma' is supported incrementally"):
+        calculate_with_state(name, ohlcv(), smoothing='wilder')
@@ -0,0 +1,171 @@
+# tests/test_ingest.py
+
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from indicators import ingest
+from indicators.ingest import META_FILE, PriceCache
+
+
+def ohlcv(rows: int = 200, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = np.round(100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.01, rows))), 2)
+    return pd.DataFrame({
+        'Date': pd.date_range('2024-01-01', periods=rows, freq='h').strftime('%Y-%m-%d %H:%M:%S'),
+        'Open': np.roll(close, 1),
+        'High': close + 0.5,
+        'Low': close - 0.5,
+        'Close': close,
+        'Volume': np.round(rng.lognormal(8.0, 1.0, rows))
+    })
+
+
+def parsed(path: str) -> pd.DataFrame:
+    data = pd.read_csv(path)
+    data['Date'] = pd.to_datetime(data['Date']).astype('datetime64[ns]')
+    return data
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = str(tmp_path / 'AAA.csv')
+    ohlcv().to_csv(path, index=False)
+    return path
+
+
+@pytest.fixture
+def ingests(monkeypatch):
+    # Count the parses, so the tests can tell a reload from a re-ingest.
+    calls = []
+    original = PriceCache.ingest
+
+    def counting(self, file_path):
+        calls.append(file_path)
+        return original(self, file_path)
+
+    monkeypatch.setattr(PriceCache, 'ingest', counting)
+    return calls
+
+
+def rewrite(path: str, data: pd.DataFrame, keep_mtime: bool = False):
+    """
+    Overwrite a source with new content, moving its modification time forward unless ``keep_mtime`` is set.
+    """
+    stat = os.stat(path)
+    data.to_csv(path, index=False)
+    mtime_ns = stat.st_mtime_ns if keep_mtime else stat.st_mtime_ns + 10 ** 9
+    os.utime(path, ns=(stat.st_atime_ns, mtime_ns))
+
+
+def shuffled_closes() -> pd.DataFrame:
+    # The same values in another order, so the file keeps its size.
+    data = ohlcv()
+    data['Close'] = data['Close'].iloc[::-1].to_numpy()
+    return data
+
+
+def test_load_matches_the_parsed_csv(source, tmp_path, ingests):
+    cache = PriceCache(str(tmp_path / 'cache'))
+    first = cache.load(source)
+    second = cache.load(source)
+    pd.testing.assert_frame_equal(first, parsed(source))
+    pd.testing.assert_frame_equal(second, parsed(source))
+    assert len(ingests) == 1
+    assert not second['Close'].to_numpy().flags.writeable
+
+
+def test_arrays_are_memory_mapped(source, tmp_path):
+    arrays = PriceCache(str(tmp_path / 'cache')).arrays(source)
+    assert isinstance(arrays['Close'], np.memmap)
+    assert arrays['Date'].dtype == np.dtype('datetime64[ns]')
+
+
+def test_size_change_reingests(source, tmp_path, ingests):
+    cache = PriceCache(str(tmp_path / 'cache'))
+    cache.load(source)
+    rewrite(source, ohlcv(rows=250))
+    pd.testing.assert_frame_equal(cache.load(source), parsed(source))
+    assert len(ingests) == 2
+
+
+def test_touched_file_keeps_its_entry(source, tmp_path, ingests):
+    cache = PriceCache(str(tmp_path / 'cache'))
+    cache.load(source)
+    os.utime(source, ns=(os.stat(source).st_atime_ns, os.stat(source).st_mtime_ns + 10 ** 9))
+    pd.testing.assert_frame_equal(cache.load(source), parsed(source))
+    assert len(ingests) == 1
+
+    # The new modification time is recorded, so the next load does not hash the file again.
+    with open(os.path.join(cache.path(source), META_FILE)) as file:
+        assert json.load(file)['mtime_ns'] == os.stat(source).st_mtime_ns
+
+
+def test_same_size_and_new_content_reingests(source, tmp_path, ingests):
+    cache = PriceCache(str(tmp_path / 'cache'))
+    cache.load(source)
+    size = os.path.getsize(source)
+    rewrite(source, shuffled_closes())
+    assert os.path.getsize(source) == size
+    pd.testing.assert_frame_equal(cache.load(source), parsed(source))
+    assert len(ingests) == 2
+
+
+def test_hash_verification_catches_changes_hidden_from_stat(source, tmp_path, ingests):
+    stat_cache = PriceCache(str(tmp_path / 'cache'))
+    hash_cache = PriceCache(str(tmp_path / 'cache'), verify='hash')
+    original = stat_cache.load(source).copy()
+
+    # Same size and modification time, different content.
+    size = os.path.getsize(source)
+    rewrite(source, shuffled_closes(), keep_mtime=True)
+    assert os.path.getsize(source) == size
+
+    pd.testing.assert_frame_equal(stat_cache.load(source), original)
+    assert len(ingests) == 1
+    pd.testing.assert_frame_equal(hash_cache.load(source), parsed(source))
+    assert len(ingests) == 2
+
+
+def test_stale_or_damaged_metadata_reingests(source, tmp_path, monkeypatch, ingests):
+    cache = PriceCache(str(tmp_path / 'cache'))
+    cache.load(source)
+    monkeypatch.setattr(ingest, 'CACHE_VERSION', ingest.CACHE_VERSION + 1)
+    cache.load(source)
+    assert len(ingests) == 2
+
+    with open(os.path.join(cache.path(source), META_FILE), 'w') as file:
+        file.write('{')
+    pd.testing.assert_frame_equal(cache.load(source), parsed(source))
+    assert len(ingests) == 3
+
+
+def test_time_zones_are_restored(tmp_path):
+    data = ohlcv(rows=48)
+    # Daylight saving time starts on 2024-03-31 in Europe/Berlin, so the offsets change within the file.
+    dates = pd.date_range('2024-03-30', periods=48, freq='h', tz='Europe/Berlin')
+    data['Date'] = dates.strftime('%Y-%m-%d %H:%M:%S%z')
+    path = str(tmp_path / 'BERLIN.csv')
+    data.to_csv(path, index=False)
+
+    loaded = PriceCache(str(tmp_path / 'cache')).load(path)
+    assert (loaded['Date'] == dates).all()
+
+
+def test_entries_are_kept_per_source_path(tmp_path):
+    cache = PriceCache(str(tmp_path / 'cache'))
+    first, second = tmp_path / 'a', tmp_path / 'b'
+    first.mkdir()
+    second.mkdir()
+    ohlcv(seed=1).to_csv(first / 'AAA.csv', index=False)
+    ohlcv(seed=2).to_csv(second / 'AAA.csv', index=False)
+    assert cache.path(str(first / 'AAA.csv')) != cache.path(str(second / 'AAA.csv'))
+    pd.testing.assert_frame_equal(cache.load(str(second / 'AAA.csv')), parsed(str(second / 'AAA.csv')))
+
+
+def test_verify_is_validated(tmp_path):
+    with pytest.raises(ValueError, match="'verify' must be 'stat' or 'hash'."):
+        PriceCache(str(tmp_path), verify='size')
@@ -0,0 +1,87 @@
+# tests/test_instrument.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import indicators
+from indicators.instrument import (MetricsRegistry, SpanRecorder, disable_instrumentation, enable_instrumentation,
+                                   instrument)
+from indicators.sma import calculate_sma
+
+
+def closes(rows: int = 100) -> pd.DataFrame:
+    return pd.DataFrame({'Close': np.linspace(100.0, 110.0, rows)})
+
+
+def test_instrumented_calls_are_recorded():
+    registry = MetricsRegistry()
+    spans = SpanRecorder()
+    sma = instrument(calculate_sma, registry, on_span=spans)
+
+    result = sma(closes(), 5)
+    pd.testing.assert_series_equal(result, calculate_sma(closes(), 5))
+    with pytest.raises(ValueError):
+        sma(pd.DataFrame({'Open': [1.0]}))
+
+    metrics = registry.snapshot()['calculate_sma']
+    assert metrics['calls'] == 2 and metrics['errors'] == 1
+    assert metrics['rows'] == 101
+    assert metrics['output_bytes'] == result.memory_usage(deep=False)
+    assert [span.error for span in spans.spans] == [None, 'ValueError']
+    assert spans.spans[0].rows == 100 and spans.spans[0].function == 'calculate_sma'
+
+    events = spans.chrome_trace()
+    assert [event['name'] for event in events] == ['calculate_sma'] * 2
+    assert events[1]['args']['error'] == 'ValueError'
+
+
+def test_snapshot_is_sorted_by_total_time():
+    registry = MetricsRegistry()
+    registry.record('fast', 0.001)
+    registry.record('slow', 0.5, rows=1_000)
+    registry.record('fast', 0.002)
+    snapshot = registry.snapshot()
+    assert list(snapshot) == ['slow', 'fast']
+    assert snapshot['fast']['calls'] == 2
+    assert snapshot['fast']['mean_seconds'] == pytest.approx(0.0015)
+    assert snapshot['slow']['rows_per_second'] == pytest.approx(2_000)
+
+    registry.reset()
+    assert registry.snapshot() == {}
+
+
+def test_prometheus_text(tmp_path):
+    registry = MetricsRegistry(buckets=(0.01, 0.1))
+    registry.record('calculate_rsi', 0.005, rows=10, output_bytes=80)
+    registry.record('calculate_rsi', 0.05, rows=10, output_bytes=80, error=True)
+    registry.record('calculate_rsi', 5.0, rows=10, output_bytes=80)
+
+    lines = registry.to_prometheus().splitlines()
+    assert 'indicator_calls_total{function="calculate_rsi"} 3' in lines
+    assert 'indicator_errors_total{function="calculate_rsi"} 1' in lines
+    assert 'indicator_rows_total{function="calculate_rsi"} 30' in lines
+    assert 'indicator_output_bytes_total{function="calculate_rsi"} 240' in lines
+    assert 'indicator_duration_seconds_bucket{function="calculate_rsi",le="0.01"} 1' in lines
+    assert 'indicator_duration_seconds_bucket{function="calculate_rsi",le="0.1"} 2' in lines
+    assert 'indicator_duration_seconds_bucket{function="calculate_rsi",le="+Inf"} 3' in lines
+    assert 'indicator_duration_seconds_count{function="calculate_rsi"} 3' in lines
+
+    path = tmp_path / 'indicators.prom'
+    registry.write_prometheus(str(path), prefix='ta')
+    assert path.read_text() == registry.to_prometheus('ta')
+    assert [item.name for item in tmp_path.iterdir()] == ['indicators.prom']
+
+
+def test_enable_instrumentation_wraps_the_exported_functions():
+    original = indicators.calculate_sma
+    try:
+        registry = enable_instrumentation()
+        indicators.calculate_sma(closes())
+        indicators.compute_indicators(closes(), ['sma'])
+        assert {name: metrics['calls'] for name, metrics in registry.snapshot().items()} == {
+            'calculate_sma': 1, 'compute_indicators': 1
+        }
+    finally:
+        disable_instrumentation()
+    assert indicators.calculate_sma is original
@@ -0,0 +1,187 @@
+# tests/test_live.py
+
+import asyncio
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from indicators import compute_indicators
+from indicators.live import LivePipeline, fake_feed
+
+SPECS = ['rsi', ('bollinger_bands', {'period': 10})]
+
+
+def ohlcv(rows: int = 60, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.01, rows)))
+    spread = np.abs(rng.normal(0.0, 0.01, rows)) * close
+    return pd.DataFrame({
+        'High': close + spread,
+        'Low': close - spread,
+        'Close': close,
+        'Volume': np.round(rng.lognormal(8.0, 1.0, rows))
+    })
+
+
+def pipeline(data: dict) -> LivePipeline:
+    live = LivePipeline(SPECS)
+    for symbol, bars in data.items():
+        live.add_feed(symbol, fake_feed(bars))
+    return live
+
+
+async def collect(subscription) -> list:
+    return [update async for update in subscription]
+
+
+def run(coroutine, timeout: float = 10.0):
+    # A pipeline that never ends its subscriptions fails the test instead of hanging it.
+    return asyncio.run(asyncio.wait_for(coroutine, timeout))
+
+
+def test_every_subscriber_receives_every_update():
+    data = {'A': ohlcv(seed=1), 'B': ohlcv(seed=2)}
+    live = pipeline(data)
+    subscriptions = [live.subscribe(), live.subscribe(maxsize=5)]
+
+    async def main():
+        _, *received = await asyncio.gather(live.run(), *[collect(subscription) for subscription in subscriptions])
+        return received
+
+    first, second = run(main())
+    assert [(update.symbol, update.values) for update in first] == \
+        [(update.symbol, update.values) for update in second]
+    assert live.latency.count == sum(len(bars) for bars in data.values())
+
+    for symbol, bars in data.items():
+        updates = [update for update in first if update.symbol == symbol]
+        assert [update.bar for update in updates] == bars.to_dict('records')
+        expected = compute_indicators(bars, SPECS)
+        actual = pd.DataFrame([update.values for update in updates])
+        assert list(actual.columns) == list(expected.columns)
+        np.testing.assert_allclose(actual.to_numpy(dtype=np.float64), expected.to_numpy(dtype=np.float64),
+                                   rtol=1e-9, equal_nan=True)
+
+
+def test_subscribers_only_receive_their_symbols():
+    live = pipeline({'A': ohlcv(seed=1), 'B': ohlcv(seed=2), 'C': ohlcv(seed=3)})
+    only_a = live.subscribe(['A'])
+    a_and_c = live.subscribe(['A', 'C'])
+
+    async def main():
+        _, *received = await asyncio.gather(live.run(), collect(only_a), collect(a_and_c))
+        return received
+
+    received_a, received_a_and_c = run(main())
+    assert {update.symbol for update in received_a} == {'A'}
+    assert len(received_a) == 60
+    assert {update.symbol for update in received_a_and_c} == {'A', 'C'}
+    assert len(received_a_and_c) == 120
+
+
+def test_block_waits_for_a_slow_subscriber():
+    live = pipeline({'A': ohlcv()})
+    subscription = live.subscribe(maxsize=1)
+
+    async def slow_reader():
+        received = []
+        async for update in subscription:
+            # The pipeline is held back by the full queue: it can be at most one update ahead.
+            assert live.latency.count <= len(received) + 2
+            received.append(update)
+            await asyncio.sleep(0)
+        return received
+
+    async def main():
+        _, received = await asyncio.gather(live.run(), slow_reader())
+        return received
+
+    received = run(main())
+    assert len(received) == 60
+    assert subscription.dropped == 0
+
+
+def test_drop_oldest_keeps_the_latest_updates():
+    live = pipeline({'A': ohlcv()})
+    subscription = live.subscribe(maxsize=3, overflow='drop_oldest')
+
+    async def main():
+        # Nothing reads while the pipeline runs, so only the newest updates are left.
+        await live.run()
+        return await collect(subscription)
+
+    received = run(main())
+    # The end marker replaces the oldest of the three pending updates.
+    assert [update.bar for update in received] == ohlcv().iloc[-2:].to_dict('records')
+    assert subscription.dropped == 58
+
+
+def test_run_ends_when_a_blocked_subscriber_stops_reading():
+    live = pipeline({'A': ohlcv()})
+    subscription = live.subscribe(maxsize=2)
+
+    async def main():
+        # Nothing reads the subscription, so the pipeline ends with the queue full.
+        task = asyncio.create_task(live.run())
+        await asyncio.sleep(0.01)
+        assert not task.done()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        return await collect(subscription)
+
+    received = run(main())
+    assert [update.bar for update in received] == ohlcv().iloc[1:2].to_dict('records')
+    assert subscription.dropped == 1
+
+
+def test_closed_subscriber_does_not_hold_up_the_pipeline():
+    live = pipeline({'A': ohlcv()})
+    closing = live.subscribe(maxsize=1)
+    reading = live.subscribe()
+
+    async def close_after_first():
+        async for update in closing:
+            closing.close()
+            return [update]
+
+    async def main():
+        _, first, received = await asyncio.gather(live.run(), close_after_first(), collect(reading))
+        return first, received
+
+    first, received = run(main())
+    assert len(first) == 1
+    assert len(received) == 60
+
+
+def test_failing_feed_ends_the_subscriptions():
+    async def broken_feed():
+        yield ohlcv().iloc[0].to_dict()
+        raise ConnectionError('feed lost')
+
+    live = LivePipeline(SPECS)
+    live.add_feed('A', broken_feed())
+    subscription = live.subscribe()
+
+    async def main():
+        with pytest.raises(ConnectionError):
+            await live.run()
+        return await collect(subscription)
+
+    assert len(run(main())) == 1
+
+
+@pytest.mark.parametrize('options, message', [
+    ({'overflow': 'drop_newest'}, "'overflow' must be"),
+    ({'maxsize': 0}, "'maxsize' must be"),
+])
+def test_subscribe_validates_its_options(options, message):
+    with pytest.raises(ValueError, match=message):
+        LivePipeline(SPECS).subscribe(**options)
+
+
+def test_feeds_are_registered_once():
+    live = pipeline({'A': ohlcv()})
+    with pytest.raises(ValueError, match="already registered for 'A'"):
+        live.add_feed('A', fake_feed(ohlcv()))
@@ -0,0 +1,73 @@
+# tests/test_panel.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from indicators.panel import field_major, is_panel, to_panel
+from indicators.registry import REGISTRY, load
+
+SYMBOLS = ['AAA', 'BBB', 'CCC']
+
+
+def ohlcv(rows: int = 400, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.01, rows)))
+    spread = np.abs(rng.normal(0.0, 0.01, rows)) * close
+    data = pd.DataFrame({
+        'Open': np.roll(close, 1),
+        'High': close + spread,
+        'Low': close - spread,
+        'Close': np.round(close, 2),
+        'Volume': np.round(rng.lognormal(8.0, 1.0, rows))
+    })
+    data.iloc[rng.choice(rows, 5, replace=False), :4] = np.nan
+    return data
+
+
+@pytest.fixture(scope='module')
+def frames():
+    return {symbol: ohlcv(seed=seed) for seed, symbol in enumerate(SYMBOLS)}
+
+
+def assert_matches_per_symbol(name, wide, frames):
+    for symbol, frame in frames.items():
+        expected = load(name)(frame)
+        if isinstance(expected, pd.DataFrame):
+            actual = wide.xs(symbol, axis=1, level=1)[expected.columns]
+        else:
+            actual = wide[symbol]
+        np.testing.assert_allclose(actual.to_numpy(dtype=np.float64), expected.to_numpy(dtype=np.float64),
+                                   rtol=1e-12, atol=1e-12, equal_nan=True, err_msg=f'{name} {symbol}')
+
+
+@pytest.mark.filterwarnings('ignore::RuntimeWarning')
+@pytest.mark.parametrize('name', sorted(REGISTRY))
+def test_panel_matches_per_symbol_calls(name, frames):
+    wide = load(name)(to_panel(frames))
+    assert_matches_per_symbol(name, wide, frames)
+
+
+@pytest.mark.filterwarnings('ignore::RuntimeWarning')
+@pytest.mark.parametrize('name', ['rsi', 'macd', 'parabolic_sar'])
+def test_symbol_major_panel_matches_field_major(name, frames):
+    panel = to_panel(frames)
+    symbol_major = panel.swaplevel(0, 1, axis=1).sort_index(axis=1)
+    assert_matches_per_symbol(name, load(name)(symbol_major), frames)
+
+
+def test_to_panel_aligns_symbols_on_the_union_of_their_indexes(frames):
+    short = {'AAA': frames['AAA'], 'BBB': frames['BBB'].iloc[100:]}
+    panel = to_panel(short)
+    assert is_panel(panel)
+    assert list(panel.columns.get_level_values(0).unique()) == sorted(frames['AAA'].columns)
+    assert panel.index.equals(frames['AAA'].index)
+    assert panel[('Close', 'BBB')].iloc[:100].isna().all()
+
+
+def test_field_major_leaves_single_symbols_and_field_major_panels_alone(frames):
+    frame = frames['AAA']
+    panel = to_panel(frames)
+    assert field_major(frame) is frame
+    assert field_major(panel) is panel
+    assert field_major(panel.swaplevel(0, 1, axis=1)).columns.equals(panel.columns)
@@ -0,0 +1,133 @@
+# tests/test_resample.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from indicators import compute_indicators
+from indicators.resample import BarAggregator, compute_multi_timeframe, resample_many, resample_ohlcv
+
+AGGREGATIONS = {'Open': 'first', 'High': 'max', 'Low': 'min', 'Close': 'last', 'Volume': 'sum'}
+RULES = ['5min', '15min', '1h', '1D']
+SPECS = ['rsi', 'macd', 'atr', 'bollinger_bands']
+
+
+def minute_bars(rows: int = 4_000, seed: int = 0, tz=None) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.001, rows)))
+    spread = np.abs(rng.normal(0.0, 0.001, rows)) * close
+    return pd.DataFrame({
+        'Open': np.roll(close, 1),
+        'High': close + spread,
+        'Low': close - spread,
+        'Close': np.round(close, 2),
+        'Volume': np.round(rng.lognormal(8.0, 1.0, rows))
+    }, index=pd.date_range('2024-03-01 09:13', periods=rows, freq='1min', tz=tz, name='Date'))
+
+
+def gappy_bars(tz=None) -> pd.DataFrame:
+    """
+    Minute bars with missing bars, a missing hour and missing values.
+    """
+    data = minute_bars(tz=tz)
+    rng = np.random.default_rng(1)
+    data = data.drop(data.index[rng.choice(len(data), 300, replace=False)])
+    data = data.drop(data.index[1_000:1_060])
+    data.iloc[rng.choice(len(data), 40, replace=False), :4] = np.nan
+    data.iloc[rng.choice(len(data), 20, replace=False), 4] = np.nan
+    return data
+
+
+def pandas_resample(data: pd.DataFrame, rule: str) -> pd.DataFrame:
+    # pandas also emits the bins without bars, which resample_ohlcv omits.
+    bins = data.resample(rule)
+    return bins.agg(AGGREGATIONS)[bins.size() > 0]
+
+
+@pytest.mark.parametrize('tz', [None, 'Asia/Tokyo'])
+def test_resample_many_matches_pandas(tz):
+    data = gappy_bars(tz)
+    result = resample_many(data, RULES)
+    assert list(result) == RULES
+    for rule in RULES:
+        pd.testing.assert_frame_equal(result[rule], pandas_resample(data, rule), check_freq=False, rtol=1e-12)
+
+
+def test_resample_reads_a_date_column():
+    data = gappy_bars()
+    with_column = data.reset_index()
+    with_column['Date'] = with_column['Date'].dt.strftime('%Y-%m-%d %H:%M:%S')
+    pd.testing.assert_frame_equal(resample_ohlcv(with_column, '1h'), resample_ohlcv(data, '1h'))
+
+
+def separate_passes(data: pd.DataFrame, rules) -> pd.DataFrame:
+    """
+    One aggregate-compute-align pass per timeframe, each starting again from the base bars.
+    """
+    results = {'base': compute_indicators(data, SPECS)}
+    for rule in rules:
+        values = compute_indicators(pandas_resample(data, rule), SPECS)
+        # Show each bar from its last minute on, so no row sees a bar before it closes.
+        closes = values.index + pd.Timedelta(rule) - pd.Timedelta('1min')
+        results[rule] = values.set_axis(closes).reindex(data.index, method='ffill')
+    return pd.concat(results, axis=1)
+
+
+@pytest.mark.filterwarnings('ignore::RuntimeWarning')
+def test_multi_timeframe_matches_separate_passes():
+    data = minute_bars()
+    rules = ['5min', '1h']
+    pd.testing.assert_frame_equal(compute_multi_timeframe(data, SPECS, rules), separate_passes(data, rules),
+                                  check_names=False, rtol=1e-9)
+
+
+def test_incomplete_bins_show_at_the_next_bar():
+    # The 09:00 bin lacks its last bar (09:04), so its value only shows at 09:05.
+    index = pd.DatetimeIndex(['2024-01-01 09:00', '2024-01-01 09:01', '2024-01-01 09:02', '2024-01-01 09:03',
+                              '2024-01-01 09:05', '2024-01-01 09:09'], name='Date')
+    data = pd.DataFrame({'Close': [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]}, index=index)
+    result = compute_multi_timeframe(data, [('sma', {'period': 1})], ['5min'], base_interval='1min')
+    np.testing.assert_array_equal(result[('5min', 'SMA_1')], [np.nan, np.nan, np.nan, np.nan, 4.0, 6.0])
+
+
+def test_bar_aggregator_matches_resample():
+    data = gappy_bars()
+    aggregator = BarAggregator('15min')
+    completed = []
+    for timestamp, bar in zip(data.index, data.to_dict('records')):
+        bar_completed, _ = aggregator.update(timestamp, bar)
+        if bar_completed is not None:
+            completed.append(bar_completed)
+    completed.append(aggregator.flush())
+
+    actual = pd.DataFrame(completed).set_index('Date')
+    expected = resample_ohlcv(data, '15min')
+    pd.testing.assert_frame_equal(actual, expected[actual.columns], check_index_type=False, check_names=False,
+                                  rtol=1e-12)
+
+
+def test_bar_aggregator_returns_the_partial_bar():
+    aggregator = BarAggregator('1h')
+    _, partial = aggregator.update('2024-01-01 09:10', {'Open': 1.0, 'High': 2.0, 'Low': 0.5, 'Close': 1.5,
+                                                        'Volume': 10.0})
+    completed, partial = aggregator.update('2024-01-01 09:20', {'Open': 1.5, 'High': 3.0, 'Low': 1.0, 'Close': 2.5,
+                                                                'Volume': 5.0})
+    assert completed is None
+    assert partial == {'Date': pd.Timestamp('2024-01-01 09:00'), 'Open': 1.0, 'High': 3.0, 'Low': 0.5, 'Close': 2.5,
+                       'Volume': 15.0}
+    with pytest.raises(ValueError, match='sorted in increasing order'):
+        aggregator.update('2024-01-01 08:59', {'Close': 1.0})
+
+
+@pytest.mark.parametrize('rule, message', [
+    ('1M', 'only fixed-length rules'),
+    ('0min', 'must have a positive length'),
+])
+def test_unsupported_rules_are_rejected(rule, message):
+    with pytest.raises(ValueError, match=message):
+        resample_ohlcv(minute_bars(10), rule)
+
+
+def test_unsorted_bars_are_rejected():
+    with pytest.raises(ValueError, match='sorted in increasing order'):
+        resample_ohlcv(minute_bars(10).iloc[::-1], '5min')
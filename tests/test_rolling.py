@@ -0,0 +1,119 @@
+# tests/test_rolling.py
+
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from indicators import rolling
+from indicators.rolling import RollingMeanStd, rolling_mean_std
+
+
+def gappy_prices(rows: int = 1_000, seed: int = 0, level: float = 100.0) -> np.ndarray:
+    """
+    Generate prices with NaN, +inf and -inf values, a flat stretch and a leading gap.
+    """
+    rng = np.random.default_rng(seed)
+    values = level + np.cumsum(rng.normal(0.0, level * 1e-3, rows))
+    values[:15] = np.nan
+    values[rng.choice(rows, 10, replace=False)] = np.nan
+    values[rng.choice(rows, 5, replace=False)] = np.inf
+    values[rng.choice(rows, 3, replace=False)] = -np.inf
+    values[600:650] = values[600]
+    return values
+
+
+@pytest.fixture(params=[False, True], ids=['numpy', 'kernel'])
+def backend(request, monkeypatch):
+    # The kernel runs as plain Python without Numba, so both paths can be checked here.
+    monkeypatch.setattr(rolling, 'NUMBA_AVAILABLE', request.param)
+
+
+@pytest.mark.parametrize('period', [1, 2, 20, 50])
+@pytest.mark.parametrize('ddof', [0, 1])
+def test_rolling_mean_std_matches_pandas(backend, period, ddof):
+    values = gappy_prices()
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        mean, std = rolling_mean_std(values, period, ddof)
+
+    windows = pd.Series(values).rolling(period)
+    np.testing.assert_allclose(mean, windows.mean(), rtol=1e-12, equal_nan=True)
+    # pandas' running sums leave up to ~1e-7 of rounding in flat windows, where the result is exactly 0.
+    np.testing.assert_allclose(std, windows.std(ddof=ddof), rtol=1e-7, atol=1e-6, equal_nan=True)
+
+
+def exact_mean_std(values: np.ndarray, period: int, ddof: int) -> tuple:
+    # Two passes over every window; windows holding NaN or an infinity are NaN, as in pandas.
+    mean = np.full(len(values), np.nan)
+    std = np.full(len(values), np.nan)
+    for end in range(period, len(values) + 1):
+        window = values[end - period:end]
+        if np.isfinite(window).all():
+            mean[end - 1] = window.mean()
+            std[end - 1] = window.std(ddof=ddof) if period > ddof else np.nan
+    return mean, std
+
+
+@pytest.mark.parametrize('period', [2, 20])
+def test_rolling_mean_std_is_accurate_at_high_prices(backend, period):
+    values = gappy_prices(level=30_000.0)
+    mean, std = rolling_mean_std(values, period)
+
+    expected_mean, expected_std = exact_mean_std(values, period, 1)
+    np.testing.assert_allclose(mean, expected_mean, rtol=1e-12, equal_nan=True)
+    np.testing.assert_allclose(std, expected_std, rtol=1e-7, atol=1e-9, equal_nan=True)
+
+
+def test_rolling_mean_std_columns_match_single_series(backend):
+    values = np.column_stack([gappy_prices(seed=seed) for seed in range(3)])
+    mean, std = rolling_mean_std(values, 20)
+    for column in range(values.shape[1]):
+        expected_mean, expected_std = rolling_mean_std(values[:, column], 20)
+        np.testing.assert_allclose(mean[:, column], expected_mean, rtol=1e-12, equal_nan=True)
+        np.testing.assert_allclose(std[:, column], expected_std, rtol=1e-7, atol=1e-9, equal_nan=True)
+
+
+@pytest.mark.parametrize('period', [1, 20])
+@pytest.mark.parametrize('ddof', [0, 1])
+def test_rolling_mean_std_stream_matches_batch(period, ddof):
+    values = gappy_prices()
+    stream = RollingMeanStd(period, ddof)
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        streamed = np.array([stream.push(value) for value in values.tolist()])
+
+    mean, std = rolling_mean_std(values, period, ddof)
+    np.testing.assert_allclose(streamed[:, 0], mean, rtol=1e-12, equal_nan=True)
+    np.testing.assert_allclose(streamed[:, 1], std, rtol=1e-7, atol=1e-9, equal_nan=True)
+
+
+def naive_rolling_mad(values: np.ndarray, period: int) -> np.ndarray:
+    # Window by window; a window holding NaN yields NaN.
+    result = np.full(values.shape, np.nan)
+    for end in range(period, len(values) + 1):
+        window = values[end - period:end]
+        result[end - 1] = np.mean(np.abs(window - window.mean(axis=0)), axis=0)
+    return result
+
+
+@pytest.mark.parametrize('period', [1, 3, 20])
+def test_rolling_mad_matches_naive(monkeypatch, period):
+    # Small chunks, so windows straddle several chunk boundaries.
+    monkeypatch.setattr(rolling, '_CHUNK_SIZE', 64)
+    values = gappy_prices()
+    values[np.isinf(values)] = np.nan
+    np.testing.assert_allclose(rolling.rolling_mad(values, period), naive_rolling_mad(values, period), rtol=1e-10,
+                               atol=1e-12, equal_nan=True)
+
+    columns = np.column_stack([values, gappy_prices(seed=1)])
+    columns[np.isinf(columns)] = np.nan
+    np.testing.assert_allclose(rolling.rolling_mad(columns, period), naive_rolling_mad(columns, period),
+                               rtol=1e-10, atol=1e-12, equal_nan=True)
+
+
+def test_rolling_mad_of_short_input_is_missing():
+    assert np.isnan(rolling.rolling_mad(np.arange(3.0), 5)).all()
+    with pytest.raises(ValueError, match="'period' must be a positive integer."):
+        rolling.rolling_mad(np.arange(3.0), 0)
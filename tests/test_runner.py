@@ -0,0 +1,187 @@
+# tests/test_runner.py
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from indicators import compute_indicators
+from indicators.cli import main
+from indicators.registry import REGISTRY
+from indicators.runner import load_price_data, process_file, read_price_chunks, run_directory
+from indicators.store import ResultStore
+
+SPECS = ['sma', 'rsi', 'macd', 'atr', 'bollinger_bands', 'obv', 'parabolic_sar']
+
+
+def ohlcv(rows: int = 400, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.01, rows)))
+    spread = np.abs(rng.normal(0.0, 0.01, rows)) * close
+    return pd.DataFrame({
+        'Date': pd.date_range('2024-01-01', periods=rows, freq='h').strftime('%Y-%m-%d %H:%M:%S'),
+        'Open': np.round(np.roll(close, 1), 4),
+        'High': np.round(close + spread, 4),
+        'Low': np.round(close - spread, 4),
+        'Close': np.round(close, 2),
+        'Volume': np.round(rng.lognormal(8.0, 1.0, rows))
+    })
+
+
+def write_csv(directory, name: str, data: pd.DataFrame) -> str:
+    path = os.path.join(directory, name)
+    data.to_csv(path, index=False)
+    return path
+
+
+def assert_frames_close(actual: pd.DataFrame, expected: pd.DataFrame):
+    assert list(actual.columns) == list(expected.columns)
+    np.testing.assert_allclose(actual.to_numpy(dtype=np.float64), expected.to_numpy(dtype=np.float64), rtol=1e-9,
+                               atol=1e-9, equal_nan=True)
+
+
+@pytest.fixture
+def prices(tmp_path):
+    directory = tmp_path / 'prices'
+    directory.mkdir()
+    return str(directory)
+
+
+def test_chunked_parsing_matches_one_pass(prices):
+    path = write_csv(prices, 'AAA.csv', ohlcv())
+    data = load_price_data(path)
+    pd.testing.assert_frame_equal(load_price_data(path, chunk_size=64), data)
+    pd.testing.assert_frame_equal(pd.concat(read_price_chunks(path, 150)), data)
+    assert data.dtypes.drop('Date').eq(np.float64).all()
+
+
+@pytest.mark.parametrize('chunk_size', [None, 64])
+def test_missing_price_columns_raise_value_error(prices, tmp_path, chunk_size):
+    path = write_csv(prices, 'AAA.csv', ohlcv().drop(columns=['High', 'Volume']))
+    with pytest.raises(ValueError, match='is missing the price columns: High, Volume.'):
+        load_price_data(path, chunk_size)
+    with pytest.raises(ValueError, match='is missing the price columns: High, Volume.'):
+        load_price_data(path, cache_dir=str(tmp_path / 'cache'))
+
+    # 'Date' is only carried along, so a file without it is accepted.
+    path = write_csv(prices, 'BBB.csv', ohlcv().drop(columns='Date'))
+    assert list(load_price_data(path, chunk_size)) == ['Open', 'High', 'Low', 'Close', 'Volume']
+
+
+@pytest.mark.filterwarnings('ignore::RuntimeWarning')
+@pytest.mark.parametrize('block_rows', [64, 1_000])
+def test_out_of_core_csv_matches_in_memory(prices, tmp_path, block_rows):
+    path = write_csv(prices, 'AAA.csv', ohlcv())
+    in_memory, blocks = tmp_path / 'memory', tmp_path / 'blocks'
+    in_memory.mkdir()
+    blocks.mkdir()
+
+    expected = process_file(path, str(in_memory), SPECS)
+    actual = process_file(path, str(blocks), SPECS, chunk_size=block_rows, out_of_core=True)
+    assert actual['rows'] == expected['rows'] == 400
+
+    expected, actual = (pd.read_csv(summary['output']) for summary in (expected, actual))
+    assert actual['Date'].equals(expected['Date'])
+    assert_frames_close(actual.drop(columns='Date'), expected.drop(columns='Date'))
+    assert_frames_close(expected.drop(columns='Date'), compute_indicators(load_price_data(path), SPECS))
+    assert not any(name.endswith('.tmp') for name in os.listdir(blocks))
+
+
+@pytest.mark.filterwarnings('ignore::RuntimeWarning')
+def test_out_of_core_arrow_matches_in_memory(prices, tmp_path):
+    path = write_csv(prices, 'AAA.csv', ohlcv())
+    process_file(path, str(tmp_path / 'memory'), SPECS, output_format='arrow')
+    process_file(path, str(tmp_path / 'blocks'), SPECS, chunk_size=100, output_format='arrow', out_of_core=True)
+
+    memory, blocks = ResultStore(str(tmp_path / 'memory')), ResultStore(str(tmp_path / 'blocks'))
+    for name in SPECS:
+        expected, actual = memory.read('AAA', name), blocks.read('AAA', name)
+        assert actual.index.equals(expected.index)
+        assert_frames_close(actual, expected)
+
+
+@pytest.mark.filterwarnings('ignore::RuntimeWarning')
+def test_price_cache_gives_the_same_results(prices, tmp_path):
+    path = write_csv(prices, 'AAA.csv', ohlcv())
+    cache_dir = str(tmp_path / 'cache')
+    for out_of_core in (False, True):
+        plain, cached = tmp_path / f'plain{out_of_core}', tmp_path / f'cached{out_of_core}'
+        plain.mkdir()
+        cached.mkdir()
+        process_file(path, str(plain), SPECS, chunk_size=100, out_of_core=out_of_core)
+        process_file(path, str(cached), SPECS, chunk_size=100, out_of_core=out_of_core, cache_dir=cache_dir)
+
+        expected = pd.read_csv(plain / 'AAA.csv')
+        actual = pd.read_csv(cached / 'AAA.csv')
+        assert_frames_close(actual.drop(columns='Date'), expected.drop(columns='Date'))
+        assert pd.to_datetime(actual['Date']).equals(pd.to_datetime(expected['Date']))
+
+
+def test_output_never_overwrites_its_input(prices):
+    path = write_csv(prices, 'AAA.csv', ohlcv())
+    with open(path) as file:
+        content = file.read()
+    with pytest.raises(ValueError, match='would overwrite its input'):
+        process_file(path, prices, SPECS)
+    with pytest.raises(ValueError, match='would overwrite its input'):
+        process_file(path, prices, SPECS, chunk_size=100, out_of_core=True)
+    with open(path) as file:
+        assert file.read() == content
+
+
+def test_empty_file_out_of_core(prices, tmp_path):
+    path = write_csv(prices, 'EMPTY.csv', ohlcv().iloc[:0])
+    summary = process_file(path, str(tmp_path), ['rsi', 'macd'], chunk_size=100, out_of_core=True)
+    assert summary['rows'] == 0
+    assert list(pd.read_csv(summary['output']).columns) == ['Date', 'RSI_14', 'MACD_12_26_9 MACD Line',
+                                                            'MACD_12_26_9 Signal Line', 'MACD_12_26_9 MACD Histogram']
+
+
+@pytest.mark.filterwarnings('ignore::RuntimeWarning')
+@pytest.mark.parametrize('workers', [1, 2])
+def test_run_directory_processes_every_file(prices, tmp_path, workers):
+    for seed, symbol in enumerate(['AAA', 'BBB', 'CCC']):
+        write_csv(prices, f'{symbol}.csv', ohlcv(seed=seed))
+    write_csv(prices, 'BROKEN.csv', ohlcv()[['Date', 'Volume']])
+    with open(os.path.join(prices, 'notes.txt'), 'w') as file:
+        file.write('not a price file')
+
+    output = str(tmp_path / 'output')
+    results, failures = run_directory(prices, output, ['rsi', 'sma'], workers=workers)
+    assert sorted(os.path.basename(result['input']) for result in results) == ['AAA.csv', 'BBB.csv', 'CCC.csv']
+    assert [os.path.basename(path) for path, _ in failures] == ['BROKEN.csv']
+    assert sorted(os.listdir(output)) == ['AAA.csv', 'BBB.csv', 'CCC.csv']
+
+    expected = compute_indicators(load_price_data(os.path.join(prices, 'BBB.csv')), ['rsi', 'sma'])
+    assert_frames_close(pd.read_csv(os.path.join(output, 'BBB.csv')).drop(columns='Date'), expected)
+
+
+def test_run_directory_rejects_unknown_formats(prices, tmp_path):
+    with pytest.raises(ValueError, match="'output_format' must be 'csv' or 'arrow'."):
+        run_directory(prices, str(tmp_path / 'output'), output_format='parquet')
+
+
+@pytest.mark.filterwarnings('ignore::RuntimeWarning')
+def test_cli_run(prices, tmp_path, capsys):
+    path = write_csv(prices, 'AAA.csv', ohlcv())
+    output = str(tmp_path / 'output')
+    assert main(['run', prices, output, '-w', '1', '-i', 'rsi:period=21,smoothing=wilder',
+                 '-i', 'bollinger_bands:extended=true']) == 0
+    assert 'Processed 1 files (400 rows)' in capsys.readouterr().out
+
+    specs = [('rsi', {'period': 21, 'smoothing': 'wilder'}), ('bollinger_bands', {'extended': True})]
+    expected = compute_indicators(load_price_data(path), specs)
+    assert_frames_close(pd.read_csv(os.path.join(output, 'AAA.csv')).drop(columns='Date'), expected)
+
+
+def test_cli_run_reports_failures(prices, tmp_path, capsys):
+    write_csv(prices, 'AAA.csv', ohlcv()[['Date', 'Volume']])
+    assert main(['run', prices, str(tmp_path / 'output'), '-w', '1', '-i', 'rsi']) == 1
+    assert 'Error:' in capsys.readouterr().err
+
+
+def test_cli_list(capsys):
+    assert main(['list']) == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert [line.split()[0] for line in lines] == sorted(REGISTRY)
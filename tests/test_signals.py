@@ -0,0 +1,168 @@
+# tests/test_signals.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from indicators import calculate_bollinger_bands, calculate_macd, calculate_rsi, calculate_stochastic_oscillator
+from indicators.panel import to_panel
+from indicators.signals import BandBreakout, Crossover, Crossunder, Hysteresis, Threshold, evaluate
+
+SIGNALS = {
+    'macd_cross': Crossover('MACD Line', 'Signal Line'),
+    'macd_crossunder': Crossunder('MACD Line', 'Signal Line'),
+    'oversold': Threshold('RSI', 30, side='below'),
+    'overbought': Threshold('RSI', 70),
+    'breakout': BandBreakout('Close', 'Upper Band', 'Lower Band'),
+    'upper_breakout': BandBreakout('Close', 'Upper Band'),
+    'trend': Hysteresis('%K', enter=80, exit=50),
+    'dip': Hysteresis('RSI', enter=30, exit=50),
+}
+
+
+def ohlcv(rows: int = 600, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.01, rows)))
+    spread = np.abs(rng.normal(0.0, 0.01, rows)) * close
+    data = pd.DataFrame({
+        'High': close + spread,
+        'Low': close - spread,
+        'Close': np.round(close, 2),
+        'Volume': np.round(rng.lognormal(8.0, 1.0, rows))
+    })
+    data.iloc[rng.choice(rows, 5, replace=False), :3] = np.nan
+    return data
+
+
+def outputs(data) -> dict:
+    macd = calculate_macd(data)
+    bands = calculate_bollinger_bands(data)
+    stochastic = calculate_stochastic_oscillator(data)
+    return {
+        'MACD Line': macd['MACD Line'], 'Signal Line': macd['Signal Line'],
+        'Close': data['Close'], 'Upper Band': bands['Upper Band'], 'Lower Band': bands['Lower Band'],
+        'RSI': calculate_rsi(data), '%K': stochastic['%K'], '%D': stochastic['%D']
+    }
+
+
+@pytest.fixture(scope='module')
+def single():
+    return outputs(ohlcv())
+
+
+@pytest.fixture(scope='module')
+def panel():
+    return outputs(to_panel({f'SYM{seed}': ohlcv(seed=seed) for seed in range(3)}))
+
+
+def looped(signal, columns: dict, symbol: int) -> list:
+    """
+    Walk the rows of one symbol in Python, comparing each row with the previous one.
+    """
+    def value(operand, row):
+        if isinstance(operand, str):
+            values = columns[operand]
+            return values[row] if values.ndim == 1 else values[row, symbol]
+        return operand
+
+    events = []
+    state = False
+    rows = len(next(iter(columns.values())))
+    for row in range(rows):
+        current = [value(operand, row) for operand in signal.operands]
+        if isinstance(signal, Hysteresis):
+            level, enter, exit = current
+            rising = enter > exit
+            if not state and (level >= enter if rising else level <= enter):
+                state = True
+                events.append((row, symbol, 1))
+            elif state and (level <= exit if rising else level >= exit):
+                state = False
+                events.append((row, symbol, -1))
+            continue
+        if row == 0:
+            continue
+        previous = [value(operand, row - 1) for operand in signal.operands]
+        if isinstance(signal, Crossover) and current[0] > current[1] and previous[0] <= previous[1]:
+            events.append((row, symbol, 1))
+        elif isinstance(signal, Crossunder) and current[0] < current[1] and previous[0] >= previous[1]:
+            events.append((row, symbol, -1))
+        elif isinstance(signal, Threshold):
+            inside = (lambda x, level: x > level) if signal.side == 'above' else (lambda x, level: x < level)
+            outside = (lambda x, level: x <= level) if signal.side == 'above' else (lambda x, level: x >= level)
+            if inside(current[0], current[1]) and outside(previous[0], previous[1]):
+                events.append((row, symbol, 1))
+            elif outside(current[0], current[1]) and inside(previous[0], previous[1]):
+                events.append((row, symbol, -1))
+        elif isinstance(signal, BandBreakout):
+            if current[0] > current[1] and previous[0] <= previous[1]:
+                events.append((row, symbol, 1))
+            elif len(current) == 3 and current[0] < current[2] and previous[0] >= previous[2]:
+                events.append((row, symbol, -1))
+    return events
+
+
+def as_tuples(events) -> list:
+    return list(zip(events.rows.tolist(), events.columns.tolist(), events.sides.tolist()))
+
+
+@pytest.mark.parametrize('layout', ['single', 'panel'])
+def test_evaluate_matches_row_loop(layout, request):
+    data = request.getfixturevalue(layout)
+    columns = {name: values.to_numpy() for name, values in data.items()}
+    symbols = 1 if layout == 'single' else columns['Close'].shape[1]
+
+    events = evaluate(SIGNALS, data)
+    for name, signal in SIGNALS.items():
+        expected = sorted(event for symbol in range(symbols) for event in looped(signal, columns, symbol))
+        assert as_tuples(events[name]) == expected, name
+        assert as_tuples(signal.events(data)) == expected, name
+
+
+@pytest.mark.parametrize('layout', ['single', 'panel'])
+def test_stream_matches_batch(layout, request):
+    data = request.getfixturevalue(layout)
+    columns = {name: values.to_numpy() for name, values in data.items()}
+    rows = len(columns['Close'])
+    for name, signal in SIGNALS.items():
+        stream = signal.stream()
+        streamed = np.array([stream.update({column: values[row] for column, values in columns.items()})
+                             for row in range(rows)])
+        np.testing.assert_array_equal(streamed, signal.sides(data), err_msg=name)
+
+
+@pytest.mark.parametrize('layout', ['single', 'panel'])
+def test_seeded_stream_continues_the_batch(layout, request):
+    data = request.getfixturevalue(layout)
+    columns = {name: values.to_numpy() for name, values in data.items()}
+    split = 400
+    for name, signal in SIGNALS.items():
+        stream = signal.stream().seed({column: values[:split] for column, values in columns.items()})
+        streamed = np.array([stream.update({column: values[row] for column, values in columns.items()})
+                             for row in range(split, len(columns['Close']))])
+        np.testing.assert_array_equal(streamed, signal.sides(data)[split:], err_msg=name)
+
+
+def test_events_to_frame(panel):
+    events = Crossover('MACD Line', 'Signal Line').events(panel)
+    frame = events.to_frame(panel['Close'].index, panel['Close'].columns)
+    assert list(frame.columns) == ['Row', 'Symbol', 'Side']
+    assert frame['Symbol'].tolist() == [f'SYM{column}' for column in events.columns]
+    assert (frame['Side'] == 1).all()
+
+
+def test_missing_values_never_produce_events():
+    values = np.array([1.0, np.nan, 3.0, np.nan, np.nan, 0.0, 2.0])
+    assert as_tuples(Crossover(values, 1.5).events({})) == [(6, 0, 1)]
+    assert as_tuples(Crossunder(values, 1.5).events({})) == []
+
+
+@pytest.mark.parametrize('create, message', [
+    (lambda: Threshold('RSI', 30, side='inside'), "'side' must be 'above' or 'below'."),
+    (lambda: Hysteresis('RSI', 30, 30), "'enter' and 'exit' must differ."),
+    (lambda: Crossover(1.0, 2.0).events({}), 'A signal must compare at least one column.'),
+    (lambda: Crossover('Fast', 'Slow').events({'Fast': np.ones(3)}), "Data must contain a 'Slow' column."),
+])
+def test_invalid_signals_raise_value_error(create, message):
+    with pytest.raises(ValueError, match=message):
+        create()
@@ -0,0 +1,118 @@
+# tests/test_store.py
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from indicators import calculate_macd, calculate_rsi, compute_indicators
+from indicators.store import ResultStore, params_key, split_results
+
+pytest.importorskip('pyarrow')
+
+
+def ohlcv(rows: int = 300, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.01, rows)))
+    return pd.DataFrame({
+        'High': close * 1.01,
+        'Low': close * 0.99,
+        'Close': close,
+        'Volume': np.round(rng.lognormal(8.0, 1.0, rows))
+    })
+
+
+def test_series_round_trip(tmp_path):
+    store = ResultStore(str(tmp_path))
+    rsi = calculate_rsi(ohlcv(), 21)
+    path = store.write('AAA', 'rsi', rsi, {'period': 21})
+    assert path == os.path.join(str(tmp_path), 'rsi', 'period=21', 'AAA.arrow')
+
+    loaded = store.read('AAA', 'rsi', {'period': 21})
+    assert list(loaded.columns) == ['value']
+    assert isinstance(loaded.index, pd.RangeIndex)
+    np.testing.assert_array_equal(loaded['value'].to_numpy(), rsi.to_numpy())
+
+
+def test_frame_round_trip_with_date_index(tmp_path):
+    store = ResultStore(str(tmp_path))
+    data = ohlcv().set_index(pd.date_range('2024-01-01', periods=300, freq='h', name='Date'))
+    macd = calculate_macd(data)
+    store.write('AAA', 'macd', macd)
+
+    # The index frequency is not stored.
+    pd.testing.assert_frame_equal(store.read('AAA', 'macd'), macd, check_freq=False)
+    pd.testing.assert_frame_equal(store.read('AAA', 'macd', columns=['Signal Line']), macd[['Signal Line']],
+                                  check_freq=False)
+    with pytest.raises(KeyError, match='Columns not stored for macd: Signal.'):
+        store.read('AAA', 'macd', columns=['Signal'])
+
+
+def test_read_many_and_symbols(tmp_path):
+    store = ResultStore(str(tmp_path))
+    frames = {symbol: ohlcv(seed=seed) for seed, symbol in enumerate(['BBB', 'AAA'])}
+    for symbol, data in frames.items():
+        store.write(symbol, 'rsi', calculate_rsi(data))
+
+    assert store.symbols('rsi') == ['AAA', 'BBB']
+    assert store.symbols('rsi', {'period': 21}) == []
+    wide = store.read_many(['AAA', 'BBB'], 'rsi')
+    for symbol, data in frames.items():
+        np.testing.assert_array_equal(wide[symbol].to_numpy(), calculate_rsi(data).to_numpy())
+
+
+def test_writer_blocks_match_a_single_write(tmp_path):
+    store = ResultStore(str(tmp_path))
+    macd = calculate_macd(ohlcv())
+    with store.writer('AAA', 'macd') as writer:
+        for start in range(0, len(macd), 64):
+            writer.write(macd.iloc[start:start + 64])
+
+    pd.testing.assert_frame_equal(store.read('AAA', 'macd'), macd, check_index_type=False)
+
+
+def test_writer_error_keeps_the_previous_version(tmp_path):
+    store = ResultStore(str(tmp_path))
+    rsi = calculate_rsi(ohlcv())
+    path = store.write('AAA', 'rsi', rsi)
+    with pytest.raises(RuntimeError):
+        with store.writer('AAA', 'rsi') as writer:
+            writer.write(rsi.iloc[:10] * 2.0)
+            raise RuntimeError('interrupted')
+
+    assert os.listdir(os.path.dirname(path)) == ['AAA.arrow']
+    np.testing.assert_array_equal(store.read('AAA', 'rsi')['value'].to_numpy(), rsi.to_numpy())
+
+
+def test_missing_result_raises_file_not_found(tmp_path):
+    with pytest.raises(FileNotFoundError, match='No stored rsi result for AAA'):
+        ResultStore(str(tmp_path)).read('AAA', 'rsi')
+
+
+def test_split_results():
+    specs = ['rsi', ('macd', {'fast_period': 6}), ('sma', {'period': 50})]
+    result = compute_indicators(ohlcv(), specs)
+    frames = split_results(result, specs)
+
+    assert [(name, params) for name, params, _ in frames] == [
+        ('rsi', {'period': 14}),
+        ('macd', {'fast_period': 6, 'slow_period': 26, 'signal_period': 9}),
+        ('sma', {'period': 50}),
+    ]
+    assert list(frames[0][2].columns) == ['value']
+    assert list(frames[1][2].columns) == ['MACD Line', 'Signal Line', 'MACD Histogram']
+
+
+def test_params_key():
+    assert params_key({}) == 'default'
+    assert params_key({'slow_period': 26, 'fast_period': 12}) == 'fast_period=12,slow_period=26'
+    assert params_key({'period': 14.0}) == params_key({'period': np.float64(14)}) == 'period=14'
+    assert params_key({'step': 0.02, 'extended': True}) == 'extended=True,step=0.02'
+
+
+def test_integral_float_parameters_share_a_result(tmp_path):
+    store = ResultStore(str(tmp_path))
+    rsi = calculate_rsi(ohlcv())
+    assert store.write('AAA', 'rsi', rsi, {'period': 14.0}) == store.path('AAA', 'rsi')
+    np.testing.assert_array_equal(store.read('AAA', 'rsi', {'period': 14})['value'].to_numpy(), rsi.to_numpy())
@@ -0,0 +1,96 @@
+# tests/test_streaming.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import indicators
+from indicators.streaming import STREAMS
+
+# Parameter sets checked for each stream, on top of the defaults.
+PARAMS = {
+    'atr': [{'smoothing': 'wilder'}, {'smoothing': 'ema'}],
+    'bollinger_bands': [{'extended': True}, {'period': 5, 'ddof': 0}],
+    'rsi': [{'smoothing': 'wilder'}, {'smoothing': 'ema'}],
+}
+
+CASES = [(name, {}) for name in sorted(STREAMS)] + [
+    (name, params) for name in sorted(PARAMS) for params in PARAMS[name]
+]
+
+
+def awkward_ohlcv(rows: int = 3_000, seed: int = 0) -> pd.DataFrame:
+    """
+    Generate OHLCV bars with the rows streams get wrong most easily: missing bars, flat stretches,
+    bars with High == Low but a different Close, and bars without volume.
+    """
+    rng = np.random.default_rng(seed)
+    close = 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.01, rows)))
+    spread = np.abs(rng.normal(0.0, 0.01, rows)) * close
+    data = pd.DataFrame({
+        'High': close + spread,
+        'Low': close - spread,
+        'Close': np.round(close, 2),
+        'Volume': np.round(rng.lognormal(8.0, 1.0, rows))
+    })
+
+    for start in (500, 1_500, 2_500):
+        data.iloc[start:start + 60, :3] = data['Close'].iloc[start]
+    # A flat stretch whose window mean is not exact in floating point.
+    data.iloc[1_800:1_830, :3] = 0.3
+
+    same = rng.choice(rows, 30, replace=False)
+    data.loc[same, 'Low'] = data.loc[same, 'High']
+    data.loc[same, 'Close'] = data.loc[same, 'High'] - 1.0
+
+    data.iloc[rng.choice(rows, 20, replace=False), :3] = np.nan
+    data.loc[rng.choice(rows, 10, replace=False), 'Volume'] = 0.0
+    return data
+
+
+def as_frame(values) -> pd.DataFrame:
+    return values.to_frame('value') if isinstance(values, pd.Series) else values
+
+
+def assert_matches(expected: pd.DataFrame, actual: pd.DataFrame):
+    assert list(actual.columns) == list(expected.columns)
+    for column in expected.columns:
+        want = expected[column].to_numpy(dtype=np.float64)
+        got = actual[column].to_numpy(dtype=np.float64)
+        close = np.isclose(got, want, rtol=1e-7, atol=1e-9, equal_nan=True) | (got == want)
+        assert close.all(), (f"'{column}' differs on rows {np.flatnonzero(~close)[:5].tolist()}: "
+                             f"{got[~close][:3].tolist()} instead of {want[~close][:3].tolist()}")
+
+
+@pytest.mark.filterwarnings('ignore::RuntimeWarning')
+@pytest.mark.parametrize('name, params', CASES)
+@pytest.mark.parametrize('seed', [0, 1])
+def test_update_matches_batch(name, params, seed):
+    data = awkward_ohlcv(seed=seed)
+    expected = as_frame(getattr(indicators, f'calculate_{name}')(data, **params))
+
+    stream = STREAMS[name](**params)
+    values = [stream.update(bar) for bar in data.to_dict('records')]
+    actual = pd.DataFrame(values) if isinstance(values[0], dict) else pd.Series(values).to_frame('value')
+
+    assert_matches(expected, actual)
+
+
+@pytest.mark.filterwarnings('ignore::RuntimeWarning')
+@pytest.mark.parametrize('name, params', CASES)
+def test_from_history_continues_the_batch(name, params):
+    data = awkward_ohlcv()
+    expected = as_frame(getattr(indicators, f'calculate_{name}')(data, **params))
+
+    stream = STREAMS[name].from_history(data.iloc[:2_520], **params)
+    values = [stream.update(bar) for _, bar in data.iloc[2_520:].iterrows()]
+    actual = pd.DataFrame(values) if isinstance(values[0], dict) else pd.Series(values).to_frame('value')
+
+    assert_matches(expected.iloc[2_520:].reset_index(drop=True), actual)
+
+
+def test_infinite_value_leaves_the_window():
+    stream = STREAMS['sma'](period=3)
+    values = [stream.update({'Close': close}) for close in (1.0, np.inf, 2.0, 3.0, 4.0, 5.0)]
+    assert np.isnan(values[:4]).all()
+    assert values[4:] == [3.0, 4.0]
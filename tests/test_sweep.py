@@ -0,0 +1,82 @@
+# tests/test_sweep.py
+
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from indicators import calculate_bollinger_bands, calculate_ema, calculate_macd, calculate_rsi, calculate_sma
+from indicators.rolling import WindowSums
+from indicators.sweep import sweep_bollinger_bands, sweep_ema, sweep_macd, sweep_rsi, sweep_sma
+
+PERIODS = [2, 5, 14, 20, 50]
+
+
+def closes(rows: int = 6_000, seed: int = 0) -> pd.DataFrame:
+    """
+    Generate closes spanning two WindowSums blocks, with NaN, +inf and -inf values and a flat stretch.
+    """
+    rng = np.random.default_rng(seed)
+    close = np.round(100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.01, rows))), 2)
+    close[rng.choice(rows, 10, replace=False)] = np.nan
+    close[[9, 4_100]] = np.inf
+    close[2_000] = -np.inf
+    close[3_000:3_100] = close[3_000]
+    return pd.DataFrame({'Close': close})
+
+
+def assert_close(actual, expected):
+    np.testing.assert_allclose(np.asarray(actual, dtype=np.float64), np.asarray(expected, dtype=np.float64),
+                               rtol=1e-9, atol=1e-9, equal_nan=True)
+
+
+@pytest.fixture
+def data():
+    return closes()
+
+
+def test_window_sums_match_pandas(data):
+    close = data['Close'].to_numpy()
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        sums = WindowSums(close, max(PERIODS), block_size=1_000)
+        for period in PERIODS:
+            windows = pd.Series(close).rolling(period)
+            assert_close(sums.sum(period), windows.sum())
+            assert_close(sums.mean(period), windows.mean())
+
+
+def test_sweep_sma_matches_calculate_sma(data):
+    result = sweep_sma(data, PERIODS)
+    for period in PERIODS:
+        assert_close(result[period], calculate_sma(data, period))
+
+
+def test_sweep_ema_matches_calculate_ema(data):
+    result = sweep_ema(data, PERIODS)
+    for period in PERIODS:
+        assert_close(result[period], calculate_ema(data, period))
+
+
+@pytest.mark.filterwarnings('ignore::RuntimeWarning')
+def test_sweep_rsi_matches_calculate_rsi(data):
+    result = sweep_rsi(data, PERIODS)
+    for period in PERIODS:
+        assert_close(result[period], calculate_rsi(data, period))
+
+
+def test_sweep_bollinger_bands_match_calculate_bollinger_bands(data):
+    result = sweep_bollinger_bands(data, PERIODS, num_std_dev=2)
+    for period in PERIODS:
+        expected = calculate_bollinger_bands(data, period, 2)
+        for band in ('Middle Band', 'Upper Band', 'Lower Band'):
+            np.testing.assert_array_equal(result[(band, period)], expected[band])
+
+
+def test_sweep_macd_matches_calculate_macd(data):
+    result = sweep_macd(data, fast_periods=(5, 12), slow_periods=(26,), signal_periods=(9,))
+    for fast in (5, 12):
+        expected = calculate_macd(data, fast, 26, 9)
+        for output in expected.columns:
+            assert_close(result[(output, fast, 26, 9)], expected[output])